@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Measure cold-start import cost of the application using ``python -X importtime``.
+
+The target module is imported in a fresh interpreter several times and the best
+cumulative time is compared against a budget. The script also verifies that
+heavy dependencies which are only needed for install or update are not pulled
+in at startup. It exits with a non-zero status when either check fails, so it
+can be used as a CI gate.
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --module services --budget-ms 50
+    python scripts/benchmark_import_time.py --module cli --budget-ms 150 --defer flet
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+DEFAULT_MODULE = "app"
+DEFAULT_BUDGET_MS = 1000
+DEFAULT_RUNS = 5
+
+# Modules that must not be imported before the first window is shown
+DEFERRED_MODULES = ["requests", "pymsi", "psutil", "zipfile", "packaging"]
+
+
+def measure_import(module: str) -> dict[str, tuple[int, int]]:
+    """Import a module in a fresh interpreter and collect per-module timings.
+
+    Args:
+        module: Name of the module to import
+
+    Returns:
+        Mapping of module name to (self_us, cumulative_us)
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(SRC_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing '{module}' failed:\n{result.stderr}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+
+    return timings
+
+
+def run_benchmark(
+        module: str, budget_ms: float, runs: int, top: int, deferred: list[str]
+) -> bool:
+    """Run the import benchmark and report the results.
+
+    Args:
+        module: Name of the module to import
+        budget_ms: Maximum allowed cumulative import time in milliseconds
+        runs: Number of fresh interpreter runs (the fastest one is reported)
+        top: Number of most expensive modules to list
+        deferred: Modules that must not be imported
+
+    Returns:
+        True if all checks passed, False otherwise
+    """
+    # The first run warms the bytecode cache and is not counted
+    measure_import(module)
+
+    best = None
+    for _ in range(runs):
+        timings = measure_import(module)
+        if best is None or timings[module][1] < best[module][1]:
+            best = timings
+
+    total_ms = best[module][1] / 1000
+    print(f"Import of '{module}': {total_ms:.1f} ms (best of {runs}, budget {budget_ms:.0f} ms)")
+
+    print(f"\nTop {top} modules by self time:")
+    heaviest = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    for name, (self_us, cumulative_us) in heaviest:
+        print(f"  {self_us / 1000:8.1f} ms  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    passed = True
+
+    loaded_deferred = [name for name in deferred if name in best]
+    if loaded_deferred:
+        print(f"\nFAIL: deferred modules imported at startup: {', '.join(loaded_deferred)}")
+        passed = False
+
+    if total_ms > budget_ms:
+        print(f"\nFAIL: import time {total_ms:.1f} ms exceeds budget of {budget_ms:.0f} ms")
+        passed = False
+
+    if passed:
+        print("\nImport time budget OK")
+
+    return passed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="Module to import")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Maximum cumulative import time in milliseconds")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS,
+                        help="Number of measured runs")
+    parser.add_argument("--top", type=int, default=15,
+                        help="Number of most expensive modules to list")
+    parser.add_argument("--defer", action="append", default=[], metavar="MODULE",
+                        help="Additional module that must not be imported (repeatable)")
+    args = parser.parse_args()
+
+    try:
+        passed = run_benchmark(
+            args.module, args.budget_ms, args.runs, args.top, DEFERRED_MODULES + args.defer
+        )
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,70 +1,251 @@
 #!/usr/bin/env python3
 """
-Generate base64-encoded Python files from image assets.
+Generate the embedded asset pack from image assets.
 
-This script reads all image files from the src/assets folder and creates
-corresponding .py files containing the base64-encoded representation of each image.
-This is necessary because when compiling with Nuitka, asset files are not included
-in the binary, so we embed them as base64 strings in Python code.
+This script reads all image files from the src/assets folder and packs them into
+a single Python module, src/assets/asset_pack.py, holding one zlib-compressed
+bytes constant and an index of the files inside it. This is necessary because
+when compiling with Nuitka, asset files are not included in the binary, so we
+embed them in Python code. Nuitka stores bytes constants in binary form, so the
+pack adds less to the executable than base64 strings did, and the application
+only decompresses it when an asset is first requested.
+
+Images listed in DISPLAY_SIZES are downscaled to the size they are displayed at
+and every PNG is losslessly recompressed. This requires Pillow; without it the
+original files are packed unchanged.
+
+The embedded data size and import time of the previously generated modules and
+of the new pack are reported.
 
 Usage:
     python scripts/generate_asset_b64.py
+    python scripts/generate_asset_b64.py --scale 2
 """
 
-import base64
+import argparse
+import io
+import os
+import subprocess
+import sys
+import zlib
 from pathlib import Path
 
+SRC_DIR = Path(__file__).parent.parent / "src"
+ASSETS_DIR = SRC_DIR / "assets"
+PACK_MODULE = "asset_pack"
 
-def generate_b64_files():
-    """Generate base64-encoded Python files for all images in src/assets."""
-    assets_dir = Path(__file__).parent.parent / "src" / "assets"
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".svg", ".webp"}
 
-    if not assets_dir.exists():
-        print(f"Error: Assets directory not found at {assets_dir}")
-        return
+# Shipped next to the executable as Nuitka data files and loaded from disk
+# (the window icon), so packing them would only add dead weight
+UNPACKED_ASSETS = {"icon.ico"}
 
-    image_extensions = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".svg", ".webp"}
+# Maximum size (width, height) each image is displayed at in the UI
+DISPLAY_SIZES = {
+    "vacc_lithuania_darkgreen_transparent.png": (400, 190),
+    "vacc_lithuania_white_transparent.png": (400, 190),
+}
 
-    image_files = [f for f in assets_dir.iterdir()
-                   if f.is_file() and f.suffix.lower() in image_extensions]
+BYTES_PER_LINE = 48
 
-    if not image_files:
-        print(f"No image files found in {assets_dir}")
-        return
 
-    print(f"Found {len(image_files)} image(s) to process:")
-    for img_file in image_files:
-        print(f"  - {img_file.name}")
+def optimise_image(img_file: Path, scale: float) -> bytes:
+    """Downscale an image to its display size and losslessly recompress it.
 
-    for img_file in image_files:
-        with open(img_file, "rb") as f:
-            image_data = f.read()
+    Args:
+        img_file: Path to the source image
+        scale: Multiplier applied to the display size (e.g. 2 for HiDPI screens)
+
+    Returns:
+        Optimised image bytes, or the original bytes if they are smaller
+    """
+    original = img_file.read_bytes()
+
+    try:
+        from PIL import Image
+    except ImportError:
+        return original
+
+    if img_file.suffix.lower() != ".png":
+        return original
+
+    with Image.open(io.BytesIO(original)) as image:
+        image.load()
+
+        display_size = DISPLAY_SIZES.get(img_file.name)
+        if display_size:
+            max_size = (int(display_size[0] * scale), int(display_size[1] * scale))
+            image.thumbnail(max_size, Image.Resampling.LANCZOS)
+
+        output = io.BytesIO()
+        image.save(output, format="PNG", optimize=True)
+
+    optimised = output.getvalue()
+
+    if not display_size and len(optimised) >= len(original):
+        return original
+
+    return optimised
+
+
+def build_pack_module(assets: dict[str, bytes]) -> str:
+    """Build the source of the asset pack module.
+
+    Args:
+        assets: Mapping of asset file name to its content
+
+    Returns:
+        Python source code of the module
+    """
+    index = {}
+    blob = bytearray()
+    for name, data in sorted(assets.items()):
+        index[name] = (len(blob), len(data))
+        blob.extend(data)
 
-        b64_data = base64.b64encode(image_data).decode("utf-8")
+    compressed = zlib.compress(bytes(blob), 9)
 
-        py_filename = img_file.stem + "_b64.py"
-        py_filepath = assets_dir / py_filename
+    index_lines = "\n".join(
+        f"    {name!r}: ({offset}, {size})," for name, (offset, size) in index.items()
+    )
+    data_lines = "\n".join(
+        f"    {compressed[i:i + BYTES_PER_LINE]!r}"
+        for i in range(0, len(compressed), BYTES_PER_LINE)
+    )
 
-        py_content = f'''"""
-Auto-generated base64-encoded image data for: {img_file.name}
+    return f'''"""
+Auto-generated asset pack for: {", ".join(index)}
 
 This file was generated by scripts/generate_asset_b64.py
 Do not edit manually - regenerate using the script instead.
 """
 
-# Original filename: {img_file.name}
-# File size: {len(image_data)} bytes
+# Uncompressed size: {len(blob)} bytes
+# Compressed size: {len(compressed)} bytes
+
+# Asset file name -> (offset, size) in the decompressed pack
+ASSET_INDEX = {{
+{index_lines}
+}}
+
 # noinspection PyPep8
-IMAGE_B64 = """{b64_data}"""
+ASSET_PACK = (
+{data_lines}
+)
 '''
 
-        with open(py_filepath, "w", encoding="utf-8") as f:
-            f.write(py_content)
 
-        print(f" Generated: {py_filename} ({len(b64_data)} chars)")
+def measure_modules(modules: list[str]) -> tuple[int, float]:
+    """Measure the embedded data size and import time of generated asset modules.
+
+    Args:
+        modules: Names of modules inside the assets package
+
+    Returns:
+        Tuple of (embedded data size in bytes, best import time in milliseconds)
+    """
+    if not modules:
+        return 0, 0.0
+
+    names = ", ".join(f"assets.{module}" for module in modules)
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {names}; "
+        "elapsed = (time.perf_counter() - start) * 1000; "
+        f"modules = [{names}]; "
+        "size = sum(len(getattr(m, 'IMAGE_B64', '')) + len(getattr(m, 'ASSET_PACK', b'')) "
+        "for m in modules); "
+        "print(size, elapsed)"
+    )
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(SRC_DIR)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    timings = []
+    # The first run compiles the bytecode cache and is not counted
+    for _ in range(6):
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=SRC_DIR, env=env,
+            capture_output=True, text=True, check=True,
+        )
+        size, elapsed = result.stdout.split()
+        timings.append(float(elapsed))
+
+    return int(size), min(timings[1:])
+
+
+def generated_modules() -> list[str]:
+    """Get the names of all previously generated asset modules."""
+    modules = sorted(f.stem for f in ASSETS_DIR.glob("*_b64.py"))
+    if (ASSETS_DIR / f"{PACK_MODULE}.py").exists():
+        modules.append(PACK_MODULE)
+    return modules
+
+
+def generate_asset_pack(scale: float) -> None:
+    """Generate the asset pack module for all images in src/assets.
+
+    Args:
+        scale: Multiplier applied to the display sizes
+    """
+    if not ASSETS_DIR.exists():
+        print(f"Error: Assets directory not found at {ASSETS_DIR}")
+        return
+
+    image_files = sorted(f for f in ASSETS_DIR.iterdir()
+                         if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS
+                         and f.name not in UNPACKED_ASSETS)
+
+    if not image_files:
+        print(f"No image files found in {ASSETS_DIR}")
+        return
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("Warning: Pillow is not installed, images will be packed without optimisation.\n")
+
+    old_modules = generated_modules()
+    old_size, old_import_ms = measure_modules(old_modules)
+
+    print(f"Found {len(image_files)} image(s) to process:")
+
+    assets = {}
+    for img_file in image_files:
+        original_size = img_file.stat().st_size
+        assets[img_file.name] = optimise_image(img_file, scale)
+        print(f"  - {img_file.name}: {original_size} -> {len(assets[img_file.name])} bytes")
+
+    pack_path = ASSETS_DIR / f"{PACK_MODULE}.py"
+    with open(pack_path, "w", encoding="utf-8") as f:
+        f.write(build_pack_module(assets))
+
+    print(f" Generated: {pack_path.name}")
+
+    # The pack replaces the per-image base64 modules
+    for module in old_modules:
+        if module != PACK_MODULE:
+            (ASSETS_DIR / f"{module}.py").unlink()
+            print(f" Removed: {module}.py")
+
+    new_size, new_import_ms = measure_modules([PACK_MODULE])
+
+    print("\n                  Before      After")
+    print(f"Embedded data {old_size:>10}  {new_size:>9} bytes")
+    print(f"Import time   {old_import_ms:>10.2f}  {new_import_ms:>9.2f} ms")
+
+    print(f"\nSuccessfully packed {len(image_files)} asset(s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate the embedded asset pack.")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiplier applied to the display sizes (e.g. 2 for HiDPI)")
+    args = parser.parse_args()
 
-    print(f"\nSuccessfully generated {len(image_files)} base64 .py file(s)")
+    generate_asset_pack(args.scale)
 
 
 if __name__ == "__main__":
-    generate_b64_files()
+    main()
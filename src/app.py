@@ -0,0 +1,157 @@
+"""Desktop application window and its startup sequence."""
+
+import platform
+import threading
+
+from services.startup_profiler import startup_profiler
+
+with startup_profiler.phase("import_flet"):
+    import flet as ft
+
+from config import settings
+from services import AppContext, PathManager
+
+with startup_profiler.phase("import_ui"):
+    from ui.components import MandatoryUpdateDialog, UpdateAvailableDialog
+    from ui.views import MainView
+
+
+def check_for_app_update(page: ft.Page, context: AppContext, main_view: MainView) -> None:
+    """Check for application updates in the background.
+
+    Runs after the main view has been shown, so a slow or unreachable GitHub
+    API never delays the first frame. The main view's install and launch
+    actions stay disabled until the check resolves, or gives up after
+    settings.UPDATE_CHECK_TIMEOUT, so an update dialog never appears over
+    an install or launch already under way.
+
+    On Windows: Shows a mandatory update dialog if update is available.
+                User must update before using the application.
+
+    On other platforms: Shows an informational dialog if update is available.
+                       User can continue without updating.
+
+    Args:
+        page: Flet page instance
+        context: Application context
+        main_view: Main view whose actions are enabled once the check resolves
+    """
+    mandatory = False
+
+    try:
+        with startup_profiler.phase("app_update_check"):
+            update_manager = context.update_manager
+            result = {}
+
+            def check() -> None:
+                result["update"] = update_manager.is_update_available(
+                    timeout=settings.UPDATE_CHECK_TIMEOUT
+                )
+
+            # The request timeout does not bound name resolution, so wait for it separately
+            checker = threading.Thread(target=check, daemon=True)
+            checker.start()
+            checker.join(settings.UPDATE_CHECK_TIMEOUT)
+
+        if "update" not in result:
+            print("Update check timed out")
+            return
+
+        is_available, release_info = result["update"]
+
+        if not is_available:
+            # No update needed, continue normally
+            return
+
+        # Update is available
+        is_windows = platform.system() == "Windows"
+
+        if is_windows:
+            # Show mandatory update dialog, the application stays unusable
+            mandatory = True
+            dialog = MandatoryUpdateDialog(page, release_info, update_manager)
+        else:
+            # Show informational dialog, user can continue using the app
+            dialog = UpdateAvailableDialog(page, release_info)
+
+        dialog.show()
+
+    except Exception as e:
+        # If update check fails (e.g., no internet), just log and continue
+        print(f"Update check failed: {e}")
+
+    finally:
+        if not mandatory:
+            main_view.enable_actions()
+        startup_profiler.write()
+
+
+def main(page: ft.Page) -> None:
+    """Main application entry point.
+
+    Args:
+        page: Flet page instance
+    """
+    startup_profiler.mark("main_entered")
+
+    context = AppContext()
+    path_manager = context.path_manager
+    config_manager = context.config_manager
+
+    with startup_profiler.phase("ensure_directories"):
+        path_manager.ensure_base_directories()
+        path_manager.ensure_fir_directories(settings.FIR_CODE)
+
+    # Delete trees left in the trash by earlier runs
+    context.trash_reaper.start()
+
+    with startup_profiler.phase("config_load"):
+        config = config_manager.config
+
+    if config.theme_mode == "system":
+        with startup_profiler.phase("theme_detect"):
+            import darkdetect
+            is_dark = darkdetect.isDark()
+            config.theme_mode = "dark" if is_dark else "light"
+            config_manager.save(config)
+
+    page.title = settings.APP_NAME
+
+    if config.theme_mode == "dark":
+        page.theme_mode = ft.ThemeMode.DARK
+    else:
+        page.theme_mode = ft.ThemeMode.LIGHT
+
+    page.window.width = settings.WINDOW_WIDTH
+    page.window.height = settings.WINDOW_HEIGHT
+    page.window.resizable = False
+    page.window.maximizable = False
+
+    with startup_profiler.phase("page_update_window"):
+        page.update()
+
+    icon_path = path_manager.assets / "icon.ico"
+    if icon_path.exists():
+        page.window.icon = str(icon_path)
+
+    with startup_profiler.phase("page_update_icon"):
+        page.update()
+
+    with startup_profiler.phase("main_view_build"):
+        main_view = MainView(page, context)
+
+    page.views.clear()
+    page.views.append(main_view)
+
+    with startup_profiler.phase("page_update_main_view"):
+        page.update()
+
+    startup_profiler.mark("first_frame")
+    startup_profiler.write()
+
+    page.run_thread(check_for_app_update, page, context, main_view)
+
+
+def run() -> None:
+    """Open the application window."""
+    ft.app(target=main, assets_dir=str(PathManager().assets))
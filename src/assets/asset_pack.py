@@ -0,0 +1,513 @@
+"""
+Auto-generated asset pack for: vacc_lithuania_darkgreen_transparent.png, vacc_lithuania_white_transparent.png
+
+This file was generated by scripts/generate_asset_b64.py
+Do not edit manually - regenerate using the script instead.
+"""
+
+# Uncompressed size: 24502 bytes
+# Compressed size: 23682 bytes
+
+# Asset file name -> (offset, size) in the decompressed pack
+ASSET_INDEX = {
+    'vacc_lithuania_darkgreen_transparent.png': (0, 14958),
+    'vacc_lithuania_white_transparent.png': (14958, 9544),
+}
+
+# noinspection PyPep8
+ASSET_PACK = (
+    b'x\xda\xd4{eTT]\xf8\xef\xa1\xa4DJ\x04\x01)\t\x01\x01)\xe9\x10\x86\x92ni\x01i\xc9\xa1\x87\x12ii\xa4\xbba(\x91\x1c\xfa\x15\x04\x91a(\t'
+    b'i$\x86\x1e\xc2\xa1\x86\xb8\xe3]\xf7\xfb]\xeb~\xba\xff\xb3\xce\x9c9\xeb\xac\xbd\xe6\xecg\xcf\xb3\x7f\xb1#VGK\x85\x8c\x84\x9e\x04\x00\x0025U\x90\x1e\x00'
+    b'\xe0`?@\x0f\xd1=\xec\xd5\x81=\xba\x04\x00$E\xd5@\xaf\x0c\xfc\xe7\x0f\xba\x03\x82\x9e8\xf8\x0c\xddH!\x03\xb6^k\xe5\x89K\x95\xe1P\x85;Q\x99|'
+    b"M#Z\xe80\x16\x12\xfb\xfc\x10\x9e\xfa\x85]L~G\x81\xb6C\xbe\x98\xef\xf3Y\xb9NDX\xe6\xa3m\x85\xe2\x91\x85\x84'\xf3^\xc5\x0fq\x7f\xb1\xe2x\xc5"
+    b">\x1f&~\xfd\xe5\xdd'|\r\x92\xdf,\xbe/\xa5,\xbdQ\xd2c\x12(f\xe1\xa7V#\xa9~CZ^=\x85cA/&\x16M\n\xb2%\xc6~\x17\x80"
+    b'\x81\xfe\x17\xf7\xffg\x9f\xe2\xaf\x93\xc9>X\xd3\r\xb2\x92\x8c\x9b\xd6m\xbd\xa7\xc3>|\xf0\xc1\x17g~z\xda\xf0\xdb*\xcbB\x15]\x94\xf5>7\xb7E\x8b)'
+    b'z\xday\x1a\xa9\x90\x06\xa6. e\r\\;\xd9\xac\x148@\xddE\xdb\xe1\xe1\x9d\x0b\xf0ev\xe2\xf4\xe1C\xad\xa5_\x8dj3\x84?\xd5\xf6\x83]{\xd9\xdc'
+    b'b\x12\x11\x08pN\xa7\xef\r\xb2>M;d\xa9B\xd4E\x0f\xb0)\xb5\xa5\xe3T-\\\xbc\xff@(*\xaa\xacS/\x80\x9aZF\xc96\x8f\xad\xa4\x90\x00\x19'
+    b'\xc29\xbauC<\x81\xebs\xd8]\x8e@\xccF\x8a,U\xb0\x85\xbe\x90\x10:\x89mm4b\x00\xf5\xbfxu\xf5.\x1a\xc7\x11\xfb\xe3\x9c\x85\xec\xa1C\x08\xd6'
+    b'\nn\x10>pH\xf8\xe5\xc5\xce\xb6\xb8`\xb3\xa9U\x0c\xdc\xfd\xb7\xff\x94\xa6\x1f\xb2WP\xf3\xd7\x8b\x82\xbe7\x06\x97,\xcd\x13<}\xc8|?\xa6\x15!i\xe9'
+    b'\xc0y\xfd\x02=\xc2#\r\x00\xa9`\x18\\\xed\xfd\xb5\xca-\x9d.\x14\xe2u0\xef\xe7\n\xdb\xabw\xc5\xc6w\xb7\xc1%\x17\xfb\xd2?\xca\x9a\xbeZ\x90\\f\xf3'
+    b'\xc4e\x0e6\xf6\x81\x88\xedd\xe7\xf3\xa5\xb6{\xefNE\xe1\x16?\x90\xc5\xe9\x8c\r!\xc1\x9c\xfa\xfbx\xf2_\x03\x9e\x060\x82oF\xe4\x86Dx\x85:,)'
+    b'CR\xd2\xf2\xb7sK\x88\x02\xd4=\x9f\xee\xf1%[r\xb9\xec\xf4\x9e\xcf\x94\x02Y?~\xb5 $>\xf0\xde=~\xbb\xd5\x8fT\xb6,[M\xaf\xbc\xe9A\xbb'
+    b'u"\xc1+\x07m\x8b\',\xce\xa2\xd1\x81\x16oq8\xfa_\xc4\xcb\xe0o[R\x8f*\x8d\x05\x1f6e\x1a\xd6 [\xee\xc4\xcc\xfe{G\xc7\xf9\xbc`\xff\\'
+    b"\x83\x8e\x11\xe4\xea\x1c\xf7\xd2}Y\xc3!\xdf'\x03a\x9b\x03\xae3*=\xeb\xdd\xb4\xbf\xeei\x19\xff\xefU\xfd\xb2\xff\xd3B\x9f\x19\x13\x12\x00}\xe3RgPg"
+    b'\xf4\x04\xd8_7=\x13?\xdc\x1a\xcd\xad\xf6\xfcm\x17^\\\xfc\x11=\xec\xd5b\xba\xf9\xc7<W\xcc\x9d\x13p\x14\xa1\x0f\xc7C\xa3\xb6f=\xdf\x0c\xbd\xb8\xbf\x9e'
+    b'\xbcf\xfb\xe5\xc9\xd1\xc0\x84Y]A\xe3\xbbih\xa5\x80e\xe3\x9f\x8d\xeb\xb6\x83Y\xcd\xa4S\xb5\x98/r|\x92\x18\xa9\x83S:\x8cI\xb5]N\x875\xfd\x0e'
+    b"\xb5y\xcc\xf9\xd9Y\xc7\xc1\x93'\xf9\xf9\x82\x05L\xf9R\xb9\x06\x85\xca\xf01`B!\xd6S\xca\x00\xa5\x11\xe3\xb6i\xb4\xd7s||\x1c\xf6\xf1<\x98\n8\xa8"
+    b"60\x12\x9cx\xac\x0b\xc2y[\xbc\xebckk\xdb\xf9\xc5/\\\x16g\x9c\x94'=\x8d\xaad\xe4I\xd8\xb3I\xc9n\x83\x8e\xfa\t\xc7\x88\xeeD\xa9\x17\xe3#"
+    b"\xf0\xb1d\n6\x08\n\xb4Q?\xbc\xb6\xe6\xb9/w\x1c\xba\x85R'\xbc\x17bi\x18J)/f\xa0\x8d3\xd1_&\xf9\xf8\x83\xfb{\xc6\xc7\x97\x13\xfb7H"
+    b'Iem++\xf2,\x01\xae\xe9O\x9f\xb7\xd9)\\Y\xdfvW\xec\xf8\xa4\x89\xad\x04\x91\xbfg\r\xb7\x0e\xff[\x95\xaf\x0f\xe1I\x0f\xe5\xda\xfa$2b/\xa7'
+    b'7[\x0c5\rj\x86\x04u\x816\x0c\xd0\xf8\xb8Zz\xab\xef(\xf8"\x9c\x15@)a|$\xb5\x84\xa7~\x06\x1b\x9c\xcb=\xc16\xd8ch\xcd\\\x15\xdb\x07'
+    b'\x12\x94\x9fz\x9f\xa3o\x82\x87\x88\xb9\xba\xb0)\xe7\xb1\xfc\xd4\xb5\xc5R\x16\x9b\xa3\x9b\x7fP\x90\x03\xab\xea\xaeV\x03\x9e`e\x9c\x08\xfbSHZii\xf7%\xff'
+    b"\xa4\xdb\x95\xdc/\xe7\xa55)ID&E\x1f\xb6\xf8K\xd4\xaec\xcb#\xa4\x02\xf3)\x91\x00n\x11\xd2\xa8&\x9f\xabr':f\xbb-\x0bF\rba\xab\xe2"
+    b')"\xa1\xfc]\r\xbd3p~\xb9";tL\x17\xe6\x8dF\xe7o\xe5a^\xe0\xf4\x82\xe0\x89\xf3\x89\xc5P\x9d\x14\x15\x83\x8d\x06.\x15\x95\x95L\x07\xd9*b'
+    b'\x83\xf5\xd88\xb9{[]\xe6\xed\xce\xd3\xbfc\x8eg\xb3c~=)@\xabtrp\xc4TQ\xe4\x08\xdf\xf1\xd16\xe8P\x0e\xd0\x15C\xcf\xa9_\x10\x94\xa0A'
+    b'"\x94\x1fP/\xb5%w\xce4]fD\x90\xed3\x8a\xb7\x17\x0c0\xed\xcf \xd9\xb4\x97\xb9\xbd5l\xdc1Tz\xc1\xdca\x02\xb4\xb2S\xe1\x7f\xee\xd2vi'
+    b'\x04#\xb2\xd4\xeb\x93\xf0\x92\xcd\x7f\xbc.xL\xd1\xd6j\x9aIq\x1a\xe0T\x93\x8e+\xff\xbee5\x0f2\xe8\xed\xe0 \x17\xc6\x80T\xfb\xaf\xe4\xbf\xff^]\x9d'
+    b"\xef\xd5\xefI\xc3\xa6\xafr\x04\xd2\x0bh'\r\x0ci\xa8\xbe\x89\x84E\xe3\xe4\r.\xfbU\xed\xe2Z\xf1t\xb7Tw\xb4\x1b\xd5X\x10\xc0/|\x89\x7f\x90|\x15"
+    b'G\xba\x1d-[1N\x1a\x10\xc9\xabN=\xc1\x7f\xaf\xbf\xaa\x81\xcc3\x9e\xd6\x0fR\x19\x82t\x8el\x82\xc5\xee\x93u/O~\xbbO]\xa6\x12#\xfd\xe6#\xfb'
+    b'\xe0\xe6>\xa3\x02\x117e\x80a\x02\xe8\xf3%\x93p\xba\x9e\x932\xfd\xa1\xab\x96\x02\r\t\x11\x8en,[\xb52\x85(\x8e4\xee[\xde\xb0h@\x9ah\x95\t'
+    b'0+\xba\n\xddX\xb4\xc0\xb9\xd8\xc9V\xf3Zy\xae\x0fk\x177^\xea\xca\x9e\x0fg\x8f\xa6}6\x8cO\xee\x9b\xef;\xef\x9ao\xd6\xb6<\x8a\xc8\xafd\xa3('
+    b'\xb12\xef\n\xf4Q\xe9\xb6to]\xa2\x9e\xdeC\xfb\xbf*\xf7\xa22\x10\xd07\xac\x94\xff\x89\xa8\xc3\xb1\xc7\x15\xabr[\xd6H\xd8\xfff\x89@4\x96U\x0b5'
+    b'Q\xa7\xc8\xc3W)B\x08\xfa\x12N\xe3e\xc8\xc9\xc8\xbe\x1fz]6\x04W\xff\xed\x1aw\xd6l\x02\xe7\xb3\x9d\x9co,\xaa\x0c\xc3FS+\xb4S\xe8V\xe4\xe1'
+    b'\xee\x0fF\xb7\xbc\xf5x\xba\xf7\xcf \x87\x97\xeb\xc3\x13\x13\xe4\x065\x86V\xf8\xbdy\xe7w\xbb\xdd\xbd\xe2\xcd\xa6S\x03\x8b\x8fm\x83\x98\x87.\x04M\xbf\xacZ;'
+    b'\xbd,\xacgs\xb7\xdb\xb2\x1aI:6S\xc7\\\xb9Ag\xf7\ns\xea"\x19\xa2\xb2\xcf\xa2m\x0f3F\x98\x8f\xd4N\xb8\xa8J\xa1\xbbO\x04#j\x18\x9bF'
+    b'Z\xd48\xec\xd3\xe9\xceI\xdeQ\xa4l\x9dI5\x82K@\xdc1z\xaf\xa72P\xdb\x8e\xfc\xf8\xadb\xf4\t;7\x96\xaafe\x12I\xbe\xcc4MM\xed+'
+    b'\x05\xaf7\x0b\xf3\xcf\x1b\xc8\x9d\xe8\xe7`\xecQ/\xbex\xbe\x7f\xefZl\xfdh~~\xd2\xeb2\xd2\xc3\x8d\x0c\x87"\xc5\x8cSE\xd9\x08!TC\xfc\xf1\xe3\xaf'
+    b'\xe0\x1b\xf4^>xI0B\x85\xe8\x8d6|\x8c\x00\xa0\x81\xc9e\xbc\x1e+p\x16i\x1d;\xd1\x14\x02v,a^\xdc\x90;\x19C\xcd\xfc\xf3r\xbao\xbd\x1a'
+    b'\x89\xf1\xd7\x88\xfd\xbdC\xee\xcc\xbb\x9c\xee\xd0O\xefx\xae[\xab:\xfc\x9d\xdf\xef[\x03\xf3\xfa\xfcr\x85\xdd\xbd\xaf\x14\x1ca\xec\xdc\xdfE\x82\xc76\xb6\xb7W\xf7'
+    b'm\xbd3G\n}\x96\xefR\xe3b\xe2\xae\xfdgK\x94,rgj\x9d\x0e\xfa\x0f\xde\xd2U\xa40%\xc3\x16\x1c\x1d\xf9\xbb\x05t)_\x08GR\xdc\xfa\xedn'
+    b'\xe5V&^E\xe8\xd6\x08\xee\xa25\xde> S+\x1d\x17gH(E\x8d\xe9\xdc\xc4Ao_\xe2|\x83\xeble\x02o\xcc\x1c\xb3\x94~&\xe3\n\xd8\x95h'
+    b'\xe0B-I\xe5\x1d\x9a\xdb\xcd\xb7\xcf\xcc\xfd\x968\xde\x1e\xfet\xc8 \xb6\x0b\x11\xc6\xd9\xe3P\xf6\\\x96\xa3q\xba\n\x02\xac\xaa\x8dj\xea\xc7o\xa1\xd3<b\xf4'
+    b"d8\xa7\xa8\xaf\xe0\x87\x8aG\x82\x11u\xe5\xec\x01\x84'\x0f\xab\x94K)\xb1/\xec\xe8\xf8[\xb6\xd7\x10z\xdeJ\x17\x9am\xa0\r^.\x84\n\xf6\x10\xf59\x9c"
+    b'\x82{(\xc3\xa8\xc0T\x8a\xed\x10l\xe5Q\r\xd3\xce\xf5\x05.k\x97\x01\xa5/z\xf3m\x82\xb2q9\x90\x8b\x97\xa4\xadnO\x80#M\xe1c2\xea\xb2\xe8\x86'
+    b'\x9b\xc1\x9e\x9e\x1e\x02\xa90R%|\x84\xc4\x0b\x0f\x06\xe0\x10:}m`ll\x7fFF\x86\xf3\xf1#\x84\xd9\xda1\xe6\x85x\x95z\xefq\x02?Oz\x10\xd1'
+    b'\xab\xf3\xc97S\x0f\x01\x16\x84 %\xb7p\xa7Q\xbc\\W\xa9e\xe8\xc3$O|\xd8\x84#\x088\xaa\x9b\xf1 \xf5\x07\xe0\x0eUDEWl\x00\n~\xa7\x85'
+    b'\x05-l\x8e\xdd\xbd\xadA\xe3\x1aFV\xc5QXHe\x9a\x90\x97d6\x82\xf3\x90V\xc1\xb6^\xfe\xfe%\x95z\xb0\xfcl\x01xYc\x8f}\x06y\x06}\x82'
+    b"\xf2\xf6\xee.\x0f\xe5\x91B,\xe5>\xa3z\xfc\n\x93\xbb\x08\xd3\x0f\x02\xb3\x1fK\x94\xd9\xbe\xd2B'X\n\x96\xce\xf0\xf6\xb5\xe4\x16T\xf8@\x03\xc8.,,@"
+    b"\x94\xd5\xd1B\xb1\x94\x08\x08\x89\xd3\xd5\xf4?\\\x19\xab6\x92\xf1*\xce'u/0\xed<\xab\xe7\xd8<9\x97\x92\x94,(eK\xa6+\xc4[\xcd\xfd^f\x8d"
+    b'\xa5Pr\x8b\xe4\xdd\x07\xa8\xb1\x19\xba1N@PY\x87S\xd5\x0eZ\xc3\xbb\x9f\xa2S@s\x93u\x80\x04\xa3\x8bYSzzx\xa9Voj\xe3d\xcc\xab\xa1'
+    b'acn\xb1\x06kY\x94\xb6\xd7\x9e\xb1\x97z\x8c\xb9\xf7\tF\t\xa6g\xb0\xe9\xbb\x80\x80\x99jL\x11\x95\x14p\xf0\x1a[~\xf1\\\xea@aI\x89s}}'
+    b'}\xe7\xa3S\xa0\xa0\xb0\\.\x10\xb3\xfb\xeb\x97\x04Rck\xf6\xb9\xabB6M;\x154F\xf0\x9e\xcf\xa1\xe9\xbb\x90\xcd\xb1\xa6sT\x1ck\x0c\xae@\x97\xc7\xe5'
+    b'\xc9\xd4\x1e\xfa\xea\xe3\\>\nz\xdb<\x85\xd0O\x01+\xb1\x07"\xf3\xa0\xf5x\xf2M\x04f\xdd5\xea8\xc9Bw\xae\xf4\xdfZ\xca$\xd5\x04o\xe9\x80\x8a\xb4'
+    b"\r\\\xd4b\xb5.;A2\xc5iGp</\xe5\x91[\xecq<\xc5\xba\xb2\xd7\xa1\xcaA\xda'k\xe9\x14\x7f\xb8\xa9\xd5/\xe7\x96\xfd\x8f\x9f\x8e\xb3\x11\x12\xe4"
+    b'l\xcf\xbeH8\xb5\x1c"\xb0RG\xf4;\x9bW\x97\xf5\xfb}\xbc\xe2iz\x07{\x9a\x14\xf14\xaf&\x88>\xc0\x06e\x13\xbc\xbd\xda8:\xea\xaf\x9a\xbex\xd1'
+    b"2\xa1H5\x00+b\xfb\xa9\xe1\x03\xa8\xe6\x9f'v\x87\xb2\x02\xd2_<\xac3ZYNll8\xdfU\xdc\xcc\xea4\x0c\xd9D\xea\x17\\\xd4/\xe1\xe1-\x81"
+    b'~\xa5u\xe2\xf4tZ\xfb\xfbS\x85Q\xe9$\t\xc6A\xa1\xda\xa9\xfa\xaf\x11\xdd\xf8\x019\x06\x82\x87\xf4\xdf\x84\xc5\xd5\xf5\xe3`g\xb7}y\xeb)\x9a\xf6\x1d\x9e'
+    b'\x07\xf3\x0c\\\xee\x1d;+\x9cQ\xd1\xb3\xaeo\xda\x0eC\x00\x96\xad\xd3\x98\xc7\xf81\xd0p\x10\x13~Q\x930\x85\xd7Z\x03\x83\xb2J\xefYw\xae\xdb\xd5FT'
+    b'J\nJ\xeb\x01\xb9\xdc\xfb[\xdd~\xfc\x1d\xeb\xc9\x8aK\xe9OY)\x18\xdc^9Y\xd9\x1e\x9aN\xfd\x84\x07\xa0~[\xe0O\xd6Jb\xf7S\x0c\xcc\x06:a'
+    b"\xb7\xb5g,Vo\xe6g\xcbw.\xc0T\xef\x1b@\xb7\xd5-Y\xe2\x1eE\xe1\x1bV\xf5\x94\xf6L\x80 \x8c\xc6!?}\xebj\xe1\xd3'\x11>\xdd\x1b\x92/"
+    b'R\x1cP\xa2x\xd6\xc1L\t\xa4\xb9,q0e\xd8\x19\xf6\x7f\xa4.-e`\xf1\xaa\x19\x11\xd1$:u\x01\xb6\xed`f,\x90\xc9 \xdc\x98\xb0\xa5\x80VL'
+    b'\x01\xdd=B\x98i]\xe0/\xe7\xfa\xb66\xb1\xe1\xc8\x9bo\x8fG\xe50V\xf3c\xfb;q\xb6}$\x1b\xd8,K*\xaa#\x95\xc6\x83\xfe\x90\xdb\x8d>\x1b7'
+    b'"\x0fS\xe0]*\x97|d\xbb\x087i\xb6B\n=\x17\xa5V\xf5\xc6\xbf\xf6Z\x84\\n~z\xa0+l\x08\x04-\xfc\xf8\x11\x0c\x0c\xceI\xa4\xd2\xd1\xc8\xaf'
+    b'|\xed\xe9\x01\xef\xa2\x03\xf7w\xf7\xcc4@\xb4xaq\xd7\xaamn7n!\r\x8d\x9at\xd48\x02\xfa\x00\x95-5\xc8\x8aGd>\x88{k\x88\x1blG'
+    b"\x843\xcdQc$\x13L\x94,\x85\xeaJ\x03\x93\xfd]\xe5\x0c/fu\x15\xa1\xa7D\x07\x9a\xb7{\x143M\n\xee\xfap'Z\xe7Ta\xd5\x08\x91B\x1f,"
+    b'G\xfd)\x9b\xa9\x9c\xba\x99\xcc\xdb\xd1\xa3\xc4\x94\x14\x15\x9c\xeb\xb0\xac\x85\x96Z\xf3\xa8\xd44\xba\xb5\x0fj\xc0\xfc\xdc\xc2_\xe9gX$\x8a\xce\x97\x12\x90\xc9[A'
+    b'\xe6\x9c\xb4|\xd6d\xe1C\xdd\xc4\xfeY\xdc\x04b\xf2\xcdF\x11>aD,W+\xd5\xd5\xd5FX\x85r`\x7f\xf3\xf5\xf6\x96\x9f\x82o\x84\xf0\xed\xd2`J\n'
+    b'\xb3\x8f\x8fOz\xc8\xa4\xa3\xc6\xec\x1e\xba\n*GC\xc9\xc1"\x8e\xa2\xd5\x89\x17 \x0c\xabs(\x18\x06X\xa0\xc7,\xa2\xfb\xd9\x9f\xbf\xf0\x99\xb5z\xdc2\x7f\xab'
+    b'\x1d\xde\x95O:\xf6o\xd0|K7\x14\xcd\x92\x7f\\J\xc9\x97w\x19\xa7t\x8b\xa2 H\x1b\x89<\x91\xf9\x9c\r\x13\xda[\xe704D\xdf\xa6\x98\x0bK\xbew'
+    b"U\x05!d\r\xa8{c\xba\x84'r\xe8\x14\xe4\x996FF!\xa3\xc6Rv\xa78\xa7\x99H\xa1=\xdbxcId\x10S\xf6\x1d\x1b\xa0\xa1\xa9\xd9\xd2q\x85"
+    b')l\xf4~\xbbZ\xf8\x1bv\xa7\x93BdX\teY\x9d\x06<\x10\xf5\x16\xd9\xda\x9f/Ch>l\x1d\xd8}\xae\x02\xdf\xc2\xf8\xcd\xba\xbd\x8f\xfb\xfa\xb2\xbf\x07'
+    b'\x9c\xd8^\x1b\x08\xbb\x84\x9f\xfc\x8d\x0e~\xf2\x91\x9f\x89N\xbc\xa9\xa6\x01%\xc28H"\x88\xb5\x04\x1dmj\x0f\xaa\n\xac\x9e%\xef\x06K\xce\xaa\xf8\xf7\x19~<'
+    b'\x9b\xf9:\x7f\xd7Z\xaa\xf4w\xfbC\xfc\x7f\xb7\x88L\xd2\x96\x8d\x17\xcd<8\xf2iO\x9f\xca\x85\xed\x06\xfa"\xd4\xe2\x81q?]X\x10\x7f\x18r\xc3e\x11\xc5'
+    b'w0/:)k)\xac\xebV\x92\x89#\x1f\xe3\xe9\xa0R\x83\x1e\xfe\x87\xc8\xea\x18\xcc\xca\xe1\x87\x05\xac4\xc3\xf1\xa6h"\xa4D\xd6\x7f\xa4Q7\xaa\xef\xaa\xfa'
+    b'\xc1a\x87\x0c)\x83\x92S\xe9\xbe$\x8e}\xfe{\x96=\xdd\xff\xce\r\'\xa4\xfd\xfd\xdb\xd5\x7fx\x94\xe4UwFHeK\n5\xf9\x92|Y"a\xc1\x15\xf0'
+    b'V \xe6\xda\xf6\xcf\ry&\xd9\xfd\xc5E\x8b\xeak\xaf\xc3\xc1\xc68\x9d(\xe2\xc9\xa7\xf2\xac:\xc5lf\xe7\xe3F`\xca,\xcc=\xd2\x0f\x81\xe3\xb2\xc3\xe6\xea'
+    b'K\xbe\x7f\x10\xf9f\xc8\t6b\x13\xb6\x0eB\x16\x8c:E\xc3\xec^\tH\x1dQg$\xf5\xa0\xbfk,\x08\x06\xb5\xe2\xb2W\xad\x90\x91\x9d\xc6Q\x84v\xc4d'
+    b'\xd1@g\x93\x92\x92Pp\x94\xd9)\xb2T&\xfd\'\x01K\xc7\xc3lh\xb0m\x0e\xfb\xd8\xd2\xceM\xdd\xfe"\xc6\x10\xddl\x9e\xbbT!\x18\x92$\xa4b\xef\xb1'
+    b'\x0c\xb1\xe9\xa1\x07\x1e5X.5\xf6L\xf8\x83\x0c\xdd\xed\x91\xc9\xc8(K\xcb\x9ai\xf3\xc3\xb3g\x83Yq\x0e\xc5}\xa7Do6\xbazA\x86\xb4\xb8\xf2\xb3\x12'
+    b'\xc8k:h\xda\x06c5\x11\xcb\xc9\x9f\x80\xc1G\xffd\xab\xce\x81\xf1\xaa\x08\xf2\xc6\xeb\xd1\x8e8\xbeX\xa2u\x16\xcbw\xd9\xfd\x1es\xde`:`7\x9b\x9d\x85'
+    b'\x85\xf7`F\xbf\xda\xfc7\xa7\xceB\xa6\x84\x10\x80\x08\xf6\xad\xc5P}\x05\xe5Tp[\x1f\xe6\x94\x91\xc8\x9flBi\xcf>\x8f\xb4\xf8\xb2\xbe\xc8\xfd\xfe\x8963'
+    b'f{\x83\xba\xed\xbd\xc4\x06\xfa<\xb20\xe3C\xc3\xeb\xf8\xa2\xfb\xda\xa0\xde\xa8\xe7\xb4\x9fc\xb6C\xe7#5\xd7\xcc\x08<\xca\xcfe\x89M\x04\xd3\x84\xf20$\x06'
+    b'\x02\x0f)7\x14.?\xe9\x96\xd1",\xca\xa1\x1f\x00#\xca\xb0\xaa(\xd3\xd1\xd1\xac\xf3\xbe\xa1\x98\x18\x83\xb2\xcd.+i\x9f1\x99\xde\x88@\x19,\x8a\\9\xb7'
+    b'\xecB \x90\xe0n\xcb\xa4\xa5\xcd\x93\x91\xfcsu\x9bxA\xd7\x16\\\xca`\xd9B\x9d\x12\xaa\xe0\xd4l\xee\xb82\x04\xac\xa7\xa0\xa7g\x84\x01\xcb~\x07\x07\x9aq'
+    b'\xb6E\x96I\xa4S\x7fg\xbb\xcf\x1djTUsGU\x1a!\x1f>l\xa6\xd0c\x89+S\xfa\x9aTw)\xbdj9\xb3&\xc8\xb4s\x8b\x1e\x11\x9c\xf2)8'
+    b'5\x08V\xa9w\xb9\x9b\xfaz\x93\x80\x96\xdf*$0\x97\x93\x17`?\xffMlO(w\xf6p\xe6\xf0\x97\xbe\xb6\xeb\x16\xe6{\xeb\xca\x1el\xda\xd9A\xbb\xdc\xeb'
+    b'\x15\xd6\xc8\xca"o\xea\x80\xe5\xe4\xdc|p\xe2\x10\xf1XPE\xf4n\xacCA\xc0V1\xad\xd0p\x8beaE[\xf5\x0fN\x1b\xfe\xab%R\xe1N\xba\xf5\x8f'
+    b'y\xec\t\xbe\xd6\xfa\x17F\xc5WqA\x7ft)\xf2I\x00\xf8\xfd\x98\xf8\xd8]R\xce\xd9\xfa\xee@\xe7\xf7\xef\xa7\xb0\xc4\x91O\x12\x14\x9d\x0f\x16\x1c\xec\x03-\xa9'
+    b'\x1f\xc2\x90\x936\x9b\xbf\x9c\xca\'\xef"(\xdclQ\xea<\x93^\xa0\xd0\xb6\xb2\xde\xbb\xafXO\xd6\x8c\xb5Y\xff\xbe*\xcdC\xf8\x05\xef\x9ab\xcad\xd5\xf2\x80'
+    b'Y\xad\xc4\xf8E\xdd7\x84\xa9\xec\xccIN\x81\xb4\xc2\x10]\xb2\x8d\xc5!\x88Q]G\xf3\r\x1d\xb6C4x\x80\x98?\xd3\xe5.C\x1a@\x85\x05tO\x96\x16'
+    b'+\x9c\x18\x06\xa9IB\xef\x8f-9g\xbc\x1e\x95\x10\x196\xb01\xb0\x0f!\xc6\x13Xc\x0f\xf8\xd2\xa9\x07K\ns\x15\xbe\xfc\x14\xb0\xa6N\x10";{8\x7f'
+    b'\xe3\x96\x87t*\xb8\xd4\xc9I\xfc\xfby\xa4\xce\xc4a\x1bT\xe3SA\x95\x7f\xd0\xa5\xfd\xec\xd3g9\xa1\xd2\xc7c\xc5\xd2\\u3\xe1\x9c\x1e\x93k\xce\xfa\x97\x1d'
+    b'\x97\xcd\x9d\r(\xc9\xa1\xebZ\x16*\x9c>A\xfd\xf8c\xb3=\x86\x04\x95\xf9\x99\x12a\xc0D\xafZ\x9aT\xbea\xe0\xd9\xc0~>8F\xf0V|\xf0\xe2\x0e['
+    b"\xfb\xa0\xfba\xbf\x9cE\xdb<\xd7\x95\xc5DE\xa7\xf5\xa6\xb5)&\x04((\xc4Gx\xbb\xef\xf5a!\xee\xfd\x1a\x16'gRixC,bf\x84&bK"
+    b'vM\xd0Q\x87\xaf7\xefU-+\xf5\x05\xb0\\\x11\xbcS\xb2\x16\x8f\xfaR^v\xa5\xf2\x03\xaa\xefTg\xb4\x1e\xd8\xdd\x13\xec\x04\xbb\xde\x03\xea\xb9\xfajv%'
+    b'(\x1e\x1f\xf2g\xba\xb3\x94\x14\xe2\xb6\xcb\x7f\xe0\x01\x95\xa8S\xd1\xda\\\xa7\xc4\\K\x00\x05\xc7i\x0cQNe*\x83\xcd\xd1\xd0+#u{\xcc\x8b\xc7s\x04a'
+    b'%\xaa<l\n\xa0J\xa9-&\xdf\xfa\xc2\xee\xb1\x97H\x9e\xfd`9\xe1\xc2l\x17\xe7\xe66i\xce!\x04_\xe1\xe5\xe8a]f\x1e\xe4\x1e\x8e\x1a|\xd7\x83\xc7'
+    b"\xc0\x0c\xd0\xc9E\x06\xfa\xb5\x9arm\xfd\xbe\x17]\xaeIs\xab2tMSE\x85C\x8cC,\x04\xc6\x8c8\x92.\xc2\xb3\xd0\xd0\x86#5\xbd\x9f\x7f\xfd\xdf'"
+    b'\xb1v\xd1\x822\xb1\x81_3\x00J\xfc\xfe\x95\x15\x15z\xc0\xf6\xfb\x96\x1e*E\xff\xe4,)\xc3\x88\xa2\xc0\xd1?\xd35R\x15\x15\x15\xa6U\xd3\x8b\x83\xb9\xee\x96'
+    b'\xcc\x8ao\xea\xfa\x92\xf2\xcf\xe1\x08\t\xd4\ri\x9a\xde\x0e\x9a_-$%\x1f\x8c\x80\x18\xa50+\xbcC\xbb\x96\x96\xca\r\x0f\x89\x9dr\xcc:\xbb\xd9x\xff5c'
+    b'\xd5\xb4z\x05\xca\xcd?\x1f\x80\x93\x06\xa5\x9a\xaf\xa5m\xb4\xe5\x9f\x1b\xdaG\xa9Sq\t.\xd3\xdb\x9a\xcb\x88\xbe<\xd3\xb1\x94\xfa\xaf\xf9\x9f(\xb0\xb5\xb9B\xf6\xe8'
+    b'\xfd\x9c\xf4~chh\xf3\x90\x98\x15\xb1\xecmt\xbb\xfd~\xeb*!\x82\xe2\x14z\x9d\xe3\xb2\xd1,\x97\xad\x9d-\xd1}\xe4\x81\xaa\x1b\xff1\xc9\xfe8\x96\xf5\x9a'
+    b'\x08$\x05\xbcOr\xba\xd2\xe7\xec`\nC\x08\xed\xc5\x1a\x08d\xd2\xb5QO\x9c=\xf3Bo\xfc\xf8\xd1\xc9\x19\x1d\xcd\\ \x98\xe6G\xf8\xb3\xd9\xa8\x06\x86\xcd\xd9'
+    b':\x92\xa0\xa8l?\xd5x\xf24\xb0C^\xbb\xabYy\xd63\xe7\x96\x9c\\\xd367\xf1\x88q^\xc1\x1e\x0b\xd0\xcc \xc5!Y\xddL?k\x04\x04\xeb\xe1c'
+    b'\x8f]\x17*+3\xb5\x13\x13\x96r\x90\x8d?\x99\xf8\xe3\xf6\xe9\xac^\x11e\xdeK9W\x8b\xdf\xb3!\x92\xfbWT0\xa2\xd3`#WPs\xa5\xfd\xf4\x16\xc3'
+    b"\xabok\x9b\x0b\x1c\xb1\x8al\t\xdf\x17>@\xd2j\x96}\x17\xcaNf'd\xfb\xe1\xd4S^D\xe8Q\xdf\xaf\xdeR=M\x84\x96\xcc\xdb\xdda\x91\x84--"
+    b'\xca\xfd\n\xc0\x05*\xe8\x13\x0eF\xa0\xd3\xc8\x81\x9d\x9d\x07\x00E\x897\xd6\xe6\x14\x9b\xcc\xc3\x00\x16\xce\xab\xe9\xac\x8a\x01x\x87\xe0\xb9\xf0\xcc\x1eZB\x98,\xee='
+    b'a\xc0F\x8a\x1c\xb1v\xf0\xae\x95\x07Q\x1c\x01\xe9\x8bn\xdb\xa1\xfa\x97\xaf\xea\xe9\x187\xaa\x8b\x8b\xa3\x81k\x8e\xb0^\xf3F\x9b\xef\xc3R\xb1\x8f\xca\x10\x07]\xb6'
+    b'\x07\xf3*\xe7Y\x8eH\xaa0\xd8\x0b\x0b\xab\x86\x15\xd2\xd51\x9c\xeb\x00\xd4f\xa6\x80\xb3\xec\x95#Wa\xd0\xc9Y\xec^\xc3\x8a\xa0\xcb\xd7\x97\xac\xceY,2\xdf'
+    b'x<<\x11\xd4\xe69\xfc\xb8G\xc2\x8c{\x86\x02 pb\xbf\x86R\xe0\xd6\xa9\xff\xb9\x97\x91,\x15ZdV\x8c>\t^|\x83x4.)(\xd9\x01\x0b.'
+    b"\xc4\x13o\xd3\xc2\x12\xf4\x0bQ\x9f\xbb\xa0pi\xdaD\x83_\x0f\xba/\xb7r\xdbp\xe6\x8c\xf2J/P\x98\x87a\xb0q\xfe\xb3'\xbdkQu?:\xa8\x81\x03"
+    b'Q-\xcd\x18,\x18&\xd5\xb6\xff|\xeew\xf3\xb8\xfa\xec\x058\x9cn\x0c\xc7\x83p~f~\xcct\xac\x0e*\xe9\xce|!\xfd\x03\x84\xf1\xa0\x863O\x8f\x99\xe6'
+    b'\xee[\x7f\x1b\xe3\xbdV*(\x87\x15I\x84\x07$\x8bT&/\x9c\x87\x04\xc6\x0c\x15\xec\xb5\xcd\xcf\x9c}\xdc\xbaDa\xa6\xbf %\xa2D\xe6I+\xe8\x06\xa9\xf3'
+    b'\x86\xe0*\x92\xd4\xd2\xac\x81\x1e\x15.\x1c\x1e\xa6\xc5\x97\xa3\xaa\xc04\xbeIp\xb1*h\xa3\xdbOV\xed\xda\x9c\xe1`h\xa3\x10\x85\xbd\x95\x16\x04[>\xd02\xf0'
+    b")\\/\x02\x8dq\xaeN<\x95f\x97t\x91J\xbey\x80\x9e\x0b\xa4\xc00\xc7b\x04\xefO\xa9&}5\r\xbc\x8b'\xdb[\xb4\x0c\xd71\xc8\x16\xc6\xc9\x19\xa0"
+    b"h\x8d\xa2P\x8e\xd9\x96\xd5]\x82Cs_\xfd\xc2ak\x00)@{'g&\xb3\x1d\xaaKG\xe7\x9c\x83)@R\xf6g\xb4\x9e$y\xea&\xbc[\x9b\x1b\x8b"
+    b"M'\xdel\xf7\xce\xb4B\x9d\xa7\xa0\xfc\x06\xab#g\x1dtQ\x9e\xe6Dz\x1cW\xc7\xf0^\xa5\x02\xc9h\xd3\xa9j\xa8\x94\xe1\xbbd\xa5[\xdb\x9b\xb9\xb9\xee\xd3"
+    b"'5\x95z\x01/\x85\xad\x1e\xda|~\xa9o\x11\x13c\x88.\x1enl\xf4\x1b=_\xf8^c\xec\xe7\xed\xb6\x14\x08\xa3\xe8\xce\x0c\xa3JVj\xd9\x83\xe4\x0cM"
+    b'.,\xe46\x1b\x8c)-\xf80DY3R\xbf\x92l*\xb0Dk\xf1\xed\xa6\xe0\xd2\x00\xcc\xa3\x0b\xd7$\x00>\xca\x9d\xaf\xdaR\xa8\xd1\xf7\x80\x1c\xd8\x9f8\x06'
+    b'\xcf\xf8D\x13\x9a\xd5%\x06\x13\xbd\xdf\x81\x1a\xd1\x16\x10k\xb8\xaf\xf4\xe4\xc7\xe5\xe4|o\xd98H\xee\x8drFw\x14\x88X\x90\xec\xd7\xdf\xfd\xe6T\xf5\xa9<G'
+    b'\xa6\xe7IqG\x1d\xf5\xcb\x1c\xae\xafZ0\x80\x13}t/.\x89\xda\xb5\xb6\xa4n\xddB\x1d\x96\xbd\xae\x1ceV\xce\x8ek\xa6\x9d\xdd\xf8COX\x9bm+\xb2'
+    b'\xb5p f\xa4^E\xb6\x9eD\xeb]\xb3\x01\x0e+\xeb8MI\x9er\x1b\xb6\x87\xb6\xf1\xcc\xa5\x98\xfcS\x18\xe3\xe0\r<\xa0\xeb\xe9M>\xa3\x92:F\xd0\xb6'
+    b'\x82\xe3\x85\xe0\xcaVj\x84"\xd1\xac\x1b\xddc\x98W="U)g\xcc\xfc\xa3\xd8\xd4V\xbb\xf9m\xbcz\xeal\x94\x08Y\xb3\xd4I=\x08\x04\r\x0c%\xf5\xf7'
+    b'\xb5l\xf3\xae\x8f\x11?\xe0\xc5\xb5\xca\xb3U+?\xe1A-\x86V\xb0!\xb5\xea, \xb4\xcf\xf3\x87\xc4%W\x8a/34\x9f\xca\xbc\xa8a\x02\x9e\xa9\x1d\xce\xd0'
+    b'1\xebM\x0b\xab\xfa\xa8\xb9\xbb\xa3\x88\xd1\x81\xc1\x0e\x0b#\x03\xdd\xdd\xdd\xf5\x96\r\x95*\x98\xc0\xdd\x80Y\xf8?\xd5=44\x84\x94f\xaey0@\xd7\xc6\xef\xf8'
+    b'2t>\x84\x99\xf0\xf4\x83\xb7a\r\xa9\x84\xe6\xcaO\x90\xda\x16bIS\xa5\xfa\xef\xda\xb1\xf2\xfa\x07\xc5\xeb,\xa2\x00\xb6\xdb\x03\xbf\x95\x9bG^n)\x1b\x9f\x1e'
+    b'\x8a\xe7j0\xe51>\xbe<Z]e!##S\xd3.?\x11B.\x9et\xf5N\xa5\x10\x8bPqK\xa9\xd0\x7f\x0bN+-\xbd\x13\x17\x17\xff\xa1\xa8\xa8\xf8'
+    b'\xb5Y/\x80FjV?\xefS6\xab\xe0a\x96\xec\xe6\xe7\xde\xdf\xcd\xf6\x9a\xe0\xde\xf3\x9a\xd7,\x93\xcb\x865\x08-\xa5\xe57\xf1\x0c\x94\xb1\xe0D\xdb\xf8YM'
+    b',\xbb\x1a\xe45\xdcTbUHn\xf6\xe5\xf3\xe1\x19\x12jA\x95\xb3[\xf7\xd3\xcfM\xc1\x05m\xe2\x96c}}\x97eW\x0c\xa9u\x14\xbaH\xc6!\x91\xfc\x1c'
+    b'F\x06\xcc\xa29rq\xb61\xc3\x80G@5\x0f\xe2\x86i\xa7=gu\xba\xfa\x18\xdb\xd8\xa8\xfdd\xe3\x94\x0b\xe8h\xee\xbd\x13\xfb\xefZ#Vwa\xa1\xa7y'
+    b'\t5s\xd3\xd3\xf4\xf1c|1+\xac\xca\\V\xcc:$\x18s\xf3\x9a\xc8O#>1\xa4\xe3&\x04I_\xf8\xc7\xa4\x11\\&\xe8\x96\x83\r\x12\xe4\xb9\x88\xd7'
+    b'\x9dI\x9a) \xb7\xc45\xcc\x8c\xf8\xdd\x13\xa5J[\xb6\x13\xed\x0e\xdb\xcc L\x9aUC6>*\x13\x91\x90\xbe\xfe\x91\xeau9\x84\x9f\x87S\xd2T^\xba\xfe'
+    b'\x10\x90Z8K;>\xf6t\x9a\xa2\xdb\xa4\xc0\x9f\xfb -\r\x9dvV\xb2\xb4\xcf\x1b\xf2\x8e\xc0\xed\x05\xa6Q\xc8\xf0\xb3\xe4\xe6\x89v\xd7\x85\xe1\xdb\x01\xea\x95\x83'
+    b'<\xbc1\xd3x\x0eh!\xc1Q\xdfZ\x17\x0b\x83\x98\x9b\xb7\xdbD\x89\x9c\x9f\x9a\x17\x15\x127:{\xc2\xb9\xa5\x15\xb88\xfa\xf5\xeb\xe1\xa6\xc0\xc6t\x8f\xc1\x95\x9d'
+    b'k\xcb\x83\x80\x84~F\\\xf2<vU\xdbE\xfcUfw\xf8\xe2\x8b\x92\xbe\x86\x0b\xbd\x1d\x8e\xef\xb0\x18"6\xaa\xa3q\xc5;\xa0\x08\xb6\xb2\xde\x83Y\xc2\x97\xb7'
+    b"%\xd2\x06\x97OJ\xc5y\xea\x1b^\xe8\x11\x7fu1&\xed\xd3\xfc~i\x1f\xec\x1f\xfa'm#/k\xda:\x0cjC\x7f!\x1evC2iS\xfb\xe6]#"
+    b'o\xfarJ&c\x84@:\x85b;S\x1f\xd2~\x10,w\xdf.\xdf#\xf6\x03\xb9\x04*\xd3f&\x8bZX$b\xa7\xe0\xc3\x07\x97\xd3\xad0\xc2\xab\x07\xef'
+    b'0\xd5=\xffq\r\x97\x9b0\xd3\xe7\x040\xf1\xab\x8d\xe7\x14\xc8\x12\xf41?\xcc\xa0\xd9\xea\xb5\xc6\x05*\x03\x0b\xb4S\xfdbT_\x0e\xaa\x85\xef\xd0\xf5\xe2\xadN'
+    b'\x1d\x9cK\xcd^l\xb8\x06\x7f=\x8d\xfa\xf2\xa0\x8f\xcb#\xcc\xf63\x925z\x00S\xf3:?\x1fu\xdf\xa9c\xa8\xd3\xc4|\x84?\x05\x02\\\x83\x1b\xef\x8e9U'
+    b'\x99\xa78J\x944\xb5p_n5y9@\x03\x89\x81\xbfgg\x81\xc0\x9b\x99\x95\xdewN\xa1w\r6cB\x81\x07\x07<\x8e\x98\xb3\x03\xc2\xa9\x8ep{\xd7'
+    b'H\x9d\x8c\xc0n&\x88Q\xfd\xfeA\xb5\x81\xa5\xdc\xc8t\nA\x0etZx\x0e\xf6I\xbe\x99\xbf\xf7V\x91^\x00\xd9\x1d\xf3c&\xb9\x825"9\x8ab\xf2\xcf'
+    b'JG\x12\x89\x11\xe1p\x06\xf6A\xd4x\x1ck\xb3BN\x94\xb9<\x8a\x89h\xda\xd5\xa9\x86\xc6\x86h\x8aU\xb3?e\xce\x86\xa8n\xdc\x99\x80\x80iQ\xbfgw'
+    b"&\x1b\xbcyN\xfa\xf6\xd3\xe9m\x11')G\xce\xe3\x9a\xeb\xa0)l\xd1\x93\xcd\x96S\xe2s\xc2\x93\xe0\\VM\xc5x\xcf\xca1\xd2\x01\xc6\x88\x8a%g\x86\xb1"
+    b'\xfd\xbcl\x16\xd9g\xc6F\xb3q4\xb48\xdb\xce/s;\x0b!=\xe5\xa3\xf6S\x01+\xc5l\x02\xbf\x0b\x93<\xf8\xf1\xfd\xc5\xdf\xd9.\xe6I\xb8\xc5;\xb9\x04'
+    b'v(\x81\xdc\xb7\xa1\x06\xfcn"\xf48\x84:\x1a\x9dtH\x99Cct\n\xde\xe3\xc2\xecF\xc4\xe0\xf6\xdaGX\xf4\xa0]&M\xda\xaaa\xf14\x89\xd0\xde\xd2'
+    b'\xe7?\xed\xa0\x06Wc\x8f\x82_\xe1\xde\xe7&\x01"\x85)\xc4\xa0n\xa0j\x9b\xaf\x8cM\xfbT\xedd\xb8<\xfdg\xc2\xbf\xc9\x9a\x8cZS\xf4\xdf\xd6\x13\x17\x12'
+    b'y\xf0\x81\xcey\xe9\xedd\xab}\x13\xc5\xc0\xe4\x19\x04\xdb\xa2\xfc\xbb&-\xbb\x93\x05^\x97O\xf3\xd8ms\xda6\x9f\xfd\xdc\xa6\x11\xf0\xe6\xd5\xc4t\x9f\x83\xfa\xda'
+    b'\x92"\xce\xb4A\x05a\xefG\xee\xf8\xd8T~j\x1f\x80\xe5\x1a\x0b\xd1\xa8\xb3\xa4H\xa7\xbb\xdcB\x070\xf8\xa0\x10B\xe9?\x83KH\xb1\x1a\xe7R\x14P\x8f\xec'
+    b'{hY\x9e\xed\xc9\x9b\xa8\xb2q\xbe\x9e3gk\x85\xdb\xc5\xb4/\x8eD\xe6\x8b\x16\x10>\xdf\x8eS\x9b\r\xb8#Av\x17r\xebM\xbd\xac\xf8~|\xd2\xfab'
+    b'\x9e\xd3\xe0\x81\x81\xa2\x07d\xd1\xc1\xb7!\x16*isV{E\xf9\xf6\xd6F\x1a\xd3i5?K\xb5\xd7z\xe3\x90\xd0"\xf5\xecRX\x84]\xdd\xa8.P2\xc6'
+    b'(6\x86Pw\x88\xc9\x16d@E\xa9\x02\x0f\xa6m0\xbf\xdc\xbf6\x93=t\x8e\x90\xae\xd8\xd1\x16\x9eN2\x98\xfdN\xf7T\nI\xf4\x86@\x9evS)\x8d'
+    b'f\x8efR$\x15lx\x0fJ\xbf\x8e@\xad\x80\xc7\x96\x96\xd2\x7f"$d\xbf: t\x95\x93N\n\x94\x1c\xf2\x96\'\x04}\x03\xcb\xa9\xec\x9d\xec\x16\xd9%s'
+    b'A\x08\x1b\x94p\x93\xf0 \x1f\xd8\x82+\x8c\xd7&>\x06\xd4\xf6d\xaci\xed\x15Q\xf4\x03{{V\x9eQ\xbby\x97\x97)\xa3\xa5a\xef\xe0\x9e\x1a[\xb5\x90\x1d'
+    b'\xe2G^s\xfd\xa2\x0fO\xfd\x8e\xd3/1\xe2\x0e\x91B\x94\xac\x04\xfc{\x16-\xbb\xfb\xc7\xc5\xc5\x85L\xc4\xcc,\x940:\x85\xbfj_\x9d\xd5`\xd7\xbc\xe8\xc0'
+    b'\x9b)0\x81w\x92\xe8\xa5\x90M1\x9d\xd5\x9f.\xab\x17\xbc\x8e\x8b\xb72\x84\xa8`*C+\x9c\xd5\x8f\xdfQ\x05\xcd\xe1\xcdG~\x87\xe2\x97\x1b(?\xb7\x05_'
+    b'\xb1\xb0\xd3\x87\xed\xedX_\xdf|\xdc\xd8\x18M:\xe4\xb5L bh\xc8\xb9E\x9du\x19\x1e\xd0L\x037V&\x07\xa4\xb6\n\x82o\xf8\xa3^\x1c\xa4\x95\xe1\x81'
+    b'\x0e\x9c\x0c\x0c\xc6\xa0\x83\\\x9a\xab$\xb1\xc7g\xd5))\x9d\xc7\xe2\x89\xb5\x8f\xf8j-\xe2CqR\x92\xda\x12\x18\xbcx\xc3bMb\xb6\xb3\x01Y\t\x97\xda\x92'
+    b'\xd3e\'"\x14m\x89\xe8}\xff\xec\xcdD\n\xc3/\xbb\xbe\xd4\x85\x12\x01Ev\xc3q4#1\x976X\xf0$\xd9\xde\x9f\x98W\x02\x95h\xa7R\xe7\xd6\xcd\xa4'
+    b'\x03\xb7\x9b\xaa\x97@l\x0c\xbb\xb2u\t\xf9\xf3\x1a\xa3\x86\xba\xd9\xbd\x85\xc46\xbf\xf6:\x8fK\xd1\xa6\x1e[W\xbf\x16\xddz\xc6W-\xf7V\x15\x87l3#\x87'
+    b'$Y\xadN\xb3\x1b\x7f\xeb\xf37\x10x\x14\xd8\xca*\xc6^\xe1\x98K-\xb4\xa8\x82\xe2\x83\xc8\xb8\xb6\xa0Y\x99N\xaa\xa79\xef\xa9\xd6\xbbv\ro\xa5\xe40\x9b'
+    b'<\xb8\xe6N\x0e\xc8\x9fz\xd5\xdeF.\x81WM\x80w\xaf\x16f\xdd\x9c\x96@~\xc5\xac\xed0\x1a\x08\x11_\xd1\xc2J\xc9NQM\xa4G!eQG\x08V'
+    b'\x89s\xa6\xa5\x12\x169-\xf9?\x15\x03<\x97{\xf3\xf2\xd7}5?e\xa9)\xcdG:M\xc8\x9c\xd1\x03w\x8b\xed\xfbB\xafJ=A\x8c\x8elTA\xa9y'
+    b'O\xcc\xea\xce\x01\xffS\xcf\x8at!\xc0\xa4\xd5k3@\xc1`\x98o\x84\xad\xf4\xc3YUr6\xb7\xd1kx\xe6\xd9_\xb4\x0fV\x14k2\x81\x8c\xfa\xa8\xf5\x92'
+    b'\x0f\xf9\xaf\x8a\xaf|\x80\x06\x0e6\xbb\x14\xda\x87\xe1\x06M\x8f\x18\x9b\xcc_\xb10\xbe\xfe\x1c\x90\xb1r\xc8R\xaf\xad\x84\x16\x05\xe4\x11\xc1\xae\x19\xb0;\xff(\x97\x16'
+    b"\xfai\x07\xacw\xe9:\xd5\x92\xbd\xbb>\xdd<\xc3\xa0\xe4\x9c\x96\xd5\xd4\xd0\x11\xa6u[n\x90\xbf\xba\xa1\xc3j\\\x07\xa2\xc5\xbf:;~9'\x1eZ\xcf4\xe1"
+    b'6<7\xe7\x18\xb8Os\xd98x\x81\xda_\x84pX\xcdh\x80\x9e\xb3\xb1\x14-6\xd9|\x9f\xe2\x8c\x8e:\xfcom\x93g\x8ch\xe7\xdb\x00\xd7\x96\x98\xb7!'
+    b'\x0fs\xcd\xec\xde\x8a\x94e\x84\x93u\x01\xefi:\x02\x93(M7\x8c\x80\xa4R,\xe3\x95\xd0\x0b[\xb1_\x96\xa5\x99)\xcbB-q\xde~\xcd\xaa\xfd\x97P:'
+    b"\xc8\xca\x0f\xca*\xf1R\x8c\xa7\xb1$]\xde;\x93\xe5wc\x03\x03\x03\x0fF\xbd&\x99\xf6FJ\x14b^\xd2'\x8c\x1b\xd6\xf1\x97\x19\xed\xe54\xff^\xa4O{"
+    b"g\xd1i\xf6\xc73\xf1\xd7\xdeo\xb69\x13\x1f\x02\xef\xa0 \xf3\x0c\xf4\xf9'\xb8;\xcf\xebn\xcb\xa4i\xe7\xf4]\x97\x997x\x9d\x97U\xd3\x8c\xbb\xe8\xf6f\xf3"
+    b'\x1e:\x90\x0c\x8c\x05\x10~\x1a\x13_`\xc9s\xb3\xa9\xe8t\xf5\x92MRB@C+\xc7)\x91\x14\xbf\x1d\xb7O\xeeI\x05y\xf2|\x04w5\xcf\x9c\xc4\x10k'
+    b'\x10~\x1f8I\xac\xc92\xac\xc6\xcf\xf8\x19g\x06\x1d\xde\xc1\xdc\xf1+\x93\xf6\xa3w6=\xaa\xb6\xf1\x01\x14\xbc.\xac\xf8\xe6d\xab\x02\x89b\xa7\xb7Y\xcd\xb6L'
+    b'\x8c\x8c\x1b\xccX\x8f\xa2\x0e}\n\xa3\n\xb4\x14_\x8b0\x04\x88\x02\x16\x96\x97\xe2\x92\xa3.[o.!g\x97\x0b\xb5\xd2+\xf0\x00`u\x99\x80\x94\x11\xf0 \x12'
+    b'\xe0\xf7\xf1-\xc0\x99n\xd0\x12\xa5_\xa8s\xca\xf5\xec\xcb1r\xf3$\xf6\x10\x95R\x81\xd2;\xc0\xfd\xa7\xf7\xc0\xe7\xe3b\xbf%F\xef^\xae\xe3=L1F\xad'
+    b"II?t5\xf0\xe9Xr\xfd\xa2\xb2Z\xdd\x802\xfe\xa4\xf4l\xe8\xa3\xc9\xca\xf4l[V\x8c\xd1\xeb\xf8\xdf\xef\xd6\x19\x8b\x02G\xfe5\x1a\xc1\xad\xd8\xec\xd6'"
+    b'\xa8\xe7sA\x1ej>3S~\xab\xf8\xaeQD\x9aI2\x9bvI\x14U0\x0f9!/u7}\xd8W0N\xe7\xc8\xf6\xb1\xac\xfa\xda\x13\xe5\xc72\xbe\x89'
+    b"\xafDN\x85\xf0\xe4'Z\xdf(-\x17Au\xb6\xb4s\x1c_<\x98\xaf\x1d\x93=\xcaD\x86\x87\xc5\xfc\x8e\xa4\xf0\xad:\x17\xdbP8\xeb=\xc9\x90\x14\x19!|"
+    b'\xb3\xc3\x9f)0P\\~\xf1L0\x8d\xea\x86&\x8c\xf0\xb4\xa3G\x18Z0\xf0\x0c~\xfd\x01K\xc1\xfa{\x16\x16\x90\x0b\xc7\xa4H\x93B\x97\x1dcI\x94\xfa\xa5'
+    b'XU\xc0\xd3\x9fw8\xf2\x87\x03\xd4\xb3\xaf\xe3\xfd\x1a\xc1\xc2n\x0f\x0c\x13\xf6\x19IO]\xe6\xb9\xea\xb8\xca\x9dV\xb6\x14q\x05C5\x15\xfc\xc3\xf2\xa5>\xc6\xd4'
+    b'o\xef\xed\x99}y:\xf895BZ\x97\xca\xa6\xcbX\xa1=6l\x14z\xa5\xcf\x16\xf8\x82\xb6\xef\t\xc9\xbeM\xca\x8a-2p\xbd`\xba\xf0k&\xa8\xe5\xf1'
+    b'\x94\xb7Nlk*\x0fuJ\x8c3q\x9f\x04\xc8;\x0ew\x8cuU\x0f)\xc3\x1e!\xd2[\xff\xa5\xcc\xdc\xb2\xc0\xdf\xcaU4\xf7\xee\xdc\xb1\xda\x9b\xfa\xeb\xb3\x9e'
+    b'\xcb\xdbD\n\xa7\xa6a:\xc6w\x1a\x9a\x94_\xc9\x03{~g\x08\x8a\x13Y4E\xc5^\x1e{\x82a&\xbd\xfb\x87\x9d\x90i\xd8\xa7\xf9\xd1\xc0XO\xef~M'
+    b'\xb1\xa5\xfc\xee\xb3k\xb2\xd8cV{Y\xd7\xc1.\xe3\x04Y\xb5\xa0\xfbk\xe9\xc0r\xe8\x97\xadn\xa822\x8fv\x1aU\xb5\xdb\xbf\x8c\xe9\xd52\xabc\xfb\xf1='
+    b'\xc0\xb7O\xdf6\xa7\x87PQ\xd1]2\xa3g2\x1be\x85vv\x15\xde\xb3\x8dW0\xd9\x07q\xd5\xf7\x86\x0cM\xbe\xde\xac\x81_G\x95t,\xc4\xcb\x99\xa0i'
+    b'\xb0j\x18\xe5(B\xcf\x9d\x98\xa6\x11a;\x9d\x08\x8b\t\x97[\xb4\xe0\x9f\x8d\xdd>\xcf;\xaf<\xd0\x98\xca\x8c\x05\xfb5\xed\xe2Q\xad\x17\xfa\xe4y|C\x9e>'
+    b'z\x04\x9e\xd4\xaf\xfeK\r\x16\xf8\xba-\xdd\x96-\xac\xb3\xba6\x9c\x92B\xbe\xbf\xc7\xd6\xc1\x9b\xee\xa51\xd5kP"\xbc`\xf0\xb7\r\xc6\xfe*\xe6\xb8I\xceI'
+    b'\xa4\x82\x199q\xb5N\xca\xd6\r^\xfb\xf6\x84\x90\xee3\x95\x08\xfd\x11\xaf\xf1aP\x97\xf8\xbbO3")\xdb<(\xc6M\x9c\x87\x1b&\xe4wx\xc0\'\xe3\x06'
+    b'~\xcdz\x93S\x0f\xbfr\xaf|\xf0\xe14\xab\xa6\x1f\x06Pz0F\x98E\\\xae/ \x89\xcc\xeb\xed\xbcY\x86\xdc%\xe7CrZ\tZN\xfa\xa6P||'
+    b'\x99rF\r\xb3\xeeR\x9c\x15\x9eL\xae\xa8j\x03~\xe0\x8b\xb9\x8d\xc1ON\x86T\xbaY\xed\xf8D\xb7\xe7\x11A\xec\xd0\xb4\x1f\x0c\xf3\x9f\xd9g\xe8"\xf3\xcd\x16'
+    b'y\xd2\x7f\x02=\xe02\xd3;iK\x82\x1d\x8d\x87y\x06w\x9a\xa0\x10\xda\xec#Hg\xd4Q\x97\xd3\x96\x9d_|\xfcb\xa6\xe6\t8\x83d\xc1\xfd\xb1\x0c\xd0\\'
+    b'k*\xb3\xf9\xf0-f_(\xf0{m\xbb\xf5\xbbw\x0f\xe5[ \x9b?\xcb\x81\xaa\xca\x06\x14\x95M\x88\xdd\xfc\xfb\x974\x17\x03\xd6W5\xf1\xbf\xc9A\xa2;\xce'
+    b'/\x05\xd0\x9b\'\x88\x9b\x9f\x11\xec\xac\xaf\xf5\xc9\xfa"\xff\x8a\xc3z\x95Ku7\x98{\xcd\x9bT\xa5YOu_\x9al\xb8\x00\xc9\x02\xd2\xac\xb8\xb7\xfaMp\x8a'
+    b'\x9cc\x9c\xb8g\xd4|{P\x83\x0c\xcd\x84\xf8\xa0\x86q\x0f\xf2\xd7\x19q\xde\xbf\xf6\xd0sK+wC\x89\xdb\xbd\xe1\xd0\r\xa6/\xd9}\xfa\x0f/\x9f\x85\x19*'
+    b'm)\xdf4\xe6\xbd\x8fs\xec\xdc\x1d\xb1H\xbd\xc8\x1e\x8ez\x1cs<\x02\xfcEH\xa1\xde\x01\x8d\xe0\xc0@\xd7\x1a\x83+J\xa9\xf3Z\xb6\x91W8\xac\xf6F)'
+    b".@\x90\xc3\xa9\xa7\xcd2\xb3pn\xb5e\x83\xca\xfd\x07'\x1bssu<\x93,as\x98\xf2\xc4\x80\xd5\xc4\x94\x14\xcc\xbfq\xdd\x94\xdc\xe9\xc6\t\xc7\x8832"
+    b'yl:|8+\x9d\xd4\xaetz/Bo\x1d\x14$\r\xf7\x8c\x7f\xec\x80\x8e\xf2\xd9\xe3L\xe6\x0bd\xd0x\xcd\xc1\xc5f\xb5(.tR\xba\xc8\xed\x1e\xfe7'
+    b'\xe6\x87\x0eA\x8c\x96\x0f|\xefs\x80W(\x83M\x9e\xce\x96\x1a\xc5\xf4y\xe3\xf6\x9f\x0b\xa1=\x9c|\xfe\xf4\x8c&\xb0\x9c\x00\x1b4\x8b\xb8(\xc8\xef\xa6\xc3G\xee'
+    b'^\xdf\xfa\xfa:NX\x86\x96x1\xa5\xa2\x7fX\xb6\x03nv$y\xb2a\x83\xac\x01s\x11\x9e\x1e\xd0l}0?\x16M\xd7p\xba\xdc\x99]4s\xd8\xa7\x1f'
+    b"\x8auT.\xe8@\x99e\xdf\x05\xd7\xa4j\xa1\xe9\n\xa7\xb6\\\xb4\x96\x8d\x01\xc7\x15\x0f\x10_\x18\xdacPcX(@p'\xe9\x99\xa1U\x802\xcf:7>"
+    b'C\xa3\xf9~\xf4\xda\x05N\x92\xe8\x01\xc2\xe9\x0eD\xfe\xee\xb7l\xdc\x06+\xfa5\xd3\x8b\x15\xe9\xbc\xe7\x9d\x05!\xa1iM\xeaTKI"I\x01\x94ow\x1f\xd3'
+    b"\xb5/J\xf8)\xa9\xea\x1b\xae23\xede_\xa9)\xb5\xbe\xde\xeck\x1dJ1)\xec\x1d1\x06\x9f\xad\xb5\x11\xea\xf4<\x80\xe3\x9b\xfc\x1bKZ\xb4C'\xc8\x94"
+    b'\x9c\x83j\xd9XJ\x8c\xb7\xf8\xcb\xfdc\x14Jb\xa8\xaf\x8bcDN\x8b\xf6\x99>p\x01\xa1\xbf\xa7g\xfd\xe6+\xd4\xf9\x03\xf6\x17\x8d>~\xbc/\x9f\x89>\x17'
+    b'\xc0\x99\xe0\x80\x99h\xc35J\xaeJ\x13\xed\xc12\x80B7\x7f\xc2\xa2\x8d\xe1\xb4\xc0\x96\xad\x90\xed\xb2z\xfc\xb7e\xb9`\xae\t0\xb8\x06\x9d%5\x91t@\xb0'
+    b"a\xba3\xb0\xbd\xddf\x13\xdf\xffytu\xa4'tL\xc6\xf8\xad\xa3\xea\x03AM\xc5\x94\xcb2\xd3:\x08j\xc9JS_r\xaf\xb6\xa9\xb9\xa6\x86W7\xa5\xd7"
+    b'\x1a\xc5\x1dg\xde\xe6\xe9\xed]\xe6Kd\x9f\xee\xc9"d\xf0\x11w\x07\xc7\x1d\xb3\x8d\x0f\xc9\xcbF\x17\xb7\xb5\x89\xb1\xae\xda\xa5\x86^\x806l\xe2qSD\x81\xf6'
+    b'g\xaf\xf5\xb2JA\x7f\x03\x9aUPME\xc9T\xa7J\xe4\x15;\xdfa\xd3\xde\xaa+\xdb\x7f\xa6k\xd4\x19\x94U\xdc\x8dSz=\x97\x9b\x0e\xb5\xcem)u\x91'
+    b'7\xfat\xfec\xb6\x97\x89\xb4\xf9\xfc%?x-\xea\xb9\x91\x15\x92\xaa>\x9a\xf5\xb1\xf6\xf4\x81\xcb\x87f\xad\xae\x0c\xe9t\xa8\x8d\xf7\xc5Z\x9e\xe4\n (\xa8\xe1'
+    b'=\xf3\x18W\x03\x0b\x81\x0eo\xb3\x1er9?7\xec5\x88y\x7fw\x97\xe7\x80K\xd3\xf6\xd6\xd1\xa2b\x98\xbd\\\x8f\xfb7\xf2c\x9d\x91\x05\x966\x0f?\xeb/'
+    b'ou\xa3\x88\x9dr\xa8N\xa54\x17\x9f\xc8\x04\xa5\xfa\xa3\x82\xbd(r\xe5\x96Q\xd5YG\x95RR\x98a\xd8\xa9\xa8U\x8e\x06\xbc\x0c\x9a\xcb94\xe8F\xc0\x02'
+    b'c)\xfe\xd6\xb5D\xf3\xadM\x91\xc8\xecL\x08\x95\xfd\xaa\xcf0\xdayy\xec\xc2\x86\x90P"\xe35*\x89\xf5:"\xdf\xb69{H0\xe2\x07\xe2\xe6\xf0\xfb\xe6'
+    b'\x89\x170\x80\x81\xfe\xf5\xc6\x1f\xbd\n\xaa\xad\xcf9f\xa5U\x8a2\xe8}\xf9\xf4\x97\xf0(\xcd\xb4\xf3\xb4\xa6\xa6f\xcb\xe7\xedy\t8Do\x95\x03\x0b\x89\\\x8c'
+    b'\xe4[7\x82\xb4eJ\xe1G\x1bGGb\x1c\x83{\xb11y\xe0\xb1-\xa5O\xcb\x11\xc5\xac\xbfU\x12\x94\xa7\xbby\xbf\xc3/\xd6\x1f\x8a\xd7\xd8N\x94L\x9dB'
+    b'\xca`\x96\xb7\xca\xa5\x94\x81WW\xfc\x1c\xab\xf9\x97\xea\xd7\x91\xc3kk\xc7\xeb\x8dz\x88u\x0b\xca\xd1\xa7\xb3\x0bS"\xc1fDk\xa3\x98\xa5\xc9\xbf\xe4\'\xa1\xa1'
+    b'/\xc83\x18\xcf}ekz\xa2\xb2\x8b\x03\x98\xaa\xe2\x88\xf0\xc6\xb6\xab\rnk*\xf5`EG\xa3\xb3\xce\xa2\xf5F5!S\xa3b\xeeOKD\xc1\xd9\xe7\xd0'
+    b'\xc07[7\xdf"I[^\x8a*\xe9\'\x0c\xfaV\xdd\n:\xc4\x96\xcf\xdf&P4\x91\xf6\xa9\xa4l\x161-\xbd\x91?T\xbc\xbd\xed>\xb7\xfc\x06\x1f\x01\x81'
+    b"R2\xed\r(?\x80C\x9b\x9a\xcdC|J'\x88\x9a\xeat9\xaf\xc2\xe1B(\xd1\xc1\xed<\xa9\xca\xdf\x13\x9e\x8fO\xd8\x8e\x86\x0c^\x89#\xf6{\xda\xa0\xbb"
+    b'\xae\xa9-\xd1t\xe6X\xd1G\xcb\x900\xa8\xfd\x059o\xeb,B_\xdc\xd0\xe0\xfe\xdf\x83\x12\xaf\xfb\xac\x1b\xb1\xe8bM\xc3\x04\x04\xa40\xea(\x08`\x1e!X'
+    b"g\xfa\xd6j\xd9\xe0b\xdc\xd2\x91\xacp\xc1(\xe87H\xe1\xcbs\x84\xfc\xbe\xa2q\xf6\x84 \xc6\xf7\xdf\xfa\xaa\x9a\x8f\x97j\xffF'tn\xd2\xd6/\xebw\xd1"
+    b'\x81\xe6\x1d\xde;\xb1%\x81J\x90c\xb2w\xba[Z\xc8\x1bQ\xaa\xf5O\x10\x9e\xf4^W\x1cf\xe8\xec^\xd2\xbf\xc9\xdb\x16\xd3\xd1%\xcf\x95`\x1f\xc3\x9b\xf4\x97'
+    b"\xe5QJ\xa09Xah\xd1os\xe2\xb7\x07\xc5Z\xfb\x91\xa9z\r\xb3\xbd\xe3\x16\xfc\xa1\xfd\\\xc3\xa4'\xde\xbc\xc6\xf8\x05\xa9zNv\xda\xb0\xa0\x96\x98\xf7\x1e"
+    b'*\xba\x97\x02z\xfdE\xa6\xb6(\xdd\xb2\xe0M\x85\xfc\x98K\xb6\x93[9\xac>\xeb\xe5\x87\xf64Y6\x84\xd2\x02\x81\x10H\x9a\x05\xb9\\P\x93\xd4\xe6gMx'
+    b'W;_`\x03\xa8L\'\x98&\xacAnG\x13#\xd3<\xd9\xd8\xa8\x16{\x8c\xca\x07\xc3A\\J\xc8[2\x13\x04\xf7\xd8\x8f\x1f\xff\xbd\xea(\xd2\x93p"\x04'
+    b'w\x1b\xf0\xe4\x8f \xec*l\x16\xa0\x1c\x99\xecO\xe0\xfbY\x97V\xd8\x00\x0c\x03\x14n\xe0\x82^|\xc6\xe2\x9arZp\xdaw\x86\xaf7\x82\x03\xca\x96s\x16\x9e'
+    b'\xc8\xdc=;\xbf\x7f?\xcf\xb4\xce(\xd8\xdd\xdd]\xaf\xce\xe8&\xc8\xcc\xb8\xce\x08jT\xb3\xfc)\xcf7/\x17}?lc\x80Z\x00\xbc\\\xc8g\xc2q\x9b='
+    b"\xb3\nPL\x8a@w\x15\x907\x85\x991n\x07\x8f\xe9\xfcG/.\xfcM\x1bf\x9f\x06\x84\xea\xc3\xe1\x107aTd\xf6\x7f&JU\xfd'8\x8f\x0e\x05i"
+    b'.\x15c=\x1b\xfa\xf4\xe1%\x9b\xcczo=\x0b\xc0\x81\x06\x1a\x1bX\xb2\xc1\xf7\xb5\x12\xe4\xf5/\x03\x0c\x94\xd8\xc7\xc0\xc1\xac8\xa5#W\x18\xb9\xc9n\xafM\xfd'
+    b'\xc1\xa1\xa1\xa9\xea\xea\xea\x0c\\\xab\\\xbbe\xa9\xd8\x14\xa0\xcb\xf1{\x1c\r\x17\x92\x9aL\xa6\x9a\xc0\x89_\x83\xe0\xe3\xc7\xe7O\x9e\xa0\xe2Y\x17\xab\xa1\x7f\xf2!!'
+    b'\xc6\xb0\xebAlZ\xc7mKFE\x95)\xfaH\x08\xa2\xdeki\xdfA\xee\xaf\xa5\xb1j\xca=V\xb80\xb8\xbf6\x85\xbd\xa3\x9c\xfcK\xedT\x83&\xa6\x086'
+    b'\r\xcb\xe4\xb3\xec\xee0\xe8\x92V\xea\x1e\xc2\xba\xe7\xfceL\x8d\xa1\xa1-\xd1\x9e\xd4\xe4\xdf\x86y\xc9Lz\x95\xd8\x0c\xd5,\x01\x8e\xba\xe0\xdc\xdd]\x92\x04\xe5\xa7'
+    b'\x03\xad\x1c]C\xa7\x8c8E3=\xcf\xc1\x83\x1a\xc6\t\xb0\xf1\xf1\xae\xbce\x1b\x95\xbf0\xacM\x17\x0b\xbc\xc2`N\xa2\x82\xac\xec\x91\xe3n\xcb\xea\x19yw_'
+    b'\xc15\xd3\x08l\xf8\xf6\xf6B\xee\xe6m\x87\x18\xfa\xf5h\x07\xc2\x02\x03|\ro&<\xe6\xe4\xb3\x0e@\xe5\xbf\xda\x7f)3\x8c\x90\xe9\x1c\xe7!\xb5\x96]wf'
+    b'\xf1b\x8d \xeaK\x03\xbb\xdb\xa0\xdc\xcdfV\xee0\x80<\xdb\x9d\xac:\x90\x16\x03B\xdedO-\xdf\xb1=(6\x1c\xa1\x9en\x9e\x9d\xff\xf5p\x96!\xe1@'
+    b'f\xf3\xc4=\r,6@\xf7\xd1\xe1V\xc7\xaf\xfck\xfd\x84c\x90\x98\xb6\xce\xe0?P\x06\x82\xf6(\x9a\t\x8d\x1bf\xfbS{zBlB\xfc\xb0\x9d\xa3\xa7s'
+    b'\x85\x8e\x99Y{L\xee.\x88W\xeb\x04\xdf\x93MZy\xa8<\xb0\x9b\xc9\xb8\xf6\x8d\xe7\x89\xd6\xeaw\xaa\xa74K\xf4\x0fU\r7B\n\xd9\xb5\xd3\xe8X\xd9R'
+    b'b\xba\xe2Tu\x0c\x917\x02\n\xe8\x93\xf2\x9b\x9bP\x1a\xa5\x9e\xa7l\r\xb9\xdd\xe1C\x01\xa1\x87\xc3\xa3[@\x18\xc3\x03\x07\x02\xed\xe2\xb2\x01\x06\xf7 f\xd3\xba'
+    b'\xd9/`\xed\xd9\xa5o\xcfI\x8f\x84\xfcZ\xcas\x9fL\x1c\xf3\xc2\x03\xed\xb1\xe0\x91"p\xc9\xce\x16^\xb5\xac\xd2\xf7\x1b\x81y\xbfi({\x8fU\x13O\xb8P'
+    b'\x13\x11\xec\xbd\xd3\xd7\xe7R\xba\xbb`\xf8nRb\xf6i\xa7\xb1\x10\x0fe5\xd0\x80{\xf4\xdd\xd6d\xf7\xa4\xfd$e\xcbn>\xa8t\xe2\xc2\xde\x0fv\x8d\xadV'
+    b"(\xa7` n\x8f\xff\xab\xf2\xc9`\x95\xee[G\xc1\xb0\x16\xd3\x04\xf2\x81\r's\xdfl,\xf5\xbc\x10\xff\x81..n\xafm@1z\x1e\xf6\x1a\xd0  \xcc"
+    b'\x8a\x17S\xc3\x8d\x8df5\xd3\xd0\x86\xd9\xbd\xd6\x87\x7f\x8f\x05\xe4i@\xa3\xbf\xf9\t\x86\x82tP\x81\x00\x95\\\xe7\x1e\xd7\xc4_&\\\xb6&\xb7?\xde\xa9\xe6\x87'
+    b'\xd9c\xf7\xb3YX\xec+\xe8\xd6\xc9\xcd\xabEXX\xaf\x99\xc2\xe4\xd0j_\x9fE\x15En\xa5\x93\x92!\xbbBsc\xde\xe7o\x9aE\xdas\xcb\x96\x81f\x81'
+    b'\xf65"\x1enw\xbb\x92\xc0\x858\xae\x8do\x7f\x1d\xd1\n%\xd8D\xfc\xa7T\x8a\x17Z-$\xa8E\xf4\x0c\xbd\x12\xb95\xad*\xe1R\x06\x1b\xfd\xb2jF\x1b'
+    b'iZ?0^N\xaa\xfa\x9e\xcb\xe7\x8d?\xda\x8a\xaf<\x963r\xe7G!\x04\x96\x1ek\xa7\x85\xa1\x81\xdd\x96r\xf6\x079I\x9d\xce\x14Jq\x03Q\x13\x13~'
+    b"\x03\x14nep\xe3\xbf\xf1TG\x97\xce-\xbbXwj]@\xa3\rv\xbd\xecp\x1b\x1c\xa7(\x98\x99m\x93\xcf\xc3PQ\xe6\xf7#`Y\x15w2\x12B'"
+    b"\xff\xb5nW\x1d\x8b\xdbsz\xd5\x04\x9ek\x94Y\x19\xe6\x81-'\xff>\xa6c\xdc\xb8\xbe\xc9\xce\x0c\xf2\xb2\x07\xc6~\xba\xbc\x847\xe3\x19\xafr\x1d\xc8\x8e\x98\xe3"
+    b'\xe9\xd1\xc0\xee\xc1L\x1a\xa0\n\xf0\xb7\xab{\xff\xa6!9g\xeaoH9:D\xe2\x82\xe2\xb2\xb8\xc5\xea\x16D\x1b~\xc0?\xd9\x9f\xf3\xfct\x01S\xe1\x08\x1c@'
+    b'\x8dh\x99\xea\xc9=8\x1f\x08J^ER\xac\xb7\xcd\x1bK?\xd14\xd1\x91N\xa3nu;\xf0\x83#[\xca\xa3<\xef\xaf\xf5\xccM\x08\xb6b\x85\xa8\xf7\x1fd'
+    b'H=\x1bk\x17N_0\xd6\x14\xac\xf1\xf2s\xe6_\x8bU\xda\x8c\x19\xba\x99\xd4<B\xd1\xc2\xf2\xa5\xac\x82\x9e\x8fb\xd6\x1bk\x13\xb7t\xc1\x93tV|l\xe7'
+    b"\xce\xf6$u!\xcf4\xefz\xaf#\xc5\xb3|\xe1yb\xcfR\xf5\xb3\xe5\xfa\xe1#8\xf26\x8bt\xea\xe5V\x0cXGi\x1e\xc3D\xdd\xd4'\xd8\x89m\x94\xce"
+    b'\x8e\x8e\xeb\x9ep\x81\x03\xb3\x03qh\xbf\xbftc\xc0\xf9n\xc9B\xdc\x9fU\xa5ob\xc2V\x91X&$j\x0f\xba\xf6?\xcb\xc0\xac\xe1\xc8W\xb9\x12\xaf\xc3+'
+    b'\x02\xf7\xde7\xf58\xbc]5\x00\x04\x9e\xc1\xaf\xbe\xf5r\x83\xacp\xe5?\xd1\n\x1cf12\xf5\x80\xbd\xfc/f)\xd6O\r\xdf\xfd\xe2\x8a\x1dYp\x8aXL'
+    b"\x92\x9c\xed\x1cb\xa3\xfa\x8di\nn\xba\x94f\x1c~XHw\xf7l\xf6\xca\xa3y\x05\xf3'\x1bT\xa4\x0c\x87\x9a$X[#?\xc7\xd4\xe7:\x8b\xb4\xfa\xf9\xf8"
+    b'\xa4\xeb4\x0c\xc5\xa6\xa4\x84\x86\xff\xe0\x10\x1cL\x02\x88"\xbf\x08\xe0\xbe;\x8d\xd7\xb7\xf7z\x97\x83y\xe5g\x13\xac\x90s\xe6Jt\x8f0\xa0\x7f|\xfcF\xdd\xa8'
+    b'\xd6?V=u\x8dN\xa1\x12|(\x86Ej\x9d\x86\xd9P\xb1\x066\xc59\xe3\x08\x99\x05\x95W\x03277\x85\x9e\xf0\x86x\xc1{\x142\xf8\xab\xd0je['
+    b'\x8cN\xe9\x7fC\x93\x029\x81w:\xebf+B\x99\xdfR\xbe\xd8\xc7\xd9E\x82\xachR^\xe1\xd2\x81\x1e*R\xd8\xdc\xd6\x1d\xbe\xde\x0c\x15\xfb\xb5gU\x98\xb3'
+    b'BO\x05l\xd7\x1b,od\x85\xbeRx\xf6\xb3\x8d5\xea\xcb\xa8\x84\x9f\xad\xb5(\x8d}wL\x17\xcb\xf1\xed\xafo\xb5\\\xf6\x8fR4\x9f\x8cn\xf9\xe1lW'
+    b'h\xe6\xe6<3\xed\xfa\xb5\xb7\x82;\xde\xfb\xfe\xed*\x9a\xa4k\x84kXB\x10\x7f\xe3\x9bM\xfd\xb0\xe0)\x0eU7\t\xe4\\D\xea]]\xb3e\x83\xb6w\xe6'
+    b'H(*m\x83\x1c\xb9\xb3\x18\x00\x1a\xbd\xfa\xb7\xc4d\xe1Cf\x1c\xd1&5\xe1I`-\xd6/\xa9g<\x8f\xd5\xd7\xd7\xff\xc1\xd7?\n\xdc\x16a[]_w'
+    b'#\x18\x81\x99\x86\x92\xc4\n\xc2E\x95]\x87/\xc7:\xcb\xf4.a\x0bQQ\x87R\x8f\xb6n\x8e;\x9d\xd9\xd5\x07\xcf\x13\x94mo\xb0\xe0e\xe5\x85\xb8\xf1\x8b\x17'
+    b'\x14G\x85VV\xea\x99\x88H\x88\xfc\x1d\x01\xfe\x04\xd9\x1dB\xa7\xa1\xee\xf7\xc9"\xeb\xeb\xebS\xb14y\xe7\x8d\xe8.\xf9!A\x93\x92\xe9\xc6\xf8\xa4{\x9d\x8es'
+    b'y,\x8b\xb3\xd9eV\xa5cd\xb3\x8e\xf0\xe2)\xab\xfd\xa3i\x88X|\xfc\xfd\xec\xedEu=\x10\xd0e\xfdn\xa3Sf\xd3\xab?\xc0\x8a\xac\x13\x8f.\x1f\xe4'
+    b'}0\xe9u\xa9\x8f\x1bd\x92\x87\xc1\x99\x97,\xa4\xf2\xe0\xa1\xf6I\xd9\xady\xe5mW\xf0\x02AR\x86\x80\xb1G\x1c\xed\xa0\xc8\xc8\xdd\xb9\x97\xb3\xbf\xd5V\xd66'
+    b'\xd9Y\xcf\xd4\x8c\xe0\xef\xcc\xfe\xe3\xaaV?a\x97\xe3T\x02u\xbb\x9b\xa3\xa3^s\xe9\x17G\x1c\xb1\xc7\x07\xa0\xbf\xca\xbe\xf5\x0f\x15\x93\x17\x8fg-\x1f|U='
+    b"6\xe9\xc6\x9a\xb4r\xcb\x06\xb9\xf0\xfe\xfb\xf8\x9b3L\x9dzN\xcf*vj\xb2/kK7\x99\xf9p\xdf-\xe43x\xc0\xb5?\xfd\x1e\xf8|\x99\xac8'\xf4"
+    b'd=\xe1RTM\xf6U\xa4\xc2i\xfd\xec\xde:`\xd9\\\xa6\x17\x90\xfe\x94\xfeD\xcd\xebU<e\x0e\xc1\xc1\x99c\xaf\xa5\xb7\r\x99\xd3\x95\x1ep\x17X&\xd9'
+    b'(\xbb\xac\x89\xf1%c\xc5\x1a\x8d^\xcf\xf7\xfb\xf3\x14\xdf\x0cA\x11t\xb6\xbby\x104\xd6L\xcf\xd7\xf7\xf4L\x9d\xa9&\xfc$l\xf5\xff `\xde\xb2\xfb>t'
+    b'\xb7z\x16\xcc\t\x8a\x8c)bk\x98\x13\x97\x0cTg2\x97\xdc\n\xc1\x8ahQY5\xcbP\x96\xdc\xd3[\xbf\xa0\xd4\xae\x02\x83\xd0\xa9\xb2\xad.f\xf7\x89\x99u'
+    b'\xbe\x80\xb2<!\xca\xca0\x1epj\x17"\xe0\x8e\x83\xeb\xeb\x7f\xd5\xb7_\xe6\xde\xa0!\x89\xdb`xP\xf9\xa1[\xfb#F0\x95mW\xa1\xe1\n^\x18i\x9b'
+    b'>V5\x8fd\n\xc8=\x01e"s2rM\xd2\xf1\x83`\xa3\xd1\x92f\xe3.-\xa6\xe8\x15\x06\xa6\xe5\x7f\x13~f,\x93\x95lV~\xcb\xc2RCM\xd7'
+    b"\x19&q\xda\xa9yL\x8a\xfe\xffQ\x9e\xe0\xbc\xae3*E'\x0c>e?\xa9\xbc\x94H\x8a;{I}\xff\x11\xb7^?{\x83G\xb9\x86w\x7fE\xae\xfb\xf2"
+    b"K\x15\x06f>\x9e~\x9c\xd5\x84\xa7O\xefh\xbaB\x13\x07.\xf8q\x99\xd0jz\x06\xef\xa6LfdD\xa6\x16\xd1o>\xf7H\x1f\xaa'\xd1\x86{9/u"
+    b'4\xe0O+d\x91H\x9c\xb3\xa1n~`3\xeb\xd6\xe6l\x98\x00\xfao\xf0li\xd6\x98\xaf\xfa\x01\xf5\x04\xf8\xf4\xba\x89\x8f~\xfd\xd3\xcb\xf8\xc4\x90\x03\x7f\x9e\x19'
+    b'F\x85\x18V\xcd\xfe\x0f\xef\x05#\x8cT\xa7\x8a\xfa\x149\x85\xce]{\xb4\x12\x13\x96x\xd8\x1a\x1c\x90YY\x12\xa8)\x9aS\xcf\xe7\xb8b\xe5\xad|\x90G\xac\xf8'
+    b"\xef\x9e\xf4}<]\xe6\xfdB\xcd6\xab\x81u\xf5\x83\xab,\xc0\xc3\x91\x0c'\xe3\xd4\xda\xb3e\x81\x9fiG\xe9Y\x12\x83\xfe\xb3\x8f\xd5\x84\xe6\xeb\x9dF\xd1Z\xc8"
+    b"\x9c\xcc\\\xba'\xdd\xae6\x07\xf3\x991\xce\x9a\x86\xbd\xa8\xeeB\x8b\x0e\xc1\xa9 %K\x02\xf9$P\x9c\xb6\xa02\xb5\xadm!\tk\xd0\xd0\xc1\x13\x7f\xc9kb"
+    b'2\xe1Hs-\xe0(\xb5\xf5\xd7\x8bp\x1e\xee\xd3L`\xbc+[\xcc$\xf9\xcd\xbfU\x02X\xe0\xd1\xae\xb5\xc0,S\xac\x97S}Cfe/,\xdc\xdf\xfc '
+    b'A\x81\xed\xc0\x9b?O=\x1c\xebL\x0b\xe6\xc2\xbd\xc9\xad%\x85N\xd2\xe9\xbe\x9d\xf6]\xcb\xd7[\x9b\xaf\xe6uz:\x85\xde-\x90\xfa\xf4\xd4\xd4\xd4\xfc\xb2\xa8\xee'
+    b'\xca\xcc\xc7\xb4\xc6\xe5%\xd5\xc6\xffN2c\xfb\xdf+\x0b<\xeeG:\xfe\xe0e~b\x80\xd7\x1b0~\x99H\xce\x02\xbf:\xff\x80a8)om\xaa\x17\xa8r'
+    b'\x16\x9fk\x99#\x19\xc8^a\xfe\x83\xde\xf7\xd4t\x1d\xfa\xf1Q\xe4\xab\xdc\xabFk\xef\xbf\xeb\xc5\xd3\x1d$\xa0\xf3K\xf6\xe3\x8d<\xde\xeb\x0f\x10\xc3\xe2\x9f\x99t'
+    b'\xd4)\x0e\xc8<m\xaa\x06\xb64\xd6\x08\xa4fbb\x08aK\x0e/\x0f\x86\xd6^\xc6\xc0\xaa\xd8\xe4f\xcc\xc0\xd0L\xe3!\xd6\xb3=E\xd5~)t\xa8\x81)'
+    b'\r\x00\xfeX8&\x1d\xfe\xfb\x17l\x13\xcflm\x1f\xee\xaco\x88\x17#\x12E\xf1\xca\xfbw\xe4Hf\xe1\xf2\xa3\xf7K\xb6\xf1\x0e\x05\x01\x15\x97\x07VY[\xae'
+    b'\x96\x9f\xb7Gs\x08\nl\x16\xc4\x1f\x8e\xc9\x1d\xae\xff\xe7\x88\xe9qE\xf9\xe1\x87%0\x88\xd9G\x9aKJ\xde\x9b\x83UV\xa9R\xcb\xbf\xfe}#\x9d\xf72w'
+    b'\xe5gzA\xbb\\\xb1\xd5\x9b\xec\x7f+#8\x95\x95-\x19\x0c\xad\x80\xd5W\x144c\xfc\xd0]\x11)d\xe9\xb9\xc0h:\x0fu\x19F\xf0tv\x90\xe2\xaa8'
+    b'\x90T\x8a\x90\x86\xd5\xf7\xf0\x06\xebE=\xfc\xcaO\x1e\xb59NH\xa2n\xa4\x94@y\xe7\xe3t\xee\xc9"\x07\x9d\xc1\xde\xde\xfd\x8dT%\x82\xf8\xf6[J\xc2\xe9'
+    b'Ig\x13\x9f\xdd\xadrO{6\xd2\x06>n\xc7Kh\x81\xed\x1b\xc7\xe0!}\x8f\tw\xda\xf3\xf7\xf2\xf2\xd5\xaa7\x08\xdex$\xe3z\xe8\xea\xf1\x04 \x83\x1d'
+    b'<\xc7\x00D<+\xe3\xe7\xa4$\x83\xb43O\xdezB(\xd7\xe19^\xed\xf4\xe2\xa0\xcf\xdem\xee\x87O\x1c\x83~\xaf|\xa8\xc2\xfcQK\x96\x86U_m\xa5'
+    b'\x00M\x82\xc1\x92\x1f\x0c\xccq\x9e\x9b\xbf\xe6\xe6F\x9b^\xf3xa\xfb\x1dm\xfa\x08\xf2+\xd8XP\xf7OZ\xd9\x14\x97\x1a\x17\x04E|1\x99g\x7f#\xab\xe1'
+    b'\n\xfc\x9b\x8f\x8fOJB\x95\x1d,\xdci\x80\xc2Q\xdb\xdb\xcf\xeaS\xf2O\xcb\x11\x88)*T(\xccBU\xd0\x03:6\xd8^JGK\xb3#\x9dE70'
+    b'\xd8\x82\xc5\xd1\xe9\xd0\xe7>\xbe\x19]\xe0\xef\xe2\xde\xec\xe5\xa9\x84\x13\xdc\xa7\xdax\xa6\xce\xa1\\\xf9\xe7Oz\x0cN\x00\xad|\xf4u\x88\x1cw:#de-\x8f'
+    b'7]RJ&ff9d\x84\x8f\x9c\t\xe4g9\xdakv\x88\xf5\xd5\xaeo:\xcf\xae\xe8\xd63\xa5$%\xa92\xad\x9a\xb4S\xb5\x90\xdd\x1f\x7f\xa0\x98?y'
+    b"+'\rQbE\xf6\x06\xe2V\x13iT3&#\x11\xd1k\x8d\x0c\xd1\xb6\xc1\xa7\xae{\xb7\x95\xce\x86K9l\xca\x13qD\x9b\xf6\xf4)\n\x9f\xa5j\xda|"
+    b'\xbdQ\xbb\xdd\x18\xf0\x18\xddjm\x7f\xfb\x9f\x14K*c\xc6\xa92\xc8$\xfd\xe1\xdcb\xc85\xd67\xccM\xcd\x9e\xd7\xd3}+i\x8dr\x89\x80\x13\x14a\xc6m'
+    b'\xce\xdb\xb5\x08B\xe8\x15\xfc\xcfk\xc9\x95cb8"rO\x1dX0\x01\xca\xa9w\x87\xd4\xac\x9a\xee\xb1\xacD\xcf\\\xac*\xa1R\xea\x0bm\xda\xcc}h@Q'
+    b'\x91\x04\xa8\xa38<\x03\xa12Lf\xa9\r\xdd\xe7Ph\xac\xb8\x83\xa0\xaf\x1e\xbd\xfb\xde\xbf\xe2w\xdc\xd7\xa7D\xb5\xae\x04\xbd\x12!\xd0\xbaG\xa9_\x11 \x03B'
+    b',\x11lU\xc7\xae\xadI9$\xa6\x08l8b\xee\xfa\xc6)\xa4u\xb9(\xbb\xb94\xa7\xb2\xf6\x1c>\xb7\x9a\xd6!Dn\x10=\xf0\xab\xcb\x1f5\xff\x9d\x0e\x0c'
+    b'\x0c$b\xe9Y\x8c}\xf0\xbb\xe0\x08\x8c=\xc6\xb1\x87j\xbb\xe0O\x00r~CE\xa1\xc6\xa7 \xa2\x88eR\xba\xff\xed\xb5|\x81~\x8f6\xbe|\xfe\xe8Vg'
+    b'\x0e\x88\xfc\x8b\xb3\xbdo\xcc\xb3j\xaa\xd8k\x8f\xb3n\xf8\xb5\xd4 s\x04\xc52\x1f\xeb\xb3,b6\xe8\xef\xce\x00\x87\x90\x04n\xc0f5\xaay\x9a\x9e\x96R\xa9'
+    b'\x95\xfeCl\x00\x19\xb0;o|\xda\x7fy\xd3i\xed\xe8\xfcs\xad\xbe\xf3\x96\'\xc2\xc3\x18n*A\x8d\x97L!/\xbf\x88\xeb\x8d;\x978\xf4"P\xdb?H'
+    b'H\xff\xcd\xbf}k\x82\xd4\xc1Y\xf9\x90\xd6\x01"\xdf\x07l_-\rVZ\xad\x0f\xe6\xf7\x1a\xa5\xc8\xc7g\xc6\xe5\x02\x8a?\xc6o<\xc20\x7f\xba\xfe\xb3^\xc2'
+    b'[q\xbcAQ\xd6w(\x12;\xb7\xb0\xd0\xf9\xcc\xdb\xbb+=\x0fC`\xd8\xed;4\x16r\xb6\xa6\x99\xfbRt\xc1\xe0\xda\xf6\xd6\xa6\x95\x03\xc2,xp-\x9f'
+    b'\x18\x9a\\\x1f\x1fP\xfa\r\x16\x05\xeeK\x9b\x90\xd6$\xf5$\xaaO\x97h\xd8y\xdbPy\x10\\yy\xed\xe0\x90\xefc\xd4H\x07z\xb0\xde\xf1\x00\x13\x9c\xeb\xb7'
+    b'\x8f\x90T_\xe0\x9d\x1fkYa-\x08E@\x86\x87\x9e2!\xdc\xb7`\x83\x8a\x01\xbe\x10n\xfdS\x19\x95\xbd+H\x8c\xc0\x92t\xe8\x97i\xb9(k:\xc2\xea'
+    b'|\xc9w\xbc\xaa\x8b\xeb\xe6S/\xef\xff\x8f\xdf\xbc\xf8\xffp\xfa\xe3\x9e\xdc\xe1\xb5\xe9\xb8"x\xe6\x1e\x84\x00\xd8CMI\x0bT\xaf\xf06<\xf6\xff\xbe\xdb\x94\x83'
+    b'\xfc\xff\xec6\xcd\xf7k\xe70L?[\xf19<\x90G\xa8q\x10\xa9RP(\xe94+\xbd\xc57(\xc1\xa1\x18\x10\x19\xd4\x95\xf3\xce{\x8c\xc4\xd0\xa5\xa7\xbc\xc8'
+    b'zZ*\xbc\xfb\xe2\xa9\x8d\x91\x0e1\x89\xaa\x08P2\x8e[\xfa,\xa6\xb5h\xe9]N\xd4\xbd\x0e\x94\x04\xf2\xe6v\xce\xe5\xdc\xa2\xbbs\xb7\x0c\xe2\xb6\xb2\xb0\x84B'
+    b'\x05\xecVSC}\x0f\xe6\r[\x9c\xebZf-\x19(\x14\x88X#\xfe\x7f\xbe\xd8\x08\xb189\x13\xb0F\xd0\xe9\x84\xa52\xea\xaa\x13\xb1\x0e\xbcU\xf0f\x0f*'
+    b'P\xfbZlD\xa9\x10\xa3\xa0\x93\xca\x88\xb6\x8bx\xd7/:\xae\xfc\xa8\x84]\x8c\xf5R"\xf5<yq)4M\x9eF!\x86\x89\xe0`D\xf562\xd6=9'
+    b'\x8f\x83\x95g`w\xa4*\xa7H\x00\xe7\xf7\x8b\xa6\x97\xc3\xd48\xefqV\xdb\x80\xc3\xb3M&\xc0\x05G\x9c\xac\x8f\x01x\x8e{\xd4f\x7ff\xb7b\x9c\xaf\xa5@'
+    b'D\xa9q\xe1\xe7\xa9t\xc8yY\x15z\xfb`\xb8\xce\x0eA\xca:\x10\xa7\xe0\xfdy\xa3*4Tr\xf8\x93*?\xab\xc4\x16\xee_\xcb\xd4\x86\x07\x18\xd5uZ\x85'
+    b'\x18\xfeo\xe8\x8b\xa2\x94\x90\xc8\r\xa3W\xdb\xaf\xa9\xb1\xefv\xccI\x0b\xc2\x1b\x9eR\x93\x8d\xdeHS-\xd8\xc3\xf5f\x1a6\x8e:\xa0\x91\xe2\x89\xa0\x88d\x11\xb5'
+    b'*\xd0<\xf1J\xcdL\xee\xfa\r\xd9\x94S\xf2J{.?]\xcc\x1eAA\x83\xdb\xfc\xe7\xbc2e\xb1\xfeB\xd3\xb4\x8a\xc2\xe5\x85K\xde=CVF\xbeZ2'
+    b"`\xb4\xd6\xd0\xf6\x8f\xd9\xf5\x18\x81\xe3\x02|\xee\xbb\xe88\x90\xdc\xb6\xd3\xda\x8d\xf3#\x1c\xf6\x95\x9ff3's\x81\xa9\xcf5%\x18v\xdfu\x02l\xd2\xffL\x91"
+    b'\x88x\xf2?\x82y\x03\xef\xc1/i\x14\xbc\xbbm\xdcz\xe6\xdb\xfd\x00\xd3\xa8\xc2\x7f{\x9a\xec\xd5?\r\x8fK:\xbf\xb8\xfd"\xde\xb1\xb4\xa4\xb2\x8c\xf2\xa1\xca`'
+    b'W\x91|\xa2\x183\x1d\xc9M:\x96\xfd\xda\xf5{\xe4\x1aQ\xd8o\xe0%\xce\x17\x9a\xb0J`\xee^_\x07\xc0Dp\xa4\x02\x88\xe1\xfaK;\xa6m+\xea\x0b\x0b'
+    b'?\x1d\xbe\x01\xde\xd3\xffl\x1f\x803\x8d\xdd\x19\xbf\xefe\n\xfbx\x8d,\xef\tn\xb2\xe9t\x80\x04\x9b\x85\xf0\xfb\xe5\xfc&\xb3\x83\xf9\xa0q\xc7\xd9`\xd4a\x1f'
+    b'q\xf6\x1f\xbcU\x04\xc8q\xda\t\xfa\xca\xed}U\x1a\x83\r\x1f\xb3\xc3\xa2g\xfd\x8c\x81=\x9cv\xf2>MKT\xafwM\x12\xc5\xa4*\xe1\xaf(s\x8a\xbcM'
+    b'r+H\x0c\xfa-\xc5\x9b\xcd~)\xdc\xb7\xae\xa1s\xb3~\x1f$\xfa\ttC.BqW+\x01\xb7\x97M\xdf\xa9\xa5\xc7t\x85]R\xaf\xfd\x00\xd4\xfd\xd0n'
+    b'8<$\xf9\xaea\xee\x16\x1f\xb0B\x17\x86\x92\xad\xfe\xd6\r#\x9c\xba;\x07Z\xc97\x97\x89\xdf\xaa\x00\xa3\x92\xae\x12\xcd7\xef\x01f\xbc#\xfb\xd0\xec\xcf\xd2\xf7'
+    b'V\xe5\x80<\x83\x0cZe?\xd7\xfb\xabS\x80\xe5\x13s\xca\x94H@\xd6\xda\xbe\xd2\x81\xcf\x12\xd70\x865\xe7\x94\xbd\x8d\xed\xf7\xd6/\x0f\xb1\xe1\x1a\xd5\x90\xa8\x8d'
+    b"\\\xd5C5/#C\x0b\xaeIR\xe6\xd4\xcc}\xf5\xafj'\x9eV\xa1\xdc\xb7V\x8d7b\xc1\x9d\x9c\xc3~v\xacf\xef\x9b\xc8\x87\x1f\r\x97[\xb3\x0e\xe3A"
+    b'\x7f"\x14~\x8d9\xf1\xa5\x1a_\x9c]\xd2Kky\xc9\x0es\xc5\xad\xf4\xa2&\x88\x9eZ\xdfEq\xbd\xcb\xde[h\x0e\xba\xa9\xca\x144j>\xcf\xdc\xdde\x8f'
+    b'\xc8\xca\xf2\x90\x98d\x9e)\xefa:%\xfcz\xb0W\xd1\xb0>\xc9\xdf\x93t\xf9\xb17k\x83-\xf5<\xa5+\x7f\xa3A\xd5rwXAV\xf9\xa4P\x8dI\xf1'
+    b'\x04\xc6\xdeV\xcd\xe0\xfaPHR4\xca\xbb~k\xcf\x84\xfd\xee!\xfeH\xd7\xf3\xf6\xfe\x97\x01\xdd\x05\xa4\x81\x81\x0b\xfb\x06]a_\xe5o\xc4V*v\xf6\x9ew'
+    b'!vYT\xc1\x0b\xa1\xb2D\xda\xa9\xd2i\x1bZ\xecb\xec\xb0\xa6\xde\xb7\x7f\xee\xee\xc4\x98\xa5>{Z6\x8e:\xb1\x17\xee\xda\xed\xbf:\x19\xf9~\xd7\xf0\tM'
+    b'\xab\xa01\xbe\x88F\xab\x84o\x81k\xc8\xdb\x16\xfb3\x97\xd4\x0e\x1f\xf5\xa0t\xaf\xdb:C\x97G\t\xfa\xf4\xd5d\xb37*\xdc\xbe\x9e\x95=\x8e\x16\xf1O\x18\x8e'
+    b'\xbb\xbb\x8f\xc4D\x1e\xfda\x19\x96\x88\xf4\x18\xd9\xa3%\xfc\x00\t~\x1cN\xd3\xfc\xcd,(7\xda\xbc\xd3\r\xf35l\xa3CW\x9c6\xfc\xe2q\xcf\x12\xd5\xca\x1d'
+    b'\xa9(\xfa\x16D\xf1\x8b<uQ\x9c\x08C{\x19\n\x8b\xd7w\xfeya:\xfe\x06uD\x1b\xc7=c\x14\xb3\xe6T\x96y\xef\xc3\xf1p\xba\x87\xf9\xa7\x00\xc5\xca'
+    b"\xd5\xef\x9eY\x85./\xf3\xc7\x9e\xdd\x8e\xed\t+v\x06\x15\r\xd6\xae\xf0fM\x19wz\xc4s\x9e\xe9\x86\xf4\x94\xd2\xa0/\x82\xe6|\x8b{\x83N\xd49Z'"
+    b'\x02\x0bTD]:\xb8"\xbe"H\xc31Z\xb4\xc9\x13\xd7cv\xae\xeb[!!\x01]\xaa\x9c=o,\x1e[\xc4*|\x87\xd7*y\xf1\x01\x9d\x11\xbd[\x1d'
+    b'\x83"$\xa8\xb9\xed0V\x1f6\x99\xa56\x01)\x81?\xe7\x8c\x15"\xb8\xab\xbe\xc2\x90w$\x81\xc9\xe0\xed\xb11`1\xe9\x17\x84\x1c\x10\xe0\xb8\x0c)+\x00\x9f'
+    b'jU\xe8\x02\xd1\x17w\xae\x00m\xc4\xd8\xe5"\xce\xea\xb3\xf8!WKg{\xb1\xb4k\x0b\xc7\xa9\xf5n\xe1O\xc5K\xb9\xec\x0e\xb8\xfe\x9e\x8e\xb9\xbc\xa3\xfb!\xe4'
+    b'\xba?\x0f\x96OPI\xc9]\x0f\xfaRn1` hT\xf1\xdb\x03"4l\x1c\x9e\xf1\xf0\x89\x83&*\xb9#m\xa3\x0e8;[9\xbf\xe7!1\xd37g'
+    b'\xc7\x1a\xc5\xad\xda\x14\x00\x0b\x9e`\x9d\x00\x9f]\x14\xa5\xe7\xffRAN\x16\xaa\xba\x89\x18\xda\xdbU\x9d\xb6}\x84-\xb2\xc3j\xeed\xfbg!\xd1Z\x05f?Y'
+    b'+\xff\xab-d\xb8.\x19;Z\xd1&\xce\xd9R\xb4\x9e\x83F\xfa\xaep3\xe6\xb2\xdfYU\xc3\xee\xb5E\xa7H\x87m\xe4.\xb5uE\xde\x89q]\xb8\xab\x9d'
+    b'\xa0-~\x8a\xc3\xdb~\xe7n(\x97\x8f\xbc"\x12l\x97\x0f\xd0\xa5\xf0\xc2"g\xd1,\xe1\xf3x\x88\xbb\x7f\xa5\x9e\x14Q\x94\xea~\x96\xe4[:\xce\xcd"\\\x96'
+    b'\xac\x8e\x06>\xc9\xb7\xb7\xcbw\x85\x07{i\x8a7r\xe6Y\x1b\x13C\xd9c\xe7\xf3\xabm\x8b2\xde\x93)\x1b{\xe1\xd9\xf9\x0b7E\xdf\xda.\xb7\xfc\xe3\x99\xc6'
+    b'6#\xbe)y\xb6\xc3}X\x075\x07\xd2_=\x02IE\xac\xb8\x896E/=\xdcw\xf6\xc2\xbc$K\xaa\x96\xae\xfe\x98=w\x02\xee\x1c\x87\xd7\xd3\x0f\x12\xe5'
+    b'\x12\xb7\xe3\x9b\xf6\xa06\x81Gx?\x8a\x8d\xa21\x81\xf0\xd9\xe8\xa8`\x84\x809M\xc2\xdb\x19\x87b\x9f\xfa\xa1\x08\xc4\x8b\xa6;%z\xe9\x17Tp\xc8\xbd6 '
+    b'\xd9\xc6\xd16{f4\x9c\x08\xac7zT8[\x07\xabh\x11\x18\xd3\x89\x12\xd1e}%\tj%.d\xde\xdf\xfc\xf0\xdc\x11\xa3\x18\xf0$\x0cb\xe1\xff\x8b\x18'
+    b'vz\xaa3\x18\xdb\xc1q5\x91\xa7\x8e\xb3/\x10wi\x89\xdcG.en\xa4-\xb9w=\rs\xb8\xe2\xf7\x03.\xd2Q\xb9\x91\xa1#I\x90\xcf\xa1V\xb8\xab'
+    b'\x90\xdb\x80\x01\xd1ow\xc3\x07xoCS\xcd0\xa4\x95\xbaD\xe3\x05\xda\x0bV\xb8|\xbf\xc8\xbd\xb6\x03\xeb\xbc\x1e\x93\x0c\xd2R\x95\xf5\xdb-\x1c]V\x84\x108'
+    b'\x85\xb0\x8c\xeeS\x02m\xd3\xd2\xab&\xc2\x9d\x1c\xe4v\x8c\nR\x07\xa2\x11\xbe\x88\'\xaa\xea8\xb5x\xab,\xb4\xc9\x02\xc49\xbbI\xf0\xf7N"{7\x8c\x05\x0f'
+    b"\xdej\xafl\xd1\xda\xfb\x12\x0eg\xdb\x9fE\x90v\x12\x84\x14h\x961\xe2\x08\xf0&.A)>?Y\x90 \xea5W\x06'\x0b=<cgW\x8d&\xe4\x85"
+    b'\xf7\xcb\x91\xbd1z\xf49\x948G[Zk\xe6\xea\xd1\x83*5\xc3\xc6i|\x8dk\xf3\xdeO\x16tv\xbd\x1bk\x96\xcbk\xd6\x0b\xcc\xbf\xb2\xd0*Q7\x08'
+    b't\xc7s\xf4\x8bR\x01\xe0\xe2\xde\xe0\xd0\x12^\x9fg$\xd0]\xe9\xd8\xf9[t\xde\xef\xac\xd3M\xc1\xab)\x88\xf1\x0e\xf2\xea\xf8O\r_\x7f\xe6\xa8\xaa\x9b9\x91'
+    b'\x1d+\xbb*\x97\xfc#N\xcf\xa0\x8b7\xa3\x8as.H%\xae^\xa4\r\x90\xf4\xd7\xb1\xd5O\x8a\t\x07NgPs\xd2\xb8\xb3E\xffW\xf3U\xd6\x81\xba\x97Y'
+    b'|4\xd1\rM\x9f\xa8\x12d\x13\x0c\xb7\xbf\xb1\x05\x10g\xc5\x05\\8Y\xa4\xabu\xf5\x13\x896\xd2\xfb{\x12\xec~d\xd6j~\x80?\x0b#\xa4\x8d_\xa0\x9a'
+    b'\x1c\xb7=\x7f#\x81}e\xbdwik\xde\xfb\xd1v\xe7L\xbb\xd6\xd7G7\x01\x02\xeb\x81\xa9\r\xc7gFC\x9f\x93Y\x9e\x94\xc8\x13\xe8\xc5ul\x8a(\xcfZ'
+    b'\x9a\xb2\xcawY\xad\xfd\xaff\xcd,\x1a\n\x07\xfc\xfb\x834\x96\xa2~\xb6\x90\xecT\xf6le\xcd>\x92\x84\x10\x894\x19\xfb\xbe\x0e\xb3hAB\x18\x85\xb1MY'
+    b'+{\xc4\xd8\xb7\x90ud\x9b0\x8ce\x18\xfbX2\xb6\x19\xfe\xfd\xdf\xab\xf7\xf6\xbd{o\x9e\xeb\xef9\xcfy>\xe7\xf9\x9c\xf3\xfd\xd8\xef\xf0\xc8\x06qi\xe2b'
+    b'\x12\xd2\xfb`\xf8\xf2xh\xbb\xb2\x17#Y{\xa1c)V\xef\xae/\xeb\x1c7@0\\\x08\xe9\rI\x82\x92\x1fS\xcbP\xa4\xa1\xf6\x1f\xfe<Q|b!\xf2'
+    b'9\x0c\xcf\x16\xfd[ZC?\xa7\xfd\x98\xcd\xa7\xc3\xdc\xd0\x93\xfa\x00|\xec\xf1U\x92~b\xd7\xc3q\x82-0\xa29\x97\xa7\xf4-\x144\xf9yW\xf5N\xcdM'
+    b'\xe5\x0f\x15nL\x19\x8b\xfb\xd3\xd259\xf7a\xa2\xe7k\xd7{\x84+\xebE\x07\xc8P{3\xd63\x8a\xe1\xee/\x81A%\x05e8\xfd\xc7\xf3R\xe8\xd5\xf9='
+    b'>\xd4\xfa\x8bD\xe5\r/\xa3\xfa\xc6d-\xa9\x89\xaa\x85?\xd5\xa0\xd3b\xe0\x0f\xce\x88\xd3;\x17V\xef\x18i/f\x1c\xe5\xc3\xb2\x02\x7f\x8eF\xc6\x8bfI\x12'
+    b'%\xeb\xc1o\x7f\x0f.\xcddG\x0e5g\xe7\xc7_\xfa\x82?\xa6(7\x85i\xf7\xd4\xb4\xc8^\xf5\x1b`\x86\xea$q\xc5?\x1ey\xed\xd9\x17\x1e\x89U\x8b\x07'
+    b'\xf9\xce~M\x8c\xbe\xf4\x9au\xa4\x87P\xfat\xa8I\n\xfa\xe5\x0c)\xdak\x10\xe8\x0f5G\xbb\x85]*`\xd7\x90\xb8\x8e\xded\xd5xp\x10\xe18\xd9\xbb\x11'
+    b'\xfc\x126\xa4\x88\xf2\xc5\xb6\xd5k\x8f\xa9\xe2\x0f\x10(A^\x9f\x8f\x8b&\x15_o\xe3\xae\x9aE\xf8[\x9e.\xb9L\xab\xf5\xc2\xbf?\xa4.u\x8b\xdc\x17\x1e\x08'
+    b"\xa8u9\xe3\x8b\x80\xf9\xf1~ w\xa5\x0b\xf5\x86\x98\x9e\xde\x91\xc8\xaa\x8f'9\x19\xf1\x9b$\xc3$~f!\x1e@\x9a\x1f\xe7\xa0\xfb\xbc\xb5\xccR:\xc2\xefu"
+    b'\x13\x9a\xb4\x06\xd2\x81\xa0\xa1\xb0Q\x9ev-\x89\xa8\x1c\xb6V\xa7`;\xef\xf3s\x02(\xb3\xf8]\xb7\x13\xe4\x13\xd1%q\xe6n\xcdB\xdbK\xa7\xbe\r\xe5\xd1\x1f'
+    b'z\x82\xf5\xab\xbel\xdd\xbb"\x0ee\xb5\xd2\xf2\x91\xc9\xc6\xf1@j\x15{\x9ab\x9a0\x9a"K\x12>\xb1\xeb\xaa\x9cm\xad\x0c\x87~D\xc8\xcf\xa7@3\x06\x18'
+    b'\x7f\x1b\x11\x0b\xd5e\x9c{\x0ch\rn]\xb2B!\xd9\xe7\xc8 K\xa6|\x80\xbc8\x94\xdfJgt\x13\xe6\xbc\x17\xda\xc4\xd9\x16\xf9\xaa\x97\xa8Xm\xd2\x9c '
+    b'|rjq~[Y\x01\xcc\x10\x95\xc3\xb0\x91\xb4\xf3\xbeB\x13\x00ksf\xcb\x8c0|+\xeaU\xc0i\x14\xa4\xe0^\xa0\xc0R\x04\xf6B\x05\xa5\xeale\x8e'
+    b'\xd7}S)zH\xf6y\xfa\xf0~\xcd\xc5\xdd;\xd7\xac,\xd3\xb9\x16\xfc\xfb+O\x8b\x15\x1d\xd6/\xa3\x8a\xbb\xe7\xd3>\x0f8\xe2/:6\x0e\xd2\xee\x14l\xc6'
+    b'\xfb\xd0\x8a\xe5}\x82\x9eL\xa8,n\xcf\x88\xf1,h?\xed\xc3\xb6\x83_\x14{z\xf2\x8b\xdaF&\xd6p\xb0;@\xb6^\x96\xc73\xfb|\n"\x1b\x95t*'
+    b'\r\xe0\x88\rc\xd1\x00\xb5\x8ew\xf9\x11\xe7E\xbd^\xe0\xb1E\xb5\x85\xe9g,V&\\\xa6\xcb\x1a\xe4\xdc\xd3\xd7\xc9E:\xa2Q\xe0\x81\r\x94\xecpSj)'
+    b"\xb3,;Mx'\xe5\xb9\xb3Q\x1f\xa2\x95\xfb\x86e\xdf\x1e\x83#?\xf5\x04ma\xb3k[0\\\xb2\x99l\xac#g\xccf\xaa)\xdc\x96\xde\xf1\xa5\xda5\xb3"
+    b'\xc0\xab_\x1c\x12\xaa\xd3+\x08\xa0\t\x8d\x04KNck\xcfX\xa2\xa6\x19\xb2\x81s\xb2\x16\x9e#\xc3\x86\xe1\xfa\x17\xec\xc4\x07u\x1a\xa2%\xeaJ\x87K\xa9%+'
+    b'\th\xd9\xef\xb8\xaa\x07\xe2\x89G\x0c\x08A\x1c\x98e\xb3J\xb4W\x0e6\x89-\xffw\xf0[\xd3\xde\xd7\xe0\x1fs\xa6&5\x17k\xb7\xe1\xea\x07\xd0O\xb6\xdb\xcd'
+    b'1\xf0\x89\x83M\xbc\x0c\xc2/x\xb4\xbc\xf3\xe0bSBH\x84\x9c\x01\x8bG\x01\x97\xee\xf2\x14h^5\x0c\xbcf\xf0\xdc\xb8\xd1\xbdg\xda\x05v\xdb\x8b\x89\xeb\xef'
+    b'\xc7\x06H]%w\x94\xeb\xf5\x14dk\xdd\x9f\xa2\xf1B\xc7\x06\xa9\x08\x8bA\xa4Ry\xc89\x0f\x16\xb2\x18\x96\xb3\xe1\xb0yf\xfev\xd9\xf3\xe9\xd8\xf9y\x88\xcb'
+    b'\xbb\xe5\xb4\xff\xc3gXj\x8e\xfc\xed\x83\xbbk+\xd0[#\x12\xbe\x96\xc9\xdf\x0f\t\xc6\xf4_\x05)\xf2\xfaXk\xc4\xa8qt[)\x18\x98\x10\x16z\xd1L\xfc'
+    b'\xc7MQ\xbcG\xa3N\x11\xaaVC\xd4\x01\xe67q5\x7fr\x94\xb9L!\xffb\x88,+\xeb\x88\xa9\xe8\xc1\x94\xce%\xc44\xf6\xd2w\x7f\x063\xfc1\xe4S'
+    b'DL\x9fK\x8e\xf3\xe8\xfa\xd8 \r&\x10qEr\xbc\xd8\xb8\xcf\xc5W=\x05\x1e\xa3\x04\xb36\xb8\x1b}n\xb5o)W>\xf3\xd9\xd6\xdd\xcc\xf9\xa2\x05U\xc0'
+    b"rc\\\xa4Bw\xac~-C\x13\xef\xa2\xb5Fz\x87?kT\x92X\xc8'\xd2\xa6I2\xaa\xa84^e\n\x12\xcb\xb6\xa9\x82\xfa\xf1\xed\xa9\xa2\xcey'\x16"
+    b'\xd1"\xc7\xe4!vL]\xe9!Rm$|\x17\xc9\xbc}Q\xf9\xc4\x0b\xc8E\xf5\xe0y\xa5\x82D\x0c\x0f<\xd8\xaa\xa4\xc8\x16\\\xdb\x19\x05\x0c\x94\xdeJ\x9aI'
+    b'\xbf\xdd\x19M\xd1\x9a\x91\xd7\x7f\xfb\x95\xb7`\xf2\xef\t\xf8p\xf3\x080\xf4\x13\xab\xc0\r\x02\xff\xc2\xb8B\xea\xea\xefz=rO\x80"\x8a\x1f\x80\x89\xd3:\xf9\xcb'
+    b'\\\xd1\xeb\x00\x80;\xc4\x0c\xe0Hj\xdf\xc1\xf9\xef\xd5\xd8\xb8\xf7\x1b\xae\xb9;p\xde(\x00^QL}\x14kii\xd0;no\x87\x009\xa0"\xa7\xa4K\xc0'
+    b'IU\xf4\xb5\xf7<\xeb\xa3\x8b\xd0%\x8e2\x9er\xbf\xa7&\xb6\xe6O\xfe\x8e\x0f\xa9\xf6,\x89\xb0v4\xd6h\x02\xcd5f\x0b\t\xa6\xdaD\x0e\xbc\xeb\xb0\xda7'
+    b'\x19\xbf/\xb8\xde5\t\x10\x99\xb9, g;j\xe9\xda\x123\x80\xf7\xd0|\xa4|\r+\xc2\x8a\x19.\xfb\xe6"\x97\xfd$\xf7p\xd0\x13\xe5\xa5Bko\xa9\xea'
+    b"\xee\x1a\xee\x0e\xff\x9e\xackn\x98L\x95\xb9+\x95O\x8b\x1b\xfao\xd8\r\xee`p\xb3\x98<T\xe1R\xbb/\xd2#T#w>\xe7C@\x06\xbe\x9a\xb8'\x04"
+    b"9\xb9o\x0c\xf5z%\xd2\xcc~\xe3\x83\xbb5\xa01\xc5qZ\xf9\x9a\xfdP\xf8\x1b\x15B\x807J8\xb8\xc3m0\xf8\xa5CX\x13\x9f\xc8\x91'\xdf_\x19P"
+    b"\xe7\x9d2\xf69a%\x1d\t\xd5]\x0f\xcc`5%\xf6\xc6\x87\x7f\x10\x10V\xcc5\xba\xd9\xfa\xf0\x1a`\xdb\x03\xf9\xb9F\xfbF\x9f\xceJ\xd9\xeb2\xcc\xba'`"
+    b"9k\x92\xdc9<a'j\xe4\xf6\x13,w~\xdb\x94s\x84\x12\xde2O\xa8e\xdc\x1e\xfa\x12\x17\x01M\xcf\x98\xb4(yE7mao[\xfe\xec+\x07\xc0"
+    b'\xec\x8abg\xdeg\xad\xb7jG\xa9?\x87)\x82\x98\xda\xfc\x067\xd6\x9b9\x14Y\\\x85^}\xa8*\xe9c\x0e\xc9B\xc3\x0b1\xeb\xc2S\xcb\xe6\x80\\\x81\xa1'
+    b" 4\xf5\xfc\x9c5\x82\x98\xd7\xb37\xc3\xdb\xf6\xe4\xdd\x1e\xbd\x19\x9d\xc3\x85\xab+\x82\xcb\x96\x9e=\x838o\xe5'\xee\xd6{3\xceQ\xbcT\xbc\x8f\x83v\xdb\xb8"
+    b'\x07\xcei\xd1YX\x91H\xfe\xff\xd2\xb5n\xb8\xbf]\xaa\x15\xb7\x99\x1c\xef\xdc\xee\xad\xb0\x95\xd8\xfb\xa5\x1c0\xfb\xf4|\x1e\x9fk\xd8\x80\x81\xc0\x7f1\xb4\x18\xd2\x8f'
+    b'\x9d:\x9dA\x9ed\x98U\xac\x1eC#\x87U\xa8\xe5\xe9}\\\xe5\xa3@?\xa5?\xf3\xd9\xa6W\t\xfe\x91\x01>\xf2\xa5\xfc\x80*\xc4\xb8\xea\xea\xf0\xe9\xc9\xd8U'
+    b'\nICyV\x19\xf9\xd1\x1bo\xa6\x19\xc6\xdf\x1d\xe9A(\xe2\xd3[\xdbDZ\xa7\xbb\xf4\xc1\x07+\x05\xa6\x96c8\x96\x10E\xf1f_\xb5\x88t\x99>l\x83'
+    b'\x16Q~\xd3\x00\xd3\xdd\x88Q\xeb;\xe8\x7f\xd2Hp\xf6[_\x82\x15\xbd\xfb\xa8\xbd&A&\xd1\x12\x91\x98\xc4\x0f\x94@t\xe8\xfd@uTE?\xd4\xb4\x7f\xf5'
+    b'f\xa0\xd8\xbc\x8eo\x83\xeb4\x19\xde4P\x0b\xfc\xa8\x9bEz\xc2\xd6\xfeA\x15k\x9e\xa2Q\x8dPj\xa7z6\x86\x0e\x1b\xde\xeb\xbb\xc5\xab\xc3\xd9\x9f]\x8f\xeb'
+    b'wX3\xe3j\xa3w\xa9\xc5\xd3\x0e\xa4a\xda\t\x92\xc2\xeb/\x17\x1es\xc6\x82\x97\xf6\x9a\xfc\x00x\xd0\xa4m\xfdV\xbc\xe6FP\xab_\xf5O|\xd2\xe73='
+    b'n\xb3\xce\xa3%\xb0\xfc\xc6\xa2d\xba\xea\xf7\xa7)Eqq\xf8f\xfe5u\xf66\x17\xedC\x96\x92\xf0/\xb7q\x84\x07f\x0cM\xafI\xca3?TGL4'
+    b'\x0f"Z\xcc\xe2\xd71\xeb\xdb\xc3\x00\xdcy@\xd3\xf7\xe5\xd9\x81\xa5\xdc\x87\xde\xad\xc6\xec#\x03?\xdai\xb0P\xaa\xdd\xb1\x9f\x85^\x1f\x00\xc9\xd3\xbbh\xea\x9b\xc3'
+    b'%\x14\xebZ\n\xdc\x9f\xfd\xfez*z\xf9\xfb\xaa<\xec\xf6\xa2\x93\x84n\xbc\x8a\xe8L\x80Q$I\xd0\xef}z\xd0R2\xe1\xbaM\x7f\xa5\x06r\xadO\xa1"'
+    b'\xac\xae\xb0<;\xe5\x1a\xf5\xe9V\xe1\xa4\x01<b\xb7c\xec\xc3\xe8J\xb5\x9c7K\x8f\x10\xff\xdcd\x04\xf4\xf6iB\xe6\xee\xfb\x92\x8c\xfd\x1f\xd2]\x05y\xef\x95'
+    b';(\x98\x9c\x9f{?8\x0eL\x9d\x15\x04QO\x98\xfe\xe0\x0e06\x1f\xd4G\xfb\t\xe9\xa4Q\xd8\x89\x87\xfaF\xb8kI\xaf\xfd!\x9dq\xd1c\x82\x1a\x94\xa8'
+    b'L4L:A\x9e\x9c\xec^\x89j\x04\xe9\xd8Z\xceZ\xb3\xb7\xc7n\xb7y\xb3\xcdi\xa0\x06\xdf\t\xc2d\x0e>\x1b\xf9\x94\x7f\xcb59\x8c\xd8\nF\x08R\xdb'
+    b'eu\xcf\xd0Ll*\xeb"\x8a\x131oI\xa25\x15\xd7\xb7\xfa\xad.\tD1\x81|]!\xec1$\xa6\xab;n\xee\xba\xa8\x8a\x10]\xf2\xaf\xbe\r\xef\x8d'
+    b'E\xd7Q\xe3{\xe9\xf5\xbci\x18\x9c\xecl\x989R\xaf\xe9\xea\r5\xd8T\xe1\x0b\xc7\xc9W*\x18Z\x19(\xe7\xc14Cx\x91\xf4f\xf8u\x96\xaa\xcb\xea\xaa'
+    b'\x02\xa7Q[\x84N\x03\xa7\x90\x14\xea\xcaw"\x97\xbc#\x84g\x88\x92\xd6\x93t\x8da.L\xfe\xd7\xc5N\xb4\xa1\xdf\xcd_\xe0u\xdd7;\x1eY%\xbe+\xc5'
+    b'\x8c\xb7\x1b\xb9Y\x10\xdaCw3\x9b\xfcj\xba\x85v\xbe\xbc \xb3eN\xe4\x82F\xbd\x95\x9b6\xc0=\x0f\xb7X\x9e\x00\xdbR$ZW\xa6/v\xce\x80\x11\xe6'
+    b'\xba\xfa\xbb\x8c\x80\xf8"\x17\x13\xf34`\x0f/N)\x9e\x02\x85_\xe8Mra\xa9\x97\xb7\xf5\xd0\x13\xb0j\x96\x13=\n\xe2+\xc8b\xcc\x00C\xf8\x1e5\xd9\x80'
+    b'\x05\x9a\x115\x12\xc1\xbfE\xfaU"\xaah1^=\xb8\x90\xb2}/\'\xca\xef^\x0e\x97LR\xa8\xbar\xa3\xd0\xe2N\xa5\r\xe3\\9\x87\xedOs\x08\xd5:'
+    b'\xae\xb7E\xa5,\xfd\x88\xfc\xc5\x83\xdfv\xc3\x15\x18\x05\x1e\xdc`o\xbf%h,\x94\xe9\x0b\xcf\xf1\x84P\x02\x9dWk.\xe9\xcf\xbbV\x0bYiAk|K\xf5'
+    b'y/\xdd\xe0\x0e\x08Sntm(\x84d\xb39\x1b\xf8\x16\x08\xc7\x00\xf7\x939B\xbes\xe8\xdcY\x9f\xa7\x1d\xcf(\xb4\xfeH:\xa0\xf0\xf10\xba~\x9c\xf8\xa0'
+    b'\xf5_\x9e#\xe4\xd0\xa0\xd6)v\x06O\xf5q\x1b\xff\xf09\x18\xda\x9f\xb5\xff\xbf\xee\xb1\xccpxw\x98w\x91~\xaa\x85\xb2\xe0\x7f\xc5\x99\xcc#\x85\xd8\n\xf74'
+    b'\xcf_uZPY\xacv\\!7`\xd6l\xbd\xb40i\x94\xa0\x9f\xdc}\xe5\x1e\x92\xa0\xbd\x8b\xc1\xaaV\xb8\x12\x86\xdbZ\xa4\xaa\xecw\x1f"x\xdf\xfcSB'
+    b'\x9d$\xa35\xe8\xa9\x11\xdff\xa8\xcd\xc8\xfd\xe9k\xacU\x84Wc7\xf0k\x81\xef7\xb1>]y\xde\x16\x8f\xd3ng\x01\xa8\xc1x+no<\xe3\xa1\xa2\xd5'
+    b'_Cq\xf7"s\t\xe1y\xc57ol2\xba\xc5W*\x16=\\\xfb^\xe6\xb3G\x7f\x8d#\x01\x9b%X\x86\xffH\x994fy:\xa0\x0f\x12\xbf\x86g<'
+    b"\x95\xc3\x05a\xc9.\x19'P\xa6\xc1\x9b\x02\x8d\xd6+\xe6\xearU\xa3-\x9b\xef\xe23\x89\x13\xb1\r\xfd\xf3\xfa\x98|w\xc3\xc9DC\x8c\xc2R\xbe\xd2\x16\xd3`"
+    b'+\xfd\xcf\x8cA:X\xab\xd3\x9e@\xc6\xb2\xb6\xd4\xc4\xed\x88\xfe.\xb4m\xc0\xc4\xf2<\xa8\xb7\x15\x188\x16Jqt\xdf\x99<.D\xffcl\xbe\xbe\xf1\x12\x1f'
+    b".\x17\x90\xcb\x7f>\xaf\xb4J\xc0Ck\xcb\xaeC\xf0/V\xf1~\x82\xdeG\xe1\xae\xb9\xcf\x069T\x1fn\xf5 \xd8Is'\xde\xcdL\xfe-\xc3\xc0\xf1e\x89"
+    b'3w^\x94\xb8/|\t\xda\xda\x12\xbdD?\x99\x04\x1e\xc2P\x8d\x17\xdcg\xdd6\xa9\x8b \xa5fY\x95Q\xc2N\x8d%\xca\xd5ZC.Te\xdd\xed8('
+    b"}\xfd\x18^1\x8dK\x91z\x91\xa0\xfd\xd7^\xea\xaan\xf4\x84W\xd9'4*k\x10\xcf'\xcal\xe1\xc76\xc7\x82\xf2\x12\xdd\x9f g4\xb62\x1e\xde\xb0:"
+    b'nb\xbe\xc2y\x9c\x1b\xcd-\xb5\x1f\x9a\x80\xab\x9c\xbc\xee\xfbE\x12\xc4_p\x8d\x83\x0f,euk\xf5"\xc3F\xe2N\xc0_p\xb9\x9c:\xfcx\x81\x9e\xd2='
+    b'q6\xa6\xf0m`BT\xc7P^\xa2T\xcaN\x9f\xe0;u\xd4\x11\xa1\xb8\xfeDGx\xa2\xbc\xd0\xde\x0fr\xe7x\xd1\xaa\xc0eD\x10|\xe4R\x9a\x0fB\x8c'
+    b"+\x0f#\xdfZ\xcc\x9eI\x83.+b\xda\xc2\xa5\xedr\xc7]\xcc\n\xde\x17s\x15c\x17\xbf\xda\x80'\xea\x18h\xc3<\xdf\xba$\x14\x82\x0b\xa5t\x89\xfd\xcf\x83"
+    b'L[pn\xa4\x1c\xde\x14\x16k1\x90\x81\xc2\xa1\x81D\xeb"c\x00\x18`"\x1am4\xc39\xe7\x0c\x80M\x17W~i\x0c ?b\x19\x190\x80PS\xe4'
+    b'\xd5O\xf7\x08n?\xec\x0f\x8f\x9a[N3\xd1\xdaU7\x0f&,L\xec\x99\x9e\x05$\x9d\x8ei\xd5\x9eT\xd9\x0c\x97"%\xbb\xe1\x184\xe5$\xa2\x88x\x90\x8e'
+    b'\xbdA\xec\xd8e\xba\xf0^\xea\xe83+K}"\x00v\xde\x83pl\xcd&:\xc6\xb8\x1d\x8a:\xf3\x81\x04\x15w\xa8p@\xe8C \xa8p\xde\x04\x8c+\x8a\xf8'
+    b'&\x03O\xc1\x8a$.\xc3\x05\xdb\xde\x03r\xc9\n\x89\x9f\xef\xd3\xab\xbfy\x16\xb0\\<t\x06)[2\xb6\x99\x028\xceU\x16\xa3\x07q~Gl<-\xe9*'
+    b'\x11\xc6\x81\x06\x05\x87\xdd\xdf\xae\x0c\xa7\xa1\x9f\xb2\xff\x13_\x9c\xbf\xf9\xbc}\xf9eY\xbdLa\x84\xd8\xe9\xcd*1e\xc0\xc6x\xbe\xff\x00\xde;\xddf\xa0\x14c'
+    b'\xe92\xa1\xd0\x1e\xfe\xd7\xe4\xfd*\xbd(\xeb\x0b\xef\x1bC*\xc3\x96\x07\xa4\xf5\x9a\xe2[D\x9aW\xd7\x19I\xfeM\xa8(\xc9\x04\x90m\x1a\xd8zCe=\xc8\xfd'
+    b'1\x7f*\xedu2\xf6\xcb\xd22]\x08\xc4\xfag\xda\x85x\xde\xcam\xdb\xa2(\x1e\xaa\xeb\nIu\xde\x88A\xcf\xbc\x1d{\xed\x07\x82\xea9?\x83\xeci\x0ft'
+    b'7\x99`\xf9\xf9\x00\xd0\x19\xf3B\xbf\xae\xcdxWt\xf5\xd4\x80o\xe8\xde\x9c3\xddX\x13?\xb0\xb5-h\xff*8<s\xca\x18dy\xa9\xeeo%ac\x9d'
+    b'r_\x1d\xf9\x18X\x9d[\xee\xba\xf9\x88\x90\xd5z\xab\x1a*/\x92\xd923\xee\x0bM|\xd6u\t\x93/\xed?4I\xa0\xabY\xe1\xc2T\xe6\xf7\xc8w\x00N'
+    b'\x14\xfd\x08W\x19k\x1b\x08\xdc\xf75{g?dL\xf9;\xbd\xf2\xa1{\xda\x91\x9di\xf9\xc7\xd1\x17\xe5U\xafj\xb0\x96\x0f\xd8\x1d\xd6\xbe\xca\xcfuK\xad\x9c<'
+    b'S\xd7[\xef\x80\x8dqe^}\xc3\x8d\xd0\x07`R7\xb8\x98f\xfbM\x80/S(\xad\xb2\x17\x04\\\x1e\xf6u\x82ZF\xfe\xcc\xa31=v\xe1i\xf9\x13"'
+    b'\xfab\x9cm\xfe{\x08V\xdb\x0bq\x9eL\x87\x95I\xd7\x1d=|e\xec\xb2A\x81\xeau\xa7\xdf\x91\x7f\x1c\xf7\x9an\xfc5%\x1d\xe7>\xa91\x9f\xb8Wg|'
+    b'\xcf\xfc\xb6\x10\xe9\xcf\x98\xad\x88{\xa1\x1d\xe0\x10}\xd6$\x1d%NH\xba\xf5\x96S\xda9\xaap\xfbA\x01\x07\x9f\x1a\xf1\x992\x006\xa2\xb0"\t\t\x1dT\x11'
+    b"\xcaj\xd2\xb8\xa4\xfcl\xff{\xe9\x7f\xa7\x1e\xf8\x04\x88\xc8\xd1\xd1^\xb5\xea\x02'\xbd\xab<1\rB\xad\xab\x82Q\xe0j\x94\xb0\xe8\xd8\xc3\xfbs\xfc9\xffV\xb3"
+    b'w\xd2`\xe9\x1e|\xae\x92\xd9\xaa\xc7\xda\x8b\x8d4(\xf3*4{=\xa4\n9\xc4\xfan\xd7\x8c\xe4P`\xaf\xbap\xe7\x85\xde\xc9\xbb\xd5\xe7e\xf7c\xaf\xfd&'
+    b"\xb0\x08_\xf0\x1bJBe\xc7q\xb8\x08h'\xc01/\xd7\x0c\xfbRde\x89\xf1\xdcZ\xda\xe7\xe7\xe8\xa8\x90\xd4>w\xacZ\xb3l\xfe(\xfdM\x07;\x92#"
+    b'j\x93\xfd\xe5\x11P\xb9\xf1\xf7S\xc3D\xb1\x0c\xda\xbd\x827w\n\xa1\x9c\x05\x1c%q,qW\xf5C\xceG\xe9\xda\xb1\x8c\xf2F\xb5\xee\xc1*^\x17l\x0b\xfe'
+    b'*=\xa8}GN\xc3Q\xf2d\xc7\x0cV\xf0o\xd1r\xcc\xfez\xd1P?\xd0*\x10\x9f\xcb\xb1L\xff@,\xb8s\xf7\xcf\x80\xbc\xf4\x11\x18\x00\x147G\xc2\xf2'
+    b'\xd0\xf0\x0e\xf3lH\xe2\xd1\xad)=E?\x8eg\xa9\xc3U\xedl\x18\xdbT\x92\x93^8\x02?\xe0\x9b\xac\xa6\x01\xb3_\xc4/Y\x02\x8a\xb1\xf5\x93\xfd\xeci '
+    b"m\xdcY\xc2\xda\xce\xeah\xe2b'\x13\xc6\xad|&\x86T\x07\xc8\xf6\x86\xb4\xe2\x0erO\x94\xf8R\x9a\xae\xb4yU>\xa7\xd0e@\x08\x91\xac\x03&l}\xc6"
+    b'5\xae\xc81\xcd\xdc\x96\xd7\x99\xef\xa5\x95\xa7\xc3\xde\x82i^\xcej\xa7\xa5\xba\xfde\x0fb\xf8@\x82m\xd2\xa6\xbe\xee\x10\xa2\xac\xd3\x03\xc0\xf6S\x00E~\xe0\x84'
+    b'\xd7\xea\xfa"\x83\x04\xf2\x8d\xc7H\xa4\xae\xdc\xec\x8a\xc4\x81\xc8\xa4\xc4\xe4n\x02ez\xc9\x9b\x1a-\xc5\x86\xf2J\xc9&\xdb\xe3\xd3\x8f5\x14,\xc2\xef\xf8\x95b\xaf'
+    b'+\x19\x9c6H \xc9\xfcX\xbeT\xc2g\xad\xd9s8\x19|\x88\x19*)\xe6\xc2\xe9\xe66\xb4xAN\x0bt\xa4lz:\xd9\xef}\xa4\x8f\xaa\xebz1\x9e'
+    b"\x03\xb3k\x99-\x93*\xd16m\x19\xaa[M\x0b\xd0\x96^9\x85\xfcAN\x9623e/R\xbb\x06\x80\xf5:\x94\xb2\x12\xce\xde\xb3}\x9f\xcc\x16'\xfd\xc0,"
+    b"\xa7\xa9;\x84x`\x0cu\xa0G\xab\xae\t\xa3\x7fRn\x10\x88\xf8SL\xfa'\xb91\xf6\x82\x10\xec]\xed\xbc\xe7\x18\x1a\xf4\xc1 =\xab\x02\xffq^+H("
+    b"I\xa6\xdc@\x07c\xf6N-\x0e\x93$Uo\xd6u\xe4\xf48\xa0\xc5f\x93\xab\xbf\xa1\xa6h\xa8^G\xf8k\xc6\xb8X\xa0Ros'B\x99v\xda\xd2|\xdb"
+    b'\xa9\xa5b\xa8\\c6\xd3}\xca\xa4\xec//\xe0lk\xdf\x81\xb3\ri\xa4k\xf9+\xb45\xb7\xd5\xa5\xeeb\xd1\xf3\xab?T\xfa\x89\xa1\xce\xbb\x8aI\xa1\xd8\xa3'
+    b'\x01\xf3\x185\xab{\xf5\xd9y\x94`\xe5F\xa6\xaf\x06w\xb5\xf7S\x83[S\x08\xbf4\x0f!\x87\r\xbe\xe8UNbwI\xdb\x1d\xfe(\xa6\xe4[r?*i'
+    b"M\xf7'\x1d\x9d\xf9n\xb8\xf4&J$\x1d\x90Hr\x05\x0c\xd2\x07\xccDW\x02\xe5\x8f\xe8!\xa01D\xebr[O\xf2s\xe5\xe9\xd4/\xfbu\xb4\x88\x96\xa6d"
+    b'\xed\x0b\x0e\x1e\xecm\xf1\x0c\x8ef\xbb\xd5\x12u\xdb\xa1\x0e\xef.\xe9\xf0\xd6x0m[\xa1\xd6\x81\x98\xb5L\x19\x10;f\xe8d\xa6\x9ep~[\x0cE\t\xe6\xd2'
+    b'\xc2\xb1M\x19\xb3)A/\xb4\xd9\x83:o\xe3\x8c\x05|#8\xachnNCz\x81\xa7\xb8\x0b\xea\x16j\xab\xc4\xa4\xb1\xce{\x05w\xe7\x92\xc8h3I\x8a\xd4'
+    b'GHlr\xcd\xb7Ku\x1e~\xe5G\xfd\xa7WJ\xaf\xdc\x18ay\xa5\xca\x89\x9c\xbd\xdc\x867u\xba\x17\xe8\xac\xfc\x84e\x0e\x18\x8dT\xd1M7I\xc9\xd6\xbe'
+    b',\xfc\x8c:\x989Y\x06\xe2\x12Mk\xb1\x12Yj8dI\xc3\xb1+zW\xe7\x82\x16\xd701K\xc0\xe1\x0f\x06\xae\xd5\xf1\x8b\x86\x80 \xd3S\xe13Ji'
+    b'\xde\xd0$\xbe\x89?\xea\xb5]\x1e&,\xe2\xf8_Z\xb7N\xb8\x86\x9f\x91@:\xe1\xdc\xb6\x12\xaaU\xb1\xda9\x1a\x8b\x93\x018*\xcd1\xfb4\xf4\xfem\x9f\x8b'
+    b'\x84\xe7s\xaa[\x07\xa2\xc6\x99\x9e\xf0/\xc5H\xcc\xad\x8bK6\xc4q\xee]\x89\x8a$\xf4\xc4\x8b\x88\x04&\xed\xb5\x038\xc4\x8e\x02\n\xdav\xd5\xff\x97|>)'
+    b'\x90\xaaf\xefW:m\xa5\x05\xd9[\x08B\xd9k\xc5~\x87\xd5Q\xe9*z\xe9pe\xfe\xb2&Q\xf5\xc8\xf8\xf3 \xd9\xf1\x9b\x1bJ\x8b\xc1\xa3rH\xee1\x02'
+    b'2E[\x88\xf8\x88\xce\x99v\xfd\xb5#\x90\x9f"\x1f\xbf\xaeR\xdd\x9f\x12!h\x922\x12\x9fc\x16\xd8|U\x9e\x07rEh\xd3\xa5W\n\xdey\x80\xbc5\xf2'
+    b'6\x89&\x06\xc5\xa0gVzl\x80\xa37\xef\x0fO\xa5="\x90\xe97/\xda\\\x16\xb6\xe0&\x9a\xd02\x80\xf5\x10n\xb0\x89\xdf^\xec\xa9s\xf2\xae\xf6\xcf\xdc'
+    b'\xa3\x94O\xf4f\xbe64\x0f\x0e\xcc\x8b\xed\xe10\x05\xab)Gr{8l\xdfZp\x1d\xd95=\xec/2\r\xe4\xb5B\xfd\xf7\xec\x88\xfb\x95\xdfvz\xd7~'
+    b"\xbb#\xee\x0ec`\xc2f\x0b\xe82\x87\xc5\x8dsA\xb3\xa7\x97PY\xf7\x0b\xa1\xbaB\\\xfa/\x90\xab'\x00\xc7\xa5V\x1f\xa6\xb9\xe9\xc9\xa6\x83\xac\xbc\xf1^\x95"
+    b'\x0bf\x7f\x93\xca\x99\xe7"A\xcdpq\xc0\x90ru\xd2\xf2\x9c[\\\x9eM.L\x97\xc8C\xf3\xab\x07\xc2\xb3\xb2e\x0b\xb3\x08;\x9b\xa1\xd7a\x81\x86l\xe2\xef'
+    b'8\x03s\x1f\xee\xfc\xe9\xc0\x03\x0bH\x82\xec\x83\x1b\x06\xa0\xde\x80\xc0\xa2j\xab=O\x86?\x80q.\x9ee\xc7\xe6\xf5\x07\x8f@o\x10o)\r\xaavRr\x1e'
+    b'\xf7wU\xd1\x8b\xf2oVl38\xe74\x84\xbf\xd1a\x05\x01\xfb{\x06Oj\xe2#|\x1f\xd5\xb4FS5\x83o\x0e\x9exH\x83\xe8\xdd\x03\x1c\xbb\x8b\xc9\xb7'
+    b"\xee^n3\x03\xd0\x8a\xbd\x12'\xc8W\xe7\x82\x9d\x7f\xdb\xa5\xd0J\xeef\xfew\xbc\x0fu\xa4pg\xfe\x15\x97\xffe\x129ViRl}\xad\xdb\xc3s\x04'"
+    b"\xa7\xa2\t\x08/$2\xf5\xdf:\xb6\x93\xcdo\xaf\x08\x0f\x9e\xefT\x06\xa8\xdbf\xec\x0b\x8a\x0en'\x0b/\xd0\xee\xc3qr\xc5\xf6\x10\xaa\x89r\xa4v\xd4\xbf'"
+    b')\xc3d\xb0\xe4\xe5Z\xf8\x8a\xac\x7f\x1d\xa3\xff3\xa5\xd1-C\xa8\x85\xbfW\x80\xe4\xd3TpG\xbc\x94\xd7t:V\xc6\xafH\xc6\xf8\xec\xa5\xca\xc2j\xb5S\xeb'
+    b'\x97\xfa0\x81\xaf\xa0\x82\xaf\x0e\xe7\xd1q!?\xc6A{\x89\xde\x90P\xce\x91\x0b\xaf\xe3\x9b]\x88\x86\xb7\xd8F\x8d\x15\xf4\xb9\xbf\xba\xed\x0b\x82\xc4E3A\x1eG'
+    b'N\xabE\x1cE\x7f\x14\x8e?y\r\x99\xfd\x0b\x9a\x15\xa87\xe6\x1c\xe8\xec|e\x8bBxy\x08A\xc5Fh\xd6\xc1j\xa3\x02=\x1a\xf8#\xc4\xa2Z\xdbw\xd1'
+    b'\xa9\xbc\xcc\xec_y\x06\x8e\r\x1c\xad\xfb p\xa66\xe1\xe4n\xfc(Y\xda\x0b\xab\x16\x1e\xed\x05\xf1\x0bbv\xa9\x89\xb7\x17\x82G]\xed\x08\xfa\xf8c$+%'
+    b"\x0f,\xa5\xfa\xd1Iq\x1d\xcf\xe8\x7f;\r\xa3\xf6K1\xf7\xb2\x0cp!)s\xb2\x19B\xf5U'+p(\x14\xdb\x02\xf9!\xa7\xdf\xa1\xa8'\x9fdf\x9a0"
+    b'\xb5\xf9\xc6Mz\xc6\x83\x1bR\xa8\x8a\xf3\xfe\xb9\xec\xedu)\x04@\x9b\xd7+\x8b\x1f\xf6\x01\x97M\xe8bC\x86}5{\x81\t\xd2\x89:\x84\x01\x84n\xf4\xcb\x83'
+    b'\xdf*G\xb2\xbd\xb1\x91\x04\x05\xdd?H\xd5jk\tu\x19f\xa3NM\xa9\n\xe3>\x99\xac\xc1\x95I\x80\xbc\xc8\x11O\x81\xd3\xeet%m\xa0XP4\x04{'
+    b'\x95\xdc\xd2$\xcb\xddCp\x8ex\x8f\x9e\xe1c\xec_\x15*\xa8\xaa\xd3\xa1\x04\xa5\x849\xbd\x87\x1c\xa0\x88\xa9\xe2 \xebZX\n\xe9 Y\xe3\xe1l\x1c\xb7\xcdH'
+    b"\xf9C\xdf\xef\xcb\xc7\xffq\xda:\xdf>'\x9aR-\x93\xb3@n\xb8\xf3m\xf4!\x87\x99\xa5W=\xa7J\xf1\xdf\xfe):|\xbek\x8c\xba\x9e\x9e\xcf%\x00\t"
+    b'e\xb2r\x1f-i*\xd7\xecI\x7f\xbc#\xbb\x84~\xcc)}$y\xc1Ojb\x1c\xd4u\x85\x93\xa4}\xeb\x1c1\x95\xc4\xa9\xbd\xca\x18\xb8\x90B\xe3\xbdp\xe2'
+    b'm\xb4\xbb&6|X\xf9xK\x02\xdf,/\x82\xcc#\xd8\x7fh\xfdv\x8eD\x14d\x1c)\x03z1J`\xc6-\xee"X\xae\x10e.l}aK\xf6\x8b'
+    b"\xfc\x84p\xea;[\xa8\xda\x92\xaa\x87\xfa3\x90\xd4f\xde\x90:*-t\x86^V\xc9\x87\xf8p\x0fQ\xf2\xde\x89\x1c\xed\x9eT\x1d\xcdnI\x8b\xb4.\x1f\xd6'"
+    b':\xe1\x972\xb8\xd8~q\x1et\xf05\xc3\xbb;\xe8\xdb\xfb\xf2>c,\xe4z\xf9^\xceC\x91\x1c\xd8@\xa8\x11\\!\xe9`H\xc0o\x8a\xcf\xc1x\x94\xb8A'
+    b"\x06\xc3\x12|\x05\xdb\xcc\x18\x1c\r\x02\x1fL\x80\xe0\x9a\xc7:'\xe2\x92\xfa\xbd\xfc\xcf\xb7\xfe\xc1W\xb9\xd1=S\xd2\xcb\xf7\xf3\x1e\xc1*\xc0~m\x1d\xb8\xffn\xd3"
+    b'\xb3e\x96eN\xae\xfd\x83wL\xed\x10\xa2\x0e\xed\x12\x87\x17\xc3\xf1\xa8\xbd\xe3\xae\x80\x95\xa2g\x04\t\x0f&K\x91\xacV&&*\xeb\x94`\xdd\xebk\xf7\xa9\xa5'
+    b'P\xa869s\xd2e\xcb\xa0I\x15+\xb66p\xe2\x92y\xe8\xac\xc7\xd6\x9c\xc9\xcdE\xc4\x05\xf9\x84\xe1\xec\x87+\xe5N\x92-G\x8f\xd2g\xe4\x9cp&\x83\x1b'
+    b'*\x05\x0f\x1a+\xc0]\xe8\xa8\xf4\x10\xf7\x14\x82/\x8brU9\xe2U\x8d~\xc6\xb5\xb7\x1fz.\x97o9\x1b\xedJ$\x00\xa7p\x12P\x01+\xecOj\xcb\x8c'
+    b'\x16\x00\x88\x9et\xb5\xben\x08\xcci\xabHU\xa8L\xdf=\x91\xabK\xefe\x94\xde}\xd5\x96\xbc6\xb6\xa5\xf7\x90\x96\xd4\n\x0b\xb2\xd8\x06\xf9\xbb}\xb4\xff\x92\xd9'
+    b'>\xf3\xb1\xae\x91\xb9\xed%\x84\x9a*\xa6\xee\xb3U\x86\x84\xfe\xd1m%\xc9s(\xcbT\x1a\x08\xf1w\x1c\t\xccf\xb5\xa8[\x99\x98\xe5\xde\x94\x1er\x0e\xbd\xcb\xb1'
+    b'\xc3\xaa_\xa0\xfa\xf2\xe4\x86\xdfA\xf9v \xbfL\x9f\xe7E\xff\xa7\xcf\xb7\xac\xb1\xf6\xad\xd1\x18\\\x06\xe5\xe0R\x94L\x13\xdcA\x9b\x05\xbeG\xa5\xbdF\xe7\xcc!'
+    b"V\x81\xfa\xd3u\xc9\xfa\xa3\xc63|\x8d}\xbfj\xbf\xaa\xed\x85I@\xe1\x9f'\x9cMv\x85ACr\x883\xa5^9\xdb\xb4;\xce\xe0)\xdd\xb8\xce\xa5r\xb6"
+    b'Q\x84eW\xe8\x01\xd5cJ7\xbfS\x898R\xec\x81tI\xcczF\xd71?\x81{\xae\x05\x05\nKm@|\x05f\x1d\xc1\xcb&\xb9"P\xb9\xde\xb0p'
+    b"iS\x8f\xa9\xe5\x08\x9f'\xd5gf\x1a\xe8R\xa15\x8dN\xfc\xfa\xb9\x03\x9b\xde\xc6\xbd}\xea\xfeE\x9e\xe9\xa6\x16|\xa4\xb6c\tn\xec*e\x8d\xa3\x88.\xaa"
+    b'z\xe2h7\xb6C{\xe7#\x7f\xa52Q\xe03\xa1\xda\xf3\xfdY\xe3\xca\xda\x93E\xcd,\r\xf7"q\x08\x15\x88R0\xec\xfbq\x18zvR\xdfbhB\x8f'
+    b"\x054\xe9f\xb0\x0c~t$\xd2&\x9c\xcf\xcd\xc1Wr'*\xf8\xe4:\x92\xf38\x9e\x1f\xc9\x01\xa4\x1b\xd1\xfc=\x96\xba\x19u\xab#\xebYgO\xa2T\x16d"
+    b"P\x9ab\xe5\x94\x17\xe5\xbc\xd3L\x1eo\xb7\x14\xe2\xdf'\xf48\x06\xadHZ\x89\x9d!\xed,\x8b\x1dg]g\xd6\xb8TFO\x00\xd9\xc6\xbb\xc1\x05\x8e\x98\xc6\x08"
+    b'r\xcf\xf1g\x03\x92\x9ez?\xd2\x0b\x82L\xe0\xf43\x8f%y\x03\x8a\xcf\xab\xbf\xac\xb7=N\xbd6\xfd\xb5t=C\xd8\xabJz:\x0eL\xdc\x0b93\xc3\xce'
+    b'\xfao\x864\xe6\xe5\xaf\xc7\xe8\xbc\xc7\x80\xad-Be*\xb2\xef\xeeR\xdf}\xdf%O\xd3\x1a*\xbf\x80}\x1b\x95\x14NnUX\x97.vi\x17\xb4\x97\xaa\x1c'
+    b'<\xd5\x13\xd0\xcb\x94\xdb\x7fP\x9a\xc1S\xca\xfc\xac6\xd6\x06m|\x93\xfa\xa9\xec\x90l\xd0l-\xb9\xeb\x85\x02\xc6\x0eI\x7f=\xf2\xa2\xd2\x9f\xd3\x1f\x8b\x7f\xb6\xee'
+    b')\xca+ox^\xf2\xc9\x0fa\x83\xb8\x9d\xdc!\xe1p\x8dc?\tT\x85\xe4\x03\x1c\xd6\xf4P\x12\x9f{\xbe\xde\xb4S\xcc\x8f\xf9\x9as`\x85\xd0u\x08OO'
+    b'\x11\xddD|\x7f>~\xdf\xe1-\xa2\xec\x15G\x88\xe7AV\xa1L\xb0\xaf\x8a\x86{\xfbF!\x81c?s\x9bn\x8b\x0fu\xaa\xb3M\xdf<\xd6A\xc4\x06\xb9<'
+    b'\r\x7fVq26V\xa5\xfd\xfb\x82W\xf9UU\xa9\x08\\|\x87\xdb\xe8:E\x9fE4\xb1\xe6u\xa8\x00M\xd2\xe7\xc8\xf8\xcd\xff\xf7]\x9e\xff\x87Q\xc4u&'
+    b'<H\xa4\x85\xfbs2\xbf\xff\xbf{T\xff\x035^z\xe9'
+)
@@ -1,11 +0,0 @@
-"""
-Auto-generated base64-encoded image data for: icon.ico
-
-This file was generated by scripts/generate_asset_b64.py
-Do not edit manually - regenerate using the script instead.
-"""
-
-# Original filename: icon.ico
-# File size: 6751 bytes
-# noinspection PyPep8
-IMAGE_B64 = """AAABAAEAAAAAAAEAIABJGgAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAHWAAAB1ggGAAAAyhqoWgAAGhBJREFUeJzt3V2O40h2gFFy3DC8A794GV6Fcr3SOrwgG/RDN7vUWZKSPxGMeyPOAQYwBuNKkSny4w1SymkCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACAAubWLwCA7ZZlefnfz3Nfp/P7/f5yQ7++vsJvaPgXCDC6dzH9Lntc38X0u+hx/VfrFwDAe1ujmt3WqGYQuvoAozoa1GxT69GgRp5aTawAwZhScwtbfIDRnA1qlmn1bFAjT6vTZGIFCMGU2o/Q1QfoXamgRp9WSwU1+rQ6TSZWgGZMqX0KX36A3pQOatRptXRQM0yr0ySsAJcS1WOyRHWahBXgEoJ6TKagrtK9YIBsRPWYjFGdJmEFklujFTE2JYP6eDyWaYoZG0H9p9QvHhjb3nBdFd/SE+oa1a2uClONp32zR3WahBVIrMbHVc7Gt8ayb8SAmVLf62ZDgLFc/RnQLcHNEtVPtgROVD/ramOAMfT+xQprxHv/YoXegrryzUsAgUR8CKuGXqM6TSZWIKneptZ3Qe1tau05qKvuNxDoWw+B3TKl9hDYEaI6TcIKdCBrXPcu+2aN6yhBXQ21sUC/ssX16L3UbHEdLarTJKxAZ6IHttTDSdEDO2JQV8NuONCvqHEt/cRv1LiOHNVpElagY1ECW/sjNFECO3pQV3YC0LXWcb3qc6mt4yqqv9gRQPdaxLXFFz20iKug/s4OAYZxVWBbf3vSVYEV1dfsFGAoNePaOqjPasZVUD+zc4DhRPxzczVE/HNzI7CDgKHU+NNuEfnTbu3YUcAQTKnHieo+dhbQPVPqMYJ6jJ0GdMuUepyoHmfHAV0ypR4jqOf9q/ULAMa1LMvfASwZwmhRvd/vyxrAkiEU1ZjsRKCJn+I3z/O0LMuuqEUL6jT9HL+vr6/5fr8ve6ImqLHZmcDlzgbwVfAyRvUnr4InqvHZocDlSkVwnWpLKnkvtVQE16m2xL/1/G+W/Pf4xY4FLtf6L8684++lUoKdCzQRKa41n/iNFFdBvYadDDTVMrBXfoSmZWAF9Vp2NhDC1qeES2n1udStTwmX+nmiej07HAjD30stS1TbsNOBcCI/6VuSJ3375JcAhHQmrlFD+sqZuAppTH+0fgEAe2UK5xnCCQAAAAAAAAAAF4r0VYc1Lcvy761fA3X4Q+dAGANF9b+mafq/1q8DgE4NFNR/a/0aAOjcQFH1mVQA6hFUAChgoKB6hgWAegYKqqd9AahjWZYhgrosy38uy/IfrV8HMVj7B4p6DmnPX5a/LMt///V//s88z//b9MUQir9uA5zyfSLtNabf/7zb3OuGcpo3BrDLu6Xd3jrz7u+k+lNu/MQbBHhry/3RHoK65Y+NCypbeaMAf9v6oFH2mG4J6TSJKcd408BgzjylmymoW+P5iqByhjcPdKjkR1wix/RMPL8TU0rxRoIkrvw8aMuYlozlT8SUGrypoKFIX55QM6ZXxvInYkpt3mDwRqTo1TLPc6jo1dJbTGu8NyMv+e9RYt+c3Rch9+QIJ7RpmqbH4zHGhkIDvcV0mq45N2YNbOl9c2Y/+OYloAs9hpR2lmU5HNdwYTWtAlsIKVGFCyvAO0djuizLPM+zi9kNzkxqvTm6L4QVCKnkRCqq+4jrL0f2RaiwWgaGcUVa2jXhMk1/PsB0pEuhwgqMI1JIvxPVXGoOZZaCgXAiB5T8akXVx22AEEQUAn1BhPurkIuItuOLIn6Jtgw8TSZW4AcCCvsIKyCe/GadBLNMrqW5xwp8JJyw3dmLiRBhdX8VzhFORhT1r/yECCvwmmDCa5EHMmGFi4gkGfl6w/2EFU4QS1pYQxd5ahtZd2GNfGV1v9+L/VtO6MCool9Q/Kv1C4i+g0q53+9jbChwmasGiVHO06U0DysA8Y0Q11IXKsIKwPBKTv9dhTXy/dWS3F8FpmmMKfK7DNvcVVgBRjLKMJFN07BmuPIowYNLQA2jnENXWba3m4l1lCs3y8DAap7nYc59mXQTVoBRiWsswgrAJlmWYvcqfWEirABs1mtcS2r2lYaj/HI8uAQQU60l9C6+K3iU+wseXAJGlG0QsxQMAAV1MbGy3/MVYLaJf33tz6/73fY8L8Vnm/jX1/78ut9tz/1+X7JtH2XN85xusutVswOx5BsgchhK3mM9c+Ic5YB7PB5jbOhGYjueK471q8+5tbap1nY0WQoW1f2cIAFycI91EJEvQEq63W5jbOgGLsaoZZQVsKOEFYDdroprjZ9T+6sghXUgptZxmFa5gsn1NWEdjLgCWWQNt7BCZ0yrY+vl4jlrVKcpeVh7eQP9pPSJcpT9NuLUKqrQ3uVhzXwVskf07wgW1/6IKit/p7Wt1BMr/GSUk4uoQhzCCsBhy7KkWYm86kJbWAfW+zS3bl/v01zv2wclXXHeSxvW3qOwqn3StB8BykobVsrpMa6vtqnHuPa4TYwt09LyO8IKAAVdGtbsVyFbRf+ozSs9Ta2ftqWnCa+nbaEOH7tpw8QKAAUJKwAUJKwAnBb5Vt/VS+IpwzrKPQP30Pbz3oB2Isa1xTkhZVipQ5S4UsSTcA0ZH2ZspZf3hLAC0FwvUZ0mYaUjJm4ggsvC2tPVyCfZl33ECfo0yrEdgYkVoHPRo9rb4CWsAIOIHtjSWm1vurCO8sawVAlkFOVL9Fu2Il1YgX5EOAFfIfuzF0eM8rt9RVgBaKbHAAsrABSyLIuwAtBGj9PqNJlYecEDYtCvUY7vFtYLBWHlN71eRX434gMlUXiPtdV7XFtvn7Dym9ZvyiOOvOaME2vG1wyjuSSsrk4BxtPiM60RBgMTKwBdiBDVaZqmP1q/AADG0uMq5vM2pZpYo1yN1OY+GkAe3y8UUoUVgDJGGVRaEFagqR6XBV+J+HCjuNYhrABQkLACUFXtVYl5nkNN38IKQHWjLPlPk7ACcKHeAvtqe4QVgEuMENVpElaAoUW6N9kLYQUYnLiWJawAUJCwQjK93ad6J+IXKsAWvoR/o+eTWc/LJuvJ7PF4TLfbrd8NTWp9Hy7L0u378Dmo9/t98d3ZvNPyGPh0gSusB6w7tNcT2+rxeCzTNIUPbO+/h9Xz76HHbX41oYrqdeZ5HmY15Iwt+8hS8AbvdmRvb8J3S29rYIljlPee5WAySjOxRr1CLz29Rr1CzzK9jiLq8bDHlgu2qMcDfGJiLaS3CeKdx+OxrP9p/VpWI+379f/Ovs1b3z8mVjJKM7ESz+PxWEyw7CGUjEBYOcUSMT8R0zzWWwzZV0RaE1aKEFi+E1Rqif4Es7BS1Kt7Z2I7DjH9xb6oY52qr36Ab0/IhTWY77+8UZ7+FN+4BAL2EdbgrlzueDwel/2sFz/71Ibe7/dSLyW05/00yjZDNj5uAwAFCSsAFCSsAPxDD892tCSsG4zyJvMAEdH4SsN25nke5txXmoeXNoj8eamSIn1NIdBepHNf1D8R94qJFQDeOHJxIawAUJCwAkBBwgrAS6M/vHT0HrOwAhTW09dAjh7XI4QVgI/EdR9hBSC0bGEXVgDCahXVM5/hFVYAeHL2izGEFQAKElYAKEhYAaAgYQXgRy3+2k22p4FXwgoAfynxF32EFaCgnr51qaWs0+o0CSsAwWSO6jQJKxCY6S+e7NH7SYnt+6PA6wBgIOL6mYkVAAoSVoALfH199T3m8TdhBYCC0oS1xGeLMng8HmNsKECn0oQVIDpPMTNNwgoARV0S1t4fzV7dbrcxNhSAt0ysAFCQsAJAQcIKAAUJKwAUJKwABfioDSthBYCCUoXVty8BGfme4LGkCqvPwwIQXaqwmlgBiC5VWE2sAER3WVhF8bxX+/DIfo3+u3i1D4/s154vUGpum/uB+3kimGd/tH4B/O5T+GrG9X6/7/539rjdbvPj8Vi2RGFvXD/sg48/K9sJ8Xkf1Azgln87276Dqwgr1ZSaPInpXXwFl9GlCuuyLOGXMUu43+9L1uU44bxG5OPg+b17NrJZjwPGliqsxCSmvPP83vC0O6NI9VQwsdxut1lU28j40bMj7xfLymQkrAXN8xx6ia4UQW0vw/vsXfz3vHcyLAX/FP8M20BZwlqAoHK1jBPrs9vtNnvymF5dGtYS8Yl2Qnm1TSWuUKOdUASVGr6+vub1P61fC5RiYt3g3QVBb1Pqu5Nb9Kj29nt45/n30OM2v3r/CS4ZeSp4px5PaK9Ejyl9+vr6mqOt1sBewrrRKEFdJ4RoS+6M9x6ErCwFk94oFwGZJjm/E0YmrMDlTN/0TFgBoKDLw+pKFYCepZxY3b+BuByfsSzLEuI/I0n5VLCpF+C9iCFbX9MI528Ta2BZrogB+CVlWAF4LfrgEf31lSCswKVGWAqcJrdyRiasQDEjTCPT5DYNnzUJqytWAHqVdmJ1ZQxARGnDCgARCStQxJZVpB5uA21ZRXIbaGzCCgAFCSsAFNQsrD0sCW1hSQhgLKknVk8GQwyORfgldVgBIBphBS7h9g+jEFYAKKhpWDNdwZ65h5TpCtY9JIBz0k+sVzw0sf6MZVmaPaRxRfDWn3G/35fH4yGwAbV8D75T+vXc7/dl/U/Rf/ikaK+HuNKHtYWIJ7caHo+HwAbV4/vvVUzFjIyE9YQeT26viCtnfbrtE3E6PSrTbR/q+aP1C8hujWum+8VHrHG93W59byi7nLm4zBTTTK+V9ppPrCWCVHty3PIaf1oeLnElW/vg3vIaLQ9TglDRMxNrYSZYeE9QGYGwbnBkIs4Y2CMnPYFtI8L7autx8Xg8lvv9fuhnRLhnufW4iPBaiUFYK3s++Twej4avpK7n5WGRZZo89Ma4QoR1nuchnrC93W7zCCeb79sotOMY4f0NPwkR1hKWZQmxPFbb/X5fsi05bT3ZXh3gzPf7Wrzfv++vK1ZgMr7fIcwbtsTEWutEU3KaLnFFXytApg2iaR3VPRdfrV/rKsPqX+9DUPOP25SU4Q1VggAyiiyrClGiSgxhwtr7FczK/UaAvoUJK0AkWaZl4hFWAChIWAFOcH+V70KF1X1WALILFdYSPBkMnOX+Kmd0F1YAaElYAQ5yf5VXwoU1w99nLaHEfVbLwVCeZWDOChdWAMhMWAEOsAzMO92GNcNycAmWg6Ecy8CUEDKsPs8KQFYhwwpwNdMqpQgrwE7ur/JJ2LD62M127rMCxBE2rACQkbACw9tzf9UyMD/pPqwZloNLsBwMEEPosPrYDVCbp4EpLXRYASCbIcJqORgowf1VtggfVsvBQC2WgakhfFgBIJNhwmo5GHi2d1q1DMxWKcJqORiALFKEtRRTKwC1DRVWgGmyDExdacJqORiADNKEFaAEH7GhtuHC6j4r5BFhCTbCayCXVGG1HAxAdKnCCoyl9LKtZWCuMGRYLQcDW1gG5oh0YbUcDBxhWuUq6cJaiqkV+MS0ylEpw2pqBfYwrXKllGEFgKiGDuvW5eDsE/LW5WATMtG0Wo61DMwZf7R+AUfN83zZfdKW92Nvt9tc6j7p8wXCsiy/XTBEXS5b98Gn8D/vo+f/3bv/v8z3nm+32zzPc9jfVzT2E1dLG9ZSXgXmSt8vEF69lvv9fvrn/BWSv//xq7f5+wXC3un4p//9hwnj43+f7aT7vB/OTlVHLhizXIxBS6nDeuXUWsqroP0Uua+vrznbCexVCC01x1EiqtP0Ou6R3qtHXotlYM5KHdZSak+tUe7R3u/3peZJQziZpt/DFCm0cAVhrShKUGsT1FxKTatbraG9OrCmVVpJH9Zoy8G1YhptOVhM22r9bMARz9Ha+l6uvcoCNQz9cZtnJeKc4URXIs6imleUi9DasYx0Ecp4ughr66DN83zJa2h95X673WZRHU/NVZjW7+lnkV4LuXUR1pZaR/0qgppflGn1u9JBM63SmrA+eXfieRfPrFF9d+J5d4IT1XFd9R5vPS22/vn0Jf3DS6srHmKKENIrHmL6+vqao043/GnvezHD7/PVw017g2daJQIT6zd7p9as9k6txHDV/fzWot1/hT26CmupE070q/tSJxxX92M4+n7OFvCj72cBp7SuwgoArQkrdMy0+plplRq6C6vl4H0sBwOU1V1YgT+ZVj8zrVJLl2HNdmI4yokBIJ4uw1pK9OXgUiwH98e0+pmLUmrqNqzute4jrgBldBtWGFX0i8FSXAwSVddhzbasdZRlLVZnoprpeDkTVccLtXUd1lJMAABs1X1Y3WvdR1zzMq3+zLTKFboPKwBcSVihA6bVn5lWucoQYbUcvI/lYIDjhghrSdHjWsrj8RhjQztgWv2ZaZUrDRPWTCeQM0Y8gYz8ux3lQs8qCpkME1bgn0a+IIGahgqre637WA6OLfr7sBTTKtkMFdZpEte9MsQ1+u+ilJKBMa1CPcOFlf6MGAkXExCXsJ4wysktw9Q6krPvuywXImejalqllSHDWvLEEjmuJU8skeMa+XdQkukNchgyrNOU56r9LFftfTGtbuN9T0vDhrWkUSamyFMrPxNVuMbQYc1yojnLiQbgOkOHtSRTK5FluYg0rdKD4cOa5YRzlhMO0Xk4i14MH9aSTK3t2PfvuXiEawnr5OM3R0SL65HfYcYJ6Xa7dRmPjL8LeEdYoWMZptUSUTWtEomw/iXDCaiEXk9AkVcKSoq2UnCWSZUeCesTX9C/T28n+d64WIQ2hLWS6HEtJVJc9+zzzJNSpH1+RubfAXwirN94kGm/Xk70PYk+rZaKqmmViISVrmy5mOlhUvp0MSOq0JawvmBq3c/UCvAnYb1A5LiWFCWun/Z3D9Pq6tX+Nq1Ce8L6RukTVNS4lj5BRY5rT1FdRdnfW/S4/+EVYf0g+tV/CcuydPttPs9x7fmkvsY18vu15P43rRKdsF4o2tRa6/VEmqKWZek6qqtI+/w7UWU0wvqDyFPAGd+j2uvUGjk4pY1wAQEZCOsGozwlXDKuIwWN90yrjMgbdaPSQWw1Cf+0HaWD2GoSFvb2IRLVNiJfvK96XQlcmVg36uEp4S0/s3QIWwROVNuzLM3IhHWH3q+yVr3eb+UapaNqWiUbYW3o6ql1y4XBPM/FLyCuniC3XBh8fX3NPZywX21HL9s2TaJKTt60B5QMYuQp2D2ycnq5R/8T02p77rG2Z2I9YJSnhEue1NxzK6f3k9JKVMlKWAOIHNeSRo2rFY79RJXMhPWgHp4S3qL0CW60uEb9vZY22u8VPhHWEyJPDyWZHo5xX/UY7zeyE9ZATDf9ENVjRJUeCOtJloSPGSGuwJiEtQBxPabXuJpWjzGt0gthDSpqXEvrLa6ieoyo0hNhLaTGCTBiXGucAHuJa8TfVw29/L6gFmEtKOp0UZrp4nc1ohrx/VQjqt5P9EZYC3O/9RhT0D9FjGoNokqPhLUCcT0ma1zdVz1GVOmVsMIJUS96Sst60QMtCGslptZjMp3A3Vc9zrRKz7y5K3PyPS7yydfv9bjIv9ceRL0IfxbxvV6SiRV2EtXjRJURCGtlPt96XMRlYVE9TlQZhbBeQFyPixjXkiJGtQZRZSTCehFxPS5KXCPu7xqi7G/ISlgvJK7HtT7ZWwI+zrTKaIQVfiCqx4kqIxLWi5laj2sxtYrqcaLKqIS1AXE97sq4iupxosrIhLWRWnGNFthaca0d2Gj7sZbW966hR8LaUK3pJVoUak0vtaJQa/9Fm1Zr7T/TKqMT1sainWxryXKyFdVzsvyeoSYHQRDu5x1X6mQuqueIagzRVqxG5EAIxIn9nDMndvv+HFGNQ1jbsxQ8gFEOtKPRENVzRBX+SVgDqXkijhTXmifivfGItF9q8vQvXEdYgxHX87ZGpOb+iDSt1oyqaRV+J6wBiet5P8VEVM8TVXhNWIMS1/PeRUVUzxNVeE9YAxPX877HRVTPE1X4zAGSgBicd7vdqm5olP1Y+yElUY0v0kXzqEysCZhcz3s8HtU2VFSBZ8KahLieVyOuUaJam6jCdg6WZGpHMEooak9fJZaGR9lXoppLpAvlUZlYk6l9Mo9yUNY+mZ+dXkUVeEdYExLXMo7GVVSBTxw4iV0RwAgRueLr+LYuDY+yP0Q1rygXxiMzsSZ2xUk+wkF6xUl+y/QqqsAWwpqcuJbzKa6iCmzlIOrEVfFrHZir/krLujTcentX7qeyVYQL4dE5mDoirmVFiI0plb2EtT1LwR25KnitD9zaX0+4av03TEUVcnJQdajXyfX7dtX8msJnV8dnpImc8lpf+CKs3bry4Gr5udqr4jpN9UN05YQsqv0S1vYsBXdqnuchloZvt9s8ytJwKaIKdTnABpB1et37urNOryZVSjKxtucgG8TVB9vZwB59vVfGdZrOh0pUKU1Y23OgDSRDXEu8xgxxFVRqEdb2HHCDiRrX0q8ralyvvk8rquMR1vYcdANqceB9Cmyt13N1XKfpc8hElSsIa3sOvIG1OgDXyF7181sEdpp+ha3F08SiOi5hbc/BN7hRDsJWcb2aoDLKMR2Zz7EOrvX3/l5hnuchgjPCNkIGDkT+1uOV7qsLh16+6OGZqLLq8TjOxsTK33qbXt9tT28R6m17IDsHJL/JfsW79QIh++QqqLyS/fjtgQOTtzIeoEem7oyBFVXeyXjc9sbByUdZDtKzy9hZ4iqo/CTLMdszByk/in6glro3HD2uospW0Y/Z3jlQ2SziwVrjgauIgRVVyMPByi5R4lr7CeYocRVUyMdByyEtA3vlx4JaBlZUIScHLqdk/SPqe/kzb8BWDmBOqx3XKF9cUTuuggp9cCBTTI3ARonqsxqBFVXoh4OZokrFNWJQn5WKq6BCfxzUVHEmsNGj+uxMYEUV+uTApqo9gc0U1O/2BFZQoW8OcKr7Ka6Zg/rsp7gKKgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACb/T/2OjjCgWUk7wAAAABJRU5ErkJggg=="""
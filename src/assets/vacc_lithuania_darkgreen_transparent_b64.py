@@ -1,11 +0,0 @@
-"""
-Auto-generated base64-encoded image data for: vacc_lithuania_darkgreen_transparent.png
-
-This file was generated by scripts/generate_asset_b64.py
-Do not edit manually - regenerate using the script instead.
-"""
-
-# Original filename: vacc_lithuania_darkgreen_transparent.png
-# File size: 35883 bytes
-# noinspection PyPep8
-IMAGE_B64 = """iVBORw0KGgoAAAANSUhEUgAAB4AAAAQ4CAYAAADo08FDAAAACXBIWXMAAAsTAAALEwEAmpwYAACL3UlEQVR4nOzdd5xlZ10/8M/sptcNCYQWMqF3FhAUEbIRpEjJhl4C2dCrBP2pCD9MQEVRhCA1RCCI0pGlqFQJaAD5oSxFikRYegtkAoGEtPn9cWbJZDPllufc59xz3+/Xa16zmbn3+3z2zN09m/nMec7c4uJiAAAAAAAAAJh+G2oHAAAAAAAAAKAMBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0hAIYAAAAAAAAoCcUwAAAAAAAAAA9oQAGAAAAAAAA6AkFMAAAAAAAAEBPKIABAAAAAAAAekIBDAAAAAAAANATCmAAAAAAAACAnlAAAwAAAAAAAPSEAhgAAAAAAACgJxTAAAAAAAAAAD2hAAYAAAAAAADoCQUwAAAAAAAAQE8ogAEAAAAAAAB6QgEMAAAAAAAA0BMKYAAAAAAAAICeUAADAAAAAAAA9IQCGAAAAAAAAKAnFMAAAAAAAAAAPaEABgAAAAAAAOgJBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0hAIYAAAAAAAAoCcUwAAAAAAAAAA9oQAGAAAAAAAA6AkFMAAAAAAAAEBPKIABAAAAAAAAekIBDAAAAAAAANATCmAAAAAAAACAnlAAAwAAAAAAAPSEAhgAAAAAAACgJxTAAAAAAAAAAD2hAAYAAAAAAADoCQUwAAAAAAAAQE8ogAEAAAAAAAB6QgEMAAAAAAAA0BMKYAAAAAAAAICeUAADAAAAAAAA9IQCGAAAAAAAAKAnFMAAAAAAAAAAPaEABgAAAAAAAOgJBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0hAIYAAAAAAAAoCcUwAAAAAAAAAA9oQAGAAAAAAAA6AkFMAAAAAAAAEBPKIABAAAAAAAAekIBDAAAAAAAANATCmAAAAAAAACAnlAAAwAAAAAAAPSEAhgAAAAAAACgJxTAAAAAAAAAAD2hAAYAAAAAAADoCQUwAAAAAAAAQE8ogAEAAAAAAAB6QgEMAAAAAAAA0BMKYAAAAAAAAICeUAADAAAAAAAA9IQCGAAAAAAAAKAnFMAAAAAAAAAAPaEABgAAAAAAAOgJBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0hAIYAAAAAAAAoCcUwAAAAAAAAAA9oQAGAAAAAAAA6AkFMAAAAAAAAEBPKIABAAAAAAAAekIBDAAAAAAAANATCmAAAAAAAACAnlAAAwAAAAAAAPSEAhgAAAAAAACgJxTAAAAAAAAAAD2hAAYAAAAAAADoCQUwAAAAAAAAQE8ogAEAAAAAAAB6QgEMAAAAAAAA0BMKYAAAAAAAAICeUAADAAAAAAAA9IQCGAAAAAAAAKAnFMAAAAAAAAAAPaEABgAAAAAAAOgJBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0hAIYAAAAAAAAoCcUwAAAAAAAAAA9oQAGAAAAAAAA6AkFMAAAAAAAAEBPKIABAAAAAAAAekIBDAAAAAAAANATCmAAAAAAAACAnlAAAwAAAAAAAPSEAhgAAAAAAACgJxTAAAAAAAAAAD2hAAYAAAAAAADoCQUwAAAAAAAAQE8ogAEAAAAAAAB6QgEMAAAAAAAA0BMKYAAAAAAAAICeUAADAAAAAAAA9IQCGAAAAAAAAKAnFMAAAAAAAAAAPaEABgAAAAAAAOgJBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0hAIYAAAAAAAAoCcUwAAAAAAAAAA9oQAGAAAAAAAA6AkFMAAAAAAAAEBPKIABAAAAAAAAekIBDAAAAAAAANATCmAAAAAAAACAnlAAAwAAAAAAAPSEAhgAAAAAAACgJxTAAAAAAAAAAD2hAAYAAAAAAADoCQUwAAAAAAAAQE8ogAEAAAAAAAB6QgEMAAAAAAAA0BMKYAAAAAAAAICeUAADAAAAAAAA9IQCGAAAAAAAAKAnFMAAAAAAAAAAPaEABgAAAAAAAOgJBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0hAIYAAAAAAAAoCcUwAAAAAAAAAA9oQAGAAAAAAAA6AkFMAAAAAAAAEBPKIABAAAAAAAAekIBDAAAAAAAANATCmAAAAAAAACAnlAAAwAAAAAAAPSEAhgAAAAAAACgJxTAAAAAAAAAAD2hAAYAAAAAAADoCQUwAAAAAAAAQE8ogAEAAAAAAAB6QgEMAAAAAAAA0BMKYAAAAAAAAICeUAADAAAAAAAA9IQCGAAAAAAAAKAnFMAAAAAAAAAAPaEABgAAAAAAAOgJBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0hAIYAAAAAAAAoCcUwAAAAAAAAAA9oQAGAAAAAAAA6AkFMAAAAAAAAEBPKIABAAAAAAAAekIBDAAAAAAAANATCmAAAAAAAACAnlAAAwAAAAAAAPSEAhgAAAAAAACgJxTAAAAAAAAAAD2hAAYAAAAAAADoCQUwAAAAAAAAQE8ogAEAAAAAAAB6QgEMAAAAAAAA0BMKYAAAAAAAAICeUAADAAAAAAAA9IQCGAAAAAAAAKAnFMAAAAAAAAAAPaEABgAAAAAAAOgJBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0hAIYAAAAAAAAoCcUwAAAAAAAAAA9oQAGAAAAAAAA6AkFMAAAAAAAAEBPKIABAAAAAAAAekIBDAAAAAAAANATCmAAAAAAAACAnlAAAwAAAAAAAPSEAhgAAAAAAACgJxTAAAAAAAAAAD2hAAYAAAAAAADoCQUwAAAAAAAAQE8ogAEAAAAAAAB6QgEMAAAAAAAA0BMKYAAAAAAAAICeUAADAAAAAAAA9IQCGAAAAAAAAKAnFMAAAAAAAAAAPaEABgAAAAAAAOgJBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0hAIYAAAAAAAAoCcUwAAAAAAAAAA9oQAGAAAAAAAA6AkFMAAAAAAAAEBPKIABAAAAAAAAekIBDAAAAAAAANATCmAAAAAAAACAnlAAAwAAAAAAAPSEAhgAAAAAAACgJxTAAAAAAAAAAD2hAAYAAAAAAADoCQUwAAAAAAAAQE8ogAEAAAAAAAB6QgEMAAAAAAAA0BMKYAAAAAAAAICeUAADAAAAAAAA9IQCGAAAAAAAAKAnFMAAAAAAAAAAPaEABgAAAAAAAOgJBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0hAIYAAAAAAAAoCcUwAAAAAAAAAA9oQAGAAAAAAAA6AkFMAAAAAAAAEBPKIABAAAAAAAAekIBDAAAAAAAANATCmAAAAAAAACAnlAAAwAAAAAAAPSEAhgAAAAAAACgJxTAAAAAAAAAAD2hAAYAAAAAAADoCQUwAAAAAAAAQE8ogAEAAAAAAAB6QgEMAAAAAAAA0BMKYAAAAAAAAICeUAADAAAAAAAA9IQCGAAAAAAAAKAnFMAAAAAAAAAAPaEABgAAAAAAAOgJBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0hAIYAAAAAAAAoCcUwAAAAAAAAAA9oQAGAAAAAAAA6AkFMAAAAAAAAEBPKIABAAAAAAAAekIBDAAAAAAAANATCmAAAAAAAACAnlAAAwAAAAAAAPSEAhgAAAAAAACgJxTAAAAAAAAAAD2hAAYAAAAAAADoCQUwAAAAAAAAQE8ogAEAAAAAAAB6QgEMAAAAAAAA0BMKYAAAAAAAAICeUAADAAAAAAAA9IQCGAAAAAAAAKAnFMAAAAAAAAAAPaEABgAAAAAAAOgJBTAAAAAAAABATyiAAQAAAAAAAHpCAQwAAAAAAADQEwpgAAAAAAAAgJ5QAAMAAAAAAAD0xB61AzDbbnnHO9aOANAXBybZN8lVkhye5NtJfprk+zVDAQAAAMAs+OxZZ9WOAL+kAAaA6TWX5IgkD0zy60nukKYAvijJ3kl2JnlWkrdVygcAAAAAwIQpgAFgOm1K8pwkj06yX5oyeJe9l97fMMlzowAGAAAAAJgZCmAAmC4bk9w1ycuSXG/Axx+a5EdthgIAAAAAoBs21A4AAAzsqklemeRfMlj5mySfTPKT1hIBAAAAANAprgAGgO7bI8k9k5ya5LpDPnd7kosL5wEAAAAAoKNcAQwA3XbVJKcleUeGL3/fneRfiycCAAAAAKCzXAEMAN20Z5Ljkjw/yfwIz/9pkpckObdgJgAAAAAAOk4BDADdc50kf5bkYRltt47zkjw9yQdLhgIAAAAAoPsUwADQHXsnOTbJXye59ogzLkry2iRvSrJYKBcAAAAAAFNCAQwA3XBkLr/qd26E5y8mWUjy50lekeSCYskAAAAAAJgaCmAAqGvfJPdN8sIk1xxxxqVJ/iPJ7yX5RKFcAAAAAABMIQUwANRzvSSnJHl4Rr/q9wdJXpTkNUl+WCwZAAAAAABTSQEMQF/tleSSJJfVDrKCvZPcP8lfZfSrfi9M8qkkf5jkY4VyAQAAAAAw5RTAAPTR/klenKZo/UmSryc5O8lXk1y09OsDkpyb5srbSZXEc0mun+SPkxw/4ozFJN9K8rK46hcAAAAAgN0ogAHoo7sneUSaq4B3uSDJPmnK4P2SfDHJ+Um+nOSbSX609P47S7++cOltVzm8OGam/ZM8OMmfJrnGiDN+keTfkjw77vULAAAAAMAKFMAA9M2hae6ru9duH9936f380vurLb2/17LHXJqmFD4/yUKasnghyTfSXD38/SRfS3Jxkp1prjA+b4BMN03yJ0mOy+j3+t2Z5OVJXhdX/QIAAAAAsAoFMAB9siHJfZLccMTnb0xy8NLbtZLcbOnji2mK20uW/vu7SQ5M8h9pyuLvJ9mR5irjry197HtpCuXjkzwjyeEjZrowyXuT/Fmae/4CAAAAAMCqFMAA9Mlikl9NUwSXtOuq3V3nzSOW3t99t7WTZpvmC9OUwQtJbpzRr/r9UpLTk7w+yTkjzAAAAAAAYMYogAHok8Uk/yfJfyV5YZIDJrj2rpJ3n6W3TRn9Xr8XJnl3kr+Mq34BAAAAABhC6SukAKC2n6W5avY3k3wsl2/bPA0Wk3w5ye8leVKUvwAAAAAADEkBDEBf/b809wM+Oc22zF13QZK3JnlIkpfHls8AAAAAAIxAAQxAn/04yV8leUCS/66cZTWXpsn29CSPS7KjahoAAAAAAKaaAhiAvrs4yXuS3CvJa5f+uyvOT/KmJA9KclqS8+rGAQAAAABg2imAAZgVX0/yxCQnJflW3Si5JMlnkzw1zb1+v1A3DgAAAAAAfaEABmCW/CLN/XWPTfKhNEXspP00yd8leWCSM5L8pEIGAAAAAAB6SgEMwCz6ryT3SPKiJD+Y0JqXJPlkmvv8Pi3J/0xoXQAAAAAAZogCGIBZdUmS/5vkAUn+o+W1zkny6iQPTnPP3/NbXg8AAAAAgBmlAAZgll2U5N/SFLMvT/KzluY/JcnTk+wsPB8AAAAAAK5AAQwAydeT/G6SE5J8s9DMHyb5mySPSPLmJBcUmgsAAAAAAKvao3YAAOiIXyTZnmQxyRuS7D3inIuSnJXkJUn+JcmFJcIBAAAAAMAgFMAA0Dg4yaOS/EWSvUac8f0kp6XZTvr7hXIBAAAAAMDAFMAAzLoNSTYneWGSo0ec8YskH07y4iRnxlW/AAAAAABUogAGYJbtk+TEJH+dZN8RZ3w3zRW/r0ryg0K5AAAAAABgJApgAGbRXJIbpNmuecuIMy5M8qEkf5JkR5qrgAEAAAAAoCoFMACzZu8kD0vykiT7jzjjm0n+PMnbkvywUC4AAAAAABibAhiALtqUZkvm76a5R+9lheZeL03xe480VwEP64Ik/5Lmqt/PFswFAAAAAABFKIAB6JobJ3lTmnPUj5N8auntv5P8JMnXlj53yRAz90jy4DTl7yEj5vp6kj9N8uYkPx1xBgAAAAAAtEoBDECXzCV5bJJb5vIrdO+U5v66eyb5cpJzknw+yceX3p+f5KtJFrPyFbnXSPKqJL+d5mriYf08yT8leW6aEnpxhBkAAAAAADARCmAAuuRmSR6eK2/PvPfS+5ssvb9Tkscl2ZhkZ5Jz05Sz/5zkA2lK4o1JHpTk5Wm2lB7F/6a56vftcdUvAAAAAABTYJQroQCgLV9N8vQk/zPAYzcuvZ9PsjnJ7dJcJXx+ksPSbNX8dxmt/D03TXF83ySvi/IXAAAAAIApoQAGoEt+nub+v/dPs+3yTwZ4zgVJ3pHmat+/T3Jskh1LM0bZ6eKTSZ6Q5PeTfCG2fAYAAAAAYIrYAhqArllMc2/f+yd5aJI/S3LNVR77rSQvSnJ6kgOTnJHkwUn2GmHdH6W52ve0DHYFMgAAAAAAdI4CGICu+kWaQvcrSf4oyb2Wfe7iJB9M8idJPp7kuCR/neSoEdc6M8kLl2ZeMOIMAAAAAACoTgEMQNedleT4JA9I8uI020T/RZK/TbJ/mit2T0iy9xAzv5vmKt8dSf45yRfTXE1su2cAAAAAAKaaAhiAabCQpvD9fJKLknw6zRXBL0xygxUef1ma+9yfs/T4H6S5t+/ZS8/9XprCd6Hd2AAAAAAAMFkKYACmySfSnLu2JXleknPTlLrnpSl1f5zkm0m+nKbgPXfp/Y+TzCW5ZOKJAQAAAABgghTAAEybS9Ns2/yGJIemKXcvTrJnkgsr5gIAAAAAgOoUwABMm8Uk31/69XeWffzSClkAAAAAAKBTNtQOAAAAAAAAAEAZCmAAAAAAAACAnlAAAwAAAAAAAPSEAhiAabFX7QAAAAAAANB1CmAApsG1k1xaOwQAAAAAAHSdAhiALtu49P5bUQADAAAAAMC6FMAAdNVclL4AAAAAADAUBTAAXTO39H6xagoAAAAAAJhCCmAAumLXOUnxCwAAAAAAI1IAA1DbXkvvL6uaAgAAAAAAekABDEANhyfZZ+nXF9UMAgAAAAAAfbJH7QAAzIxfWXq/I8n3K+YAAAAAAIDeUgAD0JbDk9wzyVWTfCrJh+vGAQAAAACA/lMAA1DKvkmOSXLXJL+W5P8leXGSr9YMBQAAAAAAs0QBDMAoNiS5SZLbL3u7ZZKdSV6S5OQkP60VDoCJmlt6v1g1BQAAAABJFMAADOaGSW6T5LZp7uV7uyT7L33uvCRvSvLkJJ+okg6AmhZzeQkMAAAAQGUKYAB2OSTJdZIcsfR2/TSF722THLDbYxeT/GuS1yZ5e5ILJhcTYKocmObv0xsvvT8qzd+x105yWJodFQ5JU6Cem+bv14Uk30vynSTfSvLlJP+99P4HE00/uK5e/Tsrxx8AAADglxTAALNlPs3VvDdNct003xA/Yunj+6zz3IuTfDDJ25JsT/LjljICTLN90uyY8FtJ7pdme/xBHbL0/ipp/o5eyfeSvCvJ+5N8NMkPR4vZW44/AAAAMPPmFhe7+sP6zIJb3vGOtSNAH1wlzZVMV09y6NLbVZb9+qpJrpXkZiPMvjDNN7nfluYb3ucVyEt7zkxydAtzr5LmyrhpdmCSnxSYc2aSYwrMKWX/JOe3vMZRae7vzer2TnKXJNuSHJfJ/pDl55K8Jsk/ZHbLSMcfAACA6j571lm1I8AvuQIYoJuWl7eH5PJC92ppytxrL73doIW1z0/yT0nesfS+7XKJcl6bdgrg30yz1fc0u0OhOa8sNKeU35zAGtuSnDKBdabRYUkem+QPkmyqlOEWSV6U5IVJ3prkz5J8tlKWSXP8AQAAAFbgCmCqcgUwU+qgNFfd7Xo7MM2Wk/sn2W/Z2/L/3neFz+2z2+eWv5+085K8O8k/JvnnJL+okIHxXSPNPStLe1eSY1uYO0l/n+ThBeZcNck5BeaU8i9J7tHyGl9PcxWwfzRe7rAk/zfJU5JsrJxlJR9P8ntL7/vI8QcAAKBzXAFMlyiAqWqEAtgLFsq4KMlZSd6XZovnzyS5rGoiSjk7yfUKz7wkzQ8+XFB47qRsTJN9zzHnfDHN/bO74qBMblv2OyT5xITW6rI9kzw1yV9k/NfTJLwnyWOSfL92kEIcfwAAADpLAUyXbKgdAICJ+XKSlyS5d5ptpX8zyfOTfDrK3z55YQsz90gyzVs23DxlyqLTC8woaRLbP+/yiAmu1VWb0/wQwF9nOsrHpPn7/ttptkme9n/3b47jDwAAADAQ34hgmrj6F4bzoyRvSfON5yOS3DjJ76S5r+/PK+aiXe9qae6DWpo7CQ8pNGd7oTmlPHaCaz04zQ8CzKKNSf44zQ/LlL66fhI2JnlVko+m3n1yx+H4AwAAAAzJFtBUNeQW0F6ssLaLknwsyQfSbOv8Xxn9yt65+DM3reaS/DDJoYXnnrc089LCc9u2Ic3xuMqYc76Z5Mh058/Fvpn8D3LcNcmHJrxmbQel2cb3TrWDFHJOkmOSfL52kAE5/gAAAEwNW0DTJa4ABphOl6W5b+/Lkxyf5Kgke6f5xvLzknwq423r3JWSi+EtprnarLSDk9ykhbltOyrjl79Js316l/5c3KHCmsdXWLOmI5N8If0pH5PksCQ7ktyjco5BOP4AAAAAI1IAMy3maweAyhaSvDfNNph3TbON5OYkT07yD0l21on1S3OV1+eK3tbS3Pu0NLdN9y405+2F5pTyxAprPjDJfhXWreH6ST6X5Fq1g7RgY5J/Sbmt0dvg+AMAAACMwRbQVDXEFtBeqMyas9Ns57zr7fPx54DB7Zlme+DS92z93zTFzDT5Ypr7X4/jnCRXS3f+DO6T5Gep84N8D05zb/E+u0maXRRmoex+QLr3ww2OPwAAAFPJFtB0SelvDAMwnG+k2Q5y+dvXqqWhLy5O8sYkjyg893pprsj7duG5bTk445e/SbOldlfK3yQ5OvV2cTkh/S6Aj0jyicxG+Zg0uwUcneSjtYMscfwBAAAAClAAA0zGJUn+O1csej+d5Lxqiei716R8AZw0Wyqf1sLcNhxTaM5bC80p5TEV175bmvuYnlMxQ1sOTfKfSQ6qHWTC3pfk5mmu8K/J8QcAAAAoRAHMNNhaOwAM6bwkn8nlRe9n0tzL8OJ6kZhBn2hp7sMzPQXwowvM+HmaLdi7Yu8kx1Vcf480x/X5FTO0Ya8kH0xy1dpBKtgnyZlJbpTm9V6D41/3+AMAAAA9owBmGryjdgBYwSVJvprkf5J8een9rl9/t2Iu2OXCJP+S5J6F594pyaYkC4XnlrZfmquVx/X6NH/eu+L2STZWzvDEJH+V5LLKOUp6aZLNE1jnoiTvT/KvSf4ryc4kP0pyQZptxvdL8+frWklumuR2aV7HR7Sc69pJzkjyoJbXWY3jX/f4AwAAAD0zt7jYpVvaMWtuecc7DvIwL1JquCDNls3fSPKtJN9c4Q267r5J3tnC3OOSbG9hbknHpCl5xnXHJB8rMKeUVyd5VO0QSW6ZZmeDPrhXkve0vMbnkvzp0jrDXuU5l+Qmaa68fkLavT/u3dMUpJPk+F+uxvEHAACgkM+edVbtCPBLCmCqUgBT0YVp7mH5oyTfSfKVNFfv7rqaV8FLHxyS5MctzH1jkoe1MLekv834W0BfnGT/dGf79j2T/GzpfW2vSPKk2iEKOCzND/rs29L87yR5aprdTEr8e+aQJM9MclLa2cnnx2mudp3UVsSO/xVN+vgDAABQkAKYLlEAU9UABfB8kq+1n4Se+Vqabygvf/t6msJ3V+l7frV0MFlfSnNvyZIuSHJwulOM7m5jkp9k/Cv1Xpdk29hpyvn1JF35P4kfJrlmurU99ii2Jzm2pdl/l+QpSX7awuwbJXlrklu0MPslSX6nhbkr2R7Hf3eTPP4AAAAUpACmSxTAVDVAAewFys/TFA273s5Z9n6lX/+oTkzorKclObWFubdP8v9amFvCjdIU3+M6JsmZBeaUUuKq5pLuluQDtUOM4S5JPtjC3MU0V4i+JO3+O2afJG9IsyV7addLc5/7Njn+q5vE8QcAAKAwBTBd0sbWZQDr+WaSHyx7+26abQ9/kMuL3h+kuWoXGM/2tFMAPzDdLYBLFDKLSf6jwJxS9kpyfO0Qu3liprcA3ivNFaKlLabZHv1NLcze3YVJHpDkr9MUniWdmuYe4m1x/Nd2ato9/gAAAEDPKYCZJa9LspBkZ5JNabaXztKvR7WwzufHmV3CwrJfb1rn8ys5J00xe9myj12SZvvXX6T55ueFS7/+xbJfL//Y8sddlOnfLhSmzTeSfD/J4YXnPiLJH6abOzU8ucCM96f5u64rbpdk7zFn/DzN3+cHjB8nSXLXNNttX1po3iQ9Ps0W1qU9JZMpH3e5LMnT0/w5fHrBufdJcpMkXyw4cznHf21tH38AAACg5xTAzIrz0q37OAJMymKSlyb5k8Jzr57kZkk+X3juuK699Dau1xSYUdIjCsx4f5ofynlwgVlJcmCSO6Vb22QPYp8kz2th7iuTvLyFuYP4P0lumOReBWe+MMk9C87bxfEfTFvHHwAAAJgBG2oHgDWUvKpse8FZANPmzS3N7eIWpXcvNKdLWxtvTJkC+C+X3krq0j2JB/XIlLsKepcvpewVoMO6LM3Wx98sOPMeSY4oOG8Xx38wbR1/AAAAYAYogJkVZ9YOAFDR/6bZhr20rt2TNmnuSzuus5KcW2BOKTdPst+YM36c5ONJ/ivNrRBKOS7N/VynxT5Jnl945qVJ7p92/owN4ycp/2fyCYXnOf7DKX38AQAAgBmhAGZWbK8dAKCiy5L8fQtzb5LksBbmjuqgJLctMOclBWaUVOLq3+3Lfv2PBebtsn/KXXU9Cccn2VR45qlJvlB45qg+muQfCs57esoW/I7/cEoffwAAAGBGKICZBZ9JslA7BEBlJUuJ5e7S0txR3LnQnK5t//z4AnNesOzXLy0wb7kTC89ry4Ykzy4888dJnlN45riemeSSQrP2TXKHQrMc/+GVPP4AAADADFEAMwt21g4A0AH/0dLcLm0DXSLLF9KUSl2xOePfL/XsJF9c9t9fS/KtMWcud6+Uv6drG26d5DqFZ56S5KeFZ47rG0leXnDeowrNcfxHU+r4AwAAADNEAUxXLRacdWrBWQDT6oIk/9TC3Htm/PvTlrBHkgcUmPPKAjNKKrH98xtX+Ng7CszdZa80JXDXPanwvJ8mOaPwzFKen2br9xIekjLbEDv+oyl1/AEAAIAZogCm7z6S5MzaIQA64lUtzNyY5OgW5g7rlmmyjKuNknxUG5KcMOaMxSSnr/Dxv0jZH7bq+jbQ+2X8Y7m709K9q093+U6SdxWatVeSW4w5w/EfXYnjDwAAAMwYBTB9t6N2AIAO+XBLcx/U0txhPLTAjG+l2R65K26cZNOYM76e5JsrfPw7Sb4y5uzlfivJYQXnlfZbKfMDAsuV3Oa3DS8pOOueYz7f8R/PuMcfAAAAmDEKYPpuR+0AAB3y0ySfbmHuA9JswVzLhiSPLjDn5Sl7Vey4Hlxgxj+u8bkzCszfZUOS+xecV9oTCs/7WLr1wwIr+bckC4VmPWzM5zv+4xn3+AMAAAAzRgFM3+2sHQCgY/6mhZkHpO4WpTdKckiBOW8pMKOUDRn/nqmLSV64xudfnuTSMddY7jEFZ5V0QJK7F5650rbaXXNxyr2mb5LkwBGf6/iPb5zjDwAAAMwgBTBdVPLqq4WCswD64AMtzb1vS3MHcVyBGeck+WqBOaXcMONvqfw/Sb69xufPS/K5MddY7leSXLfgvFLumGSu8Mz3FZ7XllL3oU2S64/4PMe/jFGPPwAAADCDFMD03Y7aAQA65jtJvtfC3EekfMkzqG0FZrwq3dr++eEFZrxmgMe8rsA6y5W4F3NpWwvP++8k3y08sy3/luSyQrNuP+LzthZafxfHHwAAAGAdCmAAmC2LSV7ZwtzrJbl2C3PXc2iSGxSY89YCM0rZkORxY864NINtk/vKlCuokuSE1PtBgJXMpcwV4sttLzyvTT9Juau8f2WE5zj+dY8/AAAAMKMUwMDu5pe9TZv5XDn3/Bofh1nV1r1u793S3LUcXWDGBUk+X2BOKTdIcrUxZ/xnknMHeNyFST495lrL3SDN/Uq74qpJDi888yOF57Xtw4XmjHKfb8e/7vEHAAAAZtQetQNAi46qHWBKdGnL0y7o0pVr0JYvJzk/yQGF556Q5BWFZ67n8QVm/EOSSwrMKeV+BWa8cYjHvjTJawusucsjkvxRwXnjuGULMz/Zwsw2fabQnFHuQev41z3+AAAAwIxyBTBds6XQnNcl2VloFkDfXJbkb1uY+6tJDmth7mr2T3K3AnNeX2BGKXNJnjTmjMuSvHqIx78+zZXApZyYZGPBeeO4c+F5/5PkvMIz2/alEZ7zgyTvS/JXSR6Z5v6zo/xgneNf9/gDAAAAM8oVwHRNqW3yFgrNmQVzcRXwLq7+ZZb8fZKTWph7TCZ3P907FZhxcZJPFJhTynUy/r2U/zvJT4d4/KVpttW9+5jr7nJ4kt9IN7bqLfEaWa5Lr5VBfXWNz303yaeSfDbNNuj/k+TsNPeuLcHxr3v8AQAAgBmlAKavNtUOMGWOS/KO2iEqO652AJiwz6a5UrT0biAPyuQK4EcUmPGmJBcVmFPKAwvMeNUIz3lZyhXASbIt9QvgDUl+vfDMUtv5TtKPknwjyVlpysYdaUrJ7yb5RYvrOv6NWscfAAAAmGEKYPpqU+0AU2Z77QCVfSaOAbPn4iTvSrK18Nz7JNlzaX6b9khy/wJzXlNgRilzSZ4y5oyLMtr23u9Osw30PmOuv8sDkjwhdQuuqyfZq/DMrxSeNwmXJjmywrqOf6PW8QcAAABmmHsA01fbaweYQrO8/fHW2gGgkjNamLl3ktu0MHd3N1laaxyLSf6jQJZSjsr4RdFHM/r9fEtesXtAkt8sOG8U8y3M3NnCzL6ab2HmzhZmAgAAAPSOApi+OrN2gCn1utoBKnhOfEOZ2dXWFr0PamnucscWmPGBJBcUmFPK1gIzxrmi+fkF1l/ukYXnDet6Lcz8bgsz+8rxBwAAAKhEAUxf7awdYEptqx2gglNqB4CKFpJ8ooW5J6Tdf2OU2Co56d4PvTxpzOf/IuPdf/nDaV4TpdwvyUEF5w3rxi3MPK+FmX3l+AMAAABUogCmSxZrByDJbG0FPUu/V1jN37Qw89AkN21h7i7XTHJ4gTnvKzCjlKtn/CsmP5XkkjFnvHvM5y+3V5J7F5w3rDauQG373tZ94vgDAAAAVKIApo/a2tKUflH+QuP9Lc09rqW5SZmtkj+W5EcF5pRy3wIzXl5gxl8WmLHc4wrPG8Y1Kq6N4w8AAABQjQKYPjqjdoAeuHXtAMDE/CjJN1qY+7AWZu7y2AIzSpSlJT1tzOdfkOTNBXJ8PskPC8zZ5c5prtiu4TqV1qXh+AMAAABUogCmj3bUDtADO5IcVTtEi1z9C1f0shZm3jjNtsalHZbkVgXmdGn752tn/C2zP5jk0gJZkuRdheYkzd+3Dyw4bxgHVlqXhuMPAAAAUIkCmL75TBTApeysHQCYmHe2NPcuLcy8c4EZX0hyToE5pWwtMOOlBWbs8ucFZyXJiYXnDWLvNPeiLm1D/BDRIBx/AAAAgIoUwPTN9toBeqaP32Tt4+8JxnV2kp+0MLeNbaCPLzDjlQVmlPSEMZ9/Xsrey/l/k3yn4LxbZfLbAf+ipbmXJVlsaXafOP4AAAAAFSmA6ZtttQPQaX3e1hrGcWmSV7cw9+5JDig4b88k9y0w5z0FZpRy1SQ3G3PGh0oE2c2bCs97cOF5AAAAAMAqFMB0RamrOU4pNIfL9emK2Z21A0CH/UMLMzemzJbNu2xemjmOb6dbfxfcrcCMVxSYsbvnp7naspQnp1/nEwAAAADoLAUwfbOjdgCAKfWZNFcCl1Ziy+ZdHllgxmnp1hayTx7z+ecn+WCJILv5QZIvF5x3ZJLbFpwHAAAAAKxCAUzf7KwdgM56Z+0A0HGXJHlDC3OPTbN187g2JjmhwJy3FZhRyqFJ7jDmjPeWCLKKvy88r0SBDwAAAACsQwEMDOKY2gEKOLV2AJgCr2lh5n5JfqXAnJsnOXDMGeek7FWt47pXgRnPLzBjNX+TsttAH59kj4LzAAAAAIAVKIDpm4XaAXpqoXaAAs6sHQCmwCdbmnvvAjPuW2DG6SlbaI7rSWM+/3tJPlUiyCrOT/KlgvMOSfKrBecBAAAAACtQAAOD2FE7ADPlhrUDzLCfJzmrhbmPKDDj0QVmvLnAjFIOzfhl6CS2tn914Xm2gQYAAACAlimAgVlwXO0ADOWptQPMuNNamHlEkmuP8fyrJjlyzAw/T/LfY84o6W4FZry4wIz1vCTN/aFLOT7JPgXnAQAAAAC7UQDTJ+fVDtBzt64dYAzbawdgKI+pHWDGvb+lueNsA32XAuu/MWWLzHGNe0XzD5N8sUSQdVycsluD75fktwrOAwAAAAB2owCmC3Z0bA4r21E7ADPD1YF1fT/J2S3MHafYf3yB9f++wIxSDsz4pfZ7SgQZ0EsKz3tc4XkAAAAAwDIKYLrgVoXmnFpoDsCse2ELM2+b5PARnndQki1jrn1Jkk+MOaOk3yww4y8KzBjUW5JcWHDebyc5pOA8AAAAAGAZBTB9cmbtAAA98a6W5t5zhOeUKEtLF5jjesKYz/9Gkv8pEWRAlyX5WMF5GzLeluCDunQCa7A6xx8AAACgEgUwffH1JAu1Q9BJz6kdAKbQd5L8qIW5x43wnIcXWPe1BWaUcnCSe4w54x9KBBnSiwvPm8S9vhcmsAarW6gdAAAAAGBWKYDpi521A8yI0gXAJJxROwAjWawdYMYtJnl1C3N/O8meQzx+ryTHjrnmYpKzxpxR0l3HfP5iyt+Tdz13S/KqwjPvnORqhWfu7qctz2dtjj8AAABAJQpg+uLU2gHorE21A8CUeksLM/dIsnmIx988wxXGK3lfkgvGnFHSo8Z8/tlJvlsiyACuk6Y8f19Gu3/zeh7QwszlvtHyfNbm+AMAAABUogCmLzbVDjAjttcOMIJttQPAlPpskotbmPugIR57vwLrva7AjFL2zWj3QV7uDSWCrGO/NMftq0l+vcV1ntTi7GRyRTkrc/wBAAAAKlEA0xcLtQPQWafUDgBT6uK0UzZuS7JxgMfNpcx9Yj9QYEYpd07z+xrVZWl/++c/SnP/50dmsK/TOG6W5MYtzv/fFmaOe0X6LHH8AQAAACpRAAPDOLN2AGCi2rgP8GFptnZez3zG33b4k2nKzK4Yd/vnT6e9389vJ/lWkucl2aelNVbysBZnf6mFmQe3MLOvHH8AAACAShTA9MVC7QAzYr52AHrPealbPtnS3PsP8JitBdZ5RYEZpeyXwX7fa3ltiSC7uVGaYvmfklyrhfnreVTa+3PfxhWo12hhZl85/gAAAACV+EY7fbGzdoAZsbN2gBEs1A7AUMbZHpfyfpHk/S3MffgAj3l8gXX+ucCMUo7JeFsqX5Sy9zM+KMmbk3whyeaCc4d1rQx2RfgodrYwc76FmX21s4WZ8y3MBAAAAOgdBTC1LRaas1BoDgBXdHoLM6+b5NprfP5aaa5MHccXkvxgzBklnTjm8z+R5PwCOTYk+ZMk30/yoHTj34LHtzT3e2mK85JuUHjeJGxM8vU09/T+3SS/maZI3XuIGaP8cI7j36h1/AEAAIAZtkftAFDI5rg/LUAbzmxp7pYkf7/K536zwPyXF5hRyj5Jjh1zxhkFctw3zX2dDyswq6THJHlWkosLz70sycfSvNZKuVXBWZNyaJLrLL09dLfPfTfJp5J8Nsnnk/xPkrOT/GS3x82l+WGByzL4D+85/o1axx8AAACYYQpg+mJn7QAAPXVOki9n/Ctyd3dCVi+AH1Zgfpe2f/61jPdvrguTvHGM598oyeuT3G6MGW06JMkd084PG/xbyhaQv1Zw1qRcd43PXSPJfZbelvtBmntDfzbJ59L8HfC1JOelKepXKyHndvuc4z/Z4w8AAACQRAFMf+ysHQAoogvb0XJlL0ny0sIz75JkvyQ/3+3jeyW5+5izv5NunRceMebzP5KmBB7WQWmu+L1fuv9n69FppwD+aOF5N0xycJoiblrceITnXC3Nn8PlfxZ/lOSoNFehXrLK83YvJh3/yR5/AAAAgCTd/2YgwDheVzsAQ9tYOwArelcLM+eS3HmFj98u49/v8tXpzhVyeyV5+JgzXjPk4+eSPDvNPVgfkOn4996D0vxAQGmfbWHm7VuY2aZS2yafneYHEYZ5PTn+dY8/AAAAMKN8AwHos1NrB2As87UD8EvfSvL9FuYev8LHxr1aNkneUmBGKXdIsvcYz/9Zkn8c4vEPSvLDJM9Nsu8Y607aXmmuCi/thyn/2j268Ly2HVNozufSbD986RDPcfzrHn8AAABgRimAgT5bqB2AoS2/Avhr1VKwu8UkL29h7v3TFH+77JHkkWPO/FGSL4w5o6QTx3z+mRlsu9ebJ/lMkjcnOXTMNWt5bAszF5O8o/DMrYXntemgJLcoNOtTS++HKSAd/7rHHwAAAJhRCmAAumSf2gFY1dtamLlPktss++9bZfyrVk9Pc4/MLtgrzRW543j1Op8/NMk705S/txxzrVGU3Gr73mkKs9K2F553syTXKDyzLXdKuX/vf3LE520vtP4ujj8AAADAOhTA9MFHagcAitlr/YdQyZfT3H+ytPsu+/X9C8x7U4EZpfxaxiu0f57Vy7ONSZ6f5DtpjuGk/k23mOYKxEuW3koWwHNJ7lNw3i5npfw9oe9eeF5b7rv+QwZ29ojPc/zLGPX4AwAAADNIAUwfbK8dACjmgNoBWNWlSd7YwtxHrvLrUVyQ5PNjzihp3Kt/P5qVi7Pjk3wvyR9k8j80MZemfN5j6a30vyWfXHhekpyf5H2FZ7axXXVpe2b81+AuX0zy0xGf6/iPb5zjDwAAAMwgBTB9sLl2AKCY26z/ECr6+xZmXivJ1ZferjXmrLekO/fH3Jhk25gzXrnbf98uyZeSvD7JYWPOHtW/Jblpkg+1NP8OSY5oYe7ux3Jcv57kqMIzS7tTkk2FZr1hzOc7/uMZ9/gDAAAAM0YBTB/M1w4AFHP12gFY08damrs1ybEF5vxDgRml3CrJ/mM8/+dp7u2bJIcneU+S/0hyozFzjepbSe6S5Og0VyP+RYtrlbpqcrkPpPwPBzyp8LzSnlpw1r+M+XzHfzzjHn8AAABgxiiA6YMzagegs+ZrB2Bo+9QOwJouTPKuFuY+NuNv6XpJkn8vkKWUcbez/miSvZO8Ksk3k9wrzfbLk3ZBksekudryX3P5ltQfSbO1bxuekPK/158neV3hmY9PcmDhmaVcM+XuP3tRks+NOcPxH12J4w8AAADMGAUwAF2yqXYA1vWqFmbeJsltx5zx9jRlZRfskeTEMWf8JMk5aYrxPcdONJqXprkq/9VpCvblLk7yVy2te/0kR7Yw9+WF5x2Y8bf5bssfpty/89+UpoQcl+M/mlLHHwAAAJghCmD6YFPtAHTWztoBJmy+doACXAHcfR+tHWAVZ9QOsMztkxw05owHJTmgQJZRvC9NAfvUNEX0atr4YYBdHtrCzE8n+Ubhmaeke1ehXidlt0d+TaE5jv9oSh1/AAAAYIYogOmDHZXXX1x6O7VyDmbXqWleg1/L9P9AhAK4+36a5DO1Q+xmMd0qptsoLyfhq0nulOQeGayo+16ST7SU5akp/+/Uy5L8SeGZV0lycuGZ43pemqvQS7ggyccLzXL8h1fy+AMAAAAzRAEM5TwtTQmxqXIOLrezdoCWbUvzmnvaso8tVElSzqbaARjIy2oH2M3709xjtAs2JHl47RBD+mmSRyW5UYa/j/L/LR8nSXKNjL8t+Er+PuX/njwpyU0LzxzVnVP29feilN1+2PEfTunjDwAAAMwIBTB9sKPi2vMrfOzcJFsnG4MZtJjktSt8fH7COUpzBfB0eG/tALt5Xe0Ay9woySG1Qwzo0iTPSXOf39fmyvf5HcRH0twPuA3j3kd5JRemuT9rSRvT3IO69t9fB6UpWEt6ZeF5jv9wSh9/AAAAYEYogJl2H0ndKx63rvLxd6Qp6BYmloRZsDWXbzm+mp0TSdKe2t/AZzDfSrP9b1d8oHaAZR5SO8CA3prk2mnuoTrO1dOXJPmrEoFW8Igke7Uw9++SnF945o3TXK1Zy4Ykb0hyRMGZ703yzYLzdnH8B9PW8QcAAABmgAKYabez4+sfnKas2xJb29YwXztAQdvS/GDBeubbjdG6TbUDMJDFJC+vHWLJp5KcUzvEkg1Jnlg7xDr+M8ktkzwo5Ur8tq5SPCDJr7Yw98Ikz2xh7hOSPKmFuYN4QZJ7FZ75u4Xn7eL4D6at4w8AAADMAAUw025hStb/cJqtoU9pLQl9dUpW3+55JfOtJZmMTbUDMLA31w6w5FW1AyxzyyRXrR1iFT9Mcv8kt0/yucKzv5nk7MIzd3lsS3NPS/KdFua+NJO9CnxDmitfn1547ruTfLHwzOUc/7W1ffwBAACAnlMAM+0Wpmz9k9OUeZuKJ2El87UDjGhbmqvLF9O8ZmbJptoBGNhXUn4b11H8U+0Ayzy0doAVXJzk95NcJ8k/JrmspXXa+rvqoWlna/iLkjyyhblzabYC/p2lX7dpnyRvS3JSC7PbmLmc47+2NmYCAAAAM0QBzLTbWXn9zSM+79ysfy9Xxre5doAhzefyq32PHHHGzlJhKrl67QAMbDH1r779Ytq5inAUG5KcUDvEbl6X5Bpptqe9sOW13tXS3D2S3LWl2R9K8s4W5s4leXGSM5Ic2ML8JLlRkk8mOa6F2S9J8tUW5u7O8V/ZpI4/AAAA0GMKYKbdQuX1NxWYsbjsbVumr7TssvnaAQawKZd//b9WN0p1B9cOwNDeUHn9V1Ref7kbJjm8doglH09yszTnlB9NaM3z097r4aktzU2SxyS5oKXZj0zypST3S7mrUQ9J8ldJPp/kFoVmLvfjJM9oYe5qHP8rmvTxBwAAAHpqj9oBYEwLldffUXjeSvd5fXEuv6pzR5rf86YkZxZem3I2pSnyN6f5es0vfXxLkqNbXntLmqueppGrf6fP59L88ELbW62u5j2V1l1JG1cCDuvbSU5M8sHU2WHiBUke1sLcuyU5NO2U2eckeWDaey1dM8nb0/xZ+dOldX4+5Iy5JDdJ8ugkT0iyX8mAu3lohs83Dsf/iiZ9/AEAAICeUgAz7eZnYP2nTWCNvnpaHL9psql2AIZ2UZqtf4+tsPa3050tz+fSFEO1XJjkmUleluZrUsuONIXeYS3Mvm9W/iGpEv4pyelJHtvS/KS5WvTNab4+70/yr0n+K81r+EdproJdTFMubkpyrSQ3TXK7JPdOckSL2XZ561K2SXP8G7WOPwAAANBDCmAYz+baAWA3O2sHGMOm2gEYyWtSpwB+bbpzH/XrJblOpbVfkuTZSc6rtP5yi0n+JM3OFaU9Ke0VwEnylDRl3+YW10iSvdIUivdueZ1hfSvNluG1OP51jz8AAADQM+4BDOPZWTsA9Mim2gEYyZmV1n1bpXVX8qAKa34kzX2HfyfdKH93aes+wL+S5GotzU6aK0PvmuSHLa7RVRemuX1Aza2HHX9bPwMAAAAFKYCZdjsqr7+98vqwu521A4xhU+0AjOQnST4+4TV/nOaenl0wl+TxE1zva0nukuSYJF+Z4LqDOifJWS3Nvn9Lc3f5UZLbpnlNz5K7J/nf2iHi+AMAAAAUowBm2s1XXn9n5fVhdztrBxjDptoBGNnfTHi91yS5bMJrrub6mcz2zz9L8rg0V/3+a7qz/fVKntfS3P+TpnBv0zeT/Fpm52rMByT5aO0Qyzj+AAAAAAUogJl2C5XXn6+8PvTJ1WsHYGQfnPB6b5zwemvZ2vL8S9MUqtdKcnqSS1per4QPptnWtrTrJrlRC3N398Ukt0ry0wmsVdNDk7y9dogVOP4AAAAAY1IAA9AVh9YOwMjOSfL1Ca11QZLPTmitQTymxdlvT3JEkmelW/f5Xc9FSV7c0uxHtDR3d2cnuUWSb09ovUm6NMk9k7ypdpA1OP4AAAAAY1AAA9AVV60dgLG8ckLrvDHduQr2Wmm2ZC7tc0nukGZ72O+2MH8S2no9PCHJxpZm7+7rSW6a5N8mtN4knJNkc5L3Vs4xCMcfAAAAYEQKYAC6whbQ0+0dE1rnDRNaZxBbC8/7YZrSd3OSTxSePWk7k3yphblXSXKzFuau5idJjkly8gTXbMtZSW6Q5PO1gwzB8QcAAAAYgQIYgK5QAE+3r6Qpa9p0SZKPt7zGMJ5YaM7FaQquI9Ns+3xZobm1Pa+luY9qae5qLk3y3CS3TvK/E167hEuTPC7JnZMs1I0yEscfAAAAYEgKYAC6YI8kh9UOwVguS3Jay2u8M8nPW15jUPMpcyXqW9IUv89Nc3/jPnlnksUW5j4uyZ4tzF3PjiQ3SfJ7aUr7afCeNFuVn57p/8GCHXH8AQAAAAaiAAagC66VpgRmurW9PfPrWp4/jK0FZnwkyYMzvff5Xc9P0hTcpe2b5NdbmDuIi5O8MMk1k7w4zdWdXfTxNMfoPkm+XzlLSY4/AAAAwAAUwAB0ge2f++Fzaa+QWUzy4ZZmj+LRBWb8ZYEZXfeilub+TktzB3VOkpPS/N31zHRja9/FNIX7rdKUj13aLr00xx8AAABgDQpgALpAAdwPlyZ5a0uzP5Dk/JZmD+vqSW4+5ozzkry/QJau+39JftDC3K1JDmph7rDOSfLnaV4T90rz+r9kwhk+l+TpSQ5Pc0X5Zye8fk2OPwAAAMAKbLcJQBcogPvjNUke0sLc01uYOaotBWa8KJMvqmq4LMmfpdmut6QNSY5O8u7Cc0f1iyT/vPS2T5LbJPmtJPdLcsvCa30vybvS/ADBR5P8sPD8aeT4AwAAACyjAGbazdcOABShAO6Ps1qa+76W5o7ixAIzXl5gxrR4fcoXwEmzDXdXCuDlLkzysaW35yQ5MMn1k9x46f1RSY5Icu0kh6Upsw9JMpfk3DRbCS+kKRq/k+RbSb6c5L+X3rdxRfW02vX/Mst/mMLxBwAAAGaeAphpt1A7AFDEfO0AFPPzNEVKn929doApc276/5pYy0+TfHrpjbIuS/Pa2rD065U4/gAAAMDMUQAz7RZqBwCKcAUwAMNarfQFAAAAmGkbageAMe2sHQAoQgEMAAAAAAAFKICZdptrBwCKOLx2AAAAAAAA6AMFMNNuU+0AwNg2Jrla7RAAAAAAANAHCmCm3ZbaAYCxXTtNCQwAAAAAAIxJAcy021Q7AHTMfO0AI7hx7QAAAAAAANAXCmCm3ULtAMDYFMAAAAAAAFCIAphpt6l2AGBs86t8/JBJhgAAAAAAgD5QADPtNtcOAIxtfpWPL0wwAwAAAAAA9IICmGl3ZO0AwNjmawcAAAAAAIC+UADTB1tqBwDGMl87AAAAAAAA9IUCmD6Yrx0AGNnBcS9vAAAAAAAoRgEMQE3ztQMAAAAAAECfKICpba7AjK0FZgB1zNcOAAAAAAAAfaIApg8WagcARnZE7QAAAAAAANAnCmD6YKF2AGBkN6odAAAAAAAA+kQBTB9sqR0AGNnNawcAAAAAAIA+UQDTB7eqHQAY2Y1rBwAAAAAAgD5RANMHn6kdABjJwUmuXjsEAAAAAAD0iQKYPpif0bVh2rn6FwAAAAAAClMA0wcHJ9lUae35SuvCauZrBxjCWgXw3MRSAAAAAABAjyiA6YuF2gGAobkCGAAAAAAAClMA0xfzldbdWWldWM187QBDUAADAAAAAEBhCmD6YmftANARm2oHGIICGAAAAAAACtujdgBIc6/Pxdohptitk+xIc+XnpjTbYe96m1/jefPLPr9z6f2Zu318YWnm1qVfb05y7MhJ6zgxze9rZy7/ve1c+tz8mLMXlt7vSHOMtiY5YcyZ41qovP6gNia5Qe0QAAAAAADQNwpg6KZj0hSv29OUrjsGeM7OAT+23ud2rvC5M5f9eprK+mNyxew7c8Xf2/Jfj2v70tu2NR6zKcmWNJm2Jzm64Pq77GxhZhvm05TAAAAAAABAQbaAhm54Z5oreeeW3s5MUxAmg5W/rGxz7QC7WUjzdV1IUwTv+no/veAaOwvOatPNawcAAAAAAIA+UgDTF/O1A4zoqDQF4NYoetuwUDvAgE7N5WXwiWPO2jlumAlx/18AAAAAAGiBApi+mK+07sIIz3ldLi/7dpYMQy+ckctfHx+pG6VVm2sHAAAAAACAPnIPYPpiU6V1tw7x2EMyPVek0g1blt4Pc9/lrbl8+/Au27zG546ZVAgAAAAAAOgbVwDTF5srrbtpgMfsurfvQqtJWMmZtQMUMpfmBwgGsb3FHKXsl+SGa3z+zAnlAAAAAACA3lEA0xdbK617xjqfn4t7+1LGQprX03pXx25tPcn4bhHnHwAAAAAAaIVvwNMVc2M+/1bp1j1Fj8v4vydYyZm5/B7Bq32+6zbXDgAAAAAAAH2lAKZPtlZYc8du//2RNFs+b594Elays3aAls2lec0tt1Ahx7A21w4AAAAAAAB9tUftAFDQloprf6Ty+syuLWnuRX1u3RhD2Vw7AAAAAAAA9JUCmD7ZVGldWz1T20Km63W4uXYAAAAAAADoK1tA0ye3qh2AzpmvHYAruXmSfWqHAAAAAACAvlIAA302XzsAV3LbdT4/TVcyAwAAAABA5yiA6ZPzagcA1vVrtQMAAAAAAECfKYDpknGv/Du4SAqgTQpgAAAAAABokQKYvtlUOwCwqn2T3LJ2CAAAAAAA6DMFMH2zUDsAsKpbxnkHAAAAAABa5Rvx9M3m2gGAVdn+GQAAAAAAWqYApm+21A4ArEoBDAAAAAAALVMA0zebagcAVrVeATw3kRQAAAAAANBjCmC65nVjPn9ziRBAcVdLMl87BAAAAAAA9J0CmK7ZNubzjy0RAijuDrUDAAAAAADALFAA00dn1A4AXMntagfgChY79EY31X5dtPHaqP378da9t9L69vvpI1+jlTkO3eLrMR0emvp/p6z3dovWfvezp/bXcrW332/zN90T/k69otqv2Wk5Tl3nHAQMRAFMH51QOwBwJXesHQAAAKCQx9UOMIDH1w5A656d5Kq1QwAT5xwEDEQBDEDb9knya+s8Zm4SQQAAAMZ0rSS/UjvEAB5YOwCtOzDJK2uHACbKOQgYmAIYgLb9apoSGAAAYNodn+SA2iEGcLWs/4O4TL9jk9ypdghgYpyDgIEpgOmio2oHAIraUjsAAABAAXNJHlY7xBCeVDsArduY5ipg3+OF/nMOAobiHwd00c7aAYCittQOAAAAUMB8khvWDjGE+8b3/mbBTZM8vXYIoHXzcQ4ChuAPIH21qXYAIMlg9/8FAACYBidmum5vc3D8QO6s+OM0W64C/eUcBAxFAUxfbaodAEgy2P1/z5tEEAAAgDHMJXlw7RAj+J3aAZiIg5L8be0QQGucg4ChKYDpq5NqBwCSDPaTfptazgAAADCu+aW3aXP3TNcVY4zuXnG1HfTVfJyDgCEpgOmr+doBgCT+5xMAAOiHRyTZq3aIEeyT5A9rh2AiNiR5VZorBYF+cQ4ChqYApqvG/cfqsUVSDGZ+gmvBtNlSOwAAAMCY5pI8oHaIMTy2dgAm5gaxKx70jXMQMBIFMH22fQJrbE7ytSSLSbZNYD1YyeKyty45unYAAACAAo5IcsPaIcZwrbj1ziw5OclVaocAinEOAkaiAKbPJnEV8OZlv35tmgJuywTWhaT5IYfdS99Nk4+xqnvUDgAAAFDAI5LsXTvEmE6pHYCJOTjJy2qHAIpxDgJGogCG8Zy5wsc+nO5diUm/zKd5ja30Qw7bJppkbYMUwO5NBAAAdNlckgfVDlHAQ2sHYKIemOTOtUMAY3MOAkamAKbLjqsdYAALa3xuMcmpk4nBjNiU5nX1tTUeMz+RJOu7dpJb1Q4BAAAwphskuXHtEAVcLck1aodgYjYm+dv43i9MO+cgYGT+EUCXbS8wY77AjLUsrPP5p6Up7M5oOQf9d2qScwd43CntxhjYXeLqXgAAYPo9OsletUMU8qe1AzBRN0jyB7VDAGNxDgJGpgCm77bWDrDkhLgimNGckua187QBHz/fWpLhbKkdAAAAYEwbk9y/doiC7lc7ABP3zCSH1Q4BjMQ5CBiLApi+29Ty/FOGfPyuK4LdI5i1nJHLXycnD/ncHaXDjGAuyV0HfBwAAEBX3TzJkbVDFLQpyQ1rh2CiDkzyitohgJE4BwFjUQDTd5trB1jDroLvpMo56I7NaV4TJ1TOMa5bprkHMAAAwDR7bJI9aoco7M9qB2Dijktyx9ohgKE5BwFjUQDTdeNeIXhskRSr21FgxotyeRm8kG6X1pS3NZd//T9dN0oxd6sdAAAAYEwbk9y3dogW3LN2ACZuY5JXxy5cME2cg4CxKYCZBWe0OHtH4XkHpykBF5e97UxTEs6n2SpjftnbpG2rsOY4zqi8/uY0X6etae7/vJArfm0Xk7yj8JqbCs8bhXt6AAAA0+5mSa5ZO0QL9k9y69ohmLgbJfnD2iGAgTkHAWPr2xYCsJIttQOM6ciULwlnxZGZvfstL1Re/6AkvzrA4z7SdhAAAIAxnJjmCqw+el5chTWLnpXkb5OcUzsIsC7nIGBsrgBmFhyZ6S+BYVDzlde/ZwbbVmpLyzkAAABGtTHJvWuHaNGW2gGo4oAkr6wdAliXcxBQhAKYaVDiHiU7CswA1re1dgAAAIAx3TTJUbVDtGifJEfXDkEVxyW5Q+0QwJqcg4AiFMDMis21A8AM2CvJb9cOAQAAMKZHp79bb+7y3NoBqGJDmm2gS1xsAbTDOQgoQgHMrNhcOwDMgGPS3AN4PZ9pOwgAAMCI9khyn9ohJsBVoLPrpkl+t3YIYEXOQUAxCmBmxdbaAWAG3GPAx21uMwQAAMAYbpdkvnaICdgzyf1qh6Cak5McVjsEcCXOQUAxCmCmxbhb07ivALRv0AIYoIa5KX/rotrHpI/HFID6npDZ+X7ZH9UOQDUHJjm9dgjgSpyDgGJm5S8TSJIzaweAHrtRkhvXDgEAADCGvZLcrXaICbp17QBUdd8kv1E7BPBLzkFAUQpgZsmm2gGgxx4w4OOOajUFAADA6O6U5PDaISZoY5JH1Q5BNRuSvDp2RoGucA4CilIAM0tuVTsA9NigBfDONkMAAACM4fGZvTLs92oHoKobJvnd2iGAJM5BQGEKYKZJiRPgtgIzgCu6UZLNtUMAAACMYa8kx9QOUcGNk+xROwRV/XGSw2qHgBnnHAQUpwBm1mytHQB66CG1AwAAAIzpjkkOrR2igg1JnlI7BFUdlOTltUPAjHMOAopTADNrNtUOAD00aAE8a9vYAAAA0+Oxmd3/Z/HNd+6f5Ddqh4AZ5hwEFKcAZtqcOObzj06ypUAOoHGrNNu1AAAATKtZ3Xpzl+sm2a92CKrakOQ1md0CCmpyDnIOglYogJk2ZxSYsa3ADKBh+2cAAGDa3SHJ4bVDVDSX5A9rh6C6GyT5P7VDwAxyDnIOglYogJlFJ9QOAD0xl+QBAz72vDaDAAAAjOExceXjo2oHoBP+OLN5H1KoyTnIOQhaoQAGYFS3SXL9AR+7qcUcAAAAo9onyV1rh+iAqyfZv3YIqjsgyStrh4AZ4hzUcA6CFiiAmUYlfiJqc4EZMOuOrx0AAABgTHdN843nSbg0zfc0dr1dMqF1B7FHkuNqh6AT7pfkjrVDwIxwDmo4B0ELFMDMqi2F5mwqNAem0cNrBwAAABjTYye41tm7/fenJ7j2IGzBSdJ8v/jVsSUtTIJz0OWcg6AwBTCzakvtADDl7p7kqgM+1v80AgAAXbR/kjtNcL3Td/vv501w7UHcKcmBtUPQCTdK8vu1Q0DPOQddkXMQFKYAZlodNebzj02yvUAOmFUPqR0AAABgTPdOcsiE1lpM8je7fWx7kl9MaP1B7BH/r8flnp3ksNohoMecg67IOQgKUwAzrXYWmLFQYAbMov2TPLB2CAAAgDFNcrvJbyW5eIWPf3KCGQbxmNoB6IwDkpxWOwT0mHPQlTkHQUEKYGbZCQVmLBSYAdPmAWlK4EHcus0gAAAAIzogya9NcL23r/Lx508wwyB+Ja765HJbk/xG7RDQQ85BK3MOgoIUwMy6+doBYAptG+KxO1rKAAAAMI57Jzlogus9d5WP/1O6tQXnhiQPrx2CztiQ5r6hc7WDQM84B63MOQgKUgAzzUr84/OkMZ+/qUAGKGlTy/OvkWRLy2sAAAC0rcSuYIM6L8m5a3z+PycVZEDbagegU26c5Hdrh4CecQ5a3bbaAaAvFMDMuvnaAaCwhZbnP7Ll+QAAAG3bL8kdJrjeh9b5/J9NJMXgbpXkmrVD0CmnxLasUIpz0Nqcg6AQBTDT7rwxn39sklPHeP7CmOvDNJlL8qQhHw8AANA1901y8ATXe8Y6n//nJBdNIsiA5jLZq9PovgPSbAUNjM85aG3OQVCIAphpt6nAjKeN8dz5AuvDtLhbkuvUDgEAADCmSe5sdEGSrwzwuE+1HWRIdn9id8cm+Y3aIaAHnIPW5xwEBSiAobGpdgCYAk+oHQAAAGBMBya54wTX+48BH/fcVlMM78ZJrlc7BJ0yl+Q1sdsXjMM5aDDOQVCAApg++EyBGVsLzIA+OzTJvYd4vP8hBAAAuughSQ6a4HrPGfBx70tyYZtBRvCY2gHonBsk+d3aIWCKOQcNzjkIxqQApg82F5ixdcTnbSqwNkyDxyTZo3YIAACAMW2b4FoXJTlziMd/rKUco3pY7QAz7LLaAdZwcpofEgeGt22CazkHwYxTAAOwnrkkTxri8V9vKwgAAMAYDk1y6wmuN+yOZae0EWIM10ly+9ohZtQHawdYw4FJTqsdAqaQc9BwnINgTApgaByb7p3kYBQ7W5h55zT/6BrUfAsZAAAAxvXIJPtOcL1Th3z8vyX5eQs5xvG82gFm1COS/Kh2iDXcL833CoDBOQcNzzkIxqAApi9K3G/05BGes7PAutB1T6gdAAAAoIDjJ7jWpUneMMLzPlI6yJi21A4wo36Q5Nm1Q6xhLslrUub7cTArnIOGt6V2AJhmCmCAfpkvPO/aSR4wxOMnuZUNAADAoA5NcrMJrve/Iz7vuUVTjG9jkhNrh5hRr0zyqdoh1nC9JM+oHQKmhHPQaJyDYAwKYPrkkAIztgz5+IUCa0KXPTnJHkM8fkdLOQAAAMbx8CR7T3C9vxvxeZ9I97bg/L3aAWbUYpInJrmkdpA1PCvJ1WqHgCngHDQ65yAYkQKYPlkoMOOkIR8/X2BN6Kr9kjyudggAAIACHjLBtRaTvGCM5/97qSCF3CTD/WAw5Xwqo23jOin7J3lZ7RAwBZyDRuccBCNSAMMVHZtkW+0Q0BGPSHKVIR7v3j8AAEAXHZJk8wTX+2GSX4zx/K7d+3VDkqfWDjHDfjfJubVDrOH+SX6jdgjoMOeg8TgHwYgUwPRNiQLqlCEeu7PAetBFc0meVjsEAABAAQ9Psu8E13vnmM//ZJILSgQp6Em1A8ywH6V7hcxyc0leE99nhtU4B43POQhG4MQMV3Zk7QDQAb+VZosVAACAafewCa9Xoqw7q8CMkq6X5jZB1PGKJJ+pHWINN0jy+7VDQEc5B43POQhGoACGlW0a8HE7W8wAo9hZaM7Th3y87Z8BAIAuunqS20xwvfOSfL/AnGcVmFHSXJI/qB1ihl2W5AlJLq0dZA3PTnK12iGgY5yDynAOghG4eTZ9NJfmZvfj2Jbk1AEet3XMdcbx4iQLSc7MFQvrHWlKwE1Ln1/NfJItS78+Y7eP71zh8ZvSHJMTBk7YDUfl8t/PfFb//Y1iIclJab4GSXM/j4U0r5+jC61Rww2T3L12CAAAgAIenWTvCa73oUJzPpnkZ0n2LzSvhEdnuNtmUdYnkrwtyYNrB1nF/klOS3Jc7SDQIc5B5TgHwZDmFhfH7clgdLe84x3bGl3ihX3rNGXqWk5JcnKBtZZ7cZpCdkeacnHH0ttC4XVGNU1/abwzdUv6lcyn+VqemnbK9BJX4r42TYk9qGNyeQnOdOjSn2NXj3dTF14jXhtX1IWvye58ja6o9tfI12N9vkYrm/Rx6epx6Apfj/I+m+QWE1zvpkm+WGjWu5Pcu9CsUg5Jd74/MSk1zh+r/dk8LMnZSQ6eYJZhLKa52OCjlXPs4u/UK6r9b6Fdun6cSnIOKqvz56DPntW13bOZZbaApq9K/EPilAEes1BgnSQ5MU3muVxe+iZNSXhmwXVmzY7aAVawM5dfJbzra35UmrK6C66Z5Pghn3NmCzkAAADGdVSSm0xwvZ+l3Dfek+SZBWeVUvqH4BnOOUn+vHaINcwl+dv4njMkzkFtcA6CITgZw+qOTXO15lp2jjH/xbm8ADxjjDmsbqF2gAHtTHOl8q7Xw3kVs/x+3B4AAADohydmsv9/87HC8z6X5CeFZ47r4bUDkL9K2ZKntBuk+d4CzDrnoPKcg2AICmBY25YWZh6Xy6/0pV0LtQOMaFOa18hnJrzuIUkeP+RzZmnbHgAAYLrcb8LrPb+Fme9vYeY4rprkWrVDzLjLkjwuyaW1g6zh2UmuVjsEVOYcVJ5zEAxBAUyflSimtq3z+S1DzNp1def2EbMwvJ21A4xpcy5/3QzqpDHW+50k+47xfAAAgK64Xtbf1auki5J8qIW5Xdzu8pTaAci/J3l77RBr2D/JabVDQEXOQe05pXYAmBYKYFjb0WmuxlzNjgFmHBVXSdays3aAgubS7n2CD07y9CGf8/U2ggAAABTw6CQbJ7jep1qa+4V0bwvO+9cOQJLkKen2zmfHpvm+Gswi56D2OAfBgBTA9F2J4nXHiM97ztL6OwtkgOTy+wS3cY/gk9KUwMOYLx8DAACgiK0TXu8vWpz91hZnj+KQJDesHYL8MMmf1w6xhrkkp2eyJRh0xdYJr+ccBFyJAhjWd+Qan1tY5eOHxHYUXTBfO0BLNqW5snwlO0aYN8rVvwAAAF11VCb7zeGfJHl3i/NPTnPf1y55Tu0AJElekOTLtUOs4QZJfrd2CJgw56D2OQfBABTAMJiTVvn49t3++8Qkx6TbW/DQDzuT3DpXvhp4YYRZJ2X4q39taw4AAHTVozLZqw7/reX5307yuZbXGNa9agcgSVPKPDHdK2eWOyXJ1WqHgAlyDmqfcxAMQAHMLChRVJ00wBpzSc5IcmaB9WAQO9JcDbz8/sA7hpzh6l8AAKBP5jL5+wP+wwTW6NoWnAem+aFk6vtwLv+eQBftl+S02iFgQpyDJsM5CAagAIbBHJmm3F2JKyHpgq0Z7bX49Ax/9a9/YAEAAF11k0x2680Lk7x9AuucnuTSCawzjD+pHYBfekKabWC76tg0O+ZB3zkHTY5zEKxDAcysKFHSnpBkc4E50BWHZ/2r21eyo2wMAACAYp6YyW69+fEkF01gnR8k+ewE1hnGXWoH4Jd+kOS5tUOsYS7JazLZP5tQg3PQ5DgHwToUwDCcTbUDQEHPyPBX/wIAAHTVXJL7TnjNt0xwrfdOcK1B7BNXdXbJi5J8qXaINcwn+aPaIaBFzkGT5RwE61AAM0s+U2DGtgIzoAsOT7NF1LBseQ4A3bTobd03oP9uk+SICa53cZI3TXC9V6Z7f5+dXDsAv3RZmv/Pv6x2kDU8M833I6CPnIMmzzkI1qAAZpZsLjDjhCSnFpgDtZ2S5iflAAAA+uKJmewPrf5nkoUJrveNJD+a4HqD+PXaAbiCjyT5p9oh1rBvktNqh4CWOAdNnnMQrEEBDMPbXDsAjOmoJI8d4Xmu/gUAALpqQ5LfnvCa75jwekny7gprrmXPJPerHYIreGySn9YOsYb7xrat9I9zUB3OQbAGBTCzpkSBdXSBGVDTyUk21g4BAABQ0G2SXH2C6y0m+YcJrrfLH1dYcz1/WDsAV/D9JH9VO8Qa5pK8KsketYNAQc5B9TgHwSoUwDCaU2oHgBHdNMnxIzzP1b8AAECXPTqT/f+WryT59gTX2+Vb6d4WnLetHYAr+bMk/1M7xBquH6UN/eIcVI9zEKxCAcwsKnEyPjlKYKbTX8fVvwAAQL/MJbnnhNeseZ/Vd1ZceyUbk5xYOwRXcFmSJyy976pnJblG7RBQgHNQXc5BsAoFMIxua+0AMKS7J7nHCM87qnQQAACAgm6T5DoTXvP1E15vuWdVXHs1J9UOwJV8ON27X+dy+yZ5Ze0QUIBzUH0n1Q4AXaQAZlaVuAr4VgVmwKRsTPLCEZ+7s2AOAACA0ia99eYPknx6guvt7ntJzq24/kpuHvd07aInJjm/dog13CfJb9YOAWNyDqrPOQhWoACG8WyvHQAG9Pg09/8FAADokw1J7j3hNT8y4fVWsr12gN1sSPLU2iG4ku8meUHtEGuYS3J6FDdML+egbnAOghUogJllJX4y69h074QHuzswyR+P+NxJ/gQjAADAsO6U5IgJr/nWCa+3kj+qHWAFT6odgBX9WZKza4dYw3WT/GHtEDAi56DucA6C3SiAYXzH1g7AqnbWDtARz01yeO0QAAAALXjihNc7P8nbJ7zmSr6f5JzaIXZzvST71Q7BlVySZlewy2oHWcOzklyjdggYgXNQdzgHwW4UwMy6o2oHgJbdKKNvgeLqXwAAoMv2SHLXCa+5I90p0rpQAiw3l+T3a4dgRf+abu9gt2+araBhmjgHdYtzEOxGAcys21lozrZCc6C0VyTZWDsEAABAC+6e5NAJr/nuCa+3lmfWDrCCE2oHYFVPSvKz2iHW8NuZfJkG43AO6h7nIFhGAQxlrgJ+bZL5AnOgpBOSHDPic139CwAAdN0TJrzexUleOuE11/LjJN+tHWI3RyQ5uHYIVvT9JC+oHWINc0leleaqSpgGzkHOQdBpCmAodxXwmYXmUM7O2gEqOiDJ82uHAAAAaMmeSe404TW/kuTnE15zPW+uHWA3eyR5ZO0QrOpP0+3vlRyV5Bm1Q8AAnIMazkHQYQpgaBxXYMaRBWZAKX+S5PARn+vqXwAAoOvunslf5fPPE15vEKfUDrCCrbUDsKpLkjwx3bmH6EqemeRatUPAOpyDGqfUDrCCrbUDQFcogKGxvdCcUwrNgXHcNslTR3zuR0oGAQAAaMmJE17vsiQvmvCagzgvyXdqh9jNnZIcVDsEq3pvkvfXDrGGfZO8vHYIWIdzUMM5CDpMAQyXK3HV48lJTi0whzI21Q5QyWlJNo743C0FcwAAALRhjyTHTHjNb6d73+TepWtbcO6Z5H61Q7CmRyX5ae0Qa7hvkt+qHQJW4Rx0Rc5B0FEKYCjvabUD8EsLtQNUcEKaK4BH8ZySQQAAAFpyjySHTHjNf53wesM4pXaAFWyrHYA1fTfJX9YOsY7T0xQ50DXOQVd0Su0AK9hWOwB0gQIYrujWheacUmgODONaSV44xvNPKZQDAACgTSdMeL3FJC+e8JrD+EmS79UOsZvfSHJY7RCs6c+TnF07xBqOTPJHtUPACpyDrsg5CDpKAQxXtKPQnJMzu9sPd8l87QAT9tIkVxnxue8sGQQAAKAle2XyW8N+P8mnJ7zmsLq2BefGJA+pHYI1XZrkyWnKpa76ozQ/7A5d4Ry0Mucg6CAFMFxZiXsBJ8nOQnNgEMcm2TrG88d5LgAAwKQ8OcnBE17z3ye83ij+b7pX5D2qdgDW9f4k760dYg37JHll7RCwjHPQypyDoIMUwNCeg+Mq4NrmaweYkEOSvGyM55f6oQcAAIC2PbXCmq+usOawzk/yndohdrM5yTVrh2Bdj03y89oh1nDvTP6KS1iNc9DKnIOggxTAsLJShdjWQnMYzbbaASbkJbElEgAA0H8HpN0f9F3MylcwvSrJPVtct5TX1w6wm7lM/l6ZDO/bSV5QO8Q6Tk+yZ+0QzDznoLU5B0HHKIChXa+Nq4BrmoWT/IOTPHyM57v6FwAAmBb/N3X+H+aIJP+c5DNJrlFh/UH9abq3Becs/H95Hzw3yddqh1jDkUmeVTsEM885aG3OQdAxCmBYXakT+rmF5sDurpHkFbVDAAAATMjxLc9f7/sAt0zyrTQ/7N3F76n9LMk3aofYzY2SXK92CNZ1aZInpXvlzXJ/mOTatUMw05yD1uYcBB3Txb8ooI/OqB1ghm2qHaBFZ6S5/++oXP0LAP0x523dN2C6HZzJ3Mtv+d8XK5VhG9Lcbuj8NPdO7ZozagdYwYm1AzCQ9yb5QO0Qa9gnzVa4UINz0GDOqB1gBc5BzCwFMKyt1DeKTki794iYlC21A4xgoXaAljwtyd1qhwAAAJiQk1PnhzlWuyJy3zRl1DeS3GJycdb15+neVZwPrR2AgT06yQW1Q6zhnknuUTsEM8k5aDDOQdAhCmBY360LzTmj0JyaFmoHIEnyK0lOHXOGq2AAAIBp0vbWmytZXPa2miPS3JfxfWmuUKztF+neFpzXTbcKClb3rSQvrh1iHa9IsnftEMwc56DBOAdBhyiAYX07Cs05utCcmj5dO8AIzqgdoLDDk7ytdggAAIAJukqSq1ZYd8PS23o/QDuXZoemnyQ5peVMg3ht7QArOKF2AAb27CRfrx1iDfNJnlE7BDPFOWg4zkHQEQpgGEypqyW3F5rD4Pp2gn91kiPHnOHqXwAAYJqcXjvAgPZMs03oD1N3m9q/iC04Gd0lSZ6Y7r2GlntGkuvUDsHMcA4ajnMQdIQCGCbr2HTvBDiozbUDjGFz7QCFnJzkXmPOOK5EEAAAgAmatnt+HpbkX5L8V5JrVlj/F0l2Vlh3LddMcvvaIRjYv6TZUrar9klyWu0QzAznoOE4B0FHKIBhcCWvmtxScNakTOP2z7tMc/ZdtiT54wJztheYAQAAMCnXSrJf7RAjunWSbyb520z+e3CvnvB6g3h07QAM5bFJfl47xBrukeSetUPQe85Bo3EOgg5QAMNwzis0Z0uhOZNyZu0ABWytHWAMhyZ5Y8b/O9vWzwAAwLR5Te0AY9qQ5pvO52Wytyj6y3RvB7IHxPcip8m3kvxN7RDrOC3J3rVD0GvOQaNxDoIO8IKH4WwqNOfkTFcJfHTtAAW8o3aAMbw6ydVrhwAAAKigD/8/miQHJDkjydlJbjaB9S5O8rUJrDOMqyS5c+0QDOWPk3y7dog1HJHkj2qHoNecg0bjHAQdoACG4Z1YaM6HMx33pu3aT2uNY0ftACN4Wpp7R4/L1b8AAMC0uX76d3Xf9ZJ8Lsl7kuzb8lp/2/L8UTy2dgCGcnGSp6Tb3xt6RpLr1A5BLzkHjcc5CCpTAMPwzig469NJ5gvOK2177QCF3SrJttohhnC7JC8oMOfWBWYAAABM2mtrB2jJXJJ7pdmS8xktrvOCdK+4u0+SPWuHYCjbk/xr7RBr2DvJq2qHoJecg8bjHASVKYBhNCWvpuzadhi7bE6ZK0+75rUpt5V3m26S5ENJ9igwa0eBGQAAAJP2q7UDtGzPJH+e5HtJ7tTC/IuT7Gxh7jgOTHK32iEY2qOSXFA7xBrunqbQgpKcg8bjHASVKYBhdO8sOOuUgrNK2Jbm6uS+Ojfdvgfz/kk+muYfJeOy9TMAADCNbp7ZuUrn8DT/D/jJJIcVnv2KwvNKeHTtAAztG0leWDvEOl6R/m3XSz3OQWU4B0FFCmAY3dbaAVoyn/5ucbLch9PdK4F3pMw/uEr+kAIAAMAknV47QAW3S/L9lP2G+V8nuazgvBLukWSf2iEY2ilpiuCuOiLJX9YOQW84B5XhHAQVKYBhPKWurjw53Skju7oldRvOrR1gBa9Pcv1Cs7YWmgMAADBpt60doJINSZ6Q5KdJHlhg3mVJvlpgTkn7prkPI9PlkiRPTvfu6bncU9KUWDAu5yDnIJh6CmDojnPTXH1byxnp9j/i27KY5ve+qW6MJMn9kxxfaJatnwEAgGm1ObOz9eZqDkjyliRfSnLdMWe9dPw4xW2rHYCRvCfNVrFdtSHJu2uHYOptjnOQcxD0gAIYxleyaPta6pTA25KcUGHdrjghyZmVM9w+ydsqZwAAAOiC02oH6JAbJTk7zS1+9hhxxkvSvS0475rkoNohGMkJSS6sHWINhyd5Tu0QTDXnoMs5B8EUUwBDGSVL4DMLzhrULNzzdz23qrj2piT/UXCeq38BAIBpdpvaATpmLsl9k/wsyR+M8PzL0nwDv0v2SnK/2iEYydeTvKx2iHU8M93Y6Y3p5Bx0Rc5BMKXmFhdnccdXuuKWd7xj7QgllfzDdFyS7QXnDWI+yUKSk5ben5lmy5OdS/+9Y+lxW5c+tnnZx1azaen9wiofX8/uz1vt8/OrPH5+6WM7l31u1/stSzlOWvp1TQtJDi40S/nLILp08vea7aYuvEa8Nq6oC1+T3fkaXVHtr5Gvx/p8jVY26ePS1ePQFb4eyZ3S7S1mu+C7ab5x/YkhnvOUNFdhdclHkxxdO8QAapw/uvhnc7k9k/xvkiNqB1nDvyf5jQmv2fWvW+1/C+3S5ePkHLQ+56A1fPass0qPhJEpgKmqZwVwUu4fUl9P3fsBMzmb0tz/uZQu/yOa7ujSyd9rtpu68Brx2riiLnxNdudrdEW1v0a+HuvzNVqZwrFbfD2Szya5Re0QU+Lf01yVNej/U16abu0GeGmSqyc5p3aQdSiAV3ZskndkOrJOStePRe1/C+3S5ePkHDQ456AVKIDpki79gYM+KPUPmCOTnFpoFt22veCsLv8DGgAAYBA3rR1givxGkh9m8KuqvtRillFsTPKQ2iEY2TtT5zZm0CbnoME5B0HHKYChu56WZFvtELRqMeW2GlH+AgAA0+4Bab4hy+A2ptla87wkD1znsV3bfjNJHlU7AGN5dJJf1A4BhTgHDc85CDpMAQzllSziXpvmXrv0z5baAQAAADrmpbUDTLGDkrwlyeeTXHeVx7wyzZaXXbI5yTVrh2BkX0v+f3v3H3xZXd93/LUjECONrkZNxUZW1GYEDYSIoYMKbdW0RgMGjQ1aWTVJm1YDNZkx1kYwTWxspgFn6o+pNaxJ/T3oNlXTsVZQg6Y2RtRGo42CwR8hll/+AARh+8dZZFn353fPOe9z3/fxmNlx3GXP533v+e5+vnuf95yb11QPASOxB22cPQgWSACGaYwZgS8d8Vgsw5Ykl4x4PFf/AgCwEb6PZGlfA/evHqCB45L8ZZK3JDlsD7++tFtwbkryT6uH4JC8KMlXqoeAEdiDDp09CBZEAIblu1eSy6uHYDRbMrxDdixLe8EGAIDVUfG9pO9f927dz8cvZP55vpHkV5N8c+Z1p7YpyTMyPL5f3u3XLph/nP3y4vtquyXDLWBhldmDxmMPgoUQgGE6Y37TcHyGz4tl9Z0/4rE+MeKxAAAAKr28YM3/keQ/JPmhJG/I8m5NeajunuSVSb6c5OSdP/f6LO9xHpfkIdVDcEjemXHvdAZzsweNzx4ExQRgmNbY7xw7f+TjMa9tSc4e8XgnjHgsAADWT8WbTJd0xenSVDw3S3qj8X0L1nztzv+9McnWDC8Cf7xgjqkdleQjST6U4S5jn6kdZ49cgbX6npvk29VDwAbZg6ZjD4IiAjBM7zkjHuu8iMCr6oSMG3+9cAYAwKGqiH/fV7Dmqqh4bpYSgF9QsOZ1Ga6+2tVnk5yY4daVX5t9ouk9Jsk1SW6qHmQPzqoegEN2ZZLXVA8BG2APmoc9CGYmAMP0to18vPMyvCuM1XFGxn0H31NHPBYAAOvthpnX+4GZ11slcz83c5/7fTm/YM337ePX3pbkAUlekeTmecaZzd2SnFQ9xB48LMkjq4fgkL0oydXVQ8BBOr9gTXvQstiDaEkAhnmMfbXm5SMfj+lszvBZOGPaPvLxAABYX1+ceb37zbzeKpn7uZn73O/LfQrWfMN+fv22JL+WZEuSP8pyrpbuzC04V98tqbmaEg6FPYjEHkRDAjDMZ8wI/PEk5454PKazfeTjufUzAABj+vzM6wnAezf3czP3ud+blxas+c0ML6gfiKuTPCnJP8yyonlHz6wegFG8PckfVw8BB8gexB3sQbQjAMO8xox3F2T4XFmWa3uSU0c8nvgLAMDY/mLm9Y6Zeb1VMvdzM/e535tfKVjzA0luP8jfc0mGK7FelOHFe8Z3VJJHVw/BKJ6dfreupSd7EHewB9GOAAyr7cLqAdirC5OcPuLxfO4vAABT+OzM6x0783qrZO7nZu5zvyebktyzYN2LDuH3/vsk90/yxiTfGWccdvHc6gEYxRVJXlU9BOyHPYjd2YNoRQCG+Y15Feep8RkQS3R+knNGPub2kY8HAABJ8rmZ1zt55vVWydzPzdznfk9+p2DNm5L84QjHeFaSR2T4iCbG8/R4vbKLFyf5WvUQsA/2IHZnD6IVX8xQY+xb+W7LcBsQ6m1Oct7Ix3TrZwAApnLVzOv9RJIjZl5zFRyR4bmZ09znfk/+ecGaH0py60jH+mySE5P8kyTXjnTMdXefJI+rHoJR3JohAsNS2YPYnT2IVgRgqPNjIx7r7Ay316HWCUmuG/mY4i8AAFOa++qsw+I20HtybIbnZk7VV+ZtSnJkwbq/P8Ex35rhlpyvzHgv7K+z51UPwGhen+Qr1UPAHtiD2Bt7EG0IwFDn8gmOeekEx+TAbM74t10RfwEAmNq3k1w/85qPmXm9VTD3c3J9hnNf6dUFa347ycUTHfu2JOcmOTrJ/4yPazoUP53k8OohGM2Z1QPAHtiD2Bt7EG0IwFBr7MB3aobbQTO/c0c+nvgLAMBc3jnzes+ceb1VMPdzMvc535NnF6z5gSQ3T7zGV5M8PsO/z92pa2PumeSJ1UMwmj9J8sHqIWA39iD2xh5EGwIw1Bs79J2d5LSRj8m+XZ7xP/cXAADm8kczr3dykgfOvOaSPTDDczKnuc/57jYluUfBum+cca0PJTkmya8luXHGdbs4u3oARvWkJN+pHgJ2sgexP/YgWhCAYRnGjsCXZPg8Wqa3LcnxIx/T1b8AAMzpfxWs6Zagd6p4LirO+a4uKljzO6m58vkVSY5K8rYktxesv6p+Ksndq4dgNN9K8m+rh4Cd7EHsjz2IFgRgWI7njHy8sT+Plu91RsZ/R5j4CwDA3L5UsOaLkhxRsO7SHJHhuZhbxTnf1c8WrPknSb5RsG6S3JDkGRneqP2xohlWzT2SPKV6CEb1G0m+Vj0ExB7E/tmDaEEAhuXYNsExr5zgmAy2ZPx37om/AABUuD3JO2Ze86gkPzPzmkv0Mxmeizm9I7VXAR2e5PsL1n1rwZq7+1SSRyV5VoSwA7G1egBGd0b1AKw9e5A96EBtrR4ADpUADMsydgA8Osn2kY9Jcm6SK0Y+pvgLAECl3ytY8xVJjixYdymOzPAczK3iXO/qLQVr3p7kTQXr7s0bM3z286uT3Fo8y5I9Ick9q4dgVB/e+QOq2IPsQQfKHsTKE4BhecYOgacnuTTJaSMfd12dm+SC6iEAAGBkHypY80FJXlaw7lK8LMNzMLeKc72rJxeseXmSawvW3Zdbk/zLJMdkOCc7asdZpMPjTgEdPTHD56FCBXvQwB60f/YgVp4ADMs0dgQ+NcklEYEP1WmZJv66+hcAgGpfz/AC5dxemOSUgnWrnZLhsc/t8gznusqRqfns54orvg7Ul5I8Lsnj42Oc9uR51QMwum8l+XfVQ7CW7EHfyx60b/YgVpoADMs1RRTcNsEx18VpGSL62MRfAACW4rcK1tyU4WNrthSsXWVLhsdc8W+BinO8q7k/azoZrmr6LwXrHqz3J3lwkhcnubF4liX5e0nuWz0Eo3tpkv9XPQRrxx60d/agPbMHsdIEYFi2KT4T+NKRj7kOzoj4CwBAf+8uWve+ST6Q4d8r3R2d4bFWvZhYdY7v8PcL1vzzJF8tWHejfjvJA5JcnOFzI9fd3ZI8o3oIJnFm9QCsHXvQ/tmD7soexEoTgGH5prgd9I4kF4583K62J3nnBMcVfwEAWJqbkry9aO0HJflwkuOL1p/D8RkeY8Xn/ibDub2paO0kuVeGz9Ob25Jvvbk3X0/ytCQnJvl08SxLcHb1AEzig0k+Uj0Ea8MedODsQXdlD2JlCcCwvs6JzwTen21JTp/guOIvAABL9dLCtY/KEAOem17fM2/K8Jg+kuExVqk8t8k0b6w9EG8qWncMn0hyXIYXn68pnqXSo1L7Z4fp/KMkt1UPwVqwBx08e9DAHsTKEoBhNUz14sclSU6Y6NirbmumeYfXUyc4JgAAjOUvknyhcP3vT/L6JO/L8KLjqjsuw2N5fYbHVuULGc5tpccWrPnZJFcUrDu238/w4vOFSW6tHaXEpiRnVQ/BJL6e5Heqh2At2IM2zh5kD2JFCcCwOqaKwB+PK4F3d26SiyY47o9luKU0AAAs2fOqB0jyD5J8KsP3zyfWjrIhJ2aY/VMZHku16nN6/ySHFaz7toI1p3JLkn+V5KEZbp27bp5VPQCTeXGSb1UPQWv2oENnD4IVJADDapnySuBtEx171WxPcsEEx713kssnOC6suh1+bOgHAEzpA0murh4iw79/Tk/ysSQfTfLPktyvdKJ9u1+GGT+aYebTs4xbWV+d4ZxW+oOidd9ctO6U/irJqUmenOTLxbPM6fgkD6kegsk8s3oAWrMHjcceBCtEAIbVM9ULCGdHBN6WaT7zN0mun+i4AAAwth1Z3q3uTkry2iR/neENrC9M8ugkRxbOdOTOGV64c6a/zjDjSYUz7clZqX8D2WMK1vxiks8UrDuXdyf54ST/Jsk3i2eZiyuw+vqvGf7MwhTsQeOzB8EK2LRjR/W/AVhnP3rKKdUjrLKp/vB+Iuv5ucAXJjlnomMv4V3/sCub/+qb+u+VJXyN+LvzrpZwTnbnHN1V9TlyPvbPOTo4m5L8eZKHVw9yAP4qwxW3n03yf5N8LslVGd6EeXPu/Ly63e+ksSnf+3WxKXeeq8OT3D3J5gwvcv7dJA9L8iNJfjzJg0Z9FNP4TIbPIa78+v/bSb5asO7vJvmVgnUrbE7yuiRPTXK32lEm9ZcZ/gzOreLPz6rtGWO4T5Jrqoc4REs/b9XfC91hzufJHjS9zbEHfdcnL7tshlHgwFTc+x4Yx55erBjD8Um2Zn2uBt6c5NIMj3sKS//mHwAA9mRHkjOTfLp6kAPwoKxGjK1wZupf8N9WtO6bitatcH2Sp2d4Y8IfZDXeuLERD03yyAyfrU0/12b4c7u0O1Cw2rYVrWsP6scexMpxC2hYbVPFxYuyHp9XuyXJdRF/AQBgTz6T4d8GrKaLsozbT55WsObVGa4KXzcfS3Jshs+ivr52lMk8u3oAJvXMJLdUD0ErpxWsaQ+yB8EiCMCw+qaKjMdnuDK2s0snPLb4CwBAB/8iw22UWS03Zzh31Y5J8n0F676zYM0l+U9JfijJq9Ivpj2zegAm93PVA9CGPaiGPQgWQgCGHqaKjadmuF3YCRMdv8r2DI/r6ImOL/4CANDFzUl+snoIDtpPZhnhvuoK8jcWrbsktyR5foZbVn4w9bcCH8sDkjy6eggm9Y4kX6weghbsQXXsQbAAAjD0MWV0/HiGzwXuYHuS0yc8vvgLAEA3H0zyuuohOGCvy3DOluDkgjWvTfLhgnWX6qoMb+5+cobbknawtXoAJnd8+gQj6tiD6tmDoJAADL1MGR8vSnLhhMefw7aIvwAAsBG/lOSK6iHYrysynKslODbJEQXrbk9ye8G6S/eeJEcl+Y0s4+rwQ/Gz8ZpmdzdkuH0sbJQ9aFnsQVDAFyr0M2WEPCfDNzJbJlxjClszxN+zJ1xD/AUAoLPbkjwqyU3Vg7BXN2U4R7dVD7JT1VXjby5adxXcnuS8JA9M8vasbqT4wSSPqx6Cyb0gQwiGjbAHLY89CGYmAENPU8bI0zO8q3zzhGuMaUuGq5fFXwAAODTXJjmtegj26rQM52gpTipY8+tJPlCw7qq5NsMVTD+R5NPFs2zUlP/GZzmeVj0AK8setFz2IJiJAAx9TR0lr8vyX/y5MNPfpk78BQBgnXw0yVOrh+B7PDXDuVmKE5McXrDuu5LcWrDuqvrTJMdluG34ql1peUZqvsaY1/syfJ3CwbAHrQZ7EExMAIbepo6TlyS5NMkJE6+zEdsz3LJ6Kpsi/gIAsJ62J3l+9RB81/MznJMleXXRum8tWnfVvTbJA5L8XlYnXmxO8oTqIZjFE7OcW9uzGuxBq8UeBBMRgKG/qSPlqUk+nuV8LvBpSS7PcKvqqQi/AACsu1cl+cXqIcgvZjgXS/PjBWvelOS9Bet2cVOS5yV5RJLLkuyoHeeAuAXnerguwx3e4EDZg1aPPQgmIADDepgjWF6R+m/Id2S4Kvn4CdcQfwEAYPC6JGdVD7HGzspwDpbmsUkOK1j3vUluLli3m88leUySn07ypeJZ9ufJSe5ePQSz+NUk11cPwUqwB602exCMSACG9TFHuDwnNe/QOjfDVb9TE38BAOCu3pzhhbobqwdZIzdmeM7fXD3IXvzHonWX+nysqncleVCSl2e5UeMeSZ5SPQSzObN6AFaCPagHexCMQACG9bIpyYNnWGdHkvNnWGdzhs+6uiDTXvWbiL8AALA3l2W4Zd+VxXOsgytz5+0Rl+q4gjVvTfKegnW725HkJUn+TpL/nmXekvM51QMwm/cn+Vj1ECyePagPexAcIgEY1s+VmSdmnpdk68RrbMu0n/V7B/EXAAD27YokxyZ5Q/Ugjb0hw3N8RfUg+/CkJHcrWPf9Sb5RsO66uCbJP05ycpLPF8+yu8cnuWf1EMzmCUlurx6CxbIH9WQPgg0SgGF9zRE1L8rw7qytIx/30p3HFX8BAGA5bspwJcTT4pbQY7oxw3P6nAzP8ZL9btG6bylad918NMlDM7wYvxSHJzmjeghmc12SV1UPwWLZg3qzB8FBEoBhvc0VNy/KEG03j3CsbUlOHeE4B0L8BQCAg7MjycVJjsnw+W0cmndleC4vzjJvfbi7hxWs+Z0kf1iw7jr7b9UD7MYtONfLLyf5evUQLJI9aD3Yg+AACcDAXJHz1Azv1Lxwg79/a4YXPM4eaZ592RTxFwAADsXVSZ6S5KeyvNv1rYLPZ3junpLhuVwFZ6bmdaY/TnJtwbrr7IIs6w0Jj01y3+ohmNXTqwdgcexB68MeBAdIAAaSIXbeMNNa5yQ5/yD++61Jrs9wFfEchF8AABjPe5I8PMPVEV8rnmUVfC3Dc/XwDM/dKvntonXfVrTuOvtkki9VD7GLu2W4TTrr471J/qx6CBbFHrQ+7EFwgARg4A6bkzx4prXOy/BOrfP3899dmSH83mviee4g/gIAwPhuzfBRLluS/EKSqyqHWairMjw3WzI8V7dWDrNBxxSseXuS7QXrsrzn/dnVAzC7J2b4OwASe9C62V49wG7sQSySAAzs6srMG0F3DcFbd/n5M3b+/NEzziL+AgDAtG5M8p8zvEj7tCQfrh1nET6c4bk4JsNzc2PtOBt2VmpeY/rfSb5asC7JK7Os+HZykqOqh2BW1yR5dfUQLII9aP3Yg+AACMDAnswdQ8/LcKXvjp0/3jnj2j7vFwAA5vWdJBcnOSVD+PzNrM7n3I7h6gyP+ZgMz8HFGZ6TVfabReu69Wadzyf5QvUQu9iU5Oeqh2B2L0jyjeohKGcPWj/2IDgAAjCwN5uSfLF6iIkJvwAAUOuKJL+e5IFJTkry8izrBb2xfCHDYzspw2P99QyPvYstRevO+eZhvtdbqwfYzdnVA1BCdGFL0br2oFr2INgPARjYly3pG0m7Pi4AAFhFtyX50yQvSfKQnT9+Psnbk/xN4Vwb9TcZZv/53Pl4XpLhMd5WONcUfik1/776RHpF9FX0miTfrh5iF4/M8GeN9fLuJJdXD0EZe9D6sgfBfhxWPQCwEjZluDVzF+IvAAAs2xd2/nj9zv9/TJITk5yQ5Pgkj0jdFT+7uzLJ/8nwYvDlSf4sPa9i3pt/XbTu24vW5U5fzvCmhlOqB9nFs5K8rHoIZvf4DG+8cbHT+rEHrS97EOzHph07OjUdVs2PnrKkv585AKv+F4bwC4NV/7PM9H+fLeFrxN/Zd7WEc7I75+iuqs+R87F/zlE/RyQ5OskP7/xxVIbbK98/yQ8muXeSv5XkB5IcnuEc3Dt3nosbktxrl+PtSHLdzv+9NcPnSn5z589dkyEufDnJV5JctfPHF5PcMtHjWxW3p+br+9gknylYl7s6K8kbq4fYxeeS/MjIx6zYP+wZB+/CJOcUz7D081b9vdAdxnye7EHrbXF70Ccvu2zsPQg2TACmlAC8slbxL46lfxMOAAAAAMCK+uRll1WPAN/lthjARqxSTN2U1ZoXAAAAAABgwwRgYKPuuH3akgm/AAAAAADAWhGAgUNxfZYZWW/IMucCAAAAAACYlAAMjGFJVwNvSrK5eggAAAAAAIAKAjAwlutTe9XtJ4rXBwAAAAAAKHdY9QBAO3dE2B0FawIAAAAAAKw1VwADU5kjym6aaR0AAAAAAICVIAADU5oy0Aq/AAAAAAAAuxGAgTmMGWtd9QsAAAAAALAXAjAwl0MNtw8+xN8PAAAAAADQ3mHVAwBr546Iu2MDvwcAAAAAAIB9cAUwUGVTknsfwH8j/gIAAAAAABygTTt2HMxFeAAAAAAAAAAslSuAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJoQgAEAAAAAAACaEIABAAAAAAAAmhCAAQAAAAAAAJr4//WIViN3u0tjAAAAAElFTkSuQmCC"""
@@ -1,11 +0,0 @@
-"""
-Auto-generated base64-encoded image data for: vacc_lithuania_white_transparent.png
-
-This file was generated by scripts/generate_asset_b64.py
-Do not edit manually - regenerate using the script instead.
-"""
-
-# Original filename: vacc_lithuania_white_transparent.png
-# File size: 37144 bytes
-# noinspection PyPep8
-IMAGE_B64 = """iVBORw0KGgoAAAANSUhEUgAAB4AAAAQ4CAYAAADo08FDAAAACXBIWXMAAAsTAAALEwEAmpwYAACQyklEQVR4nOzdd5xld10//tfsppFCNiQQWsiE3llAFETIRpAiSDb0noSigCKgP/tXCdjAQhHpAsECSJFQRJoSUKooS1GKAZbeAtmQSELa/P44s+7sMOXeez7nfs499/l8POaxm5l735/3nnNmPpP7up/PWVhaWgoAAAAAAAAAs29L7QYAAAAAAAAAKEMADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAwEAIgAEAAAAAAAAGQgAMAAAAAAAAMBACYAAAAAAAAICBEAADAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAAAAyEABgAAAAAAABgIATAAAAAAAADAQAiAAQAAAAAAAAZCAAwAAAAAAAAwEAJgAAAAAAAAgIEQAAMAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAMBACIABAAAAAAAABkIADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAwEAIgAEAAAAAAAAGQgAMAAAAAAAAMBACYAAAAAAAAICBEAADAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAAAAyEABgAAAAAAABgIATAAAAAAAADAQAiAAQAAAAAAAAZCAAwAAAAAAAAwEAJgAAAAAAAAgIEQAAMAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAMBACIABAAAAAAAABkIADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAwEAIgAEAAAAAAAAGQgAMAAAAAAAAMBACYAAAAAAAAICBEAADAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAAAAyEABgAAAAAAABgIATAAAAAAAADAQAiAAQAAAAAAAAZCAAwAAAAAAAAwEAJgAAAAAAAAgIEQAAMAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAMBACIABAAAAAAAABkIADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAwEAIgAEAAAAAAAAGQgAMAAAAAAAAMBACYAAAAAAAAICBEAADAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAAAAyEABgAAAAAAABgIATAAAAAAAADAQAiAAQAAAAAAAAZCAAwAAAAAAAAwEAJgAAAAAAAAgIEQAAMAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAMBACIABAAAAAAAABkIADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAwEAIgAEAAAAAAAAGQgAMAAAAAAAAMBACYAAAAAAAAICBEAADAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAAAAyEABgAAAAAAABgIATAAAAAAAADAQAiAAQAAAAAAAAZCAAwAAAAAAAAwEAJgAAAAAAAAgIEQAAMAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAMBACIABAAAAAAAABkIADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAwEAIgAEAAAAAAAAGQgAMAAAAAAAAMBACYAAAAAAAAICBEAADAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAAAAyEABgAAAAAAABgIATAAAAAAAADAQAiAAQAAAAAAAAZCAAwAAAAAAAAwEAJgAAAAAAAAgIEQAAMAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAMBACIABAAAAAAAABkIADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAwEAIgAEAAAAAAAAGQgAMAAAAAAAAMBACYAAAAAAAAICBEAADAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAAAAyEABgAAAAAAABgIATAAAAAAAADAQAiAAQAAAAAAAAZCAAwAAAAAAAAwEAJgAAAAAAAAgIEQAAMAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAMBACIABAAAAAAAABkIADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAwEAIgAEAAAAAAAAGQgAMAAAAAAAAMBACYAAAAAAAAICBEAADAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAAAAyEABgAAAAAAABgIATAAAAAAAADAQAiAAQAAAAAAAAZCAAwAAAAAAAAwEAJgAAAAAAAAgIEQAAMAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAMBACIABAAAAAAAABkIADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAwEAIgAEAAAAAAAAGQgAMAAAAAAAAMBACYAAAAAAAAICBEAADAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAAAAyEABgAAAAAAABgIATAAAAAAAADAQAiAAQAAAAAAAAZCAAwAAAAAAAAwEAJgAAAAAAAAgIEQAAMAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAMBACIABAAAAAAAABkIADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAwEAIgAEAAAAAAAAGQgAMAAAAAAAAMBACYAAAAAAAAICBEAADAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAAAAyEABgAAAAAAABgIATAAAAAAAADAQAiAAQAAAAAAAAZCAAwAAAAAAAAwEAJgAAAAAAAAgIEQAAMAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAMBACIABAAAAAAAABkIADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAwEAIgAEAAAAAAAAGQgAMAAAAAAAAMBACYAAAAAAAAICBEAADAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAAAAyEABgAAAAAAABgIATAAAAAAAADAQAiAAQAAAAAAAAZCAAwAAAAAAAAwEAJgAAAAAAAAgIEQAAMAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAMBACIABAAAAAAAABkIADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAwEAIgAEAAAAAAAAGQgAMAAAAAAAAMBACYAAAAAAAAICBEAADAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAAAAyEABgAAAAAAABgIATAAAAAAAADAQAiAAQAAAAAAAAZCAAwAAAAAAAAwEAJgAAAAAAAAgIEQAAMAAAAAAAAMhAAYAAAAAAAAYCAEwAAAAAAAAAADIQAGAAAAAAAAGAgBMAAAAAAAAMBACIABAAAAAAAABkIADAAAAAAAADAQAmAAAAAAAACAgRAAAwAAAAAAAAyEABgAAAAAAABgIATAAAAAAAAAAANxQO0GAIAijkhypSRXSXJskq8luSDJt2o2BQAAAADAdAmAAWB2LSQ5LskDkvxkkjukCYAvSXJwkt1JfifJ6yv1BwAAAADAlC0sLS3V7gEAGN+2JE9L8ugkh6YJg9fy6SQ3nVJPAAAAAABUZgUwAMyWrUnumuT5Sa434uOPTvLdLpsCAAAAAKAfttRuAAAY2VWTvCjJP2W08DdJPpLk+511BAAAAABAr1gBDAD9d0CSeyZ5TpLrjvncs5JcWrgfAAAAAAB6ygpgAOi3qyZ5cZI3Zvzw9y1J/qV4RwAAAAAA9JYVwADQTwcmOSXJM5MsTvD8C5I8L8l5BXsCAAAAAKDnBMAA0D/XSfKHSR6ayXbrOD/JU5K8u2RTAAAAAAD0nwAYAPrj4CQnJ/nzJNeesMYlSV6R5DVJlgr1BQAAAADAjBAAA0A/HJ99q34XJnj+UpI9Sf44yQuTXFSsMwAAAAAAZoYAGADqulKS+yR5VpJrTljj8iQfTvKrST5UqC8AAAAAAGaQABgA6rlekjOSPCyTr/r9dpJnJ3l5ku8U6wwAAAAAgJkkAAZgqA5KclmSK2o3soaDk9wvyZ9m8lW/Fyf5aJLfSPKBQn0BAAAAADDjBMAADNFhSZ6bJmj9fpIvJTknyReSXLL898OTnJdm5e20QuKFJNdP8ntJHj5hjaUkX03y/Fj1CwAAAADAKgJgAIbo7kkekWYV8F4XJTkkTRh8aJJPJ7kwyWeTfCXJd5f//Pry3y9e/tgbDi+17OmwJA9K8gdJrjFhjR8m+dckvxv3+gUAAAAAYA0LS0ttX88GgF45Osl7ktxigudeniYUvjDJnjRh8Z4kX06zevhbSb6Y5NIku9OsMD5/hLo3TfL7SU7J5Pf63Z3kBUleGat+AQAAAABYhwAYgCHZkuSRSV6UJpwtZSlNcHvZ8n9/I8kRST6cJiz+VpJdaVYZf3H5c99MEyg/PMlvJjl2wrEvTvL2JH+Y5p6/AAAAAACwLltAAzAkS0l+Ik0QXNLeVbt7583jlv+8+6qxk2ab5ovThMF7ktw4k6/6/UySlyb5myTnTlADAAAAAIA5YwUwAENzWJKHJnlWksMr9zKpi5O8JcmfxKpfAAAAAADGIAAGYKhul+Q5SX48s7PjxVKSzyX5iySvjVW/AAAAAACMSQAMwJBdJcnjkvxeyt4TuAsXpVn1+8dp7icMAAAAAABjEwADMHQHprlX7zOS3KxyL2u5PM29fp+X5DVJzq/bDgAAAAAAs0wADMC8OD7JU5M8PE0o3AcXJnlTkj9K8t+VewEAAAAAYAAEwADMk4OTPDrJbyW5dsU+LksT+D47yT8k+X7FXgAAAAAAGBABMADz6DZJ/iTJiUkOmPLYFyR5XZJnJvnclMcGAAAAAGDgBMAAzKsD0my9fGqSq01hvMuS/GeaVb9vTbP9MwAAAAAAFCUABmCeHZTkJ5L86fKfXTk3yRuSPCPJ7g7HAQAAAABgzgmAASA5Psmvp1kNfFjBupck+XCS5yd5c5KLCtYGAAAAAIAfIQAGgMbBSe6dZovm4wrU+06SVyb5yyRfKlAPAAAAAAA2JQAGgH22Jjk5yavSBMKTuCTJ+5M8L8k/Jbm4TGsAAAAAALC5A2o3AAA9cWSSR6W5T+9BE9b4VpIXJ3nB8t8BAAAAAGCqBMAAzLstSbYneVaSEyes8cMk70ny3CRnx6pfAAAAAAAqEQADMM8OSXJ6kj9PcqUJa3wjzYrflyT5dqG+AAAAAABgIgJgAObRQpIbpNmueceENS5O8s9Jfj/JrjSrgAEAAAAAoCoBMADz5uAkD03yvCSHTVjjK0n+OMnrk3ynUF8AAAAAANCaABiAPtqWZkvmb6S5R+8VhepeL03we480q4DHdVGSf0qz6vcTBfsCAAAAAIAiBMAA9M2Nk7wmzRz1vSQfXf74ryTfT/LF5a9dNkbNA5I8KE34e9SEfX0pyR8k+fskF0xYAwAAAAAAOiUABqBPFpI8Nskts2+F7p3S3F/3wCSfTXJukk8l+eDynxcm+UKSpay9IvcaSV6S5GfTrCYe1w+S/GOSp6cJoZcmqAEAAAAAAFOxsLTkdWwAeuPmSd6d5NgRHnt5kq1Jdic5L004+7Yk70oTEm9N8sAkL0izpfQkPp9m1e8bYtUvAAAAAAAzYJKVUADQlS8keUqSz43w2K3Lfy4m2Z7kdmlWCV+Y5Jg0WzX/dSYLf89LExzfJ8krI/wFAAAAAGBGWAEMQN8sJLlZkmek2f75yps8/qIk/5TkaWm2hH5Akj9Pcq0Jx//I8vPfmmb7ZwAAAAAAmBkCYAD66uAkD0nyh0muuc5jvprk2UlemuSINKHxg5IcNMF4302z2vfFGW0FMgAAAAAA9I4AGIC+u2OS30pyrxWfuzTNvYJ/P8kHk5ySZtXuCROOcXaSZy3XvGjSRgEAAAAAoDYBMACzYFuS+yd5bpptmZ+R5K+SHJbkqUlOTbNieFTfSLPKd1eStyX5dJrVxCZFAAAAAABmmgAYgFly+ySXJPlYmhXBz0pygzUed0WSLUnOXX78t9Pc2/ec5ed+M03gu6fzjgEAAAAAYIoEwADMmgOSPCLJHyU5L8mBSc5PE+p+L8lXknw2TcB73vKf30uykOSyCv0CAAAAAMDUCIABmDULSa6WZvXu0WnC3UvTBMEX12sLAAAAAADqEwADAAAAAAAADMSW2g0AAAAAAAAAUIYAGAAAAAAAAGAgBMAAAAAAAAAAAyEABmBWHFS7AQAAAAAA6DsBMACz4NpJLq/dBAAAAAAA9N3C0tJS7R4AYD1bI/gFAAAAAICRWQEMQF8tRPgLAAAAAABjEQAD0DcLy3/aogIAAAAAAMYkAAagL/bOSYJfAAAAAACYkAAYgNoOWv7ziqpdAAAAAADAAAiAAajh2CSHLP/9kpqNAAAAAADAkCwsLdlpE4Cp+LHlP3cluaxiHwAAAAAAMFgH1G4AgME6Nsk9k1w1yUeTvKduOwAAAAAAMHwCYABKuVKSk5LcNcntk/x7kucm+ULNpgAAAAAAYJ7YAhqASWxJcpMkP77i45ZJdid5XpJXJLmgVnMATNXC8p/+xwIAAACgBwTAAIzihkluk+S2ae7le7skhy1/7fwkr0lyZpIP1WgOgOoWIgAGAAAA6AVbQAOw11FJrpPkuOWP66cJfG+b5PBVj11K8i9pVvq+IclF02sTYKYckebn6Y2X/zwhzc/Yayc5Js2OCkelCVDPS/PzdU+Sbyb5epKvJvlskv9a/vPbU+1+dH0Nf+fl+AMAAAD8HyuAAebLYprVvDdNct00L4gft/z5QzZ57qVJ3p3k9UnOSvK9jnoEmGWHpNkx4WeS3DfN9vglfTPJm5O8M8n7knyncP1Z5/gDAAAAc08ADDD7rpJmJdPVkxy9/HGVFX+/apJrJbnZBLUvTvMi9+vTvOB9foF+6c7ZSU7soO5V0qyMm2VHJPl+gTpnJzmpQJ1SDktyYcdjnJDm/t6s7+Akd0lyWpJTMt1ddj6Z5OVJ/i7zG0Y6/gAAAAArCIAB+mlleHtU9gW6V0sT5l57+eMGHYx9YZJ/TPLG5T+7Dpco59Q092Iu7f5ptvqeZXdL8o4CdR6c5O8L1Cnl59K8OaNLT0tyRsdjzKpjkjw2ya8n2Va3lSwleV2SP0zyicq9TIvjDwAAALAGATDA+K6cZtXd3o8j0mw5eViSQ1d8rPzvK63xtUNWfW3ln9N2fpK3JPmHJG9L8sMKPdDeNdLcs7K0Nyc5uYO60/S3SR5WoM5Vk5xboE4p/5TkHh2P8aU0q4D90rjPMUn+X5JfSrK1ci9r+WCSX13+c4gcfwAAAIANCICZNS5YKOOSJO9PsyLynUk+nuSKqh1RyjlJrle45mVp3vhwUeG607I1Te8Htqzz6TT3z+6LK2d627LfIcmHpjRWnx2Y5IlJnpH219M0vDXJY5J8q3YjhTj+AAAAACPYUrsBAKbms0mel+TeabaV/ukkz0zysQh/h+RZHdQ8IMkdO6g7LTdPmbDopQVqlPTTUxzrEVMcq6+2p3kTwJ9nNsLHpPl5/7U02yTP+u/92+P4AwAAAIzECxHMEqt/YTzfTfLaNC88H5fkxkl+Oc19fX9QsS+61dX9YB/YUd1peHChOmcVqlPKY6c41oPSvBFgHm1N8ntp3ixTenX9NGxN8pIk70v9++ROwvEHAAAAGJMtoJklLlbY2CVJPpDkXWm2df7PTL6ydyG+52bVQpLvJDm6cN3zl2teXrhu17akOR5XaVnnK0mOT3++L66U6b+R465J/nnKY9Z25TTb+N6pdiOFnJvkpCSfqt3IiBx/AAAAgAlYAQwwm65Ic9/eFyR5eJITkhyc5oXlP0ry0bTb1rkvIRfjW0qz2qy0I5PcpIO6XTsh7cPfpNk+vU/fF3eoMObDK4xZ0/FJ/jvDCR+T5Jgku5Lco3Ifo3D8AQAAACYkAGZWLNZuACrbk+TtabbBvGuabSS3J/nFJH+XZHedtv7PQuXx2d/rO6r7cx3V7dK9C9V5Q6E6pTy+wpgPSHJohXFruH6STya5Vu1GOrA1yT+l3NboXXD8AQAAAFqwBTSzwoXKvDknzXbOez8+Fd8HjO7ANNsDl75n6+fTBDOz5NNp7n/dxrlJrpb+fA8ekuR/U+eNfA9Kc2/xIbtJml0U5iHsvn/69+YGxx8AAACgJQEws8KFylB9Oc12kCs/vlitG4bkr5M8ooO6107ytQ7qduHINKvn2/qjJL9ToE4pd0+zI0ANb0tyr0pjT8Nxad5wc+XajUzRiUneV7uJZY4/AAAAQAECYGaFC5VZd1mS/8r+Qe/HkpxfrSOGbkeS93RQ93FJXtxB3S7sTPLGAnVuneZ7ti9el2blYA2XJblGmlXRQ3N0mhXjV63dyJRdnOTmaVb41+T4AwAAABQiAGYW7EyZF/BhWs5P8vHsC3o/nuZehpfWa4k5dEiSizqo+69J7txB3S68Je3vAfyDNCuJL2vfThEHp9n+eWvFHn4zyTMrjt+Fg5J8OM291efRV5PcKM31XoPjX/f4AwAAAAMjAGYWuEjpo8uSfCHJ55J8dvnPvX//RsW+YKW3JblnB3WPSpmtlbt0aJqgtK0Xp1n13Bd3Sv3tYr+U5LpJrqjcR0kvSfLYKYxzSZJ3JvmXJP+ZZHeS76Z5s8ZSmut2W5JrJblpktuleRPDcVPo7XVJHjiFcdbi+Nc9/gAAAMDACICZBS5SargozZbNX06zMucra3xA390nyZs6qHtKkrM6qFvSSWlCnrbumOQDBeqU8rIkj6rdRJJbptnZYAjuleStHY/xySR/sDzOuKs8F5LcJMmj07wZ4dCyre3n7mkC0mly/PepcfwBAACAARIAMwtcpHTh4jT3sPxukq8n+Z80q3f3ruYV8DIERyX5Xgd1X53koR3ULemv0gQ2bVya5LD0Z/v2A9Osaj6wdiNJXpjkCbWbKOCYNG/0uVJH9b+e5IlpbmVR4veZo5L8dpInJzmgQL3Vvpdmteu0tiJ2/Pc37eMPAAAADJQAmL5bTPLF2k0wc76Y5gXllR9fShP47g19L6zWHUzXZ9LcW7Kki9LcF7cvwehqW5N8P+1X6r0yyWmtuynnJ5O8v3YTy76T5Jrpz72RJ3VWkpM7qv3XSX4pyQUd1L5Rmi2Db9FB7ecl+eUO6q7lrDj+q03z+AMAAAADJQCm71yg/CBN0LD349wVf6719+/WaRN660lJntNB3R9P8u8d1C3hRmmC77ZOSnJ2gTqllFjVXNLdkryrdhMt3CXJuzuou5Rmhejz0u3vMYckeVWaLdlLu16a+9x3yfFf3zSOPwAAADBgAmD6zgU6TF9J8u0VH99Is+3ht7Mv6P12mlW7QDvHJ9ndQd0/TfLrHdQt4TeT/HHLGktptn++qH07RRyUZlXzwbUbWeGNSe5bu4kJHZRmt4hrFq67lGZ79NcUrrueLUn+PE3gWdJb0txDvCuO/8a6Pv4AAADAwAmA6buSF+grk+xJE4RsS7O9dJb/Pqk9m3y9Te0S9qz4+7ZNvr6Wc9MEs1es+NxlaQKRH6a5j+7Fy3//4Yq/r/zcysddktnfLhRmzUKaN1kcW7juN9OEN338ReIrSa7dssY7ktyjQC+l3DHJv7Ws8YM0P88Pb99OkmZr3aOSXF6o3jQ9MclfdFD3F5O8oIO6m3lWkqcUrnnTJJ8uXHMvx39zXR5/AAAAYOAEwPRdqQv0/NQPYwFq+X9Jfr+DurdI8qkO6rZx7TQBcFsPSvLaAnVKeVGSX2hZ46w0b8p5UOtu9unbNtmjOCTNThOlgvC9XpTk8YVrjmpLkjcnuVfBmm9Pcs+C9fZy/EfT1fEHAAAA5sCW2g3ABkq+O+GsgrUAZs3fd1S3j1uU3r1QnT7d23ZrkkcUqPMnyx8l9emexKN6ZMqHj59J+RWg47gizdbHJd78sNc9khxXsN5ejv9oujr+AAAAwBwQADMvzq7dAEBFn0+zDXtpD++gZlslVgC+P8l5BeqUcvMkh7as8b0kH0zynyl7T+hT0tzPdVYckuSZhWtenuR+6eZ7bBzfT/nvyccVruf4j6f08QcAAADmhACYeXFW7QYAKroiyd92UPcmSY7poO6krpzktgXqPK9AjZJKrP49a8Xf/6FAvb0OS7lV19Pw8JS/JcRzkvx34ZqTel+SvytY7ykpG/A7/uMpffwBAACAOeEewPRZqYvz40m2F6oFMKt2JHlPB3UfnO62mB7XvZO8pUCdo9OsmO2DrUn2pP2WuTdN8unlv5+Q5Ast6630xiT3LVivK1uSfDHJdQrW/F6SxSQXFKzZ1nXSrPo/oFC9HUneW6CO4z+ZHSlz/AEAAIA5YgUw82B37QYAeuDDHdXt0zbQJXr57/Qn/E2aNzC1DX/Pyb7wN2lCuK+2rLnSvVL+nq5duHXKho9Jckb6FT4myZeTvKBgvUcVquP4T6bU8QcAAADmiACYviq5NP05BWsBzKqLkvxjB3Xvmfb3py3hgCT3L1DnRQVqlFRi++dXr/G5Nxaou9dBaULgvntC4XoXJDmzcM1Snplm6/cSHpwy2xA7/pMpdfwBAACAOSIAZujem+Ts2k0A9MRLOqi5NcmJHdQd1y3T9NJWFyH5pLYkObVljaUkL13j889I2TdbnV6wVhcOTftjudqL07/Vp3t9PcmbC9U6KMktWtZw/CdX4vgDAAAAc0YAzNDtqt0AQI90cQ/gJHlgR3XH8ZACNb6aZnvkvrhxkm0ta3wpyVfW+PzXk/xPy9or/UySYwrWK+1nUuYNAiuV3Oa3C88rWOueLZ/v+LfT9vgDAAAAc0YAzNDtqt0AQI9ckORjHdS9f5otmGvZkuTRBeq8IGVXxbb1oAI1/mGDr51ZoP5eW5Lcr2C90h5XuN4H0q83C6zlX5PsKVTroS2f7/i30/b4AwAAAHNGAMzQ7a7dAEDP/EUHNQ9P3S1Kb5TkqAJ1XlugRilb0v6eqUtJnrXB11+Q5PKWY6z0mIK1Sjo8yd0L11xrW+2+uTTlrumbJDliwuc6/u21Of4AAADAHBIA00clV1/tKVgLYAje1VHd+3RUdxSnFKhxbpIvFKhTyg3TfkvlzyX52gZfPz/JJ1uOsdKPJbluwXql3DHJQuGa7yhcryul7kObJNef8HmOfxmTHn8AAABgDgmAGbpdtRsA6JmvJ/lmB3UfkfIhz6hOK1DjJenX9s8PK1Dj5SM85pUFxlmpxL2YS9tZuN5/JflG4Zpd+dckVxSq9eMTPm9nofH3cvwBAAAANiEABoD5spTkRR3UvV6Sa3dQdzNHJ7lBgTqvK1CjlC1Jfr5ljcsz2ja5L0q5gCpJTk29NwKsZSFlVoivdFbhel36fsqt8v6xCZ7j+Nc9/gAAAMCcEgADqy2u+Jg1i/nRvhc3+DzMq67udXvvjupu5MQCNS5K8qkCdUq5QZKrtazxH0nOG+FxFyf5WMuxVrpBmvuV9sVVkxxbuOZ7C9fr2nsK1ZnkPt+Of93jDwAAAMypA2o3AB06oXYDM6JPW572QZ9WrkFXPpvkwiSHF657apIXFq65mV8oUOPvklxWoE4p9y1Q49VjPPYvk7yiwJh7PSLJbxWs18YtO6j5kQ5qdunjhepMcg9ax7/u8QcAAADmlBXA9M2OQnVemWR3oVoAQ3NFkr/qoO5PJDmmg7rrOSzJ3QrU+ZsCNUpZSPKEljWuSPKyMR7/N2lWApdyepKtBeu1cefC9T6X5PzCNbv2mQme8+0k70jyp0kemeb+s5O8sc7xr3v8AQAAgDllBTB9U2qbvD2F6syDhVgFvJfVv8yTv03y5A7qnpTp3U/3TgVqXJrkQwXqlHKdtL+X8n8luWCMx1+eZlvdu7ccd69jk/xU+rFVb4lrZKU+XSuj+sIGX/tGko8m+USabdA/l+ScNPeuLcHxr3v8AQAAgDklAGaottVuYMackuSNtZuo7JTaDcCUfSLNStHSu4E8MNMLgB9RoMZrklxSoE4pDyhQ4yUTPOf5KRcAJ8lpqR8Ab0nyk4VrltrOd5q+m+TLSd6fJmzclSaU/EaSH3Y4ruPfqHX8AQAAgDm2sLRk4R+9UuqCfFOSnYVqzYt5/mHw8STbazcBFbwx5X9W/jDJEWlW1nbpgDT3MT64ZZ2TkpzdupsyFpJ8McnxLWpckuTITLal80VJDmkx9koXptkOvGbAdc0kXytc8z5J3lK45lA5/gAAAACVuAcwQ3VW7QZm0Dxvf7yzdgNQyZkd1Dw4yW06qLvaTdI+/F1K8uECvZRyQtqFv0nyvkx+P9+SK3YPT/LTBetNYrGDmrs7qDlUix3U3N1BTQAAAIDBEQAzVGfXbmBGvbJ2AxU8LV5QZn51tUXvAzuqu9LJBWq8K82q177YWaDGy1s895kFxl/pkYXrjet6HdT8Rgc1h8rxBwAAAKjEFtD0TakLcp5Xs7Y1bz8UXCvMuw8muX3hmt9NcrU09xjuwkKaIOjYlnUeluRV7dsp5py0C81+mGbl7WUtapyXZFuL5690SZKrJvl+oXrj+sMkv1245kHpfnvzoXD8AQAAACqxApg+mbfgsa/mKRCdp38rrOcvOqh5dJKbdlB3r2umffibJO8oUKOUq6f9ismPpl34m5S9v+pBSe5dsN64uliBKnwcneMPAAAAUIkAmCHqaktThkX4C413dlT3lI7qJmW2Sv5AmpXKfXGfAjVeUKDGnxSosdLPF643jmtUHBvHHwAAAKAaATBDdGbtBgbg1rUbAKbmu0m+3EHdh3ZQc6/HFqhRIiwt6Uktn39Rkr8v0MenknynQJ297pxmxXYN16k0Lg3HHwAAAKASATBDtKt2AwOwK8kJtZvokNW/sL/nd1Dzxmm2NS7tmCS3KlCnT9s/Xzvtt8x+d5LLC/SSJG8uVCdpft4+oGC9cRxRaVwajj8AAABAJQJghubjEQCXsrt2A8DUvKmjunfpoOadC9T47yTnFqhTys4CNf6yQI29/rhgrSQ5vXC9URyc5l7UpW2JNxGNwvEHAAAAqEgAzNCcVbuBgRnii6xD/DdBW+ck+X4HdbvYBvrhBWq8qECNkh7X8vnnp+y9nD+f5OsF690q098O+Icd1b0iyVJHtYfE8QcAAACoSADM0JxWuwF6bcjbWkMblyd5WQd1757k8IL1DkxynwJ13lqgRilXTXKzljX+uUQjq7ymcL0HFa4HAAAAAKxDAExflFrNcUahOuwzpBWzu2s3AD32dx3U3JoyWzbvtX25ZhtfS79+FtytQI0XFqix2jPTrLYs5RczrPkEAAAAAHpLAMzQ7KrdAMCM+nialcClldiyea9HFqjx4vRrC9lfbPn8C5O8u0Qjq3w7yWcL1js+yW0L1gMAAAAA1iEAZmh2126A3npT7Qag5y5L8qoO6p6cZuvmtrYmObVAndcXqFHK0Unu0LLG20s0so6/LVyvRIAPAAAAAGxCAAyM4qTaDRTwnNoNwAx4eQc1D03yYwXq3DzJES1rnJuyq1rbuleBGs8sUGM9f5Gy20A/PMkBBesBAAAAAGsQADM0e2o3MFB7ajdQwNm1G4AZ8JGO6t67QI37FKjx0pQNNNt6QsvnfzPJR0s0so4Lk3ymYL2jkvxEwXoAAAAAwBoEwMAodtVugLlyw9oNzLEfJHl/B3UfUaDGowvU+PsCNUo5Ou3D0Glsbf+ywvVsAw0AAAAAHRMAA/PglNoNMJYn1m5gzr24g5rHJbl2i+dfNcnxLXv4QZL/almjpLsVqPHcAjU287w094cu5eFJDilYDwAAAABYRQDMkJxfu4GBu3XtBlo4q3YDjOUxtRuYc+/sqG6bbaDvUmD8V6dskNlW2xXN30ny6RKNbOLSlN0a/NAkP1OwHgAAAACwigCYPtjVszqsbVftBpgbVgfW9a0k53RQt02w/wsFxv/bAjVKOSLtQ+23lmhkRM8rXO/nC9cDAAAAAFZYWFpaqt0DlLoIT4mVnl2b1R8YC7UbYCxLcc5qe3ySF3RQ9+ppAuZxXDntd3i4LE3oenHLOqWcnPbz1Y2SfK59KyPZkuR/U+7NGVckOSbJeYXqraeLOcvPptE5/gAAAACVWAHMkJxduwGAgXhzR3XvOcFzfrrAuK9Nf8LfJHlcy+d/OdMLf5MmsP1AwXpb0m5L8FFdPoUxWJ/jDwAAAFCJAJih+FKSPbWboJeeVrsBmEFfT/LdDuqeMsFzHlZg3FcUqFHKkUnu0bLG35VoZEzPLVxvGvf63jOFMVjfntoNAAAAAMwrATBDsbt2A3OidAAwDWfWboCJzOp240OxlORlHdT92SQHjvH4g9Jsl9zGUpL3t6xR0l1bPn8p5e/Ju5m7JXlJ4Zp3TnK1wjVXu6Dj+mzM8QcAAACoRADMUDyndgP01rbaDcCMem0HNQ9Isn2Mx9884wXGa3lHkota1ijpUS2ff06Sb5RoZATXSROevyPJsR3Uv38HNVf6csf12ZjjDwAAAFCJAJih2Fa7gTlxVu0GJnBa7QZgRn0iyaUd1H3gGI+9b4HxXlmgRilXymT3QV7pVSUa2cShaY7bF5L8ZIfjPKHD2sn0gnLW5vgDAAAAVCIAZij21G6A3jqjdgMwoy5NN2HjaUm2jvC4hZS5T+y7CtQo5c5p/l2TuiLdb//8W2nu//zIjHae2rhZkht3WP/zHdRsuyJ9njj+AAAAAJUIgIFxnF27AWCqurgP8DFptnbezGLabzv8kTRhZl+03f75Y+nu3/OzSb6a5I+SHNLRGGt5aIe1P9NBzSM7qDlUjj8AAABAJQJghmJP7QbmxGLtBhg881K/fKSjuvcb4TE7C4zzwgI1Sjk0o/27N/KKEo2scqM0wfI/JrlWB/U386h0933fxQrUa3RQc6gcfwAAAIBKvNDOUOyu3cCc2F27gQnsqd0AY2mzPS7l/TDJOzuo+7ARHvMLBcZ5W4EapZyUdlsqX5Ky9zO+cpK/T/LfSbYXrDuua2W0FeGT2N1BzcUOag7V7g5qLnZQEwAAAGBwBMDUtlSozp5CdQDY30s7qHndJNfe4OvXSrMytY3/TvLtljVKOr3l8z+U5MICfWxJ8vtJvpXkgenH74IP76juN9ME5yXdoHC9adia5Etp7un9K0l+Ok2QevAYNSZ5c47j36h1/AEAAIA5dkDtBqCQ7XF/WoAunN1R3R1J/nadr/10gfovKFCjlEOSnNyyxpkF+rhPmvs6H1OgVkmPSfI7SS4tXPeKJB9Ic62VcquCtabl6CTXWf54yKqvfSPJR5N8IsmnknwuyTlJvr/qcQtp3ixwRUZ/857j36h1/AEAAIA5JgBmKHbXbgBgoM5N8tm0X5G72qlZPwB+aIH6fdr++fZp9zvXxUle3eL5N0ryN0lu16JGl45Kcsd082aDf03ZAPL2BWtNy3U3+No1kvzc8sdK305zb+hPJPlkmp8BX0xyfpqgfr0QcmHV1xz/6R5/AAAAgCQCYIZjd+0GgCL6sB0tP+p5Sf6ycM27JDk0yQ9Wff6gJHdvWfvr6de88IiWz39vmhB4XFdOs+L3vun/99aj000A/L7C9W6Y5Mg0QdysuPEEz7lamu/Dld+L301yQppVqJet87zVwaTjP93jDwAAAJCk/y8GArTxytoNMLattRtgTW/uoOZCkjuv8fnbpf39Ll+W/qyQOyjJw1rWePmYj19I8rtp7sF6/8zG73sPTPOGgNI+0UHNH++gZpdKbZt8Tpo3IoxzPTn+dY8/AAAAMKe8gAAM2XNqN0Ari7Ub4P98Ncm3Oqj78DU+13a1bJK8tkCNUu6Q5OAWz//fJP8wxuMfmOQ7SZ6e5Eotxp22g9KsCi/tOyl/7Z5YuF7XTipU55Npth++fIznOP51jz8AAAAwpwTAwJDtqd0AY1u5AviL1bpgtaUkL+ig7v3SBH97HZDkkS1rfjfJf7esUdLpLZ9/dkbb7vXmST6e5O+THN1yzFoe20HNpSRvLFxzZ+F6XbpyklsUqvXR5T/HCSAd/7rHHwAAAJhTAmAA+uSQ2g2wrtd3UPOQJLdZ8d+3SvtVqy9Nc4/MPjgozYrcNl62ydePTvKmNOHvLVuONYmSW23fO01gVtpZhevdLMk1Ctfsyp1S7vf9j0z4vLMKjb+X4w8AAACwCQEwQ/De2g0AxRy0+UOo5LNp7j9Z2n1W/P1+Beq9pkCNUm6fdoH2D7J+eLY1yTOTfD3NMZzW73RLaVYgXrb8UTIAXkjycwXr7fX+lL8n9N0L1+vKfTZ/yMjOmfB5jn8Zkx5/AAAAYA4JgBmCs2o3ABRzeO0GWNflSV7dQd1HrvP3SVyU5FMta5TUdvXv+7J2cPbwJN9M8uuZ/psmFtKEzwcsf5T+XfIXC9dLkguTvKNwzS62qy7twLS/Bvf6dJILJnyu499em+MPAAAAzCEBMEOwvXYDQDG32fwhVPS3HdS8VpKrL39cq2Wt16Y/98fcmuS0ljVetOq/b5fkM0n+JskxLWtP6l+T3DTJP3dU/w5Jjuug7upj2dZPJjmhcM3S7pRkW6Far2r5fMe/nbbHHwAAAJgzAmCGYLF2A0AxV6/dABv6QEd1dyY5uUCdvytQo5RbJTmsxfN/kObevklybJK3Jvlwkhu17GtSX01ylyQnplmN+IwOxyq1anKld6X8mwOeULheaU8sWOufWj7f8W+n7fEHAAAA5owAmCE4s3YD9NZi7QYY2yG1G2BDFyd5cwd1H5v2W7peluTfCvRSStvtrN+X5OAkL0nylST3SrP98rRdlOQxaVZb/kv2bUn93jRb+3bhcSn/b/1BklcWrvkLSY4oXLOUa6bc/WcvSfLJljUc/8mVOP4AAADAnBEAA9An22o3wKZe0kHN2yS5bcsab0gTVvbBAUlOb1nj+0nOTROMH9i6o8n8ZZpV+S9LE7CvdGmSP+1o3OsnOb6Dui8oXO+ItN/muyu/kXK/578mTQjZluM/mVLHHwAAAJgjAmCGYFvtBuit3bUbmLLF2g0UYAVw/72vdgPrOLN2Ayv8eJIrt6zxwCSHF+hlEu9IE8A+MU0QvZ4u3gyw10M6qPmxJF8uXPOM9G8V6nVSdnvklxeq4/hPptTxBwAAAOaIAJgh2FV5/KXlj+dU7oP59Zw01+AXM/tviBAA998FST5eu4lVltKvYLqL8HIavpDkTknukdGCum8m+VBHvTwx5X9PvSLJ7xeueZUkTy1cs60/SrMKvYSLknywUC3Hf3wljz8AAAAwRwTAUM6T0oQQ2yr3wT67azfQsdPSXHNPWvG5PVU6KWdb7QYYyfNrN7DKO9PcY7QPtiR5WO0mxnRBkkcluVHGv4/y/yvfTpLkGmm/Lfha/jblf04+OclNC9ec1J1T9vp7dspuP+z4j6f08QcAAADmhACYIdhVcezFNT53XpKd022DObSU5BVrfH5xyn2UZgXwbHh77QZWeWXtBla4UZKjajcxosuTPC3NfX5fkR+9z+8o3pvmfsBdaHsf5bVcnOb+rCVtTXMP6to/v66cJmAt6UWF6zn+4yl9/AEAAIA5IQBm1r03dVc87lzn829ME9DtmVonzIOd2bfl+Hp2T6WT7tR+AZ/RfDXN9r998a7aDazw4NoNjOh1Sa6d5h6qbVZPX5bkT0s0tIZHJDmog7p/neTCwjVvnGa1Zi1bkrwqyXEFa749yVcK1tvL8R9NV8cfAAAAmAMCYGbd7p6Pf2SasG5HbG1bw2LtBgo6Lc0bCzaz2G0bndtWuwFGspTkBbWbWPbRJOfWbmLZliSPr93EJv4jyS2TPDDlQvyuVikenuQnOqh7cZLf7qDu45I8oYO6o/izJPcqXPNXCtfby/EfTVfHHwAAAJgDAmBm3Z4ZGf89abaGPqOzThiqM7L+ds9rWeysk+nYVrsBRvb3tRtY9pLaDaxwyyRXrd3EOr6T5H5JfjzJJwvX/kqScwrX3OuxHdV9cZKvd1D3LzPdVeBb0qx8fUrhum9J8unCNVdy/DfW9fEHAAAABk4AzKzbM2PjPzVNmLeteCesZbF2AxM6Lc3q8qU018w82Va7AUb2Pym/jesk/rF2Ays8pHYDa7g0ya8luU6Sf0hyRUfjdPWz6iHpZmv4S5I8soO6C2m2Av7l5b936ZAkr0/y5A5qd1FzJcd/Y13UBAAAAOaIAJhZt7vy+NsnfN552fxerrS3vXYDY1rMvtW+x09YY3epZiq5eu0GGNlS6q++/XS6WUU4iS1JTq3dxCqvTHKNNNvTXtzxWG/uqO4BSe7aUe1/TvKmDuouJHlukjOTHNFB/SS5UZKPJDmlg9rPS/KFDuqu5vivbVrHHwAAABgwATCzbk/l8bcVqLG04uO0zF5o2WeLtRsYwbbsO/9frNtKdUfWboCxvary+C+sPP5KN0xybO0mln0wyc3SzCnfndKYF6a76+GJHdVNksckuaij2o9M8pkk90251ahHJfnTJJ9KcotCNVf6XpLf7KDuehz//U37+AMAAAADdUDtBqClPZXH31W43lr3eX1u9q3q3JXm37wtydmFx6acbWmC/O1pztfi8ud3JDmx47F3pFn1NIus/p09n0zz5oWut1pdz1srjbuWLlYCjutrSU5P8u7U2WHiz5I8tIO6d0tydLoJs89N8oB0dy1dM8kb0nyv/MHyOD8Ys8ZCkpskeXSSxyU5tGSDqzwk4/fXhuO/v2kffwAAAGCgFpaW7EBLVW0vwNNTN+w6LWuHtlBL7e+JNn4iyYdWfa5WsMjozkpycoVxv5bkuPRjK/2FNG/UuU6l8S9O8ttJnp/m3qq1LCT5dpJjOqj9qHQ7374kyWM7rL/XJUnemeRfkvxnmuvmu2lWwS6lCRe3JblWkpsmuV2Se6e51rv2uiQPnMI4a3H86x5/AAAAYGCsAIZ2ttduAFbZXbuBFrbVboCJvDx1AuBXpB/hb5JcL/XC3+cl+d0k51caf6WlJL+fZueK0p6QbgPgX0oT9m3vcIwkOShNoHjvjscZ11fTvKmtFse/7vEHAAAABsY9gKGd3bUbgAHZVrsBJnJ2pXFfX2nctdRYtffeNPcd/uX0I/zdq6v7AP9Ykqt1VDtpVobeNcl3Ohyjry5Oc/uAmlsPO/62fgYAAAAKEgAz63ZVHv+syuPDartrN9DCttoNMJHvJ/nglMf8Xpp7evbBQpJfmOJ4X0xylyQnJfmfKY47qnOTvL+j2vfrqO5e301y2zTX9Dy5e5LP124ijj8AAABAMQJgZt1i5fF3Vx4fVttdu4EWttVugIn9xZTHe3mSK6Y85nqun+ls//y/SX4+zarff0l/tr9eyx91VPf/S/f3Bf9KkttnflZj3j/J+2o3sYLjDwAAAFCAAJhZt6fy+IuVx4chuXrtBpjYu6c83qunPN5GdnZc//I0geq1krw0yWUdj1fCu9Nsa1vadZPcqIO6q306ya2SXDCFsWp6SJI31G5iDY4/AAAAQEsCYAD64ujaDTCxc5N8aUpjXZTkE1MaaxSP6bD2G5Icl+R30q/7/G7mkiTP7aj2Izqqu9o5SW6R5GtTGm+aLk9yzySvqd3IBhx/AAAAgBYEwAD0xVVrN0ArL5rSOK9Of1bBXivNlsylfTLJHdJsD/uNDupPQ1fXw+OSbO2o9mpfSnLTJP86pfGm4dwk25O8vXIfo3D8AQAAACYkAAagL2wBPdveOKVxXjWlcUaxs3C976QJfbcn+VDh2tO2O8lnOqh7lSQ366Duer6f5KQkT53imF15f5IbJPlU7UbG4PgDAAAATEAADEBfCIBn2/+kCWu6dFmSD3Y8xjgeX6jOpWkCruPTbPt8RaG6tf1RR3Uf1VHd9Vye5OlJbp3k81Meu4TLk/x8kjsn2VO3lYk4/gAAAABjEgAD0AcHJDmmdhO0ckWSF3c8xpuS/KDjMUa1mDIrUV+bJvh9epr7Gw/Jm5IsdVD355Mc2EHdzexKcpMkv5omtJ8Fb02zVflLM/tvLNgVxx8AAABgJAJgAPrgWmlCYGZb19szv7Lj+uPYWaDGe5M8KLN7n9/NfD9NwF3alZL8ZAd1R3FpkmcluWaS56ZZ3dlHH0xzjH4uybcq91KS4w8AAAAwAgEwAH1g++dh+GS6C2SWkryno9qTeHSBGn9SoEbfPbujur/cUd1RnZvkyWl+dv12+rG171KawP1WacLHPm2XXprjDwAAALABATAAfSAAHobLk7yuo9rvSnJhR7XHdfUkN29Z4/wk7yzQS9/9e5Jvd1B3Z5Ird1B3XOcm+eM018S90lz/l025h08meUqSY9OsKP/ElMevyfEHAAAAWIPtNgHoAwHwcLw8yYM7qPvSDmpOakeBGs/O9IOqGq5I8odptustaUuSE5O8pXDdSf0wyduWPw5JcpskP5PkvkluWXisbyZ5c5o3ELwvyXcK159Fjj8AAADACgtLS0u1e2C+tb0AT09yZoE+JrWY5IsVx4fVFmo3MKGnJjljjc/P6r9nnh2a5H87qHvlJBd0UHcS70hyt5Y1rpb5CY6OSvK9Duq+KWXuxdy1I5JcP8mNl/88IclxSa6d5Jg0YfZRaX7enZfmd6M9aYLGryf5apLPJvmv5T+7WFE9q/a+mXWjN1M4/gAAAMDcsQKYWbendgNAEYu1G6CYH2T4wf3dazcwY87L8K+JjVyQ5GPLH5R1RZpra8vy39fi+AMAAABzRwDMrNtTuwGgCFtAAzCu9UJfAAAAgLm2pXYD0NLu2g0ARQiAAQAAAACgAAEws2577QaAIo6t3QAAAAAAAAyBAJhZt612A0BrW5NcrXYTAAAAAAAwBAJgZt2O2g0ArV07TQgMAAAAAAC0JABm1m2r3QD0zGLtBiZw49oNAAAAAADAUAiAmXV7ajcAtCYABgAAAACAQgTAzLpttRsAWltc5/NHTbMJAAAAAAAYAgEws2577QaA1hbX+fyeKfYAAAAAAACDIABm1h1fuwGgtcXaDQAAAAAAwFAIgBmCHbUbAFpZrN0AAAAAAAAMhQCYIVis3QAwsSPjXt4AAAAAAFCMABiAmhZrNwAAAAAAAEMiAKa2hQI1dhaoAdSxWLsBAAAAAAAYEgEwQ7CndgPAxI6r3QAAAAAAAAyJAJgh2FO7AWBiN6rdAAAAAAAADIkAmCHYUbsBYGI3r90AAAAAAAAMiQCYIbhV7QaAid24dgMAAAAAADAkAmCG4OO1GwAmcmSSq9duAgAAAAAAhkQAzBAszunYMOus/gUAAAAAgMIEwAzBkUm2VRp7sdK4sJ7F2g2MYaMAeGFqXQAAAAAAwIAIgBmKPbUbAMZmBTAAAAAAABQmAGYoFiuNu7vSuLCexdoNjEEADAAAAAAAhQmAGYrdtRuAnthWu4ExCIABAAAAAKCwA2o3AGnu9blUu4kZdusku9Ks/NyWZjvsvR+LGzxvccXXdy//efaqz+9Zrrlz+e/bk5w8cad1nJ7m37U7+/5tu5e/ttiy9p7lP3elOUY7k5zasmZbeyqPP6qtSW5QuwkAAAAAABiahaUluRu90PZCXCjSxfh2JHlPB3VPShO8npUmdN3VwRiTmqUfGielCX/7Yluaa+bsNOf2xA7G6Nu/eT3XS3LOBl+v9T0NAAAAAAAzzRbQ0A9vSrOSd2H54+w0AWHSr/B31myv3cAqe9Kc1z1pguC95/spBcfYXbBWl25euwEAAAAAABgiATBDsVi7gQmdkCYA3BlBbxf21G5gRM/JvjD49Ja1drdtZkrc/xcAAAAAADogAGYoFiuNu2eC57wy+8K+3SWbYRDOzL7r4711W+nU9toNAAAAAADAEB1QuwEoZFulcXeO8dijMjsrUumHHct/jnPf5Z3Zt314n23f4GsnTasJAAAAAAAYGiuAGYrtlcbdNsJj9t7bd0+nnbCWs2s3UMhCmjcQjOKsDvso5dAkN9zg62dPqQ8AAAAAABgcATBDsbPSuGdu8vWFuLcvZexJcz1ttjp2Z+edtHeLmH8AAAAAAKATXoCnLxZaPv9W6dc9RU9J+38TrOXs7LtH8Hpf77vttRsAAAAAAIChEgAzJDsrjLlr1X+/N82Wz2dNvRPWsrt2Ax1bSHPNrbSnQh/j2l67AQAAAAAAGKoDajcABe2oOPZ7K4/P/NqR5l7U59VtYyzbazcAAAAAAABDJQBmSLZVGtdWz9S2J7N1HW6v3QAAAAAAAAyVLaAZklvVboDeWazdAD/i5kkOqd0EAAAAAAAMlQAYGLLF2g3wI267yddnaSUzAAAAAAD0jgCYITm/dgPApm5fuwEAAAAAABgyATB90nbl35FFugC6JAAGAAAAAIAOCYAZmm21GwDWdaUkt6zdBAAAAAAADJkAmKHZU7sBYF23jHkHAAAAAAA65YV4hmZ77QaAddn+GQAAAAAAOiYAZmh21G4AWJcAGAAAAAAAOiYAZmi21W4AWNdmAfDCVLoAAAAAAIABEwDTN69s+fztJZoAirtaksXaTQAAAAAAwNAJgOmb01o+/+QSTQDF3aF2AwAAAAAAMA8EwAzRmbUbAH7E7Wo3wH6WevRBP9W+Lrq4Nmr/e3z076O0of17hsg5Wpvj0C/Ox2x4SOr/TNns4xad/evnT+1zud7Hr3X5jx4IP1P3V/uanZXj1HfmIGAkAmCG6NTaDQA/4o61GwAAACjk52s3MIJfqN0AnfvdJFet3QQwdeYgYCQCYAC6dkiS22/ymIVpNAIAANDStZL8WO0mRvCA2g3QuSOSvKh2E8BUmYOAkQmAAejaT6QJgQEAAGbdw5McXruJEVwtm78Rl9l3cpI71W4CmBpzEDAyATB9dELtBoCidtRuAAAAoICFJA+t3cQYnlC7ATq3Nc0qYK/xwvCZg4Cx+OWAPtpduwGgqB21GwAAAChgMckNazcxhvvEa3/z4KZJnlK7CaBzizEHAWPwDchQbavdAJBktPv/AgAAzILTM1u3tzky3pA7L34vzZarwHCZg4CxCIAZqm21GwCSjHb/3/On0QgAAEALC0keVLuJCfxy7QaYiisn+avaTQCdMQcBYxMAM1RPrt0AkGS0d/pt67gHAACAthaXP2bN3TNbK8aY3L1itR0M1WLMQcCYBMAM1WLtBoAk/ucTAAAYhkckOah2ExM4JMlv1G6CqdiS5CVpVgoCw2IOAsYmAKav2v6yenKRLkazOMWxYNbsqN0AAABASwtJ7l+7iRYeW7sBpuYGsSseDI05CJiIAJghO2sKY2xP8sUkS0lOm8J4sJalFR99cmLtBgAAAAo4LskNazfRwrXi1jvz5KlJrlK7CaAYcxAwEQEwQzaNVcDbV/z9FWkCuB1TGBeS5k0Oq0PfbdNvY133qN0AAABAAY9IcnDtJlo6o3YDTM2RSZ5fuwmgGHMQMBEBMLRz9hqfe0/6txKTYVlMc42t9SaH06baycZGCYDdmwgAAOizhSQPrN1EAQ+p3QBT9YAkd67dBNCaOQiYmACYPjuldgMj2LPB15aSPGc6bTAntqW5rr64wWMWp9LJ5q6d5Fa1mwAAAGjpBkluXLuJAq6W5Bq1m2Bqtib5q3jtF2adOQiYmF8C6LOzCtRYLFBjI3s2+fqT0gR2Z3bcB8P3nCTnjfC4M7ptY2R3idW9AADA7Ht0koNqN1HIH9RugKm6QZJfr90E0Io5CJiYAJih21m7gWWnxopgJnNGmmvnSSM+frGzTsazo3YDAAAALW1Ncr/aTRR039oNMHW/neSY2k0AEzEHAa0IgBm6bR3XP2PMx+9dEewewWzkzOy7Tp465nN3lW5mAgtJ7jri4wAAAPrq5kmOr91EQduS3LB2E0zVEUleWLsJYCLmIKAVATBDt712AxvYG/A9uXIf9Mf2NNfEqZX7aOuWae4BDAAAMMsem+SA2k0U9oe1G2DqTklyx9pNAGMzBwGtCIDpu7YrBE8u0sX6dhWo8ezsC4P3pN+hNeXtzL7z/7G6rRRzt9oNAAAAtLQ1yX1qN9GBe9ZugKnbmuRlsQsXzBJzENCaAJh5cGaHtXcVrndkmhBwacXH7jQh4WKarTIWV3xM22kVxmzjzMrjb09znnamuf/znux/bpeSvLHwmNsK15uEe3oAAACz7mZJrlm7iQ4cluTWtZtg6m6U5DdqNwGMzBwEtLawtORWpPRe24v0S+kuLF1M8sWOasMkar+j98ppgu7N+nhvkh1dN8O6+jT5175mWVsfrpHS10Yf/k30y9CuMT9PN+ccrW3ax6Wvx6EvnI/+eHaGe8umt8cqrHHUnj9KuTDJCUnOrd3IFPmZur++XMt9P059YA4CWrMCmHlwfARNzI/FyuPfM6P9Ir+j4z4AAAAmtTXJvWs30aEdtRugisOTvKh2E8CmzEFAEQJgZkGJd4XtKlAD2NzO2g0AAAC0dNM0KyWH6pAkJ9ZugipOSXKH2k0AGzIHAUUIgJkX22s3AHPgoCQ/W7sJAACAlh6dZgXWkD29dgNUsSXJX8UWvNBn5iCgCAEw82J77QZgDpyU5h7Am/l4140AAABM6IAkP1e7iSmwCnR+3TTJr9RuAliTOQgoRgDMvNhZuwGYA/cY8XHbu2wCAACghdslWazdxBQcmOS+tZugmqcmOaZ2E8CPMAcBxQiAmRVtt6ZxXwHo3qgBMEANCzP+0Ue1j8kQjykA9T0u8/N62W/VboBqjkjy0tpNAD/CHAQUMy8/TCBJzq7dAAzYjZLcuHYTAAAALRyU5G61m5iiW9dugKruk+SnajcB/B9zEFCUAJh5sq12AzBg9x/xcSd02gUAAMDk7pTk2NpNTNHWJI+q3QTVbEnystgZBfrCHAQUJQBmntyqdgMwYKMGwLu7bAIAAKCFX8j8hWG/WrsBqrphkl+p3QSQxBwEFCYAZpaUmABPK1AD2N+Nkmyv3QQAAEALByU5qXYTFdw4yQG1m6Cq30tyTO0mYM6Zg4DiBMDMm521G4ABenDtBgAAAFq6Y5KjazdRwZYkv1S7Caq6cpIX1G4C5pw5CChOAMy82Va7ARigUQPgedvGBgAAmB2Pzfz+P4sX37lfkp+q3QTMMXMQUJwAmFlzesvnn5hkR4E+gMat0mzXAgAAMKvmdevNva6b5NDaTVDVliQvz/wGUFCTOcgcBJ0QADNrzixQ47QCNYCG7Z8BAIBZd4ckx9ZuoqKFJL9Ruwmqu0GS/692EzCHzEHmIOiEAJh5dGrtBmAgFpLcf8THnt9lIwAAAC08JlY+Pqp2A/TC72U+70MKNZmDzEHQCQEwAJO6TZLrj/jYbR32AQAAMKlDkty1dhM9cPUkh9VuguoOT/Ki2k3AHDEHNcxB0AEBMLOoxDuitheoAfPu4bUbAAAAaOmuaV54nobL07ymsffjsimNO4oDkpxSuwl64b5J7li7CZgT5qCGOQg6IABmXu0oVGdboTowix5WuwEAAICWHjvFsc5Z9d8fm+LYo7AFJ0nzevHLYktamAZz0D7mIChMAMy82lG7AZhxd09y1REf638aAQCAPjosyZ2mON5LV/33H01x7FHcKckRtZugF26U5NdqNwEDZw7anzkIChMAM6tOaPn8k5OcVaAPmFcPrt0AAABAS/dOctSUxlpK8herPndWkh9OafxRHBD/r8c+v5vkmNpNwICZg/ZnDoLCBMDMqt0FauwpUAPm0WFJHlC7CQAAgJamud3kV5NcusbnPzLFHkbxmNoN0BuHJ3lx7SZgwMxBP8ocBAUJgJlnpxaosadADZg1908TAo/i1l02AgAAMKHDk9x+iuO9YZ3PP3OKPYzix2LVJ/vsTPJTtZuAATIHrc0cBAUJgJl3i7UbgBl02hiP3dVRDwAAAG3cO8mVpzje09f5/D+mX1twbknysNpN0Btb0tw3dKF2IzAw5qC1mYOgIAEws6zEL59Pbvn8bQV6gJK2dVz/Gkl2dDwGAABA10rsCjaq85Oct8HX/2NajYzotNoN0Cs3TvIrtZuAgTEHre+02g3AUAiAmXeLtRuAwvZ0XP+RHdcHAADo2qFJ7jDF8f55k6//4VS6GN2tklyzdhP0yhmxLSuUYg7amDkIChEAM+vOb/n8k5M8p8Xz97QcH2bJQpInjPl4AACAvrlPkiOnON5vbvL1tyW5ZBqNjGgh012dRv8dnmYraKA9c9DGzEFQiACYWbetQI0ntXjuYoHxYVbcLcl1ajcBAADQ0jR3Nrooyf+M8LiPdt3ImOz+xGonJ/mp2k3AAJiDNmcOggIEwNDYVrsBmAGPq90AAABAS0ckueMUx/vwiI97eqddjO/GSa5Xuwl6ZSHJy2O3L2jDHDQacxAUIABmCD5eoMbOAjVgyI5Ocu8xHu9/CAEAgD56cJIrT3G8p434uHckubjLRibwmNoN0Ds3SPIrtZuAGWYOGp05CFoSADME2wvU2Dnh87YVGBtmwWOSHFC7CQAAgJZOm+JYlyQ5e4zHf6CjPib10NoNzLErajewgaemeZM4ML7TpjiWOQjmnAAYgM0sJHnCGI//UleNAAAAtHB0kltPcbxxdyw7o4smWrhOkh+v3cScenftBjZwRJIX124CZpA5aDzmIGhJAAyNk9O/SQ4msbuDmndO80vXqBY76AEAAKCtRya50hTHe86Yj//XJD/ooI82/qh2A3PqEUm+W7uJDdw3zWsFwOjMQeMzB0ELC0tLS7V7gFJKXMzj3rd0e5KPFRgXSuni3ruvTnOPkpo9UFafJn/XSz/14RpxbeyvD+dkNedof7XPkfOxOedobdM+Ln09Dn3hfHTrP5LcZkpjXZ7JbqPztiT3LNxLG5P+O4akxvyxkOTxSV5QYexRfT7NPYFrz68b8TN1f305V30/Tl0xB43PHAQtWAEMMCyLhetdO8n9x3j8NLeyAQAAGNXRSW42xfE+P+Hznl60i/a2Jjm9dhNz6kVJPlq7iQ1cL8lv1m4CZoQ5aDLmIGhBAMyQHFWgxo4xH7+nwJjQZ7+Y8d5pt6ujPgAAANp4WJKDpzjeX0/4vA+lf1tw/mrtBubUUppVwJfVbmQDv5PkarWbgBlgDpqcOQgmJABmSPYUqPHkMR+/WGBM6KtDk/x87SYAAAAKGOe2Nm0tJfmzFs//t1KNFHKT2IKzlo8meVXtJjZwWJLn124CZoA5aHLmIJiQABj2d3KS02o3AT3xiCRXGePx83oPFwAAoN+OSrJ9iuN9J8kPWzz/d0s1UsiWJE+s3cQc+5Uk59VuYgP3S/JTtZuAHjMHtWMOggkJgBmaEgHUGWM8dneB8aCPFpI8qXYTAAAABTwsyZWmON6bWj7/I0kuKtFIQU+o3cAc+276F8istJDk5fE6M6zHHNSeOQgmYGKGH3V87QagB34mzRYrAAAAs+6hUx6vRFj3/gI1SrpemtsEUccLk3y8dhMbuEGSX6vdBPSUOag9cxBMQAAMa9s24uN2d9gDTGJ3oTpPGfPxtn8GAAD66OpJbjPF8c5P8q0CdX6nQI2SFpL8eu0m5tgVSR6X5PLajWzgd5NcrXYT0DPmoDLMQTABN89miBbS3Oy+jdOSPGeEx+1sOU4bz02yJ8nZ2T+w3pUmBNy2/PX1LCbZsfz3M1d9fvcaj9+W5picOnKH/XBC9v17FrP+v28Se5I8Oc05SJr7eexJc/2cWGiMGm6Y5O61mwAAACjg0UkOnuJ4/1yozkeS/G+SwwrVK+HRGe+2WZT1oSSvT/Kg2o2s47AkL05ySu1GoEfMQeWYg2BMC0tLbXMy6KUSF/at04SpGzkjyVMLjLXSc9MEsrvShIu7lj/2FB5nUrP0Q+NNqRvSr2Uxzbl8TroJ00usxH1FmhB7VCdlXwjObOjT97HV4/3Uh2vEtbG/PpyT1Zyj/dU+R87H5pyjtU37uPT1OPSF81HeJ5LcYorj3TTJpwvVekuSexeqVcpR6c/rE9NSY/5Y73vzmCTnJDlyir2MYynNYoP3Ve5jLz9T91f7d6G9+n6cSjIHlTWPcxBMzBbQDFWJXyTOGOExewqMkySnp+l5IftC36QJCc8uOM682VW7gTXszr5VwnvP+Qlpwuo+uGaSh4/5nLM76AMAAKCtE5LcZIrj/W/KvfCeJL9dsFYppd8Ez3jOTfLHtZvYwEKSv4rXnCExB3XBHARjMBnD+k5Os1pzI7tb1H9u9gWAZ7aow/r21G5gRLvTrFTeez2cX7GXX4vbAwAAAMPw+Ez3/28+ULjeJ5N8v3DNth5WuwHypykb8pR2gzSvLcC8MweVZw6CMQiAYWM7Oqh5Svat9KVbe2o3MKFtaa6Rj0953KOS/MKYz5mnbXsAAIDZct8pj/fMDmq+s4OabVw1ybVqNzHnrkjy80kur93IBn43ydVqNwGVmYPKMwfBGATADFmJYOq0Tb6+Y4xae1d3njVhL4xvd+0GWtqefdfNqJ7cYrxfTnKlFs8HAADoi+tl8129SrokyT93ULeP212eUbsB8m9J3lC7iQ0cluTFtZuAisxB3TmjdgMwKwTAsLET06zGXM+uEWqcEKska9ldu4GCFtLtfYKPTPKUMZ/zpS4aAQAAKODRSbZOcbyPdlT3v9O/LTjvV7sBkiS/lH7vfHZymtfVYB6Zg7pjDoIRCYAZuhLB664Jn/e05fF3F+gBkn33Ce7iHsFPThMCj2OxfBsAAABF7JzyeM/osPbrOqw9iaOS3LB2E+Q7Sf64dhMbWEjy0kw3BIO+2Dnl8cxBwI8QAMPmjt/ga3vW+fxRsR1FHyzWbqAj29KsLF/LrgnqTbL6FwAAoK9OyHRfHP5+krd0WP+pae772idPq90ASZI/S/LZ2k1s4AZJfqV2EzBl5qDumYNgBAJgGM2T1/n8Wav++/QkJ6XfW/AwDLuT3Do/uhp4zwS1npzxV//a1hwAAOirR2W6qw7/teP6X0vyyY7HGNe9ajdAkiaUeXz6F86sdEaSq9VuAqbIHNQ9cxCMQADMPCgRVD15hDEWkpyZ5OwC48EodqVZDbzy/sC7xqxh9S8AADAkC5n+/QH/bgpj9G0LziPSvCmZ+t6Tfa8J9NGhSV5cuwmYEnPQdJiDYAQCYBjN8WnC3bVYCUkf7Mxk1+JTMv7qX79gAQAAfXWTTHfrzYuTvGEK47w0yeVTGGccv1+7Af7P49JsA9tXJ6fZMQ+Gzhw0PeYg2IQAmHlRIqQ9Ncn2AnWgL47N5qvb17KrbBsAAADFPD7T3Xrzg0kumcI4307yiSmMM4671G6A//PtJE+v3cQGFpK8PNP93oQazEHTYw6CTQiAYTzbajcABf1mxl/9CwAA0FcLSe4z5TFfO8Wx3j7FsUZxSKzq7JNnJ/lM7SY2sJjkt2o3AR0yB02XOQg2sbC0tFS7B5iWXUlu1bLGK5Oc1rqT2TZLPzROinsyr+fYJLvT/LI0DlueD0Ofvo9dU/3Uh2vEtbG/PpyT1Zyj/fXxHNEvff2emfa129fj0BfORzu3TfLvmd6/69IkV0uyZ0rjXSfN/8f16by9N8mO2k10rMYcP+k5PjHJv6S/i34uSnJCkm9NaTw/U/fXl99X+36cJmUOmr55mINgYn39ZQC6sL1AjVOTPKdAHajtjIwf/gIAAPTZ4zPdF6b/I9N74T1Jvpzku1McbxQ/WbsB9vPeJP9Yu4kNXCnJi2s3AR0xB02fOQg2IACG8W2v3QC0dEKSx07wvD69ww8AAGClLUl+dspjvnHK4yXJWyqMuZEDk9y3dhPs57FJLqjdxAbuE9u2MjzmoDrMQbABATDzpkSAdWKBGlDTU5Nsrd0EAABAQbdJcvUpjreU5O+mON5ev1dhzM38Ru0G2M+3kvxp7SY2sJDkJUkOqN0IFGQOqsccBOsQAMNkzqjdAEzopkkePsHzrP4FAAD67NGZ7v+3/E+Sr01xvL2+mv5twXnb2g3wI/4wyedqN7GB60dow7CYg+oxB8E6BMDMoxKT8VMjBGY2/Xms/gUAAIZlIck9pzxmzfusvqni2GvZmuT02k2wnyuSPG75z776nSTXqN0EFGAOqsscBOsQAMPkdtZuAMZ09yT3mOB5J5RuBAAAoKDbJLnOlMf8mymPt9LvVBx7PU+u3QA/4j3p3/06V7pSkhfVbgIKMAfV9+TaDUAfCYCZVyVWAd+qQA2Ylq1JnjXhc3cX7AMAAKC0aW+9+e0kH5vieKt9M8l5Fcdfy83jnq599PgkF9ZuYgM/l+SnazcBLZmD6jMHwRoEwNDOWbUbgBH9Qpr7/wIAAAzJliT3nvKY753yeGs5q3YDq2xJ8sTaTfAjvpHkz2o3sYGFJC+N4IbZZQ7qB3MQrEEAzDwr8c6sk9O/CQ9WOyLJ70343Gm+gxEAAGBcd0py3JTHfN2Ux1vLb9VuYA1PqN0Aa/rDJOfUbmID103yG7WbgAmZg/rDHASrLCwtLdXuAWoq9Q0wTyHZLP3QOCG2L06SZ2fye2HM07U9T/r0fewa66c+XCOujf314Zys5hztr4/niH7p6/fMtK/dvh6HvnA+xveaJA+a4ngXJjkyyRVTHHM930lyTO0mVlhKcniSH9RupLAac3zp782fTvKu9Hcx0EVJrpdmxXJJfqbury+/r/b9OI3DHNQfQ52DYGJ9nfRhWk6o3QB07EaZfAuUIf1CDgAADM8BSe465TF3pR8vvCfJG2o3sMpCkl+r3QRr+pf0ewe7K6XZChpmiTmoX8xBsIoAmHm3u1Cd0wrVgdJemGRr7SYAAAA6cPckR095zLdMebyN/HbtBtZwau0GWNcTkvxv7SY28LOZfpgGbZiD+sccBCsIgKHMKuBXJFksUAdKOjXJSRM+1+pfAACg7x435fEuTfKXUx5zI99L+S1z2zouzfak9M+3kvxZ7SY2sJDkJWlWVcIsMAeZg6DXBMBQbhXw2YXqUM7u2g1UdHiSZ9ZuAgAAoCMHJrnTlMf8n/Tv3oJ/X7uBVQ5I8sjaTbCuP0i/Xys5Iclv1m4CRmAOapiDoMcEwNA4pUCN4wvUgFJ+P8mxEz7X6l8AAKDv7p7pr/J525THG8UZtRtYw87aDbCuy5I8Pv25h+hafjvJtWo3AZswBzXOqN3AGnbWbgD6QgAMjbMK1TmjUB1o47ZJnjjhc99bshEAAICOnD7l8a5I8uwpjzmK85N8vXYTq9wpyZVrN8G63p7knbWb2MCVkrygdhOwCXNQwxwEPSYAhn1KrHp8apLnFKhDGdtqN1DJi5NsnfC5Owr2AQAA0IUDkpw05TG/lv69yL1X37bgPDDJfWs3wYYeleSC2k1s4D5JfqZ2E7AOc9D+zEHQUwJgKO9JtRvg/+yp3UAFp6ZZATyJp5VsBAAAoCP3SHLUlMf8lymPN44zajewhtNqN8CGvpHkT2o3sYmXpglyoG/MQfs7o3YDazitdgPQBwJg2N+tC9U5o1AdGMe1kjyrxfPPKNQHAABAl06d8nhLSZ475THH8f0k36zdxCo/leSY2k2woT9Ock7tJjZwfJLfqt0ErMEctD9zEPSUABj2t6tQnadmfrcf7pPF2g1M2V8mucqEz31TyUYAAAA6clCmvzXst5J8bMpjjqtvW3BuTfLg2k2wocuT/GKacKmvfivNm92hL8xBazMHQQ8JgOFHlbgXcJLsLlQHRnFykp0tnt/muQAAANPyi0mOnPKY/zbl8Sbx/9K/IO9RtRtgU+9M8vbaTWzgkCQvqt0ErGAOWps5CHpIAAzdOTJWAde2WLuBKTkqyfNbPL/Umx4AAAC69sQKY76swpjjujDJ12s3scr2JNes3QSbemySH9RuYgP3zvRXXMJ6zEFrMwdBDwmAYW2lArGdheowmdNqNzAlz4stkQAAgOE7PN2+0Xcpa69gekmSe3Y4bil/U7uBVRYy/XtlMr6vJfmz2k1s4qVJDqzdBHPPHLQxcxD0zMLSUt9W5kNvlPrmOCrJnkK1+mDWfmgMfXXrg5K8psXzh358WFufvo9dg/3Uh2vEtbG/PpyT1Zyj/fXxHNEvff2emfa129fj0BfOx8aekeQ3Oqy/9/ivd1w+keQeSb7RYQ9tHJbkgvTrvH42yY1rN9FSjTl+2udwa5L/SXLClMcdx9OSnDHmc/xM3V9ffl/t+3FajzloY+Yg6BkBMGys1DdInya+tmbth8aQjv1q10jyX2neZDCpIR8f1ten72PXYD/14RpxbeyvD+dkNedof308R/RLX79nvDjeL87Hxr6a7nc/WsrGx+WKJH+d5NHLf++b3UmOr93EKtdP8vnaTbQwDwFw0gRLb6s09iguTnKDND8HRuVn6v768vtq34/TesxBm9sdcxD0hi2gYTrOrN3AHNtWu4EOnRnhLwDQWPCx6Qcw247MdO7lt/LnxVphyZY0txu6MM29U/vmzNoNrOH02g0wkrcneVftJjZwSJqtcKEGc9BozqzdwBrMQcwtK4Bhc6W+SU5I8y6oWbYjyXtqNzGmob7Y96Qkz2lZY6jHhs31afJ3HfZTH64R18b++nBOVnOO9lf7HDkfm3OO1mZ1VL84H+t7VpKnTHnMzbbjTJKvJLlXkk92385IDk5yUfp1br+Q5Hq1m2hhXlYAJ8m1k3wuyZUqjT+Ke6YJq0fhZ+r+av8utFffj9NazEGjMQdBj1gBDJu7daE6ZxaqU9Oe2g2QJPmxCH8BAID58vAKYy6t+FjPcUk+nuQdaVYo1vbDJF+u3cQq101yi9pNMJKvJnlu7SY28cI0IRNMkzloNOYg6BEBMGxuV6E6JxaqU9PHajcwgTNrN1DYsUleX7sJAACAKbpKkqtWGHfL8sdmb6BdSHK3JN9PckbHPY3iFbUbWMOptRtgZL+b5Eu1m9jAYpLfrN0Ec8UcNB5zEPSELaBhdCW+Wd6UZGeBOrXM6g+MIa12fWuarV3aGNLxYDJ9+l52PfZTH64R18b++nBOVnOO9lf7HDkfm3OO1mZ7zH5xPtb2hiT3rd3EGM5N8oiMvk1taX3cgvPrSa5Vu4kJzdMW0HvdM8k/9qCP9Vyc5EbZfKWhn6n7q/270F59P06rmYPGYw6CnrACGKbr5PTnl61xba/dQAvbazdQyFPTPvw9pUQjAAAAU3SP2g2M6Zgk/5TkP5Ncs8L4P0yyu8K4G7lmkh+v3QQj+6c0W8r21SFJXly7CeaGOWg85iDoCQEwjK7ku5Z2FKw1LbO4/fNes9z7XjuS/F6BOmcVqAEAADAt10pyaO0mJnTrJF9J8leZ/mtwL5vyeKN4dO0GGMtjk/ygdhMbuEealcrQJXPQZMxB0AMCYBjP+YXq7ChUZ1rOrt1AATtrN9DC0UlenfY/s/u09QoAAMAoXl67gZa2pHnR+fxM9x6Ef5L+7UB2/3gtcpZ8Nclf1G5iEy9Os90sdMUcNBlzEPSAewDD+Ep905yU2QlWh/KDYlYD0LPSbB/e1qz++ymvT9/Trst+6sM14trYXx/OyWrO0f5qnyPnY3PO0drcH7FfnI8fdXGGFfB8Ps3/3/3XlMa67hTGGccsvRay1zzeA3ivA5N8Mf2+d+bTkpyxztf8TN1f7d+F9ur7cVrJHNRuLHMQVOQdDzC+0wvVeU9m4960ffnlsIRdtRuYwJMi/AUAAObT9TOsF96T5HpJPpnkrUmu1PFYf9Vx/Uk8tnYDjOXSJL+Ufr829JtJrlO7CQbJHNSOOQgqswIYJlPyG+eEJLsL1ivprJQJH/vk9CRn1m5iRLdL8oEkB7Ssc+vMZvhNd/o0+XtzQj/14RpxbeyvD+dkNedof7XPkfOxOedobVZH9Yvzsb9/TfJTtZvo0KVJfi/JMzqqf2CSH6Zf5/mCNLc5urR2I2OY5xXAe707yV1qN7GBd6S5J/Bqfqbur/bvQnv1/TjtZQ5qxxwElQmAYXIlv3n6NBHutT3Jx2o30ZGjkuyp3cQmbpLkw0mOKFCrj9cXdfVp8nd99lMfrhHXxv76cE5Wc472V/scOR+bc47W5sXxfnE+9ndJmheQh+5bSR6QJmwo7Qtp3njeJ/dO8o+1mxiDALhZYfuZdL9isI21ris/U/dX+3ehvfp+nPYyB7VnDoKKbAENk3tTwVpnFKxVwmkZbvibJOcl2VG7iQ0cluR9Ef4CAADz6+aZjxfek+TYNP8P+JEkxxSu/cLC9Up4dO0GGNuXkzyrdhObeGGGt10v9ZiDyjAHQUVWAEM7pb6Bnpb+hMCLSb5Yu4kp6etK4P9Jc5+Rtt6UZGeBOgxPnyZ/b1Lopz5cI66N/fXhnKzmHO2v9jlyPjbnHK3N6qh+cT72+WCS29duooIrkrwkyeML1duSZqvLPi0CuSjJVZJcXLuREVkB3DggyefT7/vt/kWSJ634bz9T91f7d6G9+n6cEnOQOQgGQAAM7ZX6JupLGDlvPxT69kvn3yR5eKFaffu30R99+j53nfZTH64R18b++nBOVnOO9lf7HDkfm3OO1ubF8X5xPvaZl60313NhkkcleV2BWqXeZFzSA1Pm3zYNAuB97p3kzelvf1ekCe3+ffm//UzdX+3fhfbq+3FKzEHmIBiAPr3zAubdeWlW39ZyZvrzi+A0LaX5t2+r20aS5H4R/gIAAGzPfL/wniSHJ3ltmvuuXrdlrb9s305xp9VugIm8Nc1WsX21JclbajfBzNsec5A5CAbACmAoo+Q30glJdhesN4rTkrxiymP2zcfT/IJXy48n+XDBegJgNtKnyd+12k99uEZcG/vrwzlZzTnaX+1z5Hxszjlam9VR/eJ8ND6c5v+RaCylCbXul+SyCZ7fxy04L0ly1STfr93ICKwA3t/xaUKhQ2o3soGnJ3lq/ExdrfbvQnv1/TiZg/ZnDoIZ1advOphlJX9xObtgrVHNe/ibJLeqOPa2CH8BAAD2uk3tBnpmIcl9kvxvkl+f4PlXJDmnaEftHZTkvrWbYCJfSvL82k1s4rfTj53emE3moP2Zg2BGWQEM5ZT8ZjolyVkF641iMc09iJ+8/OfZaVbE7l7+713Lj9u5/LntKz63nm3Lf+5Z5/ObWf289b6+uM7jF5c/t3vF1/b+uWO5jycv/72mPUmOLFRL+Mso+jT5u2b7qQ/XiGtjf304J6s5R/urfY6cj805R2uzOqpfnI/kTun3FrN98I00L1x/aIzn/FKS53XTzsTel+TE2k2MwArgH3Vgks8nOa52Ixv4tyQ/NeUx+37eav8utFefj5M5aHPmIJgRAmAoq9Q31JdS937ATM+2NPd/LqXPv0TTH32a/F2z/397dx5k2VneB/jXlsTqwLCDZFuDSo6DwJYQi6likcAsFRZLYrMtCBpB2YkTbCmBKmNXEURScbxUQK4yxAkBDU4UtgATm5iAbSSWYBuIJUwwi63NwiJCBi2ABNomf5zpaLqZme7pPud8333v81RNqTTLed8+3733PX1/fb7bpx4eIx4ba/WwJutZo7Var5H12Jg1OjCBY1+sR/IXSX60dRML4hMZ7sra7PeUd6Sv3QDvSPLQJH/XupENCIAP7LQk789i9DqX3s9F62uhVT2fJzNo88wg6FxPTzioYKwLmGOTnD/SsejbnhGP1fMFNAAAwGac0LqBBfKkJNdl83dVfXHCXrbiiCQ/3boJtuy/p83HmMGUzKDNM4OgcwJg6Nc5SXa1boJJ7c14W40IfwEAgEX3wgxvyLJ5R2TYWvPGJC/a4O/2tv1mkry8dQNsyyuSfLd1EzASM+jwmUHQMVtAwzTGfGI9Oht/1i6L59QkF414PAEwh6On4e+x26ceHiMeG2v1sCbrWaO1Wq+R9diYNTowWw73ZdnX4/8meUjrJhbc5zNsyXn5Qf789vQVcOxN8gNJrmndyCHYAvrQ3pjk3NZNdKL3dWt9LbSq1/NkBm2fGQQdcQcwTGPMC5mLRzwWfdgZ4S8AAO25jqS3x8CDWzdQwCOT/HWSdyY58gB/3tsWnCtJ/lHrJtiWX4rwhBrMoO0zg6AjAmDo333jDuBKdia5YsTj9faGDQAAi6PFtaTr14Nb9vX42czfzzeTvDrJt2auO7WVJD+V4ev7xXV/9sb529mQN98X260ZtoCFRWYGjccMgk7YAhqmNfYTrKdvztma3UnOGulYn01y0kjHYrn0NPy9rvWph8eIx8ZaPazJetZordZrZD02Zo2+1/cluaNBzdZr0auVJHfOXPOIBjUP5rokD5y55vuSvCDJvZK8OclL09fWlGO5JsPX+af7/r+3LTiT5Pgkl7Vu4iBsAb05H0ny1NZNNNb7uvUyf3s8T2bQdMwgaMQdwDCtsS9ozhv5eMxrd8YLfxPhLwAA2yPU6EuLc9NLGJDM/8Z7kvzOvv/enGRXhq0rL2nQx9SOTvInST6eYZexL7Rt54DcgbX4Xp7ku62bgC0yg6ZjBkEjAmCY3tkjHut1EQIvqpMybvjrjTMAALarRfh39wY1F0WLc9NLAPwLDWpen+QP1/3el5KcnGHryutm72h6T0ry9SS3tG7kAM5s3QDbdmWSf9+6CdgCM2geZhDMzBbQMI+xn2hnZ7iblMVwepL3j3i8M5LsGfF4LJ+ehr8fZuhTD48Rj421eliT9azRWq3XyHpszBod2A0Z7saYy0OSfG3GeovkwUmunbHejUl2zFjvUL6e5P4z13xPkhcf4s+PSPJvkpyT5B6zdMSPJflc6yYOwG4Jm3e3JH+T4bV+GfW+bq2vhVb1dp7MIJJ+ZxBsmTuAYR5jX9hcOvLxmM6OjBv+JsJfAADGc9XM9R40c71FMve5mXvtD2XuN96T5O0b/PkdSV6TZGeSD6af4KQyW3AuvlvT5m5K2A4ziMQMoiABMMxnzBD4kiTnjng8prNn5OP19lOSAAAststmricAPri5z83ca38w/7JBzW9leEN9M65N8uwkP5G+QvOKXtK6AUbxniSfaN0EbJIZxCoziHIEwDCvMcO7N2b4XFn6tSfJKSMeT/gLAMDYvjhzveNmrrdI5j43c6/9wbyqQc2PJrnzMP/NRRnuxPqlDG/eM76jkzy+dROM4mVJvtO6CdgEM4hVZhDlCIBhsZ3fugEO6vwkp414vDNGPBYAAKz60sz1Tpi53iKZ+9zMvfYHspLkPg3qXrCNf/sbGT6v+cIkt4/TDvt5eesGGMUVSd7UugnYgBnEemYQpQiAYX5j3sV5SnwGRI/OS3LOyMfcM/LxAAAgSb48c70nzFxvkcx9buZe+wP5zQY1b0nyeyMc46VJHpXhI5oYz4vi/coqfjnJda2bgEMwg1jPDKIUD2ZoY+ytfHdn2AaE9nYked3Ix7T1MwAAU7l65no/nuRuM9dcBHfLcG7mNPfaH8g/aVDz40luG+lYX0pycpKfTvKNkY657O6f5Cmtm2AUt2UIgaFXZhDrmUGUIgCGdh494rHOyrC9Dm2dlOT6kY8p/AUAYEpz3511ZGwDfSAnZDg3c2p9Z95Kkns3qPu7ExzzXRm25PytjPfG/jJ7ResGGM1bk1zTugk4ADOIgzGDKEMADO1cOsExL57gmGzOjoy/7YrwFwCAqX03yQ0z13zSzPUWwdzn5IYMa9/SmxvU/G6S90507DuSnJvk2CR/HB/XtB0/meSo1k0wmhe0bgAOwAziYMwgyhAAQ1tjB3ynZNgOmvmdO/LxhL8AAMzl/TPXe8nM9RbB3Odk7jU/kJc1qPnRJN+ZuMZXkzw9w/fnduramvskeWbrJhjNnyb5WOsmYB0ziIMxgyhDAAztjR30nZXk1JGPyaFdmvE/9xcAAObywZnrPSHJMTPX7NkxGc7JnOZe8/VWktyrQd0LZ6z18STHJXlNkptnrFvFWa0bYFTPTnJ76yZgHzOIjZhBlCAAhj6MHQJflOHzaJne7iQnjnxMd/8CADCnP2tQ05agd2lxLlqs+f4uaFDz9rS58/nXkxyd5N1J7mxQf1E9J8k9WjfBaL6d5F+3bgL2MYPYiBlECSt799oOHjqxK+NfgAgSp3V6xr94s2bMoafh7zHfpx4eIx4ba/WwJutZo7Var5H12Jg1Orjvy/DZcXO6JsnDk9w6c93e3C3DFo1Hz1z3iLR9I/jmJPecueYnkjx55prr/WiG7/sf07iPRfHiJO9p3UTazI+eZ8Z2fC3Jg1o3MaHe1631tdCq1ufJDGIzeplBsGXuAIZ+7J7gmFdOcEwGOyP8BQCghjuTvG/mmkcnef7MNXv0/Mwf/r4vbcPfozL/G+9J8q4GNdf7XJLHJnlpkusa97IIdrVugNGd3roBlp4ZZAZt1q7WDcB2CYChL2MHgMcm2TPyMUnOzfBT+mMS/gIA0NLbGtT89ST3blC3F/fOcA7m1mKt9/fOBjXvTPJfG9Q9mAszfPbzm5Pc1riXnj0jyX1aN8GoPrnvF7RiBplBm2UGsfAEwNCfsYPA05JcnOTUkY+7rM5N8sbWTQAAwMg+3qDmDyV5fYO6vXh9hnMwtxZrvb/nNqh5aZJvNKh7KLcl+WdJjsuwJr1szdqTo2KngIqemeHzUKEFM2hgBm3MDGLhCYChT2OHwKckuShC4O06NdOEv+7+BQCgtZsyvEE5t3+R5IkN6rb2xAxf+9wuzbDWrdw7w+cez63FHV+b9ZUkT0ny9PgYpwN5ResGGN23k/zb1k2wlMyg72UGHZoZxEJb2bvXD3dAx8Z+gl6V4bNrOXynZgjRxyb8pYWehr/nQJ96eIx4bKzVw5qsZ43War1G1mNj1mhjL0zyngZ1/y7J47I8bzzuTPLpJA9sUPtFSf5bg7qrPpTh7r857c2w1eVXZ667Va9J8tok92rdSCfuSPLQDK8TrbSYH4swM7brurR5HZxS7+vW+lpoVavzZAZtzAxaq4cZBFvmDmDo2xSfCXzxyMdcBqdH+AsAQH3/o1HdByb5aIbvV6o7NsPX2ir0aLXGq57aoObnszhvvCfJryV5WJL3ZvjcyGV3RJKfat0Ek3hB6wZYOmbQxsygtcwgFpoAGPo3xXbQe5OcP/Jxq9qT5P0THFf4CwBAb25JmzuAk+GzcD+Z5MRG9edwYoavscXn/ibD2t7SqHaS3DfD5+nNreetNw/mpgx35J+c5C8b99KDs1o3wCQ+luRPWjfB0jCDNs8MWssMYmHZAhoWw1RP1KfGHcGHsjvTDHnhL631NPw9H/rUw2PEY2OtHtZkPWu0Vus1sh4bs0ab8w+SfKFh/VuSvDLJBWm/ZmNZSXJ2kt9Ocs+GfTwiyRcb1v9I2tx9dVySKxrUHdPLkrwhyQNaN9LI3iQ/kOSahvXntigzY7vuk+QbGe6yq6D3detlrrY4T2bQ1plBbWcQbJk7gGExTHVhdFGSkyY69qLblWnC3zMmOCYAAIzli0kub1j/nknemuSPkjyyYR9jeWSGr+WtaRv+Xp624W+SPLlBzS9l8d94T5LfTXJ0hp28bmvbShMrSc5s3QSTuCnJb7ZugqVgBm2dGWQGsaAEwLA4pgqBL0ly6kTHXlTnZrjjYGyPzrClNAAA9OwVrRtI8rQkn8tw/Xxy21a25OQMvX8uw9fSWus1fXCSIxvUfXeDmlO5Nck/T3J8hq1zl81LWzfAZH45ybdbN0FpZtD2mUGwgGwBDYtnqift2zPc9brs9iQ5bYLj3i/JDRMcF7bC8F98U2+Z1cNjpPft0+bWw5qsZ43War1G1mNj1mjzVpJ8NclDWjeyn09nuIv2fUmua9zLwTwoyfMzhK2Pa9zL/q5N8rC0fQ58KMkzG9Q9IW23NJ/Sc5L8hyTHtG5kRscnuaxBXVtAT++01PiB+d7XrfW10Kq5z5MZND4zCBaAABgWkxB4GrszzbbPSf/fBLBcDP/FJwBePj2syXrWaK3Wa2Q9NmaNDs/Tkvxx6yYO4M4Md578fpJPJPl82t05du8MWzw/Kcnzkjwlfe609hMZPvuwpW8nudfMNa9KsnPmmnNbSfIrSV6T5Psb9zKH85K8vkFdAfA8rkxybOsmtqn3dWt9LbRq7vNkBk3DDILOCYBhcU315P1slvNzgc9Pcs5Ex+79GwCWj+G/+ATAy6eHNVnPGq3Veo2sx8as0eFZyRCuPqJ1I5vwN0n+d4bP2vurJF9OcnWGHXi+k7s+r25v1j4OVvK9j4uV3LVWRyW5R5IdSX4wyd9P8sNJfiTJY5L80KhfxTS+kCGkbvn4f2iGO8rn9oYkr2pQt4UdSd6S5IwkR7RtZVJ/neE5ODcB8Dzun+TrrZvYpt7XrfW10Ko5z5MZNL0dMYOgSwJgWGxTPYHPznA37DLYkeTiJCdOdPzeL/5ZTob/4hMAL58e1mQ9a7RW6zWyHhuzRofvEUn+snUTbEsP20/+zyTPalD3sRl+MGCZPCbJf85i/ODGVv1Yhs/WnpMAeD4XJjmzdRPb0Pu6tb4WWjXneTKD5mMGQWd63JoI2LypLpguSHLpRMfuyc4k10f4CwAAB/KFDN8bsJguSPvwN0lObVDz2izfG+/J8DWfkOQfZ7gDvqKXtW6ASb0kya2tm6CUUxvUNIPMIOiCABgW31Qh44kZ7oyt7OIJjy38BQCggn+aYRtlFst3Mqxda8cluXuDuu9vULMn/zHJQ5K8KfXCtJe0boDJ/UzrBijDDGrDDIJOCIChhqnCxlMybA9z0kTHb2VPhq/r2ImOL/wFAKCK76TN1olsz7PSR3Df6g7yCxvV7cmtSV6Z5PgkH0s/W79u18OSPL51E0zqfUmuat0EJZhB7ZhB0AEBMNQxZeh4SZJdEx5/TnuSnDbh8YW/AABU87Ekb2ndBJv2lgxr1oMnNKj5jSSfbFC3V1dn+OHu52bYlrSCXa0bYHInpk5gRDtmUHtmEDQkAIZapgwfL0hy/oTHn8PuCH8BAGArfj7JFa2bYENXZFirHpyQ5G4N6u5JcmeDur37gyRHJ/lX6ePu8O14cbynWd2NGbaPha0yg/piBkEDHqhQz5Qh5DkZLmR2TlhjCrsyhL9nTVhD+AsAQGV3JHlskltaN8JB3ZJhje5o3cg+re4af0ejuovgziSvS3JMkvdkcUOKByR5SusmmNwvZAiCYSvMoP6YQTCzlb177aYBRU395L5fkhsmrjGGnZn+TgXhL4vG8F98U7/u9PAY8dq6Vg9rsp41Wqv1GlmPjVmjcTw+yZ+1boID+vEkn2rdxH5uTXLUzDVvSvLAJLfNXHdRPTbJ2zPcKbdodic5e6ZaLeZHlZmxXU9P8oetmzgMva9b62uhVXOcJzOof2YQTMwdwFDX1BdT1yc5deIa23V+hL8AADCmTyU5o3UTfI8z0lf4e3Lmf+M9ST4Qb7wfjs8keWSGbcMX7U7L09PmMca8/ijD4xQOhxm0GMwgmJgAGGqbOpy8KMnFSU6auM5W7MmwZfVUViL8BQBgOe1J8srWTfD/vTLDmvTkzY3qvqtR3UX3O0keluRtWZzwYkeSZ7Ruglk8M/1sbc9iMIMWixkEExEAQ31Th5SnJLkk/Xwu8KlJLk1y2oQ1BL8AACy7NyX5udZNkJ/LsBa9eUyDmrck+XCDulXckuQVSR6V5H+ln61iD+Ws1g0wi+sz7PAGm2UGLR4zCCYgAIblMEdgeUXaX5DvzXBX8okT1hD+AgDA4C1JzmzdxBI7M8Ma9ObJSY5sUPfDSb7ToG41X07ypCQ/meQrjXvZyHOT3KN1E8zi1UluaN0EC8EMWmxmEIxIAAzLY47g8py0+QmtczPc9Ts14S8AAKz1jgxv1N3cupElcnOGc/6O1o0cxG83qtvr+VhUH0jyQ0l+Nf2GGvdK8rzWTTCbF7RugIVgBtVgBsEIVvbuXYS76YER7cxwt+7UXp/kvIlr7EiyO9Nu97xK+Eslhv/im/o1qYfHiNfdtXpYk/Ws0Vqt18h6bMwaTevhST6Sfj4apqorkzwt83xPt1W3Jzli5pq3JXlAkm/OXHdZPCDJf0nyrPT3WvbBJM+euEaL+dHbee7FZ9Jme9/N6n3dWl8LrZryPJlB9Sz7DIItcwcwLJ8rM8+wfF2SXRPX2B3hLwAA9OCKJCckeXvrRgp7e4Zz3HP4++zM/8Z7MvzwgTfep/P1JP8wyROSXNa4l/WenuQ+rZtgNs9IcmfrJuiWGVSTGQRbJACG5TVHqHlBhp8u3DXycS/ed1zhLwAA9OOWJGcneWFsCT2mmzOc07MznOOevaFR3Xc2qrtsPpXk+AxvxvfiqCSnt26C2Vyf5E2tm6BbZlBtZhAcJgEwLLe5ws0LMoS2O0Y41u4kp4xwnM0Q/gIAwOHZm+S9SY7L8PltbM8HMpzL96afrTsP5Ycb1Lw9ye81qLvMfr91A+uc3boBZvWLSW5q3QRdMoOWgxkEmyQABuYKOU/J8JOa52/x3+/K8IbHWSP1cygrEf4CAMB2XJvkeUmek/6261sEl2U4d8/LcC4XwQvS5n2mTyT5RoO6y+yN6esHEp6c5IGtm2BWL2rdAN0xg5aHGQSbJAAGkiHsvHGmWuckOe8w/v6uJDdkuIt4DoJfAAAYzx8keUSGuyOua9zLIrguw7l6RIZzt0h+rVHddzequ8z+IslXWjexnyMybJPO8vhwkj9v3QRdMYOWhxkEmyQABlbtSPLwmWq9LsNPap23wd+7MkPwe9+J+1kl/AUAgPHdluGjXHYm+dkkV7dsplNXZzg3OzOcq9taNrNFxzWoeWeSPQ3q0t95f1nrBpjdMzO8BkBiBi2bPa0bWMcMoksCYGB/V2beEHT/IHjXfr9/+r7fP3bGXoS/AAAwrZuT/KcMb9K+MMkn27bThU9mOBfHZTg3N7dtZ8vOTJv3mD6d5KsN6pL8VvoK356Q5OjWTTCrryd5c+sm6IIZtHzMINiElb17e9ouHejIsrw4CH5ZRsvy/K5s6teuHh4jXp/X6mFN1rNGa7VeI+uxMWvUp4cneXmGu18f0riXuVyb5C1J3pbkisa9jOXyzLej1P5eleQNDeoy+Kskx7duYj+vTvLvJjhui/lhZmzeTUn+Xusm9ul93VpfC60a+zyZQctpWWYQbJk7gIGDWUlyVesmJtb7hTkAAFR3RZLXJjkmyeOS/GqGN3KruTzD1/a4DF/ra1Mn/E2GratbeH+jugze1bqBdc5q3QBN/EzrBmhuZ6O6ZlBbZhBswB3AwGZUfKEQ/rLMKj6nl407gJdPD2uynjVaq/UaWY+NWaPFclySpyZ5VpJTkjy4bTuH7WtJPprkQ0kuSs1Qe9XPp802rJ9NclKDutzlmCSXJbl760b2c3yGnsbkDuD+XZI+Xg96X7fW10KrxjxPZtDyWpYZBFt2ZOsGgIWwkn4uEsfQ+wU5AAAsu8v3/Xrrvv8/LsnJGd5sPTHJo9Lujp/1rkzyfzK8GXxpkj9P7cB3vV9pVPc9jepyl79N8pkkT2zdyH5emuT1rZtgdk/P8IM3drtcPmbQ8jKDYAPuAAYOx6K/YAh+YbDoz2XcAbyMeliT9azRWq3XyHpszBrVc7ckxyb5wX2/js5wN8iDkzwgyf2SfH+Gz4Y8KsMa3C93rcWNSe673/H2Jrl+339vS/LNJN/a93tfzxAu/G2Sa5Jcve/XVUlunejrWxR3ps3j+4QkX2hQl7XOTHJh6yb28+UkPzLyMd0BvBjOT3JO4x56X7fW10KrxjxPZtByW4YZBFsmAAa2YhFfOHq/CAcAAAAAANg222IAW7FIYepKFqtfAAAAAACALRMAA1u1un1azwS/AAAAAADAUhEAA9txQ/oMWW9Mn30BAAAAAABMSgAMjKGnu4FXkuxo3QQAAAAAAEALAmBgLDek7V23n21cHwAAAAAAoLkjWzcAlLMawu5tUBMAAAAAAGCpuQMYmMocoezKTHUAAAAAAAAWggAYmNKUAa3gFwAAAAAAYB0BMDCHMcNad/0CAAAAAAAchAAYmMt2g9uHb/PfAwAAAAAAlHdk6waApbMa4u7dwr8BAAAAAADgENwBDLSykuR+m/g7wl8AAAAAAIBNWtm793BuwgMAAAAAAACgV+4ABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEARAmAAAAAAAACAIgTAAAAAAAAAAEUIgAEAAAAAAACKEAADAAAAAAAAFCEABgAAAAAAAChCAAwAAAAAAABQhAAYAAAAAAAAoAgBMAAAAAAAAEAR/w8tpYFA+L4+PgAAAABJRU5ErkJggg=="""
@@ -0,0 +1,419 @@
+"""Headless command-line interface.
+
+Exposes installation, version checks, profile preparation and launching
+without the Flet UI, for provisioning and verifying workstations from
+scripts. Each command prints one JSON object to stdout; diagnostics and,
+with --progress, JSON progress events go to stderr. The exit code is 0 on
+success, 1 on failure and 130 when interrupted.
+
+Usage:
+    python cli.py status
+    python cli.py --progress install-euroscope
+    python cli.py install-sectorfile --zip EYVL.zip
+    python cli.py launch --profile EYVL
+    python cli.py provision-seats --store D:/store D:/seat1 D:/seat2
+    python cli.py rollback sectorfile --to 20251004190612-251001-0003
+    python cli.py store-gc
+    python cli.py doctor --repair
+    python cli.py doctor --store D:/store --target seats
+    python cli.py export-bundle E:/eyvl.bundle
+    python cli.py --root D:/EYVL import-bundle E:/eyvl.bundle
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, Optional
+
+from config import settings
+from models import ProgressEvent
+from services import AppContext, CancellationToken, ProgressTracker
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_INTERRUPTED = 130
+
+
+def _progress_printer(enabled: bool) -> Optional[Callable[[ProgressEvent], None]]:
+    """Get a progress callback writing JSON lines to stderr, or None if disabled."""
+    if not enabled:
+        return None
+
+    def print_progress(event: ProgressEvent) -> None:
+        print(json.dumps({"progress": asdict(event)}), file=sys.stderr, flush=True)
+
+    return print_progress
+
+
+def cmd_status(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Report the local installation state without network access."""
+    path_manager = context.path_manager
+
+    try:
+        sectorfile_version = context.sector_version_manager.get_current_version()
+    except FileNotFoundError:
+        sectorfile_version = None
+
+    return {
+        "ok": True,
+        "root": str(path_manager.root),
+        "app_version": settings.APP_VERSION,
+        "euroscope_installed": (path_manager.euroscope / "EuroScope.exe").exists(),
+        "sectorfile_version": sectorfile_version,
+        "profiles": context.profile_manager.get_available_profiles(path_manager.sectorfile),
+        "config_valid": context.config_manager.config.is_valid(),
+    }
+
+
+def cmd_check_updates(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Check online for newer sectorfile and application versions."""
+    version_manager = context.sector_version_manager
+
+    try:
+        current = version_manager.get_current_version()
+    except FileNotFoundError:
+        current = None
+
+    newest = version_manager.get_newest_version()
+    sectorfile_update = current is None or int(current.split("-")[0]) < int(newest.split("-")[0])
+
+    app_update, release_info = context.update_manager.is_update_available(
+        timeout=settings.UPDATE_CHECK_TIMEOUT
+    )
+
+    return {
+        "ok": True,
+        "sectorfile": {
+            "current": current,
+            "newest": newest,
+            "update_available": sectorfile_update,
+        },
+        "app": {
+            "current": settings.APP_VERSION,
+            "latest": release_info["version"] if release_info else None,
+            "update_available": app_update,
+            "download_url": release_info["download_url"] if release_info else None,
+        },
+    }
+
+
+def cmd_install_euroscope(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Install EuroScope from the official MSI installer."""
+    success = context.installer.install_euroscope(_progress_printer(args.progress), cancel_token)
+    return {"ok": success, "path": str(context.path_manager.euroscope)}
+
+
+def cmd_install_sectorfile(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Install the sectorfile from a given zip, or wait for a manual download."""
+    installer = context.installer
+
+    if args.zip is None:
+        success = installer.install_sectorfile(_progress_printer(args.progress), cancel_token)
+    else:
+        if not args.zip.is_file():
+            return {"ok": False, "error": f"Zip file not found: {args.zip}"}
+
+        tracker = ProgressTracker(_progress_printer(args.progress))
+        staged = installer.extract_sectorfile(args.zip, tracker, cancel_token)
+        try:
+            installer.finish_sectorfile(staged, None, tracker, cancel_token)
+        except BaseException:
+            staged.abort()
+            raise
+        tracker.finish("Sectorfile installation complete!")
+        success = True
+
+    return {"ok": success, "path": str(context.path_manager.sectorfile)}
+
+
+def cmd_fresh_install(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Install EuroScope while waiting for the manual sectorfile download."""
+    from services import FreshInstall
+
+    success = FreshInstall(context.installer).run(_progress_printer(args.progress), cancel_token)
+    return {"ok": success}
+
+
+def cmd_rollback(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Restore the tree replaced by the last installation, or a sectorfile snapshot."""
+    if args.to:
+        if args.target != "sectorfile":
+            raise ValueError("Only the sectorfile keeps snapshots")
+        restored = context.installer.restore_sectorfile_snapshot(args.to)
+    elif args.target == "euroscope":
+        restored = context.installer.rollback_euroscope()
+    else:
+        restored = context.installer.rollback_sectorfile()
+    return {"ok": restored, "target": args.target}
+
+
+def cmd_snapshots(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """List the kept sectorfile snapshots, newest first."""
+    return {"ok": True, "snapshots": context.installer.sectorfile_snapshots()}
+
+
+def cmd_prepare_profiles(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Write the configured credentials into the sectorfile profiles."""
+    config = context.config_manager.config
+    if not config.is_valid():
+        return {"ok": False, "error": "Settings are incomplete"}
+
+    sectorfile = context.path_manager.sectorfile
+    context.launcher.prepare_profiles(config=config, sectorfile_path=sectorfile)
+    return {"ok": True, "profiles": context.profile_manager.get_available_profiles(sectorfile)}
+
+
+def cmd_launch(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Prepare profiles and launch EuroScope, and AFV unless disabled."""
+    path_manager = context.path_manager
+    config = context.config_manager.config
+
+    if not config.is_valid():
+        return {"ok": False, "error": "Settings are incomplete"}
+
+    profiles = context.profile_manager.get_available_profiles(path_manager.sectorfile)
+    profile = args.profile or (profiles[0] if profiles else None)
+    if profile not in profiles:
+        return {"ok": False, "error": f"Profile not found: {profile}", "profiles": profiles}
+
+    launcher = context.launcher
+    launcher.prepare_profiles(config=config, sectorfile_path=path_manager.sectorfile)
+
+    if not launcher.launch_euroscope(euroscope_path=path_manager.euroscope, profile_name=profile):
+        return {"ok": False, "error": "Failed to launch EuroScope", "profile": profile}
+
+    afv_launched = False
+    if config.afv_path and not args.no_afv:
+        afv_launched = launcher.launch_afv(config.afv_path)
+
+    return {"ok": True, "profile": profile, "afv_launched": afv_launched}
+
+
+def cmd_provision_seats(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Publish this root's EuroScope into a shared store and link seats to it."""
+    from services import BlobStore, SeatProvisioner
+
+    provisioner = SeatProvisioner(BlobStore(args.store))
+    tree = provisioner.publish(context.path_manager.euroscope)
+
+    seats = []
+    for seat in args.seats:
+        cancel_token.raise_if_cancelled()
+        seats.append(provisioner.provision(seat, tree))
+
+    return {"ok": True, "store": str(args.store), "tree": tree, "seats": seats}
+
+
+def cmd_store_gc(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Remove stored files that no installed or previous tree uses any more."""
+    return {"ok": True, **context.blob_store.collect_garbage()}
+
+
+def cmd_doctor(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Verify installed trees against their install manifests, optionally repairing them."""
+    from services import BlobStore, SeatProvisioner, TreeVerifier
+
+    # (verifier, installed directory, store ref of its tree, extra report fields)
+    trees = []
+    for name in args.targets or ["euroscope", "sectorfile", "seats"]:
+        if name == "seats":
+            store = BlobStore(args.store) if args.store else context.blob_store
+            for seat_root, ref in sorted(SeatProvisioner(store).seats().items()):
+                trees.append((TreeVerifier(store), seat_root / settings.EUROSCOPE_DIR, ref,
+                              {"seat": str(seat_root)}))
+        else:
+            target = getattr(context.path_manager, name)
+            trees.append((TreeVerifier(context.blob_store), target, None, {}))
+
+    reports = []
+    intact = True
+    for verifier, target, ref, fields in trees:
+        try:
+            report = {**fields, **verifier.verify(target, cancel_token, ref)}
+        except FileNotFoundError as e:
+            reports.append({**fields, "target": target.name, "error": str(e)})
+            intact = False
+            continue
+
+        if args.repair and (report["missing"] or report["damaged"]):
+            report.update(verifier.repair(target, report))
+            intact = intact and not report["unrepairable"]
+        else:
+            intact = intact and not (report["missing"] or report["damaged"])
+        reports.append(report)
+
+    return {"ok": intact, "trees": reports}
+
+
+def cmd_export_bundle(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Write the installation to one bundle file for offline provisioning."""
+    from services import OfflineBundle
+
+    bundle = OfflineBundle(context.installer)
+    return {"ok": True, **bundle.export(args.bundle, _progress_printer(args.progress), cancel_token)}
+
+
+def cmd_import_bundle(context: AppContext, args: argparse.Namespace, cancel_token: CancellationToken) -> dict:
+    """Install everything in an offline provisioning bundle."""
+    from services import OfflineBundle
+
+    bundle = OfflineBundle(context.installer)
+    return {"ok": True, **bundle.import_bundle(args.bundle, _progress_printer(args.progress), cancel_token)}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(description=f"{settings.APP_NAME} installer (headless)")
+    parser.add_argument("--root", type=Path, default=None,
+                        help="Application root directory (default: current directory)")
+    parser.add_argument("--progress", action="store_true",
+                        help="Write progress events as JSON lines to stderr")
+    parser.add_argument("--mirror", action="append", default=None, metavar="URL",
+                        help=f"LAN mirror to try before the origin, repeatable "
+                             f"(default: ${settings.MIRRORS_ENV})")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("status", help=cmd_status.__doc__).set_defaults(handler=cmd_status)
+    commands.add_parser("check-updates", help=cmd_check_updates.__doc__).set_defaults(
+        handler=cmd_check_updates)
+    commands.add_parser("install-euroscope", help=cmd_install_euroscope.__doc__).set_defaults(
+        handler=cmd_install_euroscope)
+
+    install_sectorfile = commands.add_parser("install-sectorfile", help=cmd_install_sectorfile.__doc__)
+    install_sectorfile.add_argument("--zip", type=Path, default=None,
+                                    help="Sectorfile zip to install instead of downloading it")
+    install_sectorfile.set_defaults(handler=cmd_install_sectorfile)
+
+    commands.add_parser("fresh-install", help=cmd_fresh_install.__doc__).set_defaults(
+        handler=cmd_fresh_install)
+
+    rollback = commands.add_parser("rollback", help=cmd_rollback.__doc__)
+    rollback.add_argument("target", choices=["euroscope", "sectorfile"])
+    rollback.add_argument("--to", default=None, metavar="VERSION",
+                          help="Sectorfile snapshot to restore (see snapshots)")
+    rollback.set_defaults(handler=cmd_rollback)
+
+    commands.add_parser("snapshots", help=cmd_snapshots.__doc__).set_defaults(handler=cmd_snapshots)
+
+    commands.add_parser("prepare-profiles", help=cmd_prepare_profiles.__doc__).set_defaults(
+        handler=cmd_prepare_profiles)
+
+    launch = commands.add_parser("launch", help=cmd_launch.__doc__)
+    launch.add_argument("--profile", default=None,
+                        help="Profile to launch (default: first available)")
+    launch.add_argument("--no-afv", action="store_true", help="Do not launch Audio for VATSIM")
+    launch.set_defaults(handler=cmd_launch)
+
+    provision_seats = commands.add_parser("provision-seats", help=cmd_provision_seats.__doc__)
+    provision_seats.add_argument("--store", type=Path, required=True,
+                                 help="Shared store directory, on the same volume as the seats")
+    provision_seats.add_argument("seats", type=Path, nargs="+", help="Root directories of the seats")
+    provision_seats.set_defaults(handler=cmd_provision_seats)
+
+    commands.add_parser("store-gc", help=cmd_store_gc.__doc__).set_defaults(handler=cmd_store_gc)
+
+    doctor = commands.add_parser("doctor", help=cmd_doctor.__doc__)
+    doctor.add_argument("--target", dest="targets", action="append",
+                        choices=["euroscope", "sectorfile", "seats"],
+                        help="Tree to verify, repeatable (default: all)")
+    doctor.add_argument("--store", type=Path,
+                        help="Shared store of the seats to verify (default: this root's store)")
+    doctor.add_argument("--repair", action="store_true",
+                        help="Restore missing and damaged files from the store")
+    doctor.set_defaults(handler=cmd_doctor)
+
+    export_bundle = commands.add_parser("export-bundle", help=cmd_export_bundle.__doc__)
+    export_bundle.add_argument("bundle", type=Path, help="Bundle file to create")
+    export_bundle.set_defaults(handler=cmd_export_bundle)
+
+    import_bundle = commands.add_parser("import-bundle", help=cmd_import_bundle.__doc__)
+    import_bundle.add_argument("bundle", type=Path, help="Bundle file to import")
+    import_bundle.set_defaults(handler=cmd_import_bundle)
+
+    return parser
+
+
+@contextlib.contextmanager
+def _stdout_to_stderr():
+    """Send everything written to stdout to stderr, including by child processes.
+
+    Redirecting sys.stdout alone leaves file descriptor 1 untouched, and
+    worker processes (MSI extraction) inherit that, so it is redirected too.
+    """
+    sys.stdout.flush()
+    try:
+        saved = os.dup(1)
+    except OSError:
+        # No stdout to protect (e.g. a windowed build without a console)
+        saved = None
+    else:
+        os.dup2(2, 1)
+
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            yield
+    finally:
+        if saved is not None:
+            os.dup2(saved, 1)
+            os.close(saved)
+
+
+def run(argv: Optional[list[str]] = None) -> int:
+    """Run a command and print its result as JSON.
+
+    The command runs in a worker thread, so Ctrl+C cancels it through its
+    cancellation token and lets it clean up instead of interrupting it
+    at an arbitrary point.
+
+    Args:
+        argv: Command-line arguments, defaults to sys.argv[1:]
+
+    Returns:
+        Process exit code
+    """
+    args = build_parser().parse_args(argv)
+    if args.mirror is not None:
+        settings.MIRROR_URLS = tuple(args.mirror)
+    context = AppContext(args.root)
+    cancel_token = CancellationToken()
+    outcome = {}
+
+    def execute() -> None:
+        try:
+            context.path_manager.ensure_base_directories()
+            outcome["result"] = args.handler(context, args, cancel_token)
+        except Exception as e:
+            outcome["result"] = {"ok": False, "error": str(e)}
+
+    interrupted = False
+
+    # Services report diagnostics with print(); keep stdout for the result
+    with _stdout_to_stderr():
+        worker = threading.Thread(target=execute, name=f"cli-{args.command}")
+        worker.start()
+
+        while worker.is_alive():
+            try:
+                worker.join(0.2)
+            except KeyboardInterrupt:
+                interrupted = True
+                cancel_token.cancel()
+
+    result = {"command": args.command, **outcome.get("result", {"ok": False})}
+    if interrupted:
+        result["cancelled"] = True
+    print(json.dumps(result, indent=2))
+
+    if interrupted:
+        return EXIT_INTERRUPTED
+    return EXIT_OK if result["ok"] else EXIT_FAILED
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -3,6 +3,7 @@
 import os
 import tempfile
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -14,16 +15,30 @@ class Settings:
     FIR_CODE: str = "EYVL"
 
     TEMP_DIR: str = "temp"
+    TRASH_DIR: str = "trash"
+    STAGING_DIR: str = "staging"
+    PREVIOUS_DIR: str = "previous"
+    STORE_DIR: str = "store"
+    MSI_INDEX_DIR: str = "msi_index"
+    MSI_INDEX_COUNT: int = 4  # Table indexes of recently installed MSI files to keep
+    EUROSCOPE_JOURNAL_FILE: str = "euroscope_install.journal"
     CONFIG_FILE: str = "config.json"
+    CONFIG_SAVE_DEBOUNCE: float = 0.5  # seconds
     EUROSCOPE_DIR: str = "Euroscope"
     SECTORFILE_DIR: str = "Sectorfile"
     CUSTOM_FILES_DIR: str = "Customfiles"
     ASSETS_DIR: str = "assets"
 
+    STARTUP_PROFILE_ENV: str = "SECTORFILE_INSTALLER_PROFILE"
+
     WINDOW_WIDTH: int = 640
     WINDOW_HEIGHT: int = 380
+    PROGRESS_UPDATE_FPS: int = 10
 
     EUROSCOPE_MSI_URL: str = "https://euroscope.hu/install/EuroScopeSetup.3.2.3.2.msi"
+    # Pinned hash of the MSI above. Mirrors are only used for the MSI when it is
+    # set, so it must be updated together with EUROSCOPE_MSI_URL.
+    EUROSCOPE_MSI_SHA256: str = ""
     EUROSCOPE_FONT_NAME: str = "EuroScope.ttf"
     EUROSCOPE_FONT_PATH: str = "C:/Windows/Fonts/EuroScope.ttf"
     EUROSCOPE_FOLDER_NAME_MAP = {
@@ -31,14 +46,29 @@ class Settings:
         "_E7043CA494204E24ABEE6401A7892467": "sounds",
     }
 
+    # Installed files that EuroScope or the launcher rewrite are never shared
+    STORE_PRIVATE_SUFFIXES = (".prf", ".asr", ".txt", ".ini", ".cfg", ".xml", ".json")
+    SECTORFILE_SNAPSHOT_COUNT: int = 3
+
+    # Profile fields and files the launcher fills in with the user's credentials
+    PROFILE_CREDENTIAL_FIELDS = ("realname", "certificate", "password", "rating")
+    HOPPIE_CODE_FILE: str = "TopSkyCPDLChoppieCode.txt"
+
+    AFV_DEFAULT_PATH: str = r"C:\AudioForVATSIM\AudioForVATSIM.exe"
+
     AERONAV_BASE_URL: str = "https://files.aero-nav.com"
     SECTORFILE_DOWNLOAD_TIMEOUT: int = 300  # seconds (5 minutes)
 
     GITHUB_REPO_OWNER: str = "Lithuania-vACC"
     GITHUB_REPO_NAME: str = "Sectorfile_Installer"
     GITHUB_API_BASE: str = "https://api.github.com"
+    UPDATE_CHECK_TIMEOUT: int = 5  # seconds
     UPDATE_ASSET_NAME: str = "main.dist.zip"
     UPDATE_TEMP_DIR: str = os.path.join(tempfile.gettempdir(), "sectorfile_installer_update")
 
+    # LAN mirrors tried in order before the origin, ";"-separated in the environment
+    MIRRORS_ENV: str = "SECTORFILE_INSTALLER_MIRRORS"
+    MIRROR_URLS: Optional[tuple] = None  # Overrides the environment when set
+
 
 settings = Settings()
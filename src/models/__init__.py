@@ -1,9 +1,12 @@
 """Data models for the application."""
 
-from models.enums import VatsimRating
+from models.enums import InstallPhase, VatsimRating
+from models.progress import ProgressEvent
 from models.user_config import UserConfig
 
 __all__ = [
+    "InstallPhase",
+    "ProgressEvent",
     "VatsimRating",
     "UserConfig",
 ]
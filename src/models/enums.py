@@ -31,3 +31,16 @@ class VatsimRating(str, Enum):
             "SUP": 10,
         }
         return ratings[self.value]
+
+
+class InstallPhase(str, Enum):
+    """Phases of an installation, in the order they run."""
+
+    PREPARE = "prepare"
+    WAIT = "wait"
+    DOWNLOAD = "download"
+    DECOMPRESS = "decompress"
+    EXTRACT = "extract"
+    COPY = "copy"
+    FONT = "font"
+    DONE = "done"
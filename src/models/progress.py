@@ -0,0 +1,27 @@
+"""Progress reporting models."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from models import InstallPhase
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """Snapshot of an operation's progress."""
+
+    message: str
+    phase: Optional[InstallPhase] = None
+    bytes_done: int = 0
+    bytes_total: int = 0
+    files_done: int = 0
+    files_total: int = 0
+    fraction: Optional[float] = None  # Overall progress 0..1, None if unknown
+    eta_seconds: Optional[float] = None
+
+    @property
+    def percent(self) -> Optional[int]:
+        """Get overall progress as a whole percentage, None if unknown."""
+        if self.fraction is None:
+            return None
+        return int(self.fraction * 100)
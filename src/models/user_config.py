@@ -19,15 +19,6 @@ class UserConfig:
     afv_path: str = ""
     theme_mode: str = "system"  # "light", "dark", or "system"
 
-    def __post_init__(self):
-        if not self.afv_path:
-            default_path = r"C:\AudioForVATSIM\AudioForVATSIM.exe"
-            try:
-                with open(default_path):
-                    self.afv_path = default_path
-            except FileNotFoundError:
-                pass
-
     def is_valid(self) -> bool:
         """Check if all required fields are filled."""
         return bool(
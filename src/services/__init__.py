@@ -1,18 +1,95 @@
-"""Service layer for the application."""
+"""Service layer for the application.
+
+Services that depend on heavy third-party packages (``requests``, ``pymsi``,
+``psutil``, ``zipfile``, ``packaging``) or on costly standard modules
+(``hashlib``, ``mmap``, ``concurrent.futures``) are loaded lazily on first
+attribute access so that importing this package does not delay the first
+window paint.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
 from services.path_manager import PathManager
+from services.tool_locator import ToolLocator
+from services.cancellation import CancellationToken, OperationCancelled
 from services.config_manager import ConfigManager
-from services.installer import Installer
-from services.launcher import Launcher
 from services.profile_manager import ProfileManager
-from services.sector_version_manager import SectorVersionManager
-from services.app_update_manager import AppUpdateManager
+from services.startup_profiler import StartupProfiler
+from services.progress_tracker import ProgressTracker
+from services.asset_manager import AssetManager
+from services.trash_reaper import TrashReaper
+from services.app_context import AppContext
+
+if TYPE_CHECKING:
+    from services.install_journal import InstallJournal
+    from services.blob_store import BlobStore
+    from services.tree_verifier import TreeVerifier
+    from services.staged_install import StagedInstall
+    from services.seat_provisioner import SeatProvisioner
+    from services.fresh_install import FreshInstall
+    from services.installer import Installer
+    from services.launcher import Launcher
+    from services.offline_bundle import OfflineBundle
+    from services.sector_version_manager import SectorVersionManager
+    from services.app_update_manager import AppUpdateManager
+
+_LAZY_SERVICES = {
+    "InstallJournal": "services.install_journal",
+    "BlobStore": "services.blob_store",
+    "TreeVerifier": "services.tree_verifier",
+    "StagedInstall": "services.staged_install",
+    "SeatProvisioner": "services.seat_provisioner",
+    "FreshInstall": "services.fresh_install",
+    "Installer": "services.installer",
+    "Launcher": "services.launcher",
+    "OfflineBundle": "services.offline_bundle",
+    "SectorVersionManager": "services.sector_version_manager",
+    "AppUpdateManager": "services.app_update_manager",
+}
 
 __all__ = [
+    "AppContext",
+    "AssetManager",
+    "BlobStore",
+    "CancellationToken",
     "ConfigManager",
+    "FreshInstall",
+    "InstallJournal",
     "Installer",
     "Launcher",
+    "OfflineBundle",
+    "OperationCancelled",
     "PathManager",
     "ProfileManager",
+    "ProgressTracker",
+    "SeatProvisioner",
     "SectorVersionManager",
+    "StagedInstall",
+    "StartupProfiler",
+    "ToolLocator",
+    "TrashReaper",
+    "TreeVerifier",
     "AppUpdateManager"
 ]
+
+
+def __getattr__(name: str):
+    """Import heavy services on first access.
+
+    Args:
+        name: Attribute name being looked up
+
+    Returns:
+        The requested service class
+    """
+    module_name = _LAZY_SERVICES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
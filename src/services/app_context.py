@@ -0,0 +1,90 @@
+"""Application context holding shared service instances."""
+
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from config import settings
+from services.asset_manager import AssetManager
+from services.config_manager import ConfigManager
+from services.path_manager import PathManager
+from services.profile_manager import ProfileManager
+from services.trash_reaper import TrashReaper
+
+if TYPE_CHECKING:
+    from services.app_update_manager import AppUpdateManager
+    from services.blob_store import BlobStore
+    from services.installer import Installer
+    from services.launcher import Launcher
+    from services.sector_version_manager import SectorVersionManager
+
+
+class AppContext:
+    """Constructs each service once, on first use, and shares it.
+
+    Services with heavy dependencies are imported only when first accessed,
+    so creating the context is cheap.
+    """
+
+    def __init__(self, root: Path | None = None):
+        """Initialize application context.
+
+        Args:
+            root: Root directory for the application. Defaults to current working directory.
+        """
+        self._root = root
+
+    @cached_property
+    def path_manager(self) -> PathManager:
+        """Get the shared path manager."""
+        return PathManager(self._root)
+
+    @cached_property
+    def config_manager(self) -> ConfigManager:
+        """Get the shared config manager."""
+        return ConfigManager(self.path_manager, debounce=settings.CONFIG_SAVE_DEBOUNCE)
+
+    @cached_property
+    def asset_manager(self) -> AssetManager:
+        """Get the shared asset manager."""
+        return AssetManager(self.path_manager)
+
+    @cached_property
+    def profile_manager(self) -> ProfileManager:
+        """Get the shared profile manager."""
+        return ProfileManager()
+
+    @cached_property
+    def trash_reaper(self) -> TrashReaper:
+        """Get the shared trash reaper."""
+        return TrashReaper(self.path_manager)
+
+    @cached_property
+    def blob_store(self) -> "BlobStore":
+        """Get the shared blob store."""
+        from services.blob_store import BlobStore
+        return BlobStore(self.path_manager.store)
+
+    @cached_property
+    def installer(self) -> "Installer":
+        """Get the shared installer."""
+        from services.installer import Installer
+        return Installer(self.path_manager, self.trash_reaper, self.blob_store)
+
+    @cached_property
+    def launcher(self) -> "Launcher":
+        """Get the shared launcher."""
+        from services.launcher import Launcher
+        return Launcher(self.path_manager)
+
+    @cached_property
+    def sector_version_manager(self) -> "SectorVersionManager":
+        """Get the shared sectorfile version manager."""
+        from services.sector_version_manager import SectorVersionManager
+        return SectorVersionManager(self.path_manager)
+
+    @cached_property
+    def update_manager(self) -> "AppUpdateManager":
+        """Get the shared application update manager."""
+        from services.app_update_manager import AppUpdateManager
+        return AppUpdateManager(self.path_manager)
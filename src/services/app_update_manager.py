@@ -1,6 +1,8 @@
 import os
 import sys
 import json
+import hashlib
+import shutil
 import zipfile
 import subprocess
 from pathlib import Path
@@ -10,12 +12,21 @@ from packaging import version as pkg_version
 import requests
 
 from config import settings
-from services import PathManager
+from services import CancellationToken, OperationCancelled, PathManager
+from services.mirrors import with_fallback
 
 
 class AppUpdateManager:
     """Manages application version checking and auto-updates."""
 
+    def __init__(self, path_manager: PathManager):
+        """Initialize application update manager.
+
+        Args:
+            path_manager: Path manager instance
+        """
+        self.path_manager = path_manager
+
     @staticmethod
     def get_current_version() -> str:
         """Get the current application version from settings.
@@ -26,17 +37,23 @@ class AppUpdateManager:
         return settings.APP_VERSION
 
     @staticmethod
-    def get_latest_release() -> Optional[dict]:
+    def get_latest_release(timeout: float = 10) -> Optional[dict]:
         """Fetch the latest release information from GitHub.
 
-        Queries the GitHub API to get the latest release, including version
-        and download URL for the main.dist.zip asset.
+        Queries the GitHub API to get the latest release, including version,
+        download URL and pinned SHA-256 of the main.dist.zip asset. The
+        release metadata is never taken from a mirror, since it carries the
+        hash that mirrored downloads are checked against.
+
+        Args:
+            timeout: Request timeout in seconds
 
         Returns:
             Dictionary with keys:
                 - version (str): Version string (e.g., "2.1.0")
                 - tag_name (str): Git tag (e.g., "v2.1.0")
                 - download_url (str): Direct download URL for main.dist.zip
+                - sha256 (str|None): SHA-256 of main.dist.zip published by GitHub
                 - release_url (str): GitHub release page URL
             Returns None if API call fails or release not found
 
@@ -50,12 +67,8 @@ class AppUpdateManager:
         )
 
         try:
-            response = requests.get(url, timeout=10)
-
-            if response.status_code != 200:
-                print(f"GitHub API returned status {response.status_code}")
-                return None
-
+            response = requests.get(url, timeout=timeout)
+            response.raise_for_status()
             data = response.json()
 
             tag_name = data.get("tag_name", "")
@@ -63,10 +76,14 @@ class AppUpdateManager:
 
             assets = data.get("assets", [])
             download_url = None
+            sha256 = None
 
             for asset in assets:
                 if asset.get("name") == settings.UPDATE_ASSET_NAME:
                     download_url = asset.get("browser_download_url")
+                    digest = asset.get("digest") or ""
+                    if digest.startswith("sha256:"):
+                        sha256 = digest[len("sha256:"):]
                     break
 
             if not download_url:
@@ -77,6 +94,7 @@ class AppUpdateManager:
                 "version": version_str,
                 "tag_name": tag_name,
                 "download_url": download_url,
+                "sha256": sha256,
                 "release_url": data.get("html_url", ""),
             }
 
@@ -88,12 +106,15 @@ class AppUpdateManager:
             return None
 
     @staticmethod
-    def is_update_available() -> tuple[bool, Optional[dict]]:
+    def is_update_available(timeout: float = 10) -> tuple[bool, Optional[dict]]:
         """Check if a newer application version is available.
 
         Compares the current version with the latest GitHub release version
         using semantic versioning comparison.
 
+        Args:
+            timeout: Request timeout in seconds for the GitHub API call
+
         Returns:
             Tuple of (is_available, release_info):
                 - is_available (bool): True if update is available
@@ -101,7 +122,7 @@ class AppUpdateManager:
         """
         try:
             current_version = AppUpdateManager.get_current_version()
-            latest_release = AppUpdateManager.get_latest_release()
+            latest_release = AppUpdateManager.get_latest_release(timeout)
 
             if not latest_release:
                 return False, None
@@ -121,16 +142,26 @@ class AppUpdateManager:
             return False, None
 
     @staticmethod
-    def download_update(download_url: str) -> str:
-        """Download the update zip file from GitHub.
+    def download_update(
+            download_url: str,
+            cancel_token: Optional[CancellationToken] = None,
+            sha256: Optional[str] = None,
+    ) -> str:
+        """Download the update zip file from the first mirror that has it, or GitHub.
+
+        Mirrors are only used when the release publishes a SHA-256 for the
+        zip file; without one the update is downloaded from GitHub only.
 
         Args:
             download_url: Direct download URL for main.dist.zip
+            cancel_token: Optional token checked for every downloaded chunk
+            sha256: Pinned SHA-256 the download must match, if known
 
         Returns:
             Path to downloaded zip file
 
         Raises:
+            OperationCancelled: If cancelled; the partial download is removed
             Exception: If download fails
         """
         # Create temp directory if it doesn't exist
@@ -138,47 +169,71 @@ class AppUpdateManager:
 
         zip_path = os.path.join(settings.UPDATE_TEMP_DIR, "main.dist.zip")
 
-        try:
-            print(f"Downloading update from {download_url}...")
-            response = requests.get(download_url, stream=True, timeout=60)
+        def fetch(source: str) -> str:
+            print(f"Downloading update from {source}...")
+            response = requests.get(source, stream=True, timeout=60)
             response.raise_for_status()
 
+            digest = hashlib.sha256()
             with open(zip_path, "wb") as f:
                 for chunk in response.iter_content(chunk_size=8192):
+                    if cancel_token:
+                        cancel_token.raise_if_cancelled()
                     if chunk:
                         f.write(chunk)
+                        digest.update(chunk)
+
+            if sha256 and digest.hexdigest() != sha256:
+                os.remove(zip_path)
+                raise ValueError(f"Update from {source} does not match the pinned SHA-256")
+
+            return zip_path
+
+        try:
+            with_fallback(download_url, fetch, verified=bool(sha256))
 
             print(f"Download complete: {zip_path}")
             return zip_path
 
+        except OperationCancelled:
+            print("Update download cancelled.")
+            if os.path.exists(zip_path):
+                os.remove(zip_path)
+            raise
         except Exception as e:
             raise Exception(f"Failed to download update: {e}")
 
     @staticmethod
-    def extract_update(zip_path: str) -> str:
+    def extract_update(
+            zip_path: str, cancel_token: Optional[CancellationToken] = None
+    ) -> str:
         """Extract the downloaded update zip file.
 
         Args:
             zip_path: Path to the downloaded zip file
+            cancel_token: Optional token checked for every extracted file
 
         Returns:
             Path to the extracted main.dist directory
 
         Raises:
+            OperationCancelled: If cancelled; the partial extraction is removed
             Exception: If extraction fails
         """
         extract_dir = os.path.join(settings.UPDATE_TEMP_DIR, "new_version")
 
         try:
             if os.path.exists(extract_dir):
-                import shutil
                 shutil.rmtree(extract_dir)
 
             os.makedirs(extract_dir, exist_ok=True)
 
             print(f"Extracting update to {extract_dir}...")
             with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(extract_dir)
+                for member in zip_ref.infolist():
+                    if cancel_token:
+                        cancel_token.raise_if_cancelled()
+                    zip_ref.extract(member, extract_dir)
 
             main_dist_path = os.path.join(extract_dir, "main.dist")
             if os.path.exists(main_dist_path) and os.path.isdir(main_dist_path):
@@ -188,6 +243,10 @@ class AppUpdateManager:
                 print(f"Extraction complete: {extract_dir}")
                 return extract_dir
 
+        except OperationCancelled:
+            print("Update extraction cancelled.")
+            shutil.rmtree(extract_dir, ignore_errors=True)
+            raise
         except Exception as e:
             raise Exception(f"Failed to extract update: {e}")
 
@@ -204,8 +263,7 @@ class AppUpdateManager:
         else:
             return str(Path(__file__).parent.parent / "assets")
 
-    @staticmethod
-    def launch_updater_and_exit(new_version_path: str, page=None):
+    def launch_updater_and_exit(self, new_version_path: str, page=None):
         """Launch the updater script and exit the application.
 
         This function will start the updater batch script, which will:
@@ -222,7 +280,7 @@ class AppUpdateManager:
             This function exits the application via page.window.destroy() if page
             is provided, otherwise uses sys.exit(0)
         """
-        install_dir = PathManager().root
+        install_dir = self.path_manager.root
         exe_path = install_dir / "main.exe"
         updater_script = ".\\updater.bat"
 
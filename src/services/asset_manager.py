@@ -0,0 +1,88 @@
+"""Embedded asset management service."""
+
+import zlib
+from functools import lru_cache
+from pathlib import Path
+
+from services import PathManager
+
+
+class AssetManager:
+    """Materialises packed assets into the assets directory served by Flet.
+
+    Images referenced by ``src`` are loaded by the Flet client from the assets
+    directory and cached there, so switching between them only sends the new
+    reference instead of the whole base64 payload.
+    """
+
+    def __init__(self, path_manager: PathManager):
+        """Initialize asset manager.
+
+        Args:
+            path_manager: Path manager instance
+        """
+        self.path_manager = path_manager
+
+    def get_src(self, name: str) -> str:
+        """Get the Flet ``src`` reference for an embedded asset.
+
+        Args:
+            name: Asset file name (e.g., 'vacc_lithuania_white_transparent.png')
+
+        Returns:
+            Path of the asset relative to the assets directory
+        """
+        self.get_path(name)
+        return f"/{name}"
+
+    def get_path(self, name: str) -> Path:
+        """Get the filesystem path of an embedded asset, writing it on first use.
+
+        Args:
+            name: Asset file name (e.g., 'vacc_lithuania_white_transparent.png')
+
+        Returns:
+            Path to the asset file
+
+        Raises:
+            KeyError: If the asset is not embedded in the application
+        """
+        return self._materialise(self.path_manager.assets, name)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _materialise(assets_dir: Path, name: str) -> Path:
+        data = AssetManager.decode(name)
+        path = assets_dir / name
+
+        # Rewrite only if missing or different from the embedded version
+        if not path.is_file() or path.stat().st_size != len(data) or path.read_bytes() != data:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+
+        return path
+
+    @staticmethod
+    def decode(name: str) -> bytes:
+        """Get the content of an embedded asset from the asset pack.
+
+        Args:
+            name: Asset file name (e.g., 'vacc_lithuania_white_transparent.png')
+
+        Returns:
+            Raw asset bytes
+
+        Raises:
+            KeyError: If the asset is not embedded in the application
+        """
+        from assets.asset_pack import ASSET_INDEX
+
+        offset, size = ASSET_INDEX[name]
+        return AssetManager._load_pack()[offset:offset + size]
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _load_pack() -> bytes:
+        """Import and decompress the asset pack once per process."""
+        from assets.asset_pack import ASSET_PACK
+        return zlib.decompress(ASSET_PACK)
@@ -0,0 +1,454 @@
+"""Content-addressed store of read-only files and the trees built from them."""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import Callable, Iterator, Optional
+
+from config import settings
+from services.install_journal import file_sha256
+from services.trash_reaper import remove_file
+
+READ_ONLY = stat.S_IREAD | stat.S_IRGRP | stat.S_IROTH
+
+# Seconds between attempts to take the store lock held by another process
+LOCK_RETRY_INTERVAL = 0.1
+
+
+def is_rewritten(relative: str) -> bool:
+    """Check whether an installed file may be rewritten in place and so must not be shared.
+
+    Args:
+        relative: Path relative to the installed tree
+
+    Returns:
+        True if the file type is listed in settings.STORE_PRIVATE_SUFFIXES
+    """
+    return PurePosixPath(relative).suffix.lower() in settings.STORE_PRIVATE_SUFFIXES
+
+
+class BlobStore:
+    """Stores each distinct file content once and materialises trees from it.
+
+    A file is stored as a read-only blob named by the SHA-256 of its content,
+    so identical files across trees and versions share one blob. A tree is a
+    manifest mapping relative paths to blob digests, itself named by the
+    SHA-256 of the manifest. Trees are materialised with hardlinks to the
+    blobs, falling back to symlinks and then to copies where links are not
+    possible, so materialising costs almost no time or disk space.
+
+    Named refs point at the trees in use (such as the active and previous
+    installations). Trees without a ref, and blobs that no referenced tree
+    and no hardlink outside the store use, are removed by collect_garbage().
+    Changes to the store are serialised across threads and processes (such
+    as the CLI's store-gc) by a lock file, and a new tree can be given a
+    ref in the same locked step, so garbage collection never sees it
+    unreferenced.
+
+    Layout:
+        blobs/ab/abcdef...   file contents
+        trees/<digest>.json  tree manifests
+        index/<digest>.idx   verification index of installed trees
+        refs.json            ref name -> tree digest
+        lock                 held while the store is being changed
+    """
+
+    def __init__(self, root: Path):
+        """Initialize blob store.
+
+        Args:
+            root: Store directory
+        """
+        self.root = root
+        self.blobs = root / "blobs"
+        self.trees = root / "trees"
+        self.indexes = root / "index"
+        self.refs_file = root / "refs.json"
+        self._lock = threading.RLock()
+        self._depth = 0
+
+    def blob_path(self, digest: str) -> Path:
+        """Get the path of a blob.
+
+        Args:
+            digest: SHA-256 hex digest of the content
+
+        Returns:
+            Path of the blob file
+        """
+        return self.blobs / digest[:2] / digest
+
+    def index_path(self, digest: str) -> Path:
+        """Get the path of a tree's verification index.
+
+        Args:
+            digest: Tree digest
+
+        Returns:
+            Path of the index file
+        """
+        return self.indexes / f"{digest}.idx"
+
+    def add_file(self, path: Path, digest: Optional[str] = None) -> str:
+        """Add a file's content to the store, unless it is already stored.
+
+        Args:
+            path: File to add
+            digest: SHA-256 of the file if already known
+
+        Returns:
+            SHA-256 hex digest of the content
+        """
+        digest = digest or file_sha256(path)
+        blob = self.blob_path(digest)
+
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            partial = blob.with_name(f"{digest}.{uuid.uuid4().hex}.tmp")
+            shutil.copyfile(path, partial)
+            os.chmod(partial, READ_ONLY)
+            os.replace(partial, blob)
+
+        return digest
+
+    def ingest(
+        self,
+        directory: Path,
+        private: Optional[Callable[[str], bool]] = None,
+        ref: Optional[str] = None,
+    ) -> str:
+        """Deduplicate a freshly installed tree against the store, in place.
+
+        Each file whose content is already stored is replaced by a hardlink
+        to the blob, freeing its space; a file with new content becomes the
+        blob itself, without copying. Files selected by private stay
+        independent writable files and are stored as copies.
+
+        Args:
+            directory: Installed tree to deduplicate
+            private: Optional predicate selecting relative paths to keep private
+            ref: Optional ref to point at the tree
+
+        Returns:
+            Digest identifying the tree
+        """
+        with self.locked():
+            manifest = {}
+
+            for item in sorted(directory.rglob("*")):
+                if not item.is_file() or item.is_symlink():
+                    continue
+
+                relative = item.relative_to(directory).as_posix()
+                digest = file_sha256(item)
+                manifest[relative] = digest
+                blob = self.blob_path(digest)
+
+                if private and private(relative):
+                    self.add_file(item, digest)
+                elif blob.exists():
+                    self._replace_with_link(blob, item)
+                else:
+                    self._adopt(item, blob)
+
+            return self._save_referenced(manifest, ref)
+
+    def add_tree(self, source: Path, ref: Optional[str] = None) -> str:
+        """Add every file of a directory tree and record the tree's manifest.
+
+        Args:
+            source: Directory to add
+            ref: Optional ref to point at the tree
+
+        Returns:
+            Digest identifying the tree
+        """
+        with self.locked():
+            manifest = {
+                item.relative_to(source).as_posix(): self.add_file(item)
+                for item in sorted(source.rglob("*"))
+                if item.is_file()
+            }
+            return self._save_referenced(manifest, ref)
+
+    def _save_referenced(self, manifest: dict[str, str], ref: Optional[str]) -> str:
+        """Record a tree manifest and point a ref at it, under the store lock."""
+        digest = self.save_tree(manifest)
+        if ref:
+            self.update_refs({ref: digest})
+        return digest
+
+    def save_tree(self, manifest: dict[str, str]) -> str:
+        """Record a tree manifest.
+
+        Args:
+            manifest: Mapping of relative path to blob digest
+
+        Returns:
+            Digest identifying the tree
+        """
+        data = json.dumps(manifest, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+
+        path = self.trees / f"{digest}.json"
+        if not path.exists():
+            self.trees.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(f"{digest}.{uuid.uuid4().hex}.tmp")
+            partial.write_bytes(data)
+            os.replace(partial, path)
+
+        return digest
+
+    def load_tree(self, digest: str) -> dict[str, str]:
+        """Load a tree manifest.
+
+        Args:
+            digest: Tree digest
+
+        Returns:
+            Mapping of relative path to blob digest
+
+        Raises:
+            FileNotFoundError: If the tree is not in the store
+        """
+        return json.loads((self.trees / f"{digest}.json").read_text(encoding="utf-8"))
+
+    def ref(self, name: str) -> Optional[str]:
+        """Get the tree a ref points at.
+
+        Args:
+            name: Ref name
+
+        Returns:
+            Tree digest, or None if the ref does not exist
+        """
+        return self.refs().get(name)
+
+    def refs(self) -> dict[str, str]:
+        """Get all refs.
+
+        Returns:
+            Mapping of ref name to tree digest
+        """
+        try:
+            return json.loads(self.refs_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def update_refs(self, changes: dict[str, Optional[str]]) -> None:
+        """Atomically set or remove refs.
+
+        Args:
+            changes: Mapping of ref name to tree digest, or None to remove the ref
+        """
+        with self.locked():
+            refs = self.refs()
+            for name, digest in changes.items():
+                if digest is None:
+                    refs.pop(name, None)
+                else:
+                    refs[name] = digest
+
+            self.root.mkdir(parents=True, exist_ok=True)
+            partial = self.refs_file.with_name(f"refs.{uuid.uuid4().hex}.tmp")
+            partial.write_text(json.dumps(refs, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(partial, self.refs_file)
+
+    def collect_garbage(self) -> dict[str, int]:
+        """Remove trees without a ref and blobs that nothing uses any more.
+
+        A blob is kept while a referenced tree lists it, or while a hardlink
+        outside the store still points at it (for example a discarded tree
+        the trash reaper has not deleted yet).
+
+        Returns:
+            Number of removed trees and blobs, and the bytes freed
+        """
+        with self.locked():
+            live_trees = set(self.refs().values())
+            referenced = set()
+            removed_trees = 0
+
+            for manifest_path in self.trees.glob("*.json") if self.trees.exists() else []:
+                if manifest_path.stem in live_trees:
+                    referenced.update(self.load_tree(manifest_path.stem).values())
+                else:
+                    manifest_path.unlink()
+                    self.index_path(manifest_path.stem).unlink(missing_ok=True)
+                    removed_trees += 1
+
+            removed_blobs = 0
+            freed_bytes = 0
+
+            for blob in self.blobs.glob("*/*") if self.blobs.exists() else []:
+                if blob.name in referenced:
+                    continue
+
+                info = blob.stat()
+                if info.st_nlink > 1:
+                    continue
+
+                remove_file(blob)
+                removed_blobs += 1
+                freed_bytes += info.st_size
+
+            return {"trees": removed_trees, "blobs": removed_blobs, "bytes": freed_bytes}
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the store lock, which is shared with other processes and reentrant.
+
+        Yields:
+            Nothing; the lock is released when the block exits
+        """
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                return
+
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(self.root / "lock", "a+b") as lock_file:
+                _lock_file(lock_file)
+                self._depth = 1
+                try:
+                    yield
+                finally:
+                    self._depth = 0
+                    _unlock_file(lock_file)
+
+    def materialise(
+        self,
+        digest: str,
+        destination: Path,
+        private: Optional[Callable[[str], bool]] = None,
+    ) -> dict[str, int]:
+        """Build a tree in a directory by linking it to the stored blobs.
+
+        Linked files share the read-only blob; files selected by private are
+        copied instead, so they can be modified independently.
+
+        Args:
+            digest: Tree digest
+            destination: Empty directory to build the tree in
+            private: Optional predicate selecting relative paths to copy
+
+        Returns:
+            Number of files that were hardlinked, symlinked and copied
+        """
+        counts = {"hardlinked": 0, "symlinked": 0, "copied": 0}
+
+        for relative, blob_digest in self.load_tree(digest).items():
+            blob = self.blob_path(blob_digest)
+            target = destination / relative
+            target.parent.mkdir(parents=True, exist_ok=True)
+
+            if private and private(relative):
+                shutil.copyfile(blob, target)
+                counts["copied"] += 1
+                continue
+
+            counts[self.link(blob, target)] += 1
+
+        return counts
+
+    @staticmethod
+    def _replace_with_link(blob: Path, path: Path) -> None:
+        """Replace a file by a hardlink to an identical blob, keeping the file on failure.
+
+        Args:
+            blob: Blob with the same content
+            path: File to replace
+        """
+        os.chmod(blob, READ_ONLY)
+        partial = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            os.link(blob, partial)
+        except OSError:
+            return
+        os.replace(partial, path)
+
+    def _adopt(self, path: Path, blob: Path) -> None:
+        """Make a file the blob for its content, copying it if it cannot be linked.
+
+        Args:
+            path: File to adopt
+            blob: Blob path for the file's content
+        """
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(path, blob)
+        except OSError:
+            self.add_file(path, blob.name)
+            return
+        os.chmod(blob, READ_ONLY)
+
+    @staticmethod
+    def link(blob: Path, target: Path) -> str:
+        """Link a target path to a blob, using the cheapest method available.
+
+        Args:
+            blob: Blob file
+            target: Path to create
+
+        Returns:
+            Name of the method used
+        """
+        # Deleting a read-only link on Windows clears the flag shared with the blob
+        os.chmod(blob, READ_ONLY)
+
+        try:
+            os.link(blob, target)
+            return "hardlinked"
+        except OSError:
+            pass
+
+        try:
+            os.symlink(blob, target)
+            return "symlinked"
+        except OSError:
+            pass
+
+        shutil.copyfile(blob, target)
+        return "copied"
+
+
+def _lock_file(lock_file) -> None:
+    """Take an exclusive lock on an open file, waiting for other processes."""
+    if os.name == "nt":
+        import msvcrt
+
+        lock_file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                time.sleep(LOCK_RETRY_INTERVAL)
+    else:
+        import fcntl
+
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(lock_file) -> None:
+    """Release a lock taken by _lock_file()."""
+    if os.name == "nt":
+        import msvcrt
+
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,73 @@
+"""Cooperative cancellation for long-running operations."""
+
+import threading
+import time
+from typing import Optional
+
+# Seconds between checks of the parent token while waiting on a linked token
+LINK_POLL_INTERVAL = 0.1
+
+
+class OperationCancelled(Exception):
+    """Raised when an operation is stopped through its cancellation token."""
+
+
+class CancellationToken:
+    """Thread-safe flag used to request that an operation stops."""
+
+    def __init__(self, event=None, parent: Optional["CancellationToken"] = None):
+        """Initialize cancellation token.
+
+        Args:
+            event: Optional event to share, such as a multiprocessing.Event
+                signalling a worker process; a new threading.Event otherwise
+            parent: Optional token whose cancellation also cancels this one
+        """
+        self._event = event if event is not None else threading.Event()
+        self._parent = parent
+
+    def linked(self) -> "CancellationToken":
+        """Get a token that is cancelled with this one, but can also be cancelled on its own.
+
+        Returns:
+            New linked token
+        """
+        return CancellationToken(parent=self)
+
+    def cancel(self) -> None:
+        """Request cancellation."""
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Check whether cancellation has been requested."""
+        return self._event.is_set() or (self._parent is not None and self._parent.is_cancelled)
+
+    def raise_if_cancelled(self) -> None:
+        """Raise OperationCancelled if cancellation has been requested.
+
+        Raises:
+            OperationCancelled: If the token has been cancelled
+        """
+        if self.is_cancelled:
+            raise OperationCancelled("Operation cancelled")
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep until the timeout elapses or cancellation is requested.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if cancellation was requested, False if the timeout elapsed
+        """
+        if self._parent is None:
+            return self._event.wait(timeout)
+
+        deadline = time.monotonic() + timeout
+        while not self.is_cancelled:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._event.wait(min(remaining, LINK_POLL_INTERVAL))
+        return True
@@ -1,24 +1,52 @@
 """Configuration management service."""
 
+import atexit
 import json
-from pathlib import Path
+import os
+import threading
+import weakref
 from typing import Optional
 
 from models import UserConfig
-from services import PathManager
+from services import PathManager, ToolLocator
+
+# Config managers whose pending changes are flushed on exit, without keeping them alive
+_open_managers: "weakref.WeakSet[ConfigManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_managers() -> None:
+    """Flush the pending changes of every config manager still in use."""
+    for manager in list(_open_managers):
+        manager.flush()
 
 
 class ConfigManager:
-    """Manages user configuration persistence."""
+    """Manages user configuration persistence.
 
-    def __init__(self, path_manager: PathManager):
+    Writes are atomic (temporary file plus os.replace) and skipped when the
+    serialised configuration is unchanged. With a non-zero debounce, saves are
+    written behind: rapid changes within the debounce window are coalesced
+    into a single write. Pending changes are flushed on exit, and a failed
+    write leaves them pending for the next flush.
+    """
+
+    def __init__(self, path_manager: PathManager, debounce: float = 0.0):
         """Initialize config manager.
 
         Args:
             path_manager: Path manager instance
+            debounce: Seconds to wait for further changes before writing. 0 writes immediately.
         """
         self.path_manager = path_manager
+        self.debounce = debounce
         self._config: Optional[UserConfig] = None
+        self._last_written: Optional[str] = None
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+
+        _open_managers.add(self)
 
     @property
     def config(self) -> UserConfig:
@@ -30,9 +58,9 @@ class ConfigManager:
     def load(self) -> UserConfig:
         """Load configuration from disk.
 
-        On first startup (when config file doesn't exist), this will attempt to
-        auto-detect Audio for VATSIM at its default installation location and
-        populate the afv_path setting automatically.
+        When no AFV path is configured, Audio for VATSIM is auto-detected at
+        its default installation location. On first startup (when config file
+        doesn't exist) the detected path is saved.
 
         Returns:
             UserConfig instance (default if file doesn't exist)
@@ -42,10 +70,10 @@ class ConfigManager:
         if not config_file.exists():
             config = UserConfig()
 
-            default_afv_path = Path(r"C:\AudioForVATSIM\AudioForVATSIM.exe")
-            if default_afv_path.exists():
-                config.afv_path = str(default_afv_path)
-                print(f"Auto-detected Audio for VATSIM at {default_afv_path}")
+            afv_path = ToolLocator.find_afv()
+            if afv_path:
+                config.afv_path = afv_path
+                print(f"Auto-detected Audio for VATSIM at {afv_path}")
 
                 self._config = config
                 self.save(config)
@@ -53,32 +81,88 @@ class ConfigManager:
             return config
 
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return UserConfig.from_dict(data)
+            content = config_file.read_text(encoding="utf-8")
+            config = UserConfig.from_dict(json.loads(content))
+            self._last_written = content
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             print(f"Error loading config: {e}")
-            return UserConfig()
+            config = UserConfig()
+
+        if not config.afv_path:
+            config.afv_path = ToolLocator.find_afv() or ""
+
+        return config
 
     def save(self, config: Optional[UserConfig] = None) -> None:
         """Save configuration to disk.
 
+        In write-behind mode the write is scheduled after the debounce window
+        instead of happening immediately.
+
         Args:
             config: Configuration to save. Uses current config if None.
         """
-        if config is not None:
-            self._config = config
+        with self._lock:
+            if config is not None:
+                self._config = config
 
-        if self._config is None:
-            return
+            if self._config is None:
+                return
 
-        self.path_manager.config_file.parent.mkdir(parents=True, exist_ok=True)
+            self._dirty = True
 
-        try:
-            with open(self.path_manager.config_file, "w", encoding="utf-8") as f:
-                json.dump(self._config.to_dict(), f, indent=2)
-        except (OSError, TypeError) as e:
-            print(f"Error saving config: {e}")
+            if self.debounce <= 0:
+                self.flush()
+                return
+
+            if self._timer is not None:
+                self._timer.cancel()
+
+            self._timer = threading.Timer(self.debounce, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write any pending configuration changes to disk immediately."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            if not self._dirty or self._config is None:
+                return
+
+            try:
+                content = json.dumps(self._config.to_dict(), indent=2)
+            except TypeError as e:
+                print(f"Error saving config: {e}")
+                return
+
+            if content == self._last_written:
+                self._dirty = False
+                return
+
+            config_file = self.path_manager.config_file
+            temp_file = config_file.with_name(config_file.name + ".tmp")
+
+            try:
+                config_file.parent.mkdir(parents=True, exist_ok=True)
+
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                os.replace(temp_file, config_file)
+                self._last_written = content
+                self._dirty = False
+            except OSError as e:
+                print(f"Error saving config: {e}")
+
+    def close(self) -> None:
+        """Write any pending changes and stop flushing them on exit."""
+        self.flush()
+        _open_managers.discard(self)
 
     def update(self, **kwargs) -> None:
         """Update configuration fields and save.
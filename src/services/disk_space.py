@@ -0,0 +1,67 @@
+"""Disk space accounting for installations."""
+
+import errno
+import shutil
+from pathlib import Path
+from typing import Iterable
+
+# Allocation unit files are rounded up to when estimating the space they take
+CLUSTER_SIZE = 4096
+
+
+def tree_file_sizes(path: Path) -> list[int]:
+    """Get the sizes of the files in a file or directory tree on disk.
+
+    Args:
+        path: File or directory path
+
+    Returns:
+        Size of each file in bytes
+    """
+    if path.is_file():
+        return [path.stat().st_size]
+    return [item.stat().st_size for item in path.rglob("*") if item.is_file()]
+
+
+def tree_size(path: Path) -> int:
+    """Get the total size of a file or directory tree on disk.
+
+    Args:
+        path: File or directory path
+
+    Returns:
+        Total size in bytes
+    """
+    return sum(tree_file_sizes(path))
+
+
+def allocated_size(sizes: Iterable[int]) -> int:
+    """Get the disk space files take, with each rounded up to whole clusters.
+
+    Args:
+        sizes: File sizes in bytes
+
+    Returns:
+        Space required in bytes
+    """
+    return sum(-(-size // CLUSTER_SIZE) * CLUSTER_SIZE for size in sizes)
+
+
+def ensure_free_space(directory: Path, required: int, action: str) -> None:
+    """Refuse an operation early if its volume does not have the space it needs.
+
+    Args:
+        directory: Existing directory on the volume written to
+        required: Bytes the operation will write
+        action: Description of the operation for the error message
+
+    Raises:
+        OSError: With errno ENOSPC if there is not enough free space
+    """
+    free = shutil.disk_usage(directory).free
+    if required > free:
+        raise OSError(
+            errno.ENOSPC,
+            f"Not enough disk space to {action}: {required / 2**20:.0f} MB needed, "
+            f"{free / 2**20:.0f} MB free",
+        )
@@ -0,0 +1,287 @@
+"""Fresh installation of EuroScope and the sectorfile as a dependency graph of stages."""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional
+
+from models import InstallPhase, ProgressEvent
+from services import CancellationToken, OperationCancelled, ProgressTracker
+
+if TYPE_CHECKING:
+    from services import Installer
+
+
+@dataclass(frozen=True)
+class Stage:
+    """A unit of work that runs once the stages it depends on have succeeded."""
+
+    name: str
+    run: Callable[[], bool]
+    after: tuple[str, ...] = ()
+    wanted: bool = False  # The stage's own result is wanted, not only as a dependency
+    cancel_token: Optional[CancellationToken] = None  # Stops the stage once it is not needed
+
+
+def _needed_stages(stages: list[Stage], results: dict[str, bool]) -> set[str]:
+    """Get the stages whose result can still be used.
+
+    A stage is needed if it can still succeed, and it is wanted, has no
+    dependents, or has a dependent that is itself needed.
+
+    Args:
+        stages: All stages
+        results: Results of the finished stages
+
+    Returns:
+        Names of the needed stages
+    """
+    by_name = {stage.name: stage for stage in stages}
+    viable = {}
+
+    def is_viable(name: str) -> bool:
+        if name not in viable:
+            viable[name] = results.get(name) is not False and all(
+                is_viable(dep) for dep in by_name[name].after
+            )
+        return viable[name]
+
+    needed = set()
+    changed = True
+    while changed:
+        changed = False
+        for stage in stages:
+            if stage.name in needed or not is_viable(stage.name):
+                continue
+            dependents = [other.name for other in stages if stage.name in other.after]
+            if stage.wanted or not dependents or any(name in needed for name in dependents):
+                needed.add(stage.name)
+                changed = True
+    return needed
+
+
+def run_stages(stages: list[Stage]) -> dict[str, bool]:
+    """Run stages concurrently, each as soon as its dependencies have succeeded.
+
+    A stage that fails or raises causes the stages depending on it to be
+    skipped; independent stages keep running. Stages left without any use
+    for their result are skipped too, and running ones are stopped through
+    their cancel token.
+
+    Args:
+        stages: Stages to run
+
+    Returns:
+        Mapping of stage name to whether it succeeded; skipped stages are False
+
+    Raises:
+        ValueError: If a stage depends on an unknown stage, or dependencies are cyclic
+    """
+    names = {stage.name for stage in stages}
+    for stage in stages:
+        unknown = set(stage.after) - names
+        if unknown:
+            raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {sorted(unknown)}")
+
+    results: dict[str, bool] = {}
+    pending = {stage.name: stage for stage in stages}
+    running = {}
+    needed = _needed_stages(stages, results)
+
+    with ThreadPoolExecutor(max_workers=len(stages) or 1) as pool:
+        while pending or running:
+            changed = True
+            while changed:
+                changed = False
+                for name, stage in list(pending.items()):
+                    if any(results.get(dep) is False for dep in stage.after) or name not in needed:
+                        print(f"Skipping stage '{name}'")
+                        results[name] = False
+                    elif all(results.get(dep) for dep in stage.after):
+                        running[pool.submit(stage.run)] = name
+                    else:
+                        continue
+                    del pending[name]
+                    changed = True
+
+            if not running:
+                if pending:
+                    raise ValueError(f"Stages have cyclic dependencies: {sorted(pending)}")
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = bool(future.result())
+                except OperationCancelled:
+                    results[name] = False
+                except Exception as e:
+                    print(f"Stage '{name}' failed: {e}")
+                    results[name] = False
+
+            if False in results.values():
+                needed = _needed_stages(stages, results)
+                for future, name in running.items():
+                    stage = next(stage for stage in stages if stage.name == name)
+                    if name not in needed and stage.cancel_token is not None:
+                        print(f"Stopping stage '{name}', its result can no longer be used")
+                        stage.cancel_token.cancel()
+
+    return results
+
+
+class _ProgressMerger:
+    """Combines progress of concurrently running lanes into one event stream."""
+
+    def __init__(self, callback: Optional[Callable[[ProgressEvent], None]], labels: list[str]):
+        self.callback = callback
+        self._events: dict[str, Optional[ProgressEvent]] = {label: None for label in labels}
+        self._lock = threading.Lock()
+
+    def lane(self, label: str) -> Callable[[ProgressEvent], None]:
+        """Get the progress callback of one lane."""
+        return lambda event: self._on_event(label, event)
+
+    def _on_event(self, label: str, event: ProgressEvent) -> None:
+        with self._lock:
+            self._events[label] = event
+            events = [e for e in self._events.values() if e is not None]
+
+            fractions = [e.fraction for e in self._events.values() if e and e.fraction is not None]
+            fraction = sum(fractions) / len(self._events) if fractions else None
+
+            # The remaining time is only known once every unfinished lane estimates it
+            etas = [e.eta_seconds for e in events if e.fraction != 1.0]
+            eta_seconds = max(etas) if etas and None not in etas else None
+
+            merged = ProgressEvent(
+                message="\n".join(
+                    f"{label}: {e.message}" for label, e in self._events.items() if e is not None
+                ),
+                phase=event.phase,
+                fraction=fraction,
+                eta_seconds=eta_seconds,
+            )
+
+        if self.callback:
+            self.callback(merged)
+
+
+class FreshInstall:
+    """Installs EuroScope and the sectorfile with independent stages overlapped.
+
+    The EuroScope MSI download and extraction run while the user logs in to
+    AeroNav and downloads the sectorfile zip, which is extracted as soon as
+    it appears. The two lanes only join for the Customfiles overlay, which
+    swaps the finished sectorfile into place:
+
+        euroscope ─────────────────────────────────┐
+        sectorfile_download ─ sectorfile_extract ──┴─ customfiles_overlay
+    """
+
+    def __init__(self, installer: "Installer"):
+        """Initialize fresh install.
+
+        Args:
+            installer: Installer service
+        """
+        self.installer = installer
+
+    def run(
+        self,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> bool:
+        """Run the fresh installation.
+
+        If the sectorfile lane fails, the EuroScope installation still
+        completes. If the EuroScope lane fails, the sectorfile lane is
+        stopped at once, since its result could not be used; a sectorfile
+        zip already downloaded is kept so it does not have to be downloaded
+        again.
+
+        Args:
+            progress_callback: Optional callback for combined progress updates
+            cancel_token: Optional token used to stop all stages
+
+        Returns:
+            True if every stage succeeded, False otherwise
+        """
+        cancel_token = cancel_token or CancellationToken()
+        sectorfile_token = cancel_token.linked()
+        merger = _ProgressMerger(progress_callback, ["EuroScope", "Sectorfile"])
+        tracker = ProgressTracker(merger.lane("Sectorfile"))
+        state = {}
+
+        def sectorfile_stage(step: Callable[[], bool]) -> Callable[[], bool]:
+            def run() -> bool:
+                try:
+                    return step()
+                except OperationCancelled:
+                    raise
+                except Exception as e:
+                    tracker.report(f"Error: {e}")
+                    raise
+            return run
+
+        def install_euroscope() -> bool:
+            return self.installer.install_euroscope(merger.lane("EuroScope"), cancel_token)
+
+        def download_sectorfile() -> bool:
+            state["zip_file"] = self.installer.wait_for_sectorfile_download(tracker, sectorfile_token)
+            if not state["zip_file"]:
+                tracker.report("No zip file found or timeout")
+                return False
+            return True
+
+        def extract_sectorfile() -> bool:
+            state["staged"] = self.installer.extract_sectorfile(
+                state["zip_file"], tracker, sectorfile_token
+            )
+            tracker.report("Sectorfile extracted, waiting for EuroScope...")
+            return True
+
+        def overlay_custom_files() -> bool:
+            self.installer.finish_sectorfile(
+                state["staged"], state["zip_file"], tracker, cancel_token
+            )
+            tracker.finish("Sectorfile installation complete!")
+            return True
+
+        results = run_stages([
+            Stage("euroscope", install_euroscope, wanted=True),
+            Stage(
+                "sectorfile_download",
+                sectorfile_stage(download_sectorfile),
+                cancel_token=sectorfile_token,
+            ),
+            Stage(
+                "sectorfile_extract",
+                sectorfile_stage(extract_sectorfile),
+                after=("sectorfile_download",),
+                cancel_token=sectorfile_token,
+            ),
+            Stage(
+                "customfiles_overlay",
+                sectorfile_stage(overlay_custom_files),
+                after=("euroscope", "sectorfile_extract"),
+            ),
+        ])
+
+        if all(results.values()):
+            if progress_callback:
+                progress_callback(ProgressEvent(
+                    "Installation complete!", InstallPhase.DONE, fraction=1.0
+                ))
+            return True
+
+        if not results["customfiles_overlay"] and "staged" in state:
+            state["staged"].abort()
+
+        if cancel_token.is_cancelled:
+            tracker.report("Installation cancelled")
+        elif not results["euroscope"]:
+            tracker.report("Stopped, the EuroScope installation failed")
+
+        return False
@@ -0,0 +1,203 @@
+"""Persistent journal of installation progress, for resuming interrupted installs."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+# Exit code of a process stopped by an injected fault
+FAULT_EXIT_CODE = 75
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """Get the SHA-256 hex digest of a file.
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class InstallJournal:
+    """Append-only record of the durable progress of an installation.
+
+    Each line is a JSON record: a header naming the source being installed,
+    a completed phase, or an installed file with its size and SHA-256. A file
+    is only trusted on resume if its content on disk still matches the
+    recorded hash, so file data never has to be flushed before it is
+    journalled, and a torn last line left by a crash is ignored.
+
+    Tests can pass fault_at=N to make the process exit abruptly at the N-th
+    step, to check that an installation resumes correctly from any point.
+    """
+
+    def __init__(self, path: Path, root: Path, fault_at: Optional[int] = None):
+        """Initialize install journal.
+
+        Args:
+            path: Journal file path
+            root: Directory that recorded file paths are relative to
+            fault_at: Step at which to exit the process, for tests only
+        """
+        self.path = path
+        self.root = root
+
+        self._phases: dict[str, dict] = {}
+        self._files: dict[str, tuple[int, str]] = {}
+        self._file = None
+        self.steps = 0
+        self.fault_at = fault_at
+
+    def open(self, source: str) -> bool:
+        """Load the journal, starting a new one if it records another source.
+
+        Args:
+            source: Identifier of what is being installed (e.g. the MSI URL)
+
+        Returns:
+            True if progress of an earlier attempt was loaded
+        """
+        records = self._read()
+        resumed = bool(records) and records[0].get("source") == source
+
+        self._phases.clear()
+        self._files.clear()
+
+        if resumed:
+            for record in records[1:]:
+                if "phase" in record:
+                    self._phases[record["phase"]] = record
+                elif "file" in record:
+                    self._files[record["file"]] = (record["size"], record["sha256"])
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a" if resumed else "w", encoding="utf-8")
+
+        if not resumed:
+            self._append({"source": source}, durable=True)
+
+        return resumed
+
+    def is_done(self, phase: str) -> bool:
+        """Check whether a phase was completed.
+
+        Args:
+            phase: Phase name (e.g. an InstallPhase)
+
+        Returns:
+            True if the phase was marked done
+        """
+        return phase in self._phases
+
+    def phase_data(self, phase: str) -> dict:
+        """Get the data recorded when a phase was completed.
+
+        Args:
+            phase: Phase name
+
+        Returns:
+            Recorded data, empty if the phase was not completed
+        """
+        return self._phases.get(phase, {})
+
+    def mark_done(self, phase: str, **data) -> None:
+        """Durably record that a phase was completed.
+
+        Args:
+            phase: Phase name
+            **data: Additional JSON-serialisable data to record
+        """
+        record = {"phase": phase, **data}
+        self._append(record, durable=True)
+        self._phases[phase] = record
+
+    def is_installed(self, path: Path) -> bool:
+        """Check whether a file was installed by an earlier attempt and is intact.
+
+        Args:
+            path: File path inside the journal root
+
+        Returns:
+            True if the file is recorded and its size and hash still match
+        """
+        entry = self._files.get(self._relative(path))
+        if entry is None:
+            return False
+
+        size, sha256 = entry
+        try:
+            return path.stat().st_size == size and file_sha256(path) == sha256
+        except OSError:
+            return False
+
+    def record_file(self, path: Path, data: bytes) -> None:
+        """Record a file that has been written.
+
+        Args:
+            path: File path inside the journal root
+            data: Content written to the file
+        """
+        relative = self._relative(path)
+        sha256 = hashlib.sha256(data).hexdigest()
+        self._append({"file": relative, "size": len(data), "sha256": sha256})
+        self._files[relative] = (len(data), sha256)
+
+    def step(self) -> None:
+        """Count a step at which a fault may be injected."""
+        self.steps += 1
+        if self.steps == self.fault_at:
+            os._exit(FAULT_EXIT_CODE)
+
+    def close(self) -> None:
+        """Close the journal, keeping it for a later attempt."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self) -> None:
+        """Close and delete the journal once the installation is finished or abandoned."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+        self._phases.clear()
+        self._files.clear()
+
+    def _relative(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def _append(self, record: dict, durable: bool = False) -> None:
+        """Append a record to the journal file.
+
+        Args:
+            record: Record to append
+            durable: Whether to wait until the record is on disk
+        """
+        self.step()
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        if durable:
+            os.fsync(self._file.fileno())
+
+    def _read(self) -> list[dict]:
+        """Read all complete records from the journal file."""
+        if not self.path.exists():
+            return []
+
+        records = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Torn write from a crash; nothing after it was durable
+                    break
+        return records
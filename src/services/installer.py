@@ -4,147 +4,518 @@ import platform
 import shutil
 import subprocess
 import time
+import urllib.error
 import urllib.request
 import webbrowser
 import zipfile
 from pathlib import Path
 from typing import Callable, Optional
 
-import pymsi
-
 from config import settings
-from services import PathManager
-
-
-def extract_root(root, output: Path, is_root: bool = True):
-    """Extract files from MSI root directory."""
-
-    if not output.exists():
-        output.mkdir(parents=True, exist_ok=True)
-
-    for component in root.components.values():
-        for file in component.files.values():
-            if file.media is None:
-                continue
-            cab_file = file.resolve()
-            (output / file.name).write_bytes(cab_file.decompress())
-
-    for child in root.children.values():
-        folder_name = child.name
-        if is_root:
-            # Check if this ID has a mapped name
-            if child.id in settings.EUROSCOPE_FOLDER_NAME_MAP:
-                folder_name = settings.EUROSCOPE_FOLDER_NAME_MAP[child.id]
-            elif "." in child.id:
-                folder_name, guid = child.id.split(".", 1)
-                if child.id != folder_name:
-                    print(f"Warning: Directory ID '{child.id}' has a GUID suffix ({guid}).")
-            else:
-                folder_name = child.id
-        extract_root(child, output / folder_name, False)
+from models import InstallPhase, ProgressEvent
+from services import (
+    BlobStore,
+    CancellationToken,
+    InstallJournal,
+    OperationCancelled,
+    PathManager,
+    ProgressTracker,
+    StagedInstall,
+    TrashReaper,
+)
+from services.blob_store import is_rewritten
+from services.disk_space import allocated_size, ensure_free_space, tree_file_sizes, tree_size
+from services.install_journal import file_sha256
+from services.mirrors import with_fallback
+from services.msi_extraction import (
+    ExtractionRequest,
+    MsiLayout,
+    ensure_extraction_space,
+    run_extraction_worker,
+)
+from services.seat_provisioner import seat_private_paths
+
+# Prefix of the store refs that keep sectorfile snapshots, followed by the version
+SECTORFILE_SNAPSHOT_REF = f"{settings.SECTORFILE_DIR}@"
+
+# Subdirectories of Customfiles/{FIR_CODE} overlaid onto the sectorfile
+CUSTOM_FILE_SUBDIRS = ["Alias", "ASR", "Plugins", "Settings", "Sounds"]
+
+# Assumed ratio of installed size to MSI size, until the MSI file table is read
+MSI_EXPANSION_ESTIMATE = 3
+
+# Largest read of a download; reads return what has arrived, so on a slow
+# link cancellation is still noticed as soon as any data comes in
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def snapshot_age_key(version: str) -> tuple[str, str]:
+    """Get the sort key ordering sectorfile versions from oldest to newest.
+
+    Versions are YYYYMMDDHHMMSS-AIRAC-BUILD, so they are ordered by their
+    build timestamp. Labels without one sort as older than any that has one.
+
+    Args:
+        version: Sectorfile version
+
+    Returns:
+        Sort key of the version
+    """
+    timestamp = version.split("-", 1)[0]
+    if len(timestamp) == 14 and timestamp.isdigit():
+        return timestamp, version
+    return "", version
 
 
 class Installer:
     """Handles installation of EuroScope and sectorfiles."""
 
-    def __init__(self, path_manager: PathManager):
+    def __init__(
+        self,
+        path_manager: PathManager,
+        trash_reaper: Optional[TrashReaper] = None,
+        store: Optional[BlobStore] = None,
+        fault_at: Optional[int] = None,
+    ):
         """Initialize installer.
 
         Args:
             path_manager: Path manager instance
+            trash_reaper: Trash reaper used to delete old trees in the background
+            store: Blob store that installed trees are deduplicated into
+            fault_at: Install step at which to exit the process, for resume tests only
         """
         self.path_manager = path_manager
+        self.trash_reaper = trash_reaper or TrashReaper(path_manager)
+        self.store = store or BlobStore(path_manager.store)
+        self.fault_at = fault_at
+
+    def staged_install(self, target: Path) -> StagedInstall:
+        """Get a staged installation of a directory, deduplicated into the store.
+
+        Args:
+            target: Live directory being replaced (e.g. Euroscope/)
+
+        Returns:
+            Staged installation of the directory
+        """
+        return StagedInstall(target, self.path_manager, self.trash_reaper, self.store)
+
+    def collect_garbage(self) -> dict[str, int]:
+        """Remove stored files that no installed or previous tree uses any more.
+
+        Files still linked from a replaced tree that the trash reaper has not
+        deleted yet are kept, and freed by a later collection.
+
+        Returns:
+            Number of removed trees and blobs, and the bytes freed
+        """
+        try:
+            return self.store.collect_garbage()
+        except OSError as e:
+            print(f"Warning: Could not clean up the blob store: {e}")
+            return {"trees": 0, "blobs": 0, "bytes": 0}
+
+    def rollback_euroscope(self) -> bool:
+        """Restore the EuroScope installation replaced by the last install.
+
+        Returns:
+            True if the previous installation was restored, False if there was none
+        """
+        return self.staged_install(self.path_manager.euroscope).rollback()
+
+    def rollback_sectorfile(self) -> bool:
+        """Restore the sectorfile replaced by the last install.
+
+        Returns:
+            True if the previous sectorfile was restored, False if there was none
+        """
+        return self.staged_install(self.path_manager.sectorfile).rollback()
+
+    def sectorfile_snapshots(self) -> list[str]:
+        """Get the versions of the kept sectorfile snapshots.
+
+        Returns:
+            Snapshot versions, newest first
+        """
+        return sorted(
+            (name[len(SECTORFILE_SNAPSHOT_REF):]
+             for name in self.store.refs()
+             if name.startswith(SECTORFILE_SNAPSHOT_REF)),
+            key=snapshot_age_key,
+            reverse=True,
+        )
+
+    def restore_sectorfile_snapshot(self, version: str) -> bool:
+        """Switch the sectorfile to a kept snapshot.
+
+        The snapshot is rebuilt from hardlinks into the store and swapped in
+        like a new install, so this takes no download or extraction and the
+        replaced sectorfile is kept for rollback_sectorfile().
+
+        Args:
+            version: Snapshot version from sectorfile_snapshots()
+
+        Returns:
+            True if the snapshot was restored, False if there is no such snapshot
+        """
+        tree = self.store.ref(f"{SECTORFILE_SNAPSHOT_REF}{version}")
+        if not tree:
+            return False
+
+        staged = self.staged_install(self.path_manager.sectorfile)
+        staging_dir = staged.begin()
+        try:
+            private = self._sectorfile_private()
+            self.store.materialise(tree, staging_dir, private=private)
+            staged.commit(private=private, tree=tree)
+        except BaseException:
+            staged.abort()
+            raise
+
+        self.collect_garbage()
+        return True
+
+    def _snapshot_sectorfile(self, staged: StagedInstall) -> None:
+        """Keep the just-committed sectorfile as a snapshot, dropping the oldest.
+
+        Only the just-committed snapshot and the newest others, up to
+        settings.SECTORFILE_SNAPSHOT_COUNT, are kept. The snapshots share
+        unchanged files with each other through the store.
+
+        Args:
+            staged: Staged installation that was just committed
+        """
+        from services import SectorVersionManager
+
+        tree = self.store.ref(staged.ref)
+        if not tree:
+            return
+
+        try:
+            version = SectorVersionManager(self.path_manager).get_current_version()
+        except FileNotFoundError:
+            return
+
+        others = [old for old in self.sectorfile_snapshots() if old != version]
+        kept = [version, *others][:max(settings.SECTORFILE_SNAPSHOT_COUNT, 1)]
+
+        changes = {f"{SECTORFILE_SNAPSHOT_REF}{old}": None for old in others if old not in kept}
+        changes[f"{SECTORFILE_SNAPSHOT_REF}{version}"] = tree
+        self.store.update_refs(changes)
 
     def install_euroscope(
-        self, progress_callback: Optional[Callable[[str], None]] = None
+        self,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> bool:
         """Install EuroScope from official MSI installer.
 
+        Progress is reported as one weighted percentage across the download,
+        decompress, extract and copy phases, using the MSI file table sizes.
+        The cancel token is checked for every downloaded block, decompressed
+        folder and extracted file.
+
+        Files are extracted into a staging directory and swapped in place of
+        the active installation only once complete, so the active installation
+        stays usable throughout and is kept for rollback_euroscope().
+
+        Progress is checkpointed in a journal in the temp directory: the
+        downloaded MSI with its hash, every extracted file with its hash, and
+        each completed phase. If an installation is interrupted by an error,
+        a crash or a power loss, the next attempt continues a partial download
+        and skips phases and files that are already complete and intact. On
+        cancellation the staged tree, downloaded MSI and journal are removed.
+        The active installation is left untouched either way.
+
+        The MSI is parsed and extracted in a worker process at lower priority,
+        so the memory it takes is returned to the system when it exits.
+        The MSI's table index is cached by hash, so free space is checked
+        before the worker starts, and a resumed attempt only parses the MSI
+        if files are left to extract.
+
         Args:
             progress_callback: Optional callback for progress updates
+            cancel_token: Optional token used to stop the installation
 
         Returns:
             True if successful, False otherwise
         """
-        try:
-            if progress_callback:
-                progress_callback("Preparing installation...")
+        cancel_token = cancel_token or CancellationToken()
+        tracker = ProgressTracker(progress_callback)
+        msi_path = self.path_manager.temp / "EuroScopeSetup.msi"
+        staged = self.staged_install(self.path_manager.euroscope)
+        journal = InstallJournal(
+            self.path_manager.temp / settings.EUROSCOPE_JOURNAL_FILE, staged.staging, self.fault_at
+        )
 
-            if self.path_manager.euroscope.exists():
-                shutil.rmtree(self.path_manager.euroscope)
+        try:
+            tracker.start_phase(InstallPhase.PREPARE, "Preparing installation...")
 
             self.path_manager.temp.mkdir(parents=True, exist_ok=True)
+            resumed = journal.open(settings.EUROSCOPE_MSI_URL)
+            staging_dir = staged.begin(resume=resumed)
 
-            if progress_callback:
-                progress_callback("Downloading EuroScope MSI installer...")
+            if resumed:
+                tracker.report("Resuming previous installation...")
 
-            msi_path = self.path_manager.temp / "EuroScopeSetup.msi"
-            urllib.request.urlretrieve(settings.EUROSCOPE_MSI_URL, msi_path)
+            if not journal.is_done(InstallPhase.EXTRACT):
+                if not self._is_msi_downloaded(journal, msi_path):
+                    tracker.start_phase(
+                        InstallPhase.DOWNLOAD, "Downloading EuroScope MSI installer..."
+                    )
+                    self._download_msi(msi_path, tracker, cancel_token, journal)
+                    journal.mark_done(InstallPhase.DOWNLOAD, sha256=file_sha256(msi_path))
 
-            if progress_callback:
-                progress_callback("Extracting files from MSI...")
+                cancel_token.raise_if_cancelled()
 
-            package = pymsi.Package(msi_path)
-            msi = pymsi.Msi(package, True)
+                # With a cached index, a too small volume is refused before the worker starts
+                sha256 = journal.phase_data(InstallPhase.DOWNLOAD).get("sha256")
+                layout = MsiLayout.load(MsiLayout.index_path(self.path_manager.msi_index, sha256))
+                if layout:
+                    ensure_extraction_space(layout, staging_dir)
 
-            folders = []
-            for media in msi.medias.values():
-                if media.cabinet and media.cabinet.disks:
-                    for disk in media.cabinet.disks.values():
-                        for directory in disk:
-                            for folder in directory.folders:
-                                if folder not in folders:
-                                    folders.append(folder)
+                tracker.report("Extracting files from MSI...")
 
-            if progress_callback:
-                progress_callback(f"Decompressing {len(folders)} folders...")
+                # The worker reopens the journal, so only one process writes it at a time
+                journal.close()
+                journal.steps = run_extraction_worker(
+                    ExtractionRequest(
+                        msi_path,
+                        staging_dir,
+                        journal.path,
+                        settings.EUROSCOPE_MSI_URL,
+                        resumed,
+                        journal.steps,
+                        self.path_manager.msi_index,
+                        space_checked=layout is not None,
+                        fault_at=self.fault_at,
+                    ),
+                    tracker,
+                    cancel_token,
+                )
+                journal.open(settings.EUROSCOPE_MSI_URL)
+                msi_path.unlink(missing_ok=True)
 
-            for folder in folders:
-                folder.decompress()
+            cancel_token.raise_if_cancelled()
 
-            self.path_manager.euroscope.mkdir(parents=True, exist_ok=True)
+            if not journal.is_done(InstallPhase.COPY):
+                tracker.start_phase(InstallPhase.COPY, "Copying AppData files to root...")
 
-            if progress_callback:
-                progress_callback("Extracting files...")
+                self._copy_appdata_to_root(staging_dir, tracker)
+                journal.mark_done(InstallPhase.COPY)
 
-            extract_root(msi.root, self.path_manager.euroscope)
+            cancel_token.raise_if_cancelled()
 
-            package.close()
-            msi_path.unlink(missing_ok=True)
-
-            if progress_callback:
-                progress_callback("Copying AppData files to root...")
-
-            self._copy_appdata_to_root()
+            self.commit_euroscope(staged)
+            journal.discard()
 
-            if progress_callback:
-                progress_callback("Installing EuroScope font...")
+            tracker.start_phase(InstallPhase.FONT, "Installing EuroScope font...")
 
-            self._install_euroscope_font()
+            self.install_euroscope_font()
 
-            if progress_callback:
-                progress_callback("Installation complete!")
+            tracker.finish("Installation complete!")
 
             return True
 
+        except OperationCancelled:
+            print("EuroScope installation cancelled.")
+            self._abort_euroscope(staged, msi_path)
+            journal.discard()
+            tracker.report("Installation cancelled")
+            return False
+
         except Exception as e:
             print(f"Error installing EuroScope: {e}")
-            if progress_callback:
-                progress_callback(f"Error: {e}")
+            # Keep the staged files and journal so the next attempt resumes
+            journal.close()
+            tracker.report(f"Error: {e}")
             return False
 
-    def _copy_appdata_to_root(self) -> None:
-        """Copy all files and folders from AppDataFolder/Euroscope/ to the root directory."""
+    def commit_euroscope(self, staged: StagedInstall) -> None:
+        """Swap a staged EuroScope tree into place.
+
+        The per-user AppData files and files EuroScope rewrites are kept out
+        of the shared store.
+
+        Args:
+            staged: Staged installation of the EuroScope directory
+        """
+        staging_files = [
+            item.relative_to(staged.staging).as_posix()
+            for item in staged.staging.rglob("*")
+            if item.is_file()
+        ]
+        per_user = seat_private_paths(dict.fromkeys(staging_files))
+        staged.commit(private=lambda relative: relative in per_user or is_rewritten(relative))
+        self.collect_garbage()
+
+    @staticmethod
+    def _is_msi_downloaded(journal: InstallJournal, msi_path: Path) -> bool:
+        """Check whether an earlier attempt fully downloaded the MSI installer.
+
+        Args:
+            journal: Journal of the running installation
+            msi_path: Path of the downloaded MSI file
+
+        Returns:
+            True if the MSI file exists and matches the journalled hash
+        """
+        if not journal.is_done(InstallPhase.DOWNLOAD) or not msi_path.exists():
+            return False
+        return file_sha256(msi_path) == journal.phase_data(InstallPhase.DOWNLOAD).get("sha256")
+
+    @staticmethod
+    def _download_msi(
+        msi_path: Path,
+        tracker: ProgressTracker,
+        cancel_token: CancellationToken,
+        journal: InstallJournal,
+    ) -> None:
+        """Download the EuroScope MSI installer from the first mirror that has it.
+
+        Mirrors are only used when settings.EUROSCOPE_MSI_SHA256 pins the
+        MSI; otherwise it is downloaded from its origin only.
+
+        Args:
+            msi_path: Path to download the MSI file to
+            tracker: Progress tracker of the running installation
+            cancel_token: Token checked for every downloaded chunk
+            journal: Journal of the running installation
+
+        Raises:
+            OperationCancelled: If cancellation is requested
+        """
+        with_fallback(
+            settings.EUROSCOPE_MSI_URL,
+            lambda url: Installer._download_msi_from(url, msi_path, tracker, cancel_token, journal),
+            verified=bool(settings.EUROSCOPE_MSI_SHA256),
+        )
+
+    @staticmethod
+    def _download_msi_from(
+        url: str,
+        msi_path: Path,
+        tracker: ProgressTracker,
+        cancel_token: CancellationToken,
+        journal: InstallJournal,
+    ) -> None:
+        """Download the EuroScope MSI installer from one source, continuing a partial download.
+
+        Data is written to a .part file, which is renamed once complete. If a
+        .part file was left by an interrupted attempt from the same source,
+        only the remaining bytes are requested, provided the server supports
+        range requests. A .part file from another source is discarded, so a
+        download never mixes bytes from two servers.
+        When settings.EUROSCOPE_MSI_SHA256 is set, a download that does not
+        match it is discarded.
+
+        Args:
+            url: URL to download the MSI from
+            msi_path: Path to download the MSI file to
+            tracker: Progress tracker of the running installation
+            cancel_token: Token checked for every downloaded chunk
+            journal: Journal of the running installation
+
+        Raises:
+            OperationCancelled: If cancellation is requested
+            ValueError: If the download does not match the pinned hash
+        """
+        part_path = msi_path.with_name(msi_path.name + ".part")
+        source_path = msi_path.with_name(msi_path.name + ".part.source")
+
+        if part_path.exists():
+            try:
+                same_source = source_path.read_text(encoding="utf-8") == url
+            except OSError:
+                same_source = False
+            if not same_source:
+                part_path.unlink()
+        source_path.write_text(url, encoding="utf-8")
+
+        offset = part_path.stat().st_size if part_path.exists() else 0
+
+        request = urllib.request.Request(url)
+        if offset:
+            request.add_header("Range", f"bytes={offset}-")
+
         try:
-            appdata_source = self.path_manager.euroscope / "AppDataFolder" / "Euroscope"
+            response = urllib.request.urlopen(request, timeout=60)
+        except urllib.error.HTTPError as e:
+            if e.code != 416 or not offset:
+                raise
+            # Range not satisfiable, the partial file is unusable
+            part_path.unlink()
+            return Installer._download_msi_from(url, msi_path, tracker, cancel_token, journal)
+
+        with response:
+            if offset and getattr(response, "status", None) != 206:
+                offset = 0
+
+            total_size = offset + int(response.headers.get("Content-Length") or 0)
+            if total_size > 0:
+                # Estimate the later phases until the MSI file table is read
+                tracker.plan({
+                    InstallPhase.DOWNLOAD: total_size,
+                    InstallPhase.DECOMPRESS: total_size * MSI_EXPANSION_ESTIMATE,
+                    InstallPhase.EXTRACT: total_size * MSI_EXPANSION_ESTIMATE,
+                })
+
+            done = offset
+            with open(part_path, "ab" if offset else "wb") as f:
+                while chunk := response.read1(DOWNLOAD_CHUNK_SIZE):
+                    cancel_token.raise_if_cancelled()
+                    journal.step()
+                    f.write(chunk)
+                    done += len(chunk)
+                    if total_size > 0:
+                        tracker.update(bytes_done=min(done, total_size), bytes_total=total_size)
+
+        if settings.EUROSCOPE_MSI_SHA256 and file_sha256(part_path) != settings.EUROSCOPE_MSI_SHA256:
+            part_path.unlink()
+            raise ValueError(f"EuroScope MSI from {url} does not match the pinned SHA-256")
+
+        part_path.replace(msi_path)
+        source_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _abort_euroscope(staged: StagedInstall, msi_path: Path) -> None:
+        """Remove partial output of an interrupted EuroScope installation.
+
+        Args:
+            staged: Staged installation to discard
+            msi_path: Path of the downloaded MSI file
+        """
+        try:
+            msi_path.unlink(missing_ok=True)
+            msi_path.with_name(msi_path.name + ".part").unlink(missing_ok=True)
+            msi_path.with_name(msi_path.name + ".part.source").unlink(missing_ok=True)
+            staged.abort()
+        except Exception as e:
+            print(f"Warning: Could not clean up EuroScope installation: {e}")
+
+    @staticmethod
+    def _copy_appdata_to_root(euroscope_dir: Path, tracker: ProgressTracker) -> None:
+        """Copy all files and folders from AppDataFolder/Euroscope/ to the root directory.
+
+        Args:
+            euroscope_dir: EuroScope installation directory
+            tracker: Progress tracker of the running installation
+        """
+        try:
+            appdata_source = euroscope_dir / "AppDataFolder" / "Euroscope"
 
             if not appdata_source.exists():
                 print(f"Warning: AppDataFolder/Euroscope not found at {appdata_source}")
                 return
 
+            items = list(appdata_source.iterdir())
+            sizes = [tree_size(item) for item in items]
+            tracker.update(bytes_total=sum(sizes))
+
             # Copy all contents from AppDataFolder/Euroscope/ to root
-            for item in appdata_source.iterdir():
-                dest = self.path_manager.euroscope / item.name
+            for item, size in zip(items, sizes):
+                dest = euroscope_dir / item.name
 
                 if item.is_file():
                     shutil.copy2(item, dest)
@@ -155,12 +526,14 @@ class Installer:
                     shutil.copytree(item, dest)
                     print(f"Copied directory: {item.name}")
 
+                tracker.advance(bytes_done=size)
+
             print("AppData files copied successfully.")
 
         except Exception as e:
             print(f"Warning: Could not copy AppData files: {e}")
 
-    def _install_euroscope_font(self) -> None:
+    def install_euroscope_font(self) -> None:
         """Install EuroScope.ttf font on Windows if it doesn't exist."""
         if platform.system() != "Windows":
             return
@@ -187,7 +560,9 @@ class Installer:
             print(f"Warning: Could not install EuroScope font: {e}")
 
     def install_sectorfile(
-        self, progress_callback: Optional[Callable[[str], None]] = None
+        self,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> bool:
         """Open browser and file explorer for manual sectorfile download, then wait and extract.
 
@@ -197,65 +572,228 @@ class Installer:
         3. Place it in the Sectorfile folder
         4. This function will detect it and extract automatically
 
+        Once the zip file is found, progress is weighted by the sizes recorded
+        in its central directory and the size of the custom files. The cancel
+        token is checked while waiting and for every extracted file.
+
+        The zip file is extracted and overlaid with the custom files in a
+        staging directory, which then replaces the active sectorfile with a
+        directory swap. The replaced sectorfile is kept for
+        rollback_sectorfile(), and the last few versions are kept as
+        snapshots for restore_sectorfile_snapshot(). On cancellation or
+        failure the staged tree is removed and the active sectorfile is left
+        untouched.
+
         Args:
             progress_callback: Optional callback for progress updates
+            cancel_token: Optional token used to stop the installation
 
         Returns:
             True if successful, False otherwise
         """
+        cancel_token = cancel_token or CancellationToken()
+        tracker = ProgressTracker(progress_callback)
+        staged = None
+
         try:
-            self.path_manager.sectorfile.mkdir(parents=True, exist_ok=True)
+            zip_file = self.wait_for_sectorfile_download(tracker, cancel_token)
 
-            if progress_callback:
-                progress_callback("Clearing sectorfile folder...")
+            if not zip_file:
+                tracker.report("No zip file found or timeout")
+                return False
 
-            for item in self.path_manager.sectorfile.iterdir():
-                if item.is_file():
-                    item.unlink()
-                elif item.is_dir():
-                    shutil.rmtree(item)
+            staged = self.extract_sectorfile(zip_file, tracker, cancel_token)
 
-            aeronav_url = f"{settings.AERONAV_BASE_URL}/{settings.FIR_CODE}"
-            webbrowser.open(aeronav_url)
+            self.finish_sectorfile(staged, zip_file, tracker, cancel_token)
 
-            self._open_file_explorer(self.path_manager.sectorfile)
+            tracker.finish("Sectorfile installation complete!")
 
-            if progress_callback:
-                progress_callback("Waiting for zip file...")
+            return True
 
-            zip_file = self._wait_for_zip_file(progress_callback)
+        except OperationCancelled:
+            print("Sectorfile installation cancelled.")
+            if staged:
+                staged.abort()
+            tracker.report("Installation cancelled")
+            return False
 
-            if not zip_file:
-                if progress_callback:
-                    progress_callback("No zip file found or timeout")
-                return False
+        except Exception as e:
+            print(f"Error installing sectorfile: {e}")
+            if staged:
+                staged.abort()
+            tracker.report(f"Error: {e}")
+            return False
+
+    def wait_for_sectorfile_download(
+        self, tracker: ProgressTracker, cancel_token: CancellationToken
+    ) -> Optional[Path]:
+        """Open the AeroNav page and Sectorfile folder, then wait for the downloaded zip file.
+
+        Zip files left in the Sectorfile folder by earlier attempts are removed first.
+
+        Args:
+            tracker: Progress tracker of the running installation
+            cancel_token: Token used to stop waiting
+
+        Returns:
+            Path to the zip file, None on timeout
+
+        Raises:
+            OperationCancelled: If cancellation is requested
+        """
+        self.path_manager.sectorfile.mkdir(parents=True, exist_ok=True)
+
+        tracker.start_phase(InstallPhase.PREPARE, "Preparing sectorfile folder...")
+
+        for old_zip in self.path_manager.sectorfile.glob("*.zip"):
+            self.trash_reaper.discard(old_zip)
+
+        aeronav_url = f"{settings.AERONAV_BASE_URL}/{settings.FIR_CODE}"
+        webbrowser.open(aeronav_url)
+
+        self._open_file_explorer(self.path_manager.sectorfile)
+
+        tracker.start_phase(InstallPhase.WAIT, "Waiting for zip file...")
 
-            if progress_callback:
-                progress_callback("Extracting sectorfile...")
+        zip_file = self._wait_for_zip_file(tracker, cancel_token=cancel_token)
+
+        cancel_token.raise_if_cancelled()
+
+        return zip_file
+
+    def extract_sectorfile(
+        self, zip_file: Path, tracker: ProgressTracker, cancel_token: CancellationToken
+    ) -> StagedInstall:
+        """Extract a downloaded sectorfile zip into a new staging directory.
+
+        Args:
+            zip_file: Path to the sectorfile zip
+            tracker: Progress tracker of the running installation
+            cancel_token: Token checked for every extracted file
+
+        Returns:
+            Staged installation holding the extracted sectorfile
+
+        Raises:
+            OperationCancelled: If cancellation is requested; the staged tree is removed
+            OSError: If the volume lacks the space the zip's central directory calls for
+        """
+        staged = self.staged_install(self.path_manager.sectorfile)
+
+        try:
+            custom_fir_path = self.path_manager.custom_fir_path(settings.FIR_CODE)
+            custom_sizes = tree_file_sizes(custom_fir_path) if custom_fir_path.exists() else []
+            custom_bytes = sum(custom_sizes)
+
+            staging_dir = staged.begin()
 
             with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-                zip_ref.extractall(self.path_manager.sectorfile)
+                members = zip_ref.infolist()
+                zip_bytes = sum(member.file_size for member in members)
+
+                ensure_free_space(
+                    staging_dir,
+                    allocated_size(member.file_size for member in members if not member.is_dir())
+                    + allocated_size(custom_sizes),
+                    "install the sectorfile",
+                )
+
+                tracker.plan({
+                    InstallPhase.EXTRACT: zip_bytes,
+                    InstallPhase.COPY: custom_bytes,
+                })
+                tracker.start_phase(
+                    InstallPhase.EXTRACT,
+                    "Extracting sectorfile...",
+                    bytes_total=zip_bytes,
+                    files_total=len(members),
+                )
+
+                for member in members:
+                    cancel_token.raise_if_cancelled()
+                    zip_ref.extract(member, staging_dir)
+                    tracker.advance(bytes_done=member.file_size, files_done=1)
+
+            return staged
+
+        except BaseException:
+            staged.abort()
+            raise
+
+    def finish_sectorfile(
+        self,
+        staged: StagedInstall,
+        zip_file: Optional[Path],
+        tracker: ProgressTracker,
+        cancel_token: CancellationToken,
+    ) -> None:
+        """Overlay the custom files onto an extracted sectorfile and swap it into place.
+
+        The zip file is removed once the sectorfile is complete, and the new
+        sectorfile is kept as a snapshot.
+
+        Args:
+            staged: Staged installation returned by extract_sectorfile()
+            zip_file: Path to the sectorfile zip, or None to keep it
+            tracker: Progress tracker of the running installation
+            cancel_token: Token checked before the swap
 
+        Raises:
+            OperationCancelled: If cancellation is requested
+        """
+        custom_fir_path = self.path_manager.custom_fir_path(settings.FIR_CODE)
+        custom_bytes = tree_size(custom_fir_path) if custom_fir_path.exists() else 0
+
+        tracker.start_phase(InstallPhase.COPY, "Copying custom files...", bytes_total=custom_bytes)
+
+        self._copy_custom_files_to_sectorfile(staged.staging, tracker)
+
+        cancel_token.raise_if_cancelled()
+
+        if zip_file:
             zip_file.unlink()
 
-            if progress_callback:
-                progress_callback("Copying custom files...")
+        self.commit_sectorfile(staged)
 
-            self._copy_custom_files_to_sectorfile()
+    def commit_sectorfile(self, staged: StagedInstall) -> None:
+        """Swap a staged sectorfile into place and keep it as a snapshot.
 
-            if progress_callback:
-                progress_callback("Sectorfile installation complete!")
+        Args:
+            staged: Staged installation of the sectorfile directory
+        """
+        staged.commit(private=self._sectorfile_private())
+        self._snapshot_sectorfile(staged)
+        self.collect_garbage()
 
-            return True
+    def _sectorfile_private(self) -> Callable[[str], bool]:
+        """Get the predicate selecting sectorfile paths the store must not share.
 
-        except Exception as e:
-            print(f"Error installing sectorfile: {e}")
-            if progress_callback:
-                progress_callback(f"Error: {e}")
-            return False
+        Besides the files EuroScope rewrites, these are the files overlaid
+        from Customfiles, which the user replaces and deletes, so they are
+        kept as independent copies rather than read-only links.
 
-    def _copy_custom_files_to_sectorfile(self) -> None:
-        """Copy custom files from CustomFiles/{FIR_CODE} to Sectorfile/{FIR_CODE}."""
+        Returns:
+            Predicate on paths relative to the sectorfile directory
+        """
+        custom_fir_path = self.path_manager.custom_fir_path(settings.FIR_CODE)
+        overlay = {
+            f"{settings.FIR_CODE}/{subdir}/{item.relative_to(custom_fir_path / subdir).as_posix()}"
+            for subdir in CUSTOM_FILE_SUBDIRS
+            if (custom_fir_path / subdir).is_dir()
+            for item in (custom_fir_path / subdir).rglob("*")
+            if item.is_file()
+        }
+        return lambda relative: relative in overlay or is_rewritten(relative)
+
+    def _copy_custom_files_to_sectorfile(
+        self, sectorfile_dir: Path, tracker: Optional[ProgressTracker] = None
+    ) -> None:
+        """Copy custom files from CustomFiles/{FIR_CODE} to Sectorfile/{FIR_CODE}.
+
+        Args:
+            sectorfile_dir: Sectorfile directory to copy the custom files into
+            tracker: Optional progress tracker of the running installation
+        """
         try:
             custom_fir_path = self.path_manager.custom_fir_path(settings.FIR_CODE)
 
@@ -263,16 +801,13 @@ class Installer:
                 print(f"No custom files directory found at {custom_fir_path}")
                 return
 
-            sectorfile_fir_path = self.path_manager.sectorfile / settings.FIR_CODE
+            sectorfile_fir_path = sectorfile_dir / settings.FIR_CODE
 
             if not sectorfile_fir_path.exists():
                 print(f"Warning: Sectorfile FIR directory not found at {sectorfile_fir_path}")
                 return
 
-            # Subdirectories to copy
-            subdirs = ["Alias", "ASR", "Plugins", "Settings", "Sounds"]
-
-            for subdir in subdirs:
+            for subdir in CUSTOM_FILE_SUBDIRS:
                 source_dir = custom_fir_path / subdir
                 dest_dir = sectorfile_fir_path / subdir
 
@@ -295,22 +830,29 @@ class Installer:
                         shutil.copytree(item, dest_item)
                         print(f"Copied custom directory: {subdir}/{item.name}")
 
+                    if tracker:
+                        tracker.advance(bytes_done=tree_size(dest_item))
+
             print("Custom files copied successfully.")
 
         except Exception as e:
             print(f"Warning: Could not copy custom files: {e}")
 
     def _wait_for_zip_file(
-        self, progress_callback: Optional[Callable[[str], None]] = None, timeout: int = None
+        self,
+        tracker: ProgressTracker,
+        timeout: int = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> Optional[Path]:
         """Wait for a zip file to appear in the Sectorfile directory.
 
         Args:
-            progress_callback: Optional callback for progress updates
+            tracker: Progress tracker of the running installation
             timeout: Maximum time to wait in seconds (default: from settings)
+            cancel_token: Optional token used to stop waiting
 
         Returns:
-            Path to the zip file if found, None if timeout
+            Path to the zip file if found, None if timeout or cancelled
         """
         if timeout is None:
             timeout = settings.SECTORFILE_DOWNLOAD_TIMEOUT
@@ -324,11 +866,15 @@ class Installer:
                 return zip_files[0]
 
             elapsed = int(time.time() - start_time)
-            if progress_callback and elapsed % 5 == 0:
+            if elapsed % 5 == 0:
                 remaining = timeout - elapsed
-                progress_callback(f"Waiting for zip file... ({remaining}s remaining)")
+                tracker.report(f"Waiting for zip file... ({remaining}s remaining)")
 
-            time.sleep(1)
+            if cancel_token:
+                if cancel_token.wait(1):
+                    return None
+            else:
+                time.sleep(1)
 
         return None
 
@@ -13,6 +13,14 @@ from services import PathManager
 class Launcher:
     """Handles launching applications."""
 
+    def __init__(self, path_manager: PathManager):
+        """Initialize launcher.
+
+        Args:
+            path_manager: Path manager instance
+        """
+        self.path_manager = path_manager
+
     def prepare_profiles(self, config: UserConfig, sectorfile_path: Path) -> None:
         """Prepare profile files with user credentials before launching.
 
@@ -29,7 +37,7 @@ class Launcher:
                     / settings.FIR_CODE
                     / "Plugins"
                     / "Topsky"
-                    / "TopSkyCPDLChoppieCode.txt"
+                    / settings.HOPPIE_CODE_FILE
             )
             if hoppie_file.parent.exists():
                 hoppie_file.write_text(config.hoppie_code)
@@ -71,11 +79,8 @@ class Launcher:
             filtered_lines = [
                 line
                 for line in lines
-                if not (
-                        line.startswith("LastSession\trealname")
-                        or line.startswith("LastSession\tcertificate")
-                        or line.startswith("LastSession\tpassword")
-                        or line.startswith("LastSession\trating")
+                if not line.startswith(
+                    tuple(f"LastSession\t{field}" for field in settings.PROFILE_CREDENTIAL_FIELDS)
                 )
             ]
 
@@ -151,7 +156,7 @@ class Launcher:
             if platform.system() == "Windows":
                 import ctypes
 
-                shortcut_lnk = str(PathManager().temp) + "/afv_launcher.lnk"
+                shortcut_lnk = str(self.path_manager.temp / "afv_launcher.lnk")
                 if not Path(shortcut_lnk).exists():
                     import lnkcreator
                     lnkcreator.create_shortcut(
@@ -0,0 +1,82 @@
+"""Ordered fallback across LAN mirrors for downloaded artifacts.
+
+A mirror is a base URL under which artifacts are served at the host and
+path of their origin URL, the layout produced by ``wget --force-directories``.
+For example, with the mirror ``http://cache.local/files`` the EuroScope MSI
+is fetched from::
+
+    http://cache.local/files/euroscope.hu/install/EuroScopeSetup.3.2.3.2.msi
+
+Mirrors are tried in the configured order and the origin URL last, so a
+missing or stale mirror only costs one failed request. Mirrors are only
+used for artifacts that are checked against a pinned hash, so a mirror
+cannot substitute content.
+"""
+
+import os
+from typing import Callable, TypeVar
+from urllib.parse import urlsplit
+
+from config import settings
+
+T = TypeVar("T")
+
+
+def configured_mirrors() -> tuple[str, ...]:
+    """Get the configured mirror base URLs.
+
+    Returns:
+        settings.MIRROR_URLS if set, otherwise the mirrors listed in the
+        environment variable named by settings.MIRRORS_ENV
+    """
+    if settings.MIRROR_URLS is not None:
+        return tuple(settings.MIRROR_URLS)
+    return tuple(filter(None, os.environ.get(settings.MIRRORS_ENV, "").split(";")))
+
+
+def mirror_urls(url: str) -> list[str]:
+    """Get the URLs to fetch an artifact from, in the order to try them.
+
+    Args:
+        url: Origin URL of the artifact
+
+    Returns:
+        The artifact's URL on each configured mirror, followed by the origin URL
+    """
+    parts = urlsplit(url)
+    path = parts.netloc + parts.path + (f"?{parts.query}" if parts.query else "")
+    return [f"{mirror.rstrip('/')}/{path}" for mirror in configured_mirrors()] + [url]
+
+
+def with_fallback(url: str, fetch: Callable[[str], T], verified: bool = True) -> T:
+    """Fetch an artifact from the first source that delivers it intact.
+
+    A source is skipped when fetch raises OSError (network and HTTP errors)
+    or ValueError (malformed content or a hash mismatch). Any other
+    exception, such as OperationCancelled, stops immediately.
+
+    Args:
+        url: Origin URL of the artifact
+        fetch: Function fetching the artifact from a given URL
+        verified: Whether fetch checks the content against a pinned hash;
+            without one the mirrors are skipped and only the origin is used
+
+    Returns:
+        Result of the first successful fetch
+
+    Raises:
+        OSError or ValueError: The error from the origin if every source failed
+    """
+    candidates = mirror_urls(url)
+
+    if not verified and len(candidates) > 1:
+        print(f"Warning: No pinned hash for {url}, not using mirrors")
+        return fetch(url)
+
+    for candidate in candidates[:-1]:
+        try:
+            return fetch(candidate)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Mirror {candidate} failed, trying next source: {e}")
+
+    return fetch(candidates[-1])
@@ -0,0 +1,608 @@
+"""MSI parsing and extraction, run in a disposable worker process.
+
+Parsing the MSI and decompressing its cabinets takes several times the
+installed size in memory, which the Python allocator largely keeps after
+the installation. Running it in a separate process returns that memory to
+the system as soon as the extraction is done, and lets the extraction run
+at a lower CPU and I/O priority than the UI.
+
+The worker reports through a typed, one-way channel: progress messages
+that replay the calls on the parent's ProgressTracker, and one final
+ResultMessage.
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Union
+
+from config import settings
+from models import InstallPhase
+from services import CancellationToken, InstallJournal, OperationCancelled, ProgressTracker
+from services.disk_space import allocated_size, ensure_free_space, tree_file_sizes
+
+# Seconds between checks of the cancel token while waiting for the worker
+WORKER_POLL_INTERVAL = 0.1
+# Seconds to wait for the worker to exit before killing it
+WORKER_JOIN_TIMEOUT = 5
+
+MSI_INDEX_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class ExtractionRequest:
+    """What the worker extracts, and where."""
+
+    msi_path: Path
+    staging_dir: Path
+    journal_path: Path
+    source: str
+    resumed: bool
+    steps: int  # Fault injection steps already taken by the parent
+    index_dir: Path  # Cached MSI table indexes
+    space_checked: bool = False  # The parent checked free space against a cached index
+    fault_at: Optional[int] = None  # Step at which to exit, for resume tests only
+
+
+@dataclass(frozen=True)
+class PlanMessage:
+    """Replays ProgressTracker.plan()."""
+
+    phase_bytes: dict[InstallPhase, int]
+
+
+@dataclass(frozen=True)
+class PhaseMessage:
+    """Replays ProgressTracker.start_phase()."""
+
+    phase: InstallPhase
+    message: str
+    bytes_total: int = 0
+    files_total: int = 0
+
+
+@dataclass(frozen=True)
+class AdvanceMessage:
+    """Replays ProgressTracker.advance()."""
+
+    bytes_done: int = 0
+    files_done: int = 0
+
+
+@dataclass(frozen=True)
+class ReportMessage:
+    """Replays ProgressTracker.report()."""
+
+    message: str
+
+
+@dataclass(frozen=True)
+class ResultMessage:
+    """Final message of the worker."""
+
+    steps: int
+    error: Optional[str] = None
+    cancelled: bool = False
+
+
+WorkerMessage = Union[PlanMessage, PhaseMessage, AdvanceMessage, ReportMessage, ResultMessage]
+
+
+@dataclass(frozen=True)
+class MsiLayout:
+    """What an MSI installs, as cached in its table index.
+
+    Paths are relative to the extraction directory, with the same folder
+    names extract_root() writes, so the index answers planning, disk space
+    and resume questions without opening the MSI database.
+    """
+
+    files: tuple[tuple[str, int], ...]  # relative path, uncompressed size
+    folders: int  # cabinet folders to decompress for a full extraction
+    appdata: Optional[str] = None  # top-level directory of the AppData files
+
+    def sizes(self, directory: Optional[str] = None) -> list[int]:
+        """Get the file sizes, optionally only of the files below a top-level directory."""
+        prefix = f"{directory}/" if directory else ""
+        return [size for path, size in self.files if path.startswith(prefix)]
+
+    @classmethod
+    def from_msi(cls, msi) -> "MsiLayout":
+        """Read the layout of a parsed MSI.
+
+        Args:
+            msi: Parsed pymsi.Msi
+
+        Returns:
+            Layout of the MSI
+        """
+        appdata = msi.root.children.get("AppDataFolder")
+        return cls(
+            files=tuple((path, file.size) for path, file in _walk(msi.root)),
+            folders=len(_cabinet_folders(msi)),
+            appdata=_output_name(appdata, True) if appdata else None,
+        )
+
+    @staticmethod
+    def index_path(index_dir: Path, sha256: Optional[str]) -> Optional[Path]:
+        """Get the index file of an MSI.
+
+        Args:
+            index_dir: Directory of cached indexes
+            sha256: SHA-256 of the MSI file, if known
+
+        Returns:
+            Index file, or None if the MSI's hash is not known
+        """
+        return index_dir / f"{sha256}.json" if sha256 else None
+
+    @classmethod
+    def load(cls, path: Optional[Path]) -> Optional["MsiLayout"]:
+        """Load a cached index, marking it as recently used.
+
+        Args:
+            path: Index file
+
+        Returns:
+            Cached layout, or None if the index is missing or unreadable
+        """
+        if path is None:
+            return None
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("format") != MSI_INDEX_FORMAT:
+                return None
+            layout = cls(
+                files=tuple((file_path, size) for file_path, size in data["files"]),
+                folders=data["folders"],
+                appdata=data.get("appdata"),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return layout
+
+    def save(self, path: Path) -> None:
+        """Atomically write the index, keeping only the most recently used others.
+
+        Args:
+            path: Index file to write
+        """
+        data = {
+            "format": MSI_INDEX_FORMAT,
+            "folders": self.folders,
+            "appdata": self.appdata,
+            "files": self.files,
+        }
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        partial.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(partial, path)
+
+        # Switching between a few MSI builds should not re-parse them every time
+        others = sorted(
+            (other for other in path.parent.glob("*.json") if other != path),
+            key=lambda other: other.stat().st_mtime,
+            reverse=True,
+        )
+        for other in others[max(settings.MSI_INDEX_COUNT - 1, 0):]:
+            other.unlink(missing_ok=True)
+
+
+def _output_name(directory, is_root: bool) -> str:
+    """Get the name an MSI directory is extracted under.
+
+    Args:
+        directory: MSI directory
+        is_root: Whether the directory is a child of the MSI root directory
+
+    Returns:
+        Folder name to extract the directory into
+    """
+    if not is_root:
+        return directory.name
+    # Check if this ID has a mapped name
+    if directory.id in settings.EUROSCOPE_FOLDER_NAME_MAP:
+        return settings.EUROSCOPE_FOLDER_NAME_MAP[directory.id]
+    return directory.id.split(".", 1)[0]
+
+
+def _walk(directory, prefix: str = "", is_root: bool = True) -> Iterator[tuple[str, object]]:
+    """Get the files an MSI directory tree installs.
+
+    Args:
+        directory: MSI directory
+        prefix: Relative path of the directory, ending in a slash
+        is_root: Whether this is the MSI root directory
+
+    Yields:
+        Relative path and pymsi file of each file with media
+    """
+    for component in directory.components.values():
+        for file in component.files.values():
+            if file.media is not None:
+                yield f"{prefix}{file.name}", file
+    for child in directory.children.values():
+        yield from _walk(child, f"{prefix}{_output_name(child, is_root)}/", False)
+
+
+def _cabinet_folders(msi) -> list:
+    """Get the distinct cabinet folders of a parsed MSI, in media order."""
+    folders = []
+    for media in msi.medias.values():
+        if media.cabinet and media.cabinet.disks:
+            for disk in media.cabinet.disks.values():
+                for directory in disk:
+                    for folder in directory.folders:
+                        if folder not in folders:
+                            folders.append(folder)
+    return folders
+
+
+def extract_root(
+    root,
+    output: Path,
+    is_root: bool = True,
+    on_file: Optional[Callable[[int], None]] = None,
+    cancel_token: Optional[CancellationToken] = None,
+    journal: Optional[InstallJournal] = None,
+    installed: Optional[set[Path]] = None,
+):
+    """Extract files from MSI root directory.
+
+    Args:
+        root: MSI directory to extract
+        output: Directory to extract into
+        is_root: Whether this is the MSI root directory
+        on_file: Optional callback receiving the size of each extracted file
+        cancel_token: Optional token checked before each file
+        journal: Optional journal recording extracted files; files it holds
+            intact copies of are not extracted again
+        installed: Optional paths already verified intact; when given, the
+            journal is not consulted and every other file is extracted
+
+    Raises:
+        OperationCancelled: If cancellation is requested
+    """
+
+    if not output.exists():
+        output.mkdir(parents=True, exist_ok=True)
+
+    for component in root.components.values():
+        for file in component.files.values():
+            if file.media is None:
+                continue
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
+            target = output / file.name
+            if installed is not None:
+                intact = target in installed
+            else:
+                intact = journal is not None and journal.is_installed(target)
+            if intact:
+                if on_file:
+                    on_file(file.size)
+                continue
+            cab_file = file.resolve()
+            data = cab_file.decompress()
+            target.write_bytes(data)
+            if journal:
+                journal.record_file(target, data)
+            if on_file:
+                on_file(len(data))
+
+    for child in root.children.values():
+        if is_root and "." in child.id and child.id not in settings.EUROSCOPE_FOLDER_NAME_MAP:
+            guid = child.id.split(".", 1)[1]
+            print(f"Warning: Directory ID '{child.id}' has a GUID suffix ({guid}).")
+        extract_root(
+            child,
+            output / _output_name(child, is_root),
+            False,
+            on_file,
+            cancel_token,
+            journal,
+            installed,
+        )
+
+
+def ensure_extraction_space(layout: MsiLayout, staging_dir: Path) -> None:
+    """Check that the volume has room for the files an MSI installs.
+
+    Counts the extracted files plus the AppData copies, less what a previous
+    attempt already wrote to the staging directory.
+
+    Args:
+        layout: Layout of the MSI
+        staging_dir: Staging directory the MSI is extracted into
+
+    Raises:
+        OSError: If the volume lacks the space
+    """
+    ensure_free_space(
+        staging_dir,
+        allocated_size(layout.sizes())
+        + (allocated_size(layout.sizes(layout.appdata)) if layout.appdata else 0)
+        - allocated_size(tree_file_sizes(staging_dir)),
+        "install EuroScope",
+    )
+
+
+def extract_msi(
+    request: ExtractionRequest,
+    journal: InstallJournal,
+    tracker: ProgressTracker,
+    cancel_token: CancellationToken,
+) -> None:
+    """Extract the EuroScope MSI into the staging directory.
+
+    The MSI database is only parsed when there is something to extract or
+    its table index is not cached yet; planning and the free space check use
+    the index. Indexes are keyed by the SHA-256 the journal recorded for the
+    download.
+
+    Args:
+        request: What to extract, and where
+        journal: Open journal of the running installation
+        tracker: Progress tracker, or a channel standing in for it
+        cancel_token: Token checked for every decompressed folder and extracted file
+
+    Raises:
+        OperationCancelled: If cancellation is requested
+        OSError: If the volume lacks the space the MSI file table calls for
+    """
+    sha256 = journal.phase_data(InstallPhase.DOWNLOAD).get("sha256")
+    index_path = MsiLayout.index_path(request.index_dir, sha256)
+    layout = MsiLayout.load(index_path)
+    space_checked = request.space_checked and layout is not None
+
+    package = None
+    try:
+        if layout is None:
+            package, msi = _open_msi(request.msi_path)
+            layout = MsiLayout.from_msi(msi)
+            if index_path:
+                try:
+                    layout.save(index_path)
+                except OSError as e:
+                    print(f"Warning: Could not cache the MSI table index: {e}")
+
+        if not space_checked:
+            ensure_extraction_space(layout, request.staging_dir)
+
+        # When resuming, folders are decompressed on demand while
+        # extracting, so only folders holding missing files are read
+        installed = None
+        if request.resumed:
+            tracker.report("Checking files extracted earlier...")
+            installed = set()
+            for relative, _ in layout.files:
+                cancel_token.raise_if_cancelled()
+                if journal.is_installed(request.staging_dir / relative):
+                    installed.add(request.staging_dir / relative)
+
+        total_bytes = sum(layout.sizes())
+        decompress = layout.folders if installed is None else 0
+        tracker.plan({
+            InstallPhase.DECOMPRESS: total_bytes if decompress else 0,
+            InstallPhase.EXTRACT: total_bytes,
+            InstallPhase.COPY: sum(layout.sizes(layout.appdata)) if layout.appdata else 0,
+        })
+
+        if installed is not None and len(installed) == len(layout.files):
+            tracker.start_phase(
+                InstallPhase.EXTRACT, "Extracting files...", bytes_total=total_bytes
+            )
+            tracker.advance(bytes_done=total_bytes, files_done=len(layout.files))
+        else:
+            if package is None:
+                package, msi = _open_msi(request.msi_path)
+
+            if decompress:
+                tracker.start_phase(
+                    InstallPhase.DECOMPRESS,
+                    f"Decompressing {decompress} folders...",
+                    files_total=decompress,
+                )
+
+                for folder in _cabinet_folders(msi):
+                    cancel_token.raise_if_cancelled()
+                    journal.step()
+                    folder.decompress()
+                    tracker.advance(files_done=1)
+
+            tracker.start_phase(
+                InstallPhase.EXTRACT, "Extracting files...", bytes_total=total_bytes
+            )
+
+            extract_root(
+                msi.root,
+                request.staging_dir,
+                on_file=lambda size: tracker.advance(bytes_done=size, files_done=1),
+                cancel_token=cancel_token,
+                journal=journal,
+                installed=installed,
+            )
+    finally:
+        if package is not None:
+            package.close()
+
+    journal.mark_done(InstallPhase.EXTRACT)
+
+
+def _open_msi(msi_path: Path):
+    """Open and parse an MSI file.
+
+    Args:
+        msi_path: MSI file
+
+    Returns:
+        Open pymsi.Package, to be closed by the caller, and the parsed pymsi.Msi
+    """
+    import pymsi
+
+    package = pymsi.Package(msi_path)
+    try:
+        return package, pymsi.Msi(package, True)
+    except BaseException:
+        package.close()
+        raise
+
+
+def run_extraction_worker(
+    request: ExtractionRequest, tracker: ProgressTracker, cancel_token: CancellationToken
+) -> int:
+    """Extract the EuroScope MSI in a worker process, relaying its progress.
+
+    The parent must not hold the journal open while the worker runs.
+
+    Args:
+        request: What to extract, and where
+        tracker: Progress tracker of the running installation
+        cancel_token: Token whose cancellation is passed on to the worker
+
+    Returns:
+        Fault injection steps taken, including those of the parent
+
+    Raises:
+        OperationCancelled: If cancellation is requested
+        RuntimeError: If the extraction failed or the worker died
+    """
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    cancel_event = context.Event()
+
+    process = context.Process(
+        target=_worker_main,
+        args=(request, sender, cancel_event),
+        name="msi-extraction",
+        daemon=True,
+    )
+    process.start()
+    sender.close()
+
+    result = None
+    try:
+        while result is None:
+            if cancel_token.is_cancelled:
+                cancel_event.set()
+            if not receiver.poll(WORKER_POLL_INTERVAL):
+                continue
+
+            try:
+                message = receiver.recv()
+            except EOFError:
+                break
+
+            if isinstance(message, ResultMessage):
+                result = message
+            else:
+                _replay(message, tracker)
+    except BaseException:
+        # The worker may be blocked sending progress nobody reads any more
+        cancel_event.set()
+        process.terminate()
+        raise
+    finally:
+        process.join(WORKER_JOIN_TIMEOUT)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        receiver.close()
+
+    if result is None:
+        raise RuntimeError(f"MSI extraction worker exited unexpectedly (code {process.exitcode})")
+    if result.cancelled:
+        raise OperationCancelled()
+    if result.error:
+        raise RuntimeError(result.error)
+    return result.steps
+
+
+def _replay(message: WorkerMessage, tracker: ProgressTracker) -> None:
+    """Apply a progress message from the worker to the parent's tracker."""
+    if isinstance(message, PlanMessage):
+        tracker.plan(message.phase_bytes)
+    elif isinstance(message, PhaseMessage):
+        tracker.start_phase(message.phase, message.message, message.bytes_total, message.files_total)
+    elif isinstance(message, AdvanceMessage):
+        tracker.advance(message.bytes_done, message.files_done)
+    elif isinstance(message, ReportMessage):
+        tracker.report(message.message)
+
+
+class _ChannelTracker:
+    """Stands in for a ProgressTracker in the worker, sending each call to the parent."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def plan(self, phase_bytes: dict[InstallPhase, int]) -> None:
+        self.connection.send(PlanMessage(phase_bytes))
+
+    def start_phase(self, phase: InstallPhase, message: str, bytes_total: int = 0, files_total: int = 0) -> None:
+        self.connection.send(PhaseMessage(phase, message, bytes_total, files_total))
+
+    def advance(self, bytes_done: int = 0, files_done: int = 0) -> None:
+        self.connection.send(AdvanceMessage(bytes_done, files_done))
+
+    def report(self, message: str) -> None:
+        self.connection.send(ReportMessage(message))
+
+
+def _lower_priority() -> None:
+    """Run the current process below the UI's CPU and I/O priority."""
+    try:
+        import psutil
+
+        process = psutil.Process()
+        if sys.platform == "win32":
+            process.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+            process.ionice(psutil.IOPRIO_LOW)
+        else:
+            process.nice(10)
+            process.ionice(psutil.IOPRIO_CLASS_BE, 7)
+    except Exception as e:
+        print(f"Warning: Could not lower the extraction worker's priority: {e}")
+
+
+def _worker_main(request: ExtractionRequest, connection, cancel_event) -> None:
+    """Entry point of the worker process.
+
+    Args:
+        request: What to extract, and where
+        connection: Sending end of the channel to the parent
+        cancel_event: Event the parent sets to request cancellation
+    """
+    # Diagnostics stay off stdout, which carries the CLI's JSON result; on
+    # Windows the worker inherits the original stdout handle, not fd 1
+    sys.stdout = sys.stderr
+
+    _lower_priority()
+
+    journal = InstallJournal(request.journal_path, request.staging_dir, request.fault_at)
+    journal.open(request.source)
+    journal.steps = request.steps
+
+    try:
+        extract_msi(request, journal, _ChannelTracker(connection), CancellationToken(cancel_event))
+        result = ResultMessage(journal.steps)
+    except OperationCancelled:
+        result = ResultMessage(journal.steps, cancelled=True)
+    except Exception as e:
+        result = ResultMessage(journal.steps, error=str(e))
+    finally:
+        journal.close()
+
+    connection.send(result)
+    connection.close()
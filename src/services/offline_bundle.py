@@ -0,0 +1,496 @@
+"""Offline provisioning bundles holding everything an installation needs."""
+
+import hashlib
+import io
+import json
+import os
+import sys
+import tarfile
+import time
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Callable, Optional
+
+from config import settings
+from models import InstallPhase, ProgressEvent
+from services import CancellationToken, ProgressTracker, StagedInstall
+from services.install_journal import file_sha256
+from services.disk_space import allocated_size, ensure_free_space
+
+if TYPE_CHECKING:
+    from services import Installer
+
+BUNDLE_FORMAT = 1
+MANIFEST_NAME = "manifest.json"
+COPY_CHUNK_SIZE = 1024 * 1024
+
+APP_SECTION = "app"
+
+# Files in the application directory that belong to the machine, not the build
+APP_EXCLUDED = {
+    settings.EUROSCOPE_DIR,
+    settings.SECTORFILE_DIR,
+    settings.CUSTOM_FILES_DIR,
+    settings.TEMP_DIR,
+    settings.CONFIG_FILE,
+    "updater_config.json",
+    "update_log.txt",
+}
+
+
+def _strip_credentials(profile: bytes) -> bytes:
+    """Remove the lines holding the user's credentials from a EuroScope profile.
+
+    Args:
+        profile: Content of a .prf file
+
+    Returns:
+        Content without the LastSession credential lines
+    """
+    prefixes = tuple(
+        f"LastSession\t{field}".encode("utf-8") for field in settings.PROFILE_CREDENTIAL_FIELDS
+    )
+    return b"".join(line for line in profile.splitlines(keepends=True) if not line.startswith(prefixes))
+
+
+def _is_safe_relative(relative: str) -> bool:
+    """Check that a path from a bundle stays inside the directory it is extracted to."""
+    if not relative or "\\" in relative or ":" in relative:
+        return False
+    path = PurePosixPath(relative)
+    return not path.is_absolute() and ".." not in path.parts
+
+
+class OfflineBundle:
+    """Exports and imports a single-file bundle for installing without network access.
+
+    A bundle is an uncompressed tar file, so it is written and read at disk
+    speed. Its first member is a manifest listing every file with its size
+    and SHA-256, followed by the installed trees:
+
+        manifest.json
+        euroscope/...    installed EuroScope
+        sectorfile/...   installed sectorfile, with custom files overlaid
+        customfiles/...  Customfiles
+        app/...          application build (only when exported from a build)
+
+    Importing streams the bundle once, hashing each file as it is written to
+    the staging directories, and only swaps the trees into place once every
+    file has been verified. The user configuration is never bundled: the
+    sectorfile is taken from its pristine snapshot in the store where there
+    is one, credential lines are stripped from every profile and the Hoppie
+    code file is left out.
+    """
+
+    def __init__(self, installer: "Installer"):
+        """Initialize offline bundle.
+
+        Args:
+            installer: Installer service
+        """
+        self.installer = installer
+        self.path_manager = installer.path_manager
+
+    def export(
+        self,
+        bundle_path: Path,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> dict:
+        """Write the current installation to a bundle file.
+
+        Args:
+            bundle_path: Bundle file to create
+            progress_callback: Optional callback for progress updates
+            cancel_token: Optional token used to stop the export
+
+        Returns:
+            Summary with the bundle path, file count and size
+
+        Raises:
+            OperationCancelled: If cancelled; the partial bundle is removed
+        """
+        from services import SectorVersionManager
+
+        cancel_token = cancel_token or CancellationToken()
+        tracker = ProgressTracker(progress_callback)
+
+        try:
+            sectorfile_version = SectorVersionManager(self.path_manager).get_current_version()
+        except FileNotFoundError:
+            sectorfile_version = None
+
+        files = self._collect_files(sectorfile_version)
+        sanitised = {
+            arcname: _strip_credentials(path.read_bytes())
+            for arcname, path in files
+            if arcname.lower().endswith(".prf")
+        }
+        sizes = {
+            arcname: len(sanitised[arcname]) if arcname in sanitised else path.stat().st_size
+            for arcname, path in files
+        }
+        total_bytes = sum(sizes.values())
+        tracker.plan({InstallPhase.PREPARE: total_bytes, InstallPhase.COPY: total_bytes})
+
+        tracker.start_phase(
+            InstallPhase.PREPARE, "Hashing files...", bytes_total=total_bytes, files_total=len(files)
+        )
+        entries = {}
+        for arcname, path in files:
+            cancel_token.raise_if_cancelled()
+            if arcname in sanitised:
+                sha256 = hashlib.sha256(sanitised[arcname]).hexdigest()
+            else:
+                sha256 = file_sha256(path)
+            entries[arcname] = {"size": sizes[arcname], "sha256": sha256}
+            tracker.advance(bytes_done=sizes[arcname], files_done=1)
+
+        manifest = {
+            "format": BUNDLE_FORMAT,
+            "fir": settings.FIR_CODE,
+            "app_version": settings.APP_VERSION,
+            "sectorfile_version": sectorfile_version,
+            "euroscope_source": settings.EUROSCOPE_MSI_URL,
+            "created": int(time.time()),
+            "files": entries,
+        }
+
+        tracker.start_phase(
+            InstallPhase.COPY, "Writing bundle...", bytes_total=total_bytes, files_total=len(files)
+        )
+        partial = bundle_path.with_name(bundle_path.name + ".part")
+        try:
+            with tarfile.open(partial, "w", format=tarfile.PAX_FORMAT) as tar:
+                data = json.dumps(manifest, indent=2).encode("utf-8")
+                info = tarfile.TarInfo(MANIFEST_NAME)
+                info.size = len(data)
+                info.mtime = manifest["created"]
+                tar.addfile(info, io.BytesIO(data))
+
+                for arcname, path in files:
+                    cancel_token.raise_if_cancelled()
+                    info = tarfile.TarInfo(arcname)
+                    info.size = entries[arcname]["size"]
+                    info.mtime = int(path.stat().st_mtime)
+                    if arcname in sanitised:
+                        tar.addfile(info, io.BytesIO(sanitised[arcname]))
+                    else:
+                        with open(path, "rb") as source:
+                            tar.addfile(info, source)
+                    tracker.advance(bytes_done=info.size, files_done=1)
+
+            os.replace(partial, bundle_path)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+        tracker.finish("Bundle exported")
+        return {"bundle": str(bundle_path), "files": len(files), "bytes": total_bytes}
+
+    def import_bundle(
+        self,
+        bundle_path: Path,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> dict:
+        """Install everything in a bundle file.
+
+        The application build is staged like the installed trees and only
+        moved into a root other than the one the running application was
+        started from, since a running executable cannot be replaced.
+
+        Args:
+            bundle_path: Bundle file to import
+            progress_callback: Optional callback for progress updates
+            cancel_token: Optional token used to stop the import
+
+        Returns:
+            Summary with the bundled versions, file count and size
+
+        Raises:
+            OperationCancelled: If cancelled; the active installation is left untouched
+            ValueError: If the bundle is malformed or a file does not match its hash
+            OSError: If the volume lacks the space the manifest calls for
+        """
+        cancel_token = cancel_token or CancellationToken()
+        tracker = ProgressTracker(progress_callback)
+        staged: dict[str, StagedInstall] = {}
+        app_staging: Optional[Path] = None
+        skip_app = self._is_running_from_root()
+
+        try:
+            tracker.start_phase(InstallPhase.PREPARE, "Reading bundle manifest...")
+
+            with tarfile.open(bundle_path, "r|") as tar:
+                members = iter(tar)
+                first = next(members, None)
+                if first is None or first.name != MANIFEST_NAME:
+                    raise ValueError(f"{bundle_path} is not an offline bundle")
+
+                manifest = json.load(tar.extractfile(first))
+                if manifest.get("format") != BUNDLE_FORMAT:
+                    raise ValueError(f"Unsupported bundle format {manifest.get('format')}")
+                if manifest.get("fir") != settings.FIR_CODE:
+                    raise ValueError(f"Bundle is for {manifest.get('fir')}, not {settings.FIR_CODE}")
+
+                expected = manifest["files"]
+                total_bytes = sum(entry["size"] for entry in expected.values())
+                self.path_manager.staging.mkdir(parents=True, exist_ok=True)
+                ensure_free_space(
+                    self.path_manager.staging,
+                    allocated_size(entry["size"] for entry in expected.values()),
+                    "import the bundle",
+                )
+                tracker.plan({InstallPhase.EXTRACT: total_bytes})
+                tracker.start_phase(
+                    InstallPhase.EXTRACT,
+                    "Extracting bundle...",
+                    bytes_total=total_bytes,
+                    files_total=len(expected),
+                )
+
+                seen = set()
+                for member in members:
+                    cancel_token.raise_if_cancelled()
+
+                    entry = expected.get(member.name)
+                    section, _, relative = member.name.partition("/")
+                    if entry is None or not member.isfile() or not _is_safe_relative(relative):
+                        raise ValueError(f"Unexpected entry in bundle: {member.name}")
+
+                    if section == APP_SECTION:
+                        if not skip_app:
+                            app_staging = app_staging or self._begin_app()
+                            self._extract(tar, member, app_staging / relative, entry["sha256"])
+                    else:
+                        destination = self._destination(section, staged)
+                        self._extract(tar, member, destination / relative, entry["sha256"])
+
+                    seen.add(member.name)
+                    tracker.advance(bytes_done=member.size, files_done=1)
+
+                missing = expected.keys() - seen
+                if missing:
+                    raise ValueError(f"Bundle is truncated, {len(missing)} files are missing")
+
+            cancel_token.raise_if_cancelled()
+            tracker.report("Activating installation...")
+
+            if "customfiles" in staged:
+                staged.pop("customfiles").commit()
+            if "euroscope" in staged:
+                self.installer.commit_euroscope(staged.pop("euroscope"))
+                self.installer.install_euroscope_font()
+            if "sectorfile" in staged:
+                self.installer.commit_sectorfile(staged.pop("sectorfile"))
+            if app_staging:
+                self._commit_app(app_staging)
+                app_staging = None
+
+        except BaseException:
+            for pending in staged.values():
+                pending.abort()
+            if app_staging:
+                self.installer.trash_reaper.discard(app_staging)
+            raise
+
+        if skip_app:
+            print("Application build in the bundle skipped, it cannot replace the running application.")
+
+        tracker.finish("Bundle imported")
+        return {
+            "bundle": str(bundle_path),
+            "app_version": manifest.get("app_version"),
+            "sectorfile_version": manifest.get("sectorfile_version"),
+            "app_skipped": skip_app,
+            "files": len(seen),
+            "bytes": total_bytes,
+        }
+
+    def _collect_files(self, sectorfile_version: Optional[str]) -> list[tuple[str, Path]]:
+        """Get the files to bundle, as pairs of bundle path and source path.
+
+        Args:
+            sectorfile_version: Installed sectorfile version, or None
+
+        Returns:
+            Files to bundle, without the Hoppie code file
+        """
+        sources = {
+            "euroscope": self.path_manager.euroscope,
+            "sectorfile": self.path_manager.sectorfile,
+            "customfiles": self.path_manager.custom_files,
+        }
+        snapshot = self._sectorfile_snapshot(sectorfile_version)
+
+        files = []
+        for section, directory in sources.items():
+            if section == "sectorfile" and snapshot is not None:
+                files.extend(
+                    (f"{section}/{relative}", self.installer.store.blob_path(digest))
+                    for relative, digest in sorted(snapshot.items())
+                )
+            elif directory.is_dir():
+                files.extend(
+                    (f"{section}/{item.relative_to(directory).as_posix()}", item)
+                    for item in sorted(directory.rglob("*"))
+                    if item.is_file()
+                )
+
+        files = [
+            (arcname, path)
+            for arcname, path in files
+            if PurePosixPath(arcname).name != settings.HOPPIE_CODE_FILE
+        ]
+
+        # Only a built application has a build worth bundling
+        if getattr(sys, "frozen", False):
+            app_dir = Path(sys.executable).parent
+            for entry in sorted(app_dir.iterdir()):
+                if entry.name in APP_EXCLUDED:
+                    continue
+                items = [entry] if entry.is_file() else sorted(entry.rglob("*"))
+                files.extend(
+                    (f"{APP_SECTION}/{item.relative_to(app_dir).as_posix()}", item)
+                    for item in items
+                    if item.is_file()
+                )
+
+        return files
+
+    def _sectorfile_snapshot(self, version: Optional[str]) -> Optional[dict[str, str]]:
+        """Get the manifest of the installed sectorfile as it was before the launcher filled it in.
+
+        Args:
+            version: Installed sectorfile version, or None
+
+        Returns:
+            Mapping of relative path to blob digest, or None if the store has
+            no complete snapshot of the version
+        """
+        from services.installer import SECTORFILE_SNAPSHOT_REF
+
+        store = self.installer.store
+        tree = store.ref(f"{SECTORFILE_SNAPSHOT_REF}{version}") if version else None
+        if not tree:
+            return None
+
+        try:
+            manifest = store.load_tree(tree)
+        except (OSError, ValueError):
+            return None
+
+        if not all(store.blob_path(digest).exists() for digest in manifest.values()):
+            return None
+        return manifest
+
+    def _destination(self, section: str, staged: dict[str, StagedInstall]) -> Path:
+        """Get the directory a bundle section is extracted to, staging it on first use.
+
+        Args:
+            section: Top-level directory of the bundle entry
+            staged: Staged installations begun so far, by section
+
+        Returns:
+            Directory to extract the section's files into
+
+        Raises:
+            ValueError: If the section is unknown
+        """
+        targets = {
+            "euroscope": self.path_manager.euroscope,
+            "sectorfile": self.path_manager.sectorfile,
+            "customfiles": self.path_manager.custom_files,
+        }
+        if section not in targets:
+            raise ValueError(f"Unknown bundle section: {section}")
+
+        if section not in staged:
+            if section == "customfiles":
+                # Custom files are edited by the user, so they stay out of the store
+                staged[section] = StagedInstall(
+                    targets[section], self.path_manager, self.installer.trash_reaper
+                )
+            else:
+                staged[section] = self.installer.staged_install(targets[section])
+            staged[section].begin()
+        return staged[section].staging
+
+    def _begin_app(self) -> Path:
+        """Prepare an empty staging directory for the application build.
+
+        Returns:
+            Path of the staging directory
+        """
+        staging = self.path_manager.staging / APP_SECTION
+        self.installer.trash_reaper.discard(staging)
+        staging.mkdir(parents=True, exist_ok=True)
+        return staging
+
+    def _commit_app(self, staging: Path) -> None:
+        """Move a staged application build into the root.
+
+        The replaced files are kept in the previous directory. If a move
+        fails, the files moved so far are put back.
+
+        Args:
+            staging: Staging directory holding the verified build
+
+        Raises:
+            OSError: If the build could not be moved into place
+        """
+        root = self.path_manager.root
+        previous = self.path_manager.previous / APP_SECTION
+        self.installer.trash_reaper.discard(previous)
+        previous.mkdir(parents=True, exist_ok=True)
+
+        moved = []
+        try:
+            for entry in sorted(staging.iterdir()):
+                if (root / entry.name).exists():
+                    (root / entry.name).rename(previous / entry.name)
+                moved.append(entry.name)
+                entry.rename(root / entry.name)
+        except OSError:
+            for name in reversed(moved):
+                if not (staging / name).exists() and (root / name).exists():
+                    (root / name).rename(staging / name)
+                if (previous / name).exists():
+                    (previous / name).rename(root / name)
+            raise
+
+        self.installer.trash_reaper.discard(staging)
+
+    @staticmethod
+    def _extract(tar: tarfile.TarFile, member: tarfile.TarInfo, target: Path, sha256: str) -> None:
+        """Stream one bundle entry to disk, verifying its hash on the way.
+
+        Args:
+            tar: Bundle being read
+            member: Entry to extract
+            target: Path to write the entry to
+            sha256: Expected SHA-256 from the manifest
+
+        Raises:
+            ValueError: If the content does not match the hash
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        source = tar.extractfile(member)
+        digest = hashlib.sha256()
+
+        with open(target, "wb") as f:
+            while chunk := source.read(COPY_CHUNK_SIZE):
+                digest.update(chunk)
+                f.write(chunk)
+
+        if digest.hexdigest() != sha256:
+            target.unlink()
+            raise ValueError(f"{member.name} does not match its hash in the bundle manifest")
+
+        os.utime(target, (member.mtime, member.mtime))
+
+    def _is_running_from_root(self) -> bool:
+        """Check whether the running application build lives in the target root."""
+        if not getattr(sys, "frozen", False):
+            return False
+        return Path(sys.executable).parent.resolve() == self.path_manager.root.resolve()
@@ -22,6 +22,31 @@ class PathManager:
         """Get temp directory path."""
         return self.root / settings.TEMP_DIR
 
+    @property
+    def trash(self) -> Path:
+        """Get trash directory path for trees awaiting deletion."""
+        return self.temp / settings.TRASH_DIR
+
+    @property
+    def staging(self) -> Path:
+        """Get directory path for installations being staged."""
+        return self.temp / settings.STAGING_DIR
+
+    @property
+    def previous(self) -> Path:
+        """Get directory path for previous installations kept for rollback."""
+        return self.temp / settings.PREVIOUS_DIR
+
+    @property
+    def store(self) -> Path:
+        """Get content-addressed blob store directory path."""
+        return self.temp / settings.STORE_DIR
+
+    @property
+    def msi_index(self) -> Path:
+        """Get directory path for cached MSI table indexes."""
+        return self.temp / settings.MSI_INDEX_DIR
+
     @property
     def config_file(self) -> Path:
         """Get config file path."""
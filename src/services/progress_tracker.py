@@ -0,0 +1,198 @@
+"""Weighted progress tracking across installation phases."""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from models import InstallPhase, ProgressEvent
+
+# Relative time cost of processing one byte in each phase
+PHASE_COSTS = {
+    InstallPhase.DOWNLOAD: 4.0,
+    InstallPhase.DECOMPRESS: 1.0,
+    InstallPhase.EXTRACT: 0.5,
+    InstallPhase.COPY: 0.5,
+}
+
+# Minimum overall progress before an ETA is estimated
+ETA_MIN_FRACTION = 0.02
+
+
+class ProgressTracker:
+    """Rolls progress of individual phases up into one overall fraction and ETA.
+
+    Each phase is weighted by the number of bytes it processes, taken from
+    archive metadata (MSI file table, zip central directory), multiplied by
+    the phase's relative cost. Phases without a weight (such as waiting for
+    the user) do not contribute to the overall fraction.
+    """
+
+    def __init__(self, callback: Optional[Callable[[ProgressEvent], None]] = None):
+        """Initialize progress tracker.
+
+        Args:
+            callback: Optional callback receiving a ProgressEvent on every change
+        """
+        self.callback = callback
+
+        self._weights: dict[InstallPhase, float] = {}
+        self._completed: set[InstallPhase] = set()
+        self._phase: Optional[InstallPhase] = None
+        self._message = ""
+        self._bytes_done = 0
+        self._bytes_total = 0
+        self._files_done = 0
+        self._files_total = 0
+        self._fraction: Optional[float] = None
+        self._started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def plan(self, phase_bytes: dict[InstallPhase, int]) -> None:
+        """Set or refine the number of bytes each phase will process.
+
+        Args:
+            phase_bytes: Mapping of phase to the bytes it processes
+        """
+        with self._lock:
+            for phase, size in phase_bytes.items():
+                self._weights[phase] = size * PHASE_COSTS.get(phase, 1.0)
+
+    def start_phase(
+            self,
+            phase: InstallPhase,
+            message: str,
+            bytes_total: int = 0,
+            files_total: int = 0,
+    ) -> None:
+        """Start a new phase, completing the current one.
+
+        Args:
+            phase: Phase being started
+            message: Human-readable description of the phase
+            bytes_total: Bytes the phase will process, if known
+            files_total: Files the phase will process, if known
+        """
+        with self._lock:
+            if self._phase is not None:
+                self._completed.add(self._phase)
+
+            self._phase = phase
+            self._message = message
+            self._bytes_done = 0
+            self._bytes_total = bytes_total
+            self._files_done = 0
+            self._files_total = files_total
+
+            if self._started_at is None and self._weights.get(phase):
+                self._started_at = time.monotonic()
+
+        self._emit()
+
+    def update(
+            self,
+            bytes_done: Optional[int] = None,
+            bytes_total: Optional[int] = None,
+            files_done: Optional[int] = None,
+            files_total: Optional[int] = None,
+    ) -> None:
+        """Set absolute counters of the current phase.
+
+        Args:
+            bytes_done: Bytes processed so far
+            bytes_total: Total bytes to process
+            files_done: Files processed so far
+            files_total: Total files to process
+        """
+        with self._lock:
+            if bytes_done is not None:
+                self._bytes_done = bytes_done
+            if bytes_total is not None:
+                self._bytes_total = bytes_total
+            if files_done is not None:
+                self._files_done = files_done
+            if files_total is not None:
+                self._files_total = files_total
+
+        self._emit()
+
+    def advance(self, bytes_done: int = 0, files_done: int = 0) -> None:
+        """Increment counters of the current phase.
+
+        Args:
+            bytes_done: Bytes processed since the last call
+            files_done: Files processed since the last call
+        """
+        with self._lock:
+            self._bytes_done += bytes_done
+            self._files_done += files_done
+
+        self._emit()
+
+    def report(self, message: str) -> None:
+        """Report a message without changing the phase or counters.
+
+        Args:
+            message: Human-readable message
+        """
+        with self._lock:
+            self._message = message
+
+        self._emit()
+
+    def finish(self, message: str) -> None:
+        """Mark all work as complete.
+
+        Args:
+            message: Human-readable completion message
+        """
+        with self._lock:
+            if self._phase is not None:
+                self._completed.add(self._phase)
+            self._completed.update(self._weights)
+            self._phase = InstallPhase.DONE
+            self._message = message
+
+        self._emit()
+
+    def _phase_fraction(self) -> float:
+        if self._bytes_total:
+            return min(self._bytes_done / self._bytes_total, 1.0)
+        if self._files_total:
+            return min(self._files_done / self._files_total, 1.0)
+        return 0.0
+
+    def _emit(self) -> None:
+        with self._lock:
+            total_weight = sum(self._weights.values())
+            fraction = None
+            eta_seconds = None
+
+            if total_weight > 0:
+                done_weight = sum(self._weights.get(phase, 0.0) for phase in self._completed)
+                if self._phase not in self._completed:
+                    done_weight += self._weights.get(self._phase, 0.0) * self._phase_fraction()
+
+                fraction = min(done_weight / total_weight, 1.0)
+
+                # Refined plans may grow the total; never move backwards
+                if self._fraction is not None:
+                    fraction = max(fraction, self._fraction)
+                self._fraction = fraction
+
+                if self._started_at is not None and ETA_MIN_FRACTION <= fraction < 1.0:
+                    elapsed = time.monotonic() - self._started_at
+                    eta_seconds = elapsed / fraction * (1.0 - fraction)
+
+            event = ProgressEvent(
+                message=self._message,
+                phase=self._phase,
+                bytes_done=self._bytes_done,
+                bytes_total=self._bytes_total,
+                files_done=self._files_done,
+                files_total=self._files_total,
+                fraction=fraction,
+                eta_seconds=eta_seconds,
+            )
+
+        if self.callback:
+            self.callback(event)
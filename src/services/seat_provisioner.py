@@ -0,0 +1,129 @@
+"""Provisioning of several application roots (seats) from one shared EuroScope tree."""
+
+from pathlib import Path
+
+from config import settings
+from services import BlobStore, PathManager, StagedInstall, TrashReaper
+from services.blob_store import is_rewritten
+from services.staged_install import PREVIOUS_REF_SUFFIX, STAGED_REF_SUFFIX
+
+APPDATA_PREFIX = "AppDataFolder/"
+APPDATA_EUROSCOPE_PREFIX = "AppDataFolder/Euroscope/"
+PUBLISHED_REF = "seats"
+SEAT_REF_PREFIX = "seat:"
+
+
+def seat_private_paths(manifest: dict[str, str]) -> set[str]:
+    """Get the paths of a EuroScope tree that each seat needs its own copy of.
+
+    These are the per-user files from the MSI's AppDataFolder, both where
+    they were extracted and where the installer copies them to in the root.
+
+    Args:
+        manifest: Tree manifest of a EuroScope installation
+
+    Returns:
+        Relative paths that must be writable per seat
+    """
+    private = {relative for relative in manifest if relative.startswith(APPDATA_PREFIX)}
+    private.update(
+        relative[len(APPDATA_EUROSCOPE_PREFIX):]
+        for relative in manifest
+        if relative.startswith(APPDATA_EUROSCOPE_PREFIX)
+    )
+    return private
+
+
+class SeatProvisioner:
+    """Sets up many seats that share one read-only, content-addressed EuroScope tree.
+
+    A finished EuroScope installation is published once into a blob store.
+    Each seat then gets a Euroscope/ directory of hardlinks into the store,
+    plus private copies of the per-user AppData files, and its own writable
+    Sectorfile/, Customfiles/ and config. Adding a seat takes seconds and
+    almost no disk space. Each seat's active and previous trees are kept by
+    store refs named after the seat, so garbage collection spares them.
+    """
+
+    def __init__(self, store: BlobStore):
+        """Initialize seat provisioner.
+
+        Args:
+            store: Blob store shared by all seats
+        """
+        self.store = store
+
+    def publish(self, euroscope_dir: Path) -> str:
+        """Publish a EuroScope installation into the store.
+
+        Files that are already stored are not copied again. The tree stays
+        referenced by the store until the next publish.
+
+        Args:
+            euroscope_dir: Installed EuroScope directory
+
+        Returns:
+            Digest identifying the published tree
+
+        Raises:
+            FileNotFoundError: If the directory does not exist
+        """
+        if not euroscope_dir.is_dir():
+            raise FileNotFoundError(f"EuroScope installation not found at {euroscope_dir}")
+        return self.store.add_tree(euroscope_dir, ref=PUBLISHED_REF)
+
+    def seats(self) -> dict[Path, str]:
+        """Get the seats provisioned from the store.
+
+        Returns:
+            Mapping of seat root directory to the ref of its active EuroScope tree
+        """
+        return {
+            Path(name[len(SEAT_REF_PREFIX):]): name
+            for name in self.store.refs()
+            if name.startswith(SEAT_REF_PREFIX)
+            and not name.endswith((PREVIOUS_REF_SUFFIX, STAGED_REF_SUFFIX))
+        }
+
+    def provision(self, seat_root: Path, tree_digest: str) -> dict:
+        """Set up a seat, replacing its EuroScope tree with the published one.
+
+        The new tree is built in the seat's staging directory and swapped in,
+        so the seat's previous installation is kept for rollback. The seat's
+        sectorfile and settings are left untouched.
+
+        Args:
+            seat_root: Root directory of the seat
+            tree_digest: Digest returned by publish()
+
+        Returns:
+            Summary with the seat root and counts of linked and copied files
+        """
+        path_manager = PathManager(seat_root)
+        path_manager.ensure_base_directories()
+        path_manager.ensure_fir_directories(settings.FIR_CODE)
+        path_manager.sectorfile.mkdir(parents=True, exist_ok=True)
+
+        staged = StagedInstall(
+            path_manager.euroscope,
+            path_manager,
+            TrashReaper(path_manager),
+            self.store,
+            ref=f"{SEAT_REF_PREFIX}{seat_root.resolve().as_posix()}",
+        )
+        staging_dir = staged.begin()
+        try:
+            # Pin the tree before reading it, so a later publish and store-gc cannot remove it
+            self.store.update_refs({staged.staged_ref: tree_digest})
+            private = seat_private_paths(self.store.load_tree(tree_digest))
+
+            def is_private(relative: str) -> bool:
+                return relative in private or is_rewritten(relative)
+
+            counts = self.store.materialise(tree_digest, staging_dir, private=is_private)
+            staged.commit(private=is_private, tree=tree_digest)
+        except BaseException:
+            staged.abort()
+            raise
+
+        return {"root": str(seat_root), **counts}
@@ -14,8 +14,6 @@ Version Format:
 import re
 from typing import Optional
 
-import requests
-
 from config import settings
 from services import PathManager
 
@@ -23,8 +21,15 @@ from services import PathManager
 class SectorVersionManager:
     """Manages sectorfile version checking and comparison."""
 
-    @staticmethod
-    def get_current_version() -> str:
+    def __init__(self, path_manager: PathManager):
+        """Initialize sectorfile version manager.
+
+        Args:
+            path_manager: Path manager instance
+        """
+        self.path_manager = path_manager
+
+    def get_current_version(self) -> str:
         """Get the currently installed sectorfile version.
 
         Returns:
@@ -33,7 +38,7 @@ class SectorVersionManager:
         Raises:
             FileNotFoundError: If no .SCT file is found in the sectorfile directory
         """
-        sectorfile_dir = PathManager().sectorfile
+        sectorfile_dir = self.path_manager.sectorfile
         sct_files = list(sectorfile_dir.glob("*.SCT"))
 
         if not sct_files:
@@ -59,6 +64,9 @@ class SectorVersionManager:
             ConnectionError: If the AeroNav page cannot be fetched
             ValueError: If no valid sectorfile versions are found
         """
+        # Deferred so reading the installed version does not load requests
+        import requests
+
         url = f"{settings.AERONAV_BASE_URL}/{settings.FIR_CODE}"
         response = requests.get(url)
 
@@ -111,8 +119,7 @@ class SectorVersionManager:
 
         return newest_version
 
-    @staticmethod
-    def is_update_available() -> bool:
+    def is_update_available(self) -> bool:
         """Check if a newer sectorfile version is available online.
 
         Compares the currently installed version with the newest available version
@@ -122,10 +129,10 @@ class SectorVersionManager:
             True if a newer version is available, False otherwise
         """
         try:
-            current_version = SectorVersionManager.get_current_version()
+            current_version = self.get_current_version()
             current_date = int(current_version.split("-")[0])
 
-            newest_version = SectorVersionManager.get_newest_version()
+            newest_version = self.get_newest_version()
             newest_date = int(newest_version.split("-")[0])
 
             return current_date < newest_date
@@ -0,0 +1,158 @@
+"""Staged installation with atomic directory swap."""
+
+from pathlib import Path
+from typing import Callable, Optional
+
+from services import BlobStore, PathManager, TrashReaper, TreeVerifier
+from services.blob_store import is_rewritten
+
+# Suffixes of the refs of the previous tree and of a tree being staged
+PREVIOUS_REF_SUFFIX = ".previous"
+STAGED_REF_SUFFIX = ".staged"
+
+
+class StagedInstall:
+    """Builds a new version of a directory off to the side and swaps it in.
+
+    The new tree is written to a staging directory on the same volume as the
+    target, so the active installation stays usable until commit() renames it
+    into place. The replaced tree is kept as the previous version, so it can be
+    restored instantly with rollback().
+
+    With a blob store, the staged tree is deduplicated against the store on
+    commit, and the store refs named after the target track the active and
+    previous trees so that their blobs survive garbage collection. Until the
+    swap, the staged tree is held by its own ref.
+    """
+
+    def __init__(
+        self,
+        target: Path,
+        path_manager: PathManager,
+        trash_reaper: TrashReaper,
+        store: Optional[BlobStore] = None,
+        ref: Optional[str] = None,
+    ):
+        """Initialize staged install.
+
+        Args:
+            target: Live directory being replaced (e.g. Euroscope/)
+            path_manager: Path manager instance
+            trash_reaper: Trash reaper used to delete replaced trees
+            store: Optional blob store to deduplicate committed trees into
+            ref: Store ref of the active tree, defaults to the target's name
+        """
+        self.target = target
+        self.staging = path_manager.staging / target.name
+        self.previous = path_manager.previous / target.name
+        self.trash_reaper = trash_reaper
+        self.store = store
+        self.ref = ref or target.name
+        self.previous_ref = f"{self.ref}{PREVIOUS_REF_SUFFIX}"
+        self.staged_ref = f"{self.ref}{STAGED_REF_SUFFIX}"
+
+    def begin(self, resume: bool = False) -> Path:
+        """Prepare an empty staging directory, discarding any stale one.
+
+        Args:
+            resume: Keep the files staged by an interrupted earlier attempt
+
+        Returns:
+            Path of the staging directory to install into
+        """
+        if not resume:
+            self.trash_reaper.discard(self.staging)
+        self.staging.mkdir(parents=True, exist_ok=True)
+        return self.staging
+
+    def commit(self, private: Callable[[str], bool] = is_rewritten, tree: Optional[str] = None) -> None:
+        """Swap the staged tree into place, keeping the replaced tree as previous.
+
+        Args:
+            private: Predicate selecting relative paths the store must not share
+            tree: Digest of the staged tree if it was materialised from the store
+
+        Raises:
+            OSError: If the swap fails; the active tree is left in place
+        """
+        tree = tree or self._ingest(private)
+
+        self.trash_reaper.discard(self.previous)
+        self.previous.parent.mkdir(parents=True, exist_ok=True)
+
+        replaced = self.target.exists()
+        if replaced:
+            self.target.rename(self.previous)
+
+        try:
+            self.staging.rename(self.target)
+        except OSError:
+            if self.previous.exists() and not self.target.exists():
+                self.previous.rename(self.target)
+            raise
+
+        if self.store:
+            self.store.update_refs({
+                self.ref: tree,
+                self.previous_ref: self.store.ref(self.ref) if replaced else None,
+                self.staged_ref: None,
+            })
+        if tree:
+            self._record(tree, private)
+
+    def abort(self) -> None:
+        """Discard the staged tree, leaving the active tree untouched."""
+        self.trash_reaper.discard(self.staging)
+        if self.store:
+            self.store.update_refs({self.staged_ref: None})
+
+    def rollback(self) -> bool:
+        """Restore the previous tree in place of the active one.
+
+        Returns:
+            True if a previous tree was restored, False if there was none
+        """
+        if not self.previous.exists():
+            return False
+
+        self.trash_reaper.discard(self.target)
+        self.previous.rename(self.target)
+
+        if self.store:
+            self.store.update_refs({
+                self.ref: self.store.ref(self.previous_ref),
+                self.previous_ref: None,
+            })
+        return True
+
+    def _record(self, tree: str, private: Callable[[str], bool]) -> None:
+        """Index the committed tree for later integrity verification.
+
+        Args:
+            tree: Digest of the committed tree
+            private: Predicate selecting relative paths that may be modified
+        """
+        try:
+            TreeVerifier(self.store).record(self.target, tree, private)
+        except OSError as e:
+            print(f"Warning: Could not index {self.target}: {e}")
+
+    def _ingest(self, private: Callable[[str], bool]) -> Optional[str]:
+        """Deduplicate the staged tree into the store, if there is one.
+
+        A failure only costs the disk space saving, so it does not stop the commit.
+
+        Args:
+            private: Predicate selecting relative paths the store must not share
+
+        Returns:
+            Digest of the staged tree, or None if it was not stored
+        """
+        if not self.store:
+            return None
+
+        try:
+            return self.store.ingest(self.staging, private, ref=self.staged_ref)
+        except OSError as e:
+            print(f"Warning: Could not deduplicate {self.staging}: {e}")
+            return None
@@ -0,0 +1,184 @@
+"""Opt-in startup phase profiler.
+
+Set the environment variable named by ``settings.STARTUP_PROFILE_ENV`` to
+enable it. The value is the directory the profile is written to, or ``1`` to
+use the application temp directory. Two files are written:
+
+    startup_profile.json  Phase timings in milliseconds, for fleet reporting
+    startup_trace.json    Chrome trace format, for chrome://tracing or Perfetto
+"""
+
+import json
+import os
+import platform
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+from config import settings
+
+PROFILE_FILE = "startup_profile.json"
+TRACE_FILE = "startup_trace.json"
+
+
+class StartupProfiler:
+    """Records monotonic timestamps for named startup phases."""
+
+    def __init__(self, output_dir: Optional[Path] = None):
+        """Initialize startup profiler.
+
+        Args:
+            output_dir: Directory to write the profile to. Profiling is disabled if None.
+        """
+        self.output_dir = output_dir
+        self._origin_ns = time.perf_counter_ns()
+        self._started_at = datetime.now(timezone.utc)
+        self._events: list[dict] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> "StartupProfiler":
+        """Create a profiler configured from the environment.
+
+        Returns:
+            StartupProfiler instance, disabled if the environment variable is not set
+        """
+        value = os.environ.get(settings.STARTUP_PROFILE_ENV, "").strip()
+
+        if not value or value == "0":
+            return cls()
+
+        if value.lower() in ("1", "true", "yes"):
+            return cls(Path.cwd() / settings.TEMP_DIR)
+
+        return cls(Path(value))
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether profiling is enabled."""
+        return self.output_dir is not None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a startup phase.
+
+        Args:
+            name: Phase name
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._record(name, start_ns, time.perf_counter_ns() - start_ns)
+
+    def mark(self, name: str) -> None:
+        """Record an instant event, such as the first frame being shown.
+
+        Args:
+            name: Event name
+        """
+        if self.enabled:
+            self._record(name, time.perf_counter_ns(), None)
+
+    def _record(self, name: str, start_ns: int, duration_ns: Optional[int]) -> None:
+        thread = threading.current_thread()
+        with self._lock:
+            self._events.append({
+                "name": name,
+                "start_ns": start_ns - self._origin_ns,
+                "duration_ns": duration_ns,
+                "thread_id": thread.ident,
+                "thread_name": thread.name,
+            })
+
+    def write(self) -> None:
+        """Write the recorded phases as JSON and Chrome trace files.
+
+        Can be called repeatedly; phases recorded since the last call
+        (for example by background threads) are included in the new files.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            events = list(self._events)
+
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+
+            with open(self.output_dir / PROFILE_FILE, "w", encoding="utf-8") as f:
+                json.dump(self._build_profile(events), f, indent=2)
+
+            with open(self.output_dir / TRACE_FILE, "w", encoding="utf-8") as f:
+                json.dump(self._build_trace(events), f)
+        except OSError as e:
+            print(f"Error writing startup profile: {e}")
+
+    def _build_profile(self, events: list[dict]) -> dict:
+        phases = [
+            {
+                "name": event["name"],
+                "start_ms": event["start_ns"] / 1e6,
+                "duration_ms": (
+                    event["duration_ns"] / 1e6 if event["duration_ns"] is not None else None
+                ),
+                "thread": event["thread_name"],
+            }
+            for event in events
+        ]
+
+        end_ns = max(
+            (event["start_ns"] + (event["duration_ns"] or 0) for event in events),
+            default=0,
+        )
+
+        return {
+            "app_version": settings.APP_VERSION,
+            "platform": platform.platform(),
+            "python_version": platform.python_version(),
+            "pid": os.getpid(),
+            "started_at": self._started_at.isoformat(),
+            "total_ms": end_ns / 1e6,
+            "phases": phases,
+        }
+
+    def _build_trace(self, events: list[dict]) -> dict:
+        pid = os.getpid()
+        trace_events = []
+        thread_names = {}
+
+        for event in events:
+            thread_names[event["thread_id"]] = event["thread_name"]
+            trace_event = {
+                "name": event["name"],
+                "cat": "startup",
+                "ts": event["start_ns"] / 1000,
+                "pid": pid,
+                "tid": event["thread_id"],
+            }
+            if event["duration_ns"] is None:
+                trace_event.update({"ph": "i", "s": "p"})
+            else:
+                trace_event.update({"ph": "X", "dur": event["duration_ns"] / 1000})
+            trace_events.append(trace_event)
+
+        for thread_id, thread_name in thread_names.items():
+            trace_events.append({
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            })
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+startup_profiler = StartupProfiler.from_environment()
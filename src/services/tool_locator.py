@@ -0,0 +1,28 @@
+"""External tool location service."""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from config import settings
+
+
+class ToolLocator:
+    """Auto-detects external tools at their default install locations.
+
+    Each probe touches the filesystem at most once per process. Call
+    ``cache_clear()`` on a probe to force it to run again.
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def find_afv() -> Optional[str]:
+        """Find Audio for VATSIM at its default installation location.
+
+        Returns:
+            Path to the AFV executable, or None if it is not installed there
+        """
+        default_path = Path(settings.AFV_DEFAULT_PATH)
+        if default_path.is_file():
+            return str(default_path)
+        return None
@@ -0,0 +1,201 @@
+"""Deferred background deletion of old directory trees."""
+
+import os
+import platform
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from services import PathManager
+
+# SetFileInformationByHandle(FileDispositionInfoEx) flags, Windows 10 1809 and later
+FILE_DISPOSITION_INFO_EX = 21
+FILE_DISPOSITION_FLAG_DELETE = 0x1
+FILE_DISPOSITION_FLAG_POSIX_SEMANTICS = 0x2
+FILE_DISPOSITION_FLAG_IGNORE_READONLY_ATTRIBUTE = 0x10
+
+
+def remove_file(path: Path) -> None:
+    """Delete a file without changing its attributes, even if it is read-only.
+
+    The read-only attribute belongs to the file, not to the name, so
+    clearing it to delete one hardlink would make every other link to the
+    same file writable, including its blob in the store. Elsewhere unlinking
+    never needs write access to the file; on Windows the file is deleted
+    with a disposition that ignores the read-only attribute.
+
+    Args:
+        path: File to delete
+
+    Raises:
+        OSError: If the file could not be deleted
+    """
+    try:
+        os.unlink(path)
+    except PermissionError:
+        if platform.system() != "Windows":
+            raise
+        _delete_ignoring_read_only(path)
+
+
+def _delete_ignoring_read_only(path: Path) -> None:
+    """Delete a file on Windows regardless of its read-only attribute."""
+    import ctypes
+    from ctypes import wintypes
+
+    DELETE = 0x00010000
+    FILE_SHARE_ALL = 0x1 | 0x2 | 0x4
+    OPEN_EXISTING = 3
+    FILE_FLAG_OPEN_REPARSE_POINT = 0x00200000
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateFileW.argtypes = [
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
+    ]
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    kernel32.SetFileInformationByHandle.argtypes = [
+        wintypes.HANDLE, ctypes.c_int, wintypes.LPVOID, wintypes.DWORD,
+    ]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+    handle = kernel32.CreateFileW(
+        str(path), DELETE, FILE_SHARE_ALL, None, OPEN_EXISTING, FILE_FLAG_OPEN_REPARSE_POINT, None
+    )
+    if handle == wintypes.HANDLE(-1).value:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    try:
+        flags = wintypes.DWORD(
+            FILE_DISPOSITION_FLAG_DELETE
+            | FILE_DISPOSITION_FLAG_POSIX_SEMANTICS
+            | FILE_DISPOSITION_FLAG_IGNORE_READONLY_ATTRIBUTE
+        )
+        if not kernel32.SetFileInformationByHandle(
+            handle, FILE_DISPOSITION_INFO_EX, ctypes.byref(flags), ctypes.sizeof(flags)
+        ):
+            raise ctypes.WinError(ctypes.get_last_error())
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+class TrashReaper:
+    """Moves old trees into a trash area and deletes them in the background.
+
+    Renaming a tree into the trash directory on the same volume is instant,
+    so callers can continue immediately. A low-priority daemon thread then
+    deletes the trash. Anything left behind by a crash or an early exit is
+    deleted the next time the reaper starts.
+    """
+
+    def __init__(self, path_manager: PathManager):
+        """Initialize trash reaper.
+
+        Args:
+            path_manager: Path manager instance
+        """
+        self.path_manager = path_manager
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the background reaper, deleting any trash left from earlier runs."""
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._thread = threading.Thread(
+                target=self._run, name="TrashReaper", daemon=True
+            )
+            self._thread.start()
+
+        self._wake.set()
+
+    def discard(self, path: Path) -> None:
+        """Move a file or directory into the trash for deletion in the background.
+
+        Falls back to deleting synchronously if it cannot be renamed, for
+        example when it is on another volume.
+
+        Args:
+            path: File or directory to discard
+        """
+        if not path.exists():
+            return
+
+        trash = self.path_manager.trash
+
+        try:
+            trash.mkdir(parents=True, exist_ok=True)
+            path.rename(trash / f"{path.name}.{uuid.uuid4().hex}")
+        except OSError as e:
+            print(f"Could not move {path} to trash, deleting in place: {e}")
+            self._delete(path)
+            return
+
+        self.start()
+        self._wake.set()
+
+    def discard_contents(self, path: Path, keep: Optional[Path] = None) -> None:
+        """Discard everything inside a directory.
+
+        Args:
+            path: Directory to clear
+            keep: Optional item inside the directory to leave in place
+        """
+        if not path.exists():
+            return
+
+        for item in path.iterdir():
+            if keep is not None and item == keep:
+                continue
+            self.discard(item)
+
+    def _run(self) -> None:
+        """Delete trash whenever new items arrive. Runs in the reaper thread."""
+        self._enter_background_mode()
+
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+
+            trash = self.path_manager.trash
+            if not trash.exists():
+                continue
+
+            for item in list(trash.iterdir()):
+                self._delete(item)
+
+    @staticmethod
+    def _delete(path: Path) -> None:
+        def remove_read_only(function, failed_path, exc_info):
+            # Windows refuses to delete read-only files, such as links into a blob store
+            if function not in (os.unlink, os.remove):
+                raise exc_info[1]
+            remove_file(Path(failed_path))
+
+        try:
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path, onerror=remove_read_only)
+            elif path.exists() or path.is_symlink():
+                remove_file(path)
+        except OSError as e:
+            print(f"Warning: Could not delete {path}: {e}")
+
+    @staticmethod
+    def _enter_background_mode() -> None:
+        """Lower the CPU and I/O priority of the current thread where supported."""
+        if platform.system() != "Windows":
+            return
+
+        try:
+            import ctypes
+
+            THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_MODE_BACKGROUND_BEGIN)
+        except Exception as e:
+            print(f"Could not lower reaper thread priority: {e}")
@@ -0,0 +1,339 @@
+"""Integrity verification and repair of installed trees against their store manifests."""
+
+import mmap
+import os
+import shutil
+import struct
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from services import BlobStore, CancellationToken
+from services.blob_store import is_rewritten
+from services.install_journal import file_sha256
+from services.trash_reaper import remove_file
+
+INDEX_MAGIC = b"SFIDX\x01"
+INDEX_HEADER = struct.Struct("<6s2x32sI")  # magic, tree digest, entry count
+INDEX_ENTRY = struct.Struct("<Qq32sIHH")  # size, mtime_ns, blob digest, path offset, path length, flags
+
+FLAG_PRIVATE = 1
+
+# Hashing is I/O bound and hashlib releases the GIL, so use more threads than cores
+HASH_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """Expected state of one installed file."""
+
+    path: str
+    size: int
+    mtime_ns: int  # 0 when the file's content has not been confirmed
+    digest: str
+    private: bool
+
+
+class TreeIndex:
+    """Compact binary index of an installed tree, read through a memory map.
+
+    Layout: a header with the tree digest and entry count, a table of
+    fixed-size entries, then the UTF-8 paths the entries point into. Opening
+    an index only maps the file; entries are decoded as they are iterated.
+    """
+
+    def __init__(self, path: Path):
+        """Open an index file.
+
+        Args:
+            path: Index file
+
+        Raises:
+            FileNotFoundError: If the index does not exist
+            ValueError: If the file is not a valid index
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < INDEX_HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a tree index")
+
+        magic, tree, self._count = INDEX_HEADER.unpack_from(self._map, 0)
+        if magic != INDEX_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a tree index")
+
+        self.tree = tree.hex()
+        self._paths_offset = INDEX_HEADER.size + self._count * INDEX_ENTRY.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[IndexEntry]:
+        for i in range(self._count):
+            size, mtime_ns, digest, offset, length, flags = INDEX_ENTRY.unpack_from(
+                self._map, INDEX_HEADER.size + i * INDEX_ENTRY.size
+            )
+            start = self._paths_offset + offset
+            yield IndexEntry(
+                path=self._map[start:start + length].decode("utf-8"),
+                size=size,
+                mtime_ns=mtime_ns,
+                digest=digest.hex(),
+                private=bool(flags & FLAG_PRIVATE),
+            )
+
+    def close(self) -> None:
+        """Unmap the index file."""
+        self._map.close()
+
+    @staticmethod
+    def write(path: Path, tree: str, entries: list[IndexEntry]) -> None:
+        """Atomically write an index file.
+
+        Args:
+            path: Index file to write
+            tree: Digest of the indexed tree
+            entries: Entries to store
+        """
+        table = bytearray()
+        paths = bytearray()
+
+        for entry in entries:
+            encoded = entry.path.encode("utf-8")
+            table += INDEX_ENTRY.pack(
+                entry.size,
+                entry.mtime_ns,
+                bytes.fromhex(entry.digest),
+                len(paths),
+                len(encoded),
+                FLAG_PRIVATE if entry.private else 0,
+            )
+            paths += encoded
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        with open(partial, "wb") as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, bytes.fromhex(tree), len(entries)))
+            f.write(table)
+            f.write(paths)
+        os.replace(partial, path)
+
+
+class TreeVerifier:
+    """Checks installed trees against the manifests in the blob store and repairs them.
+
+    Each committed tree gets an index recording the expected size of every
+    file and the modification time it had when its content was known to be
+    good. Verification only stats files whose size and modification time
+    still match; the rest are hashed in parallel. Damaged or missing files
+    are restored from the store's blobs, so repair needs no download or
+    reinstallation.
+
+    Private files (settings EuroScope rewrites) are only checked for
+    existence, since their content is expected to change.
+    """
+
+    def __init__(self, store: BlobStore):
+        """Initialize tree verifier.
+
+        Args:
+            store: Blob store holding the tree manifests
+        """
+        self.store = store
+
+    def record(
+        self, target: Path, tree: str, private: Callable[[str], bool] = is_rewritten
+    ) -> None:
+        """Index a tree that has just been installed from known-good content.
+
+        Args:
+            target: Installed directory
+            tree: Digest of the installed tree
+            private: Predicate selecting relative paths that may be modified
+        """
+        entries = []
+
+        for relative, digest in sorted(self.store.load_tree(tree).items()):
+            blob = self.store.blob_path(digest)
+            try:
+                info = (target / relative).stat()
+            except OSError:
+                info = None
+
+            size = blob.stat().st_size if blob.exists() else (info.st_size if info else 0)
+            confirmed = info is not None and info.st_size == size
+            entries.append(IndexEntry(
+                path=relative,
+                size=size,
+                mtime_ns=info.st_mtime_ns if confirmed else 0,
+                digest=digest,
+                private=private(relative),
+            ))
+
+        TreeIndex.write(self.store.index_path(tree), tree, entries)
+
+    def verify(
+        self,
+        target: Path,
+        cancel_token: Optional[CancellationToken] = None,
+        ref: Optional[str] = None,
+    ) -> dict:
+        """Verify an installed directory against the manifest of its active tree.
+
+        Args:
+            target: Installed directory (e.g. Euroscope/)
+            cancel_token: Optional token checked between files
+            ref: Store ref of the directory's active tree, defaults to the directory's name
+
+        Returns:
+            Summary with the tree digest, file counts and the relative paths
+            of missing and damaged files
+
+        Raises:
+            FileNotFoundError: If the store has no manifest for the directory
+            OperationCancelled: If cancellation is requested
+        """
+        cancel_token = cancel_token or CancellationToken()
+        ref = ref or target.name
+        tree = self.store.ref(ref)
+        if not tree:
+            raise FileNotFoundError(f"No install manifest for {target}, reinstall it to enable verification")
+
+        entries = self._load_entries(target, tree)
+        missing = []
+        suspicious = []
+
+        for entry in entries:
+            cancel_token.raise_if_cancelled()
+            try:
+                info = (target / entry.path).stat()
+            except OSError:
+                missing.append(entry.path)
+                continue
+
+            if entry.private:
+                continue
+            if info.st_size != entry.size or info.st_mtime_ns != entry.mtime_ns:
+                suspicious.append(entry)
+
+        damaged = []
+        confirmed = {}
+
+        def check(entry: IndexEntry) -> None:
+            cancel_token.raise_if_cancelled()
+            path = target / entry.path
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+                intact = file_sha256(path) == entry.digest
+            except OSError:
+                intact = False
+
+            if intact:
+                confirmed[entry.path] = mtime_ns
+            else:
+                damaged.append(entry.path)
+
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+            list(pool.map(check, suspicious))
+
+        if confirmed:
+            self._save_entries(tree, [
+                IndexEntry(e.path, e.size, confirmed.get(e.path, e.mtime_ns), e.digest, e.private)
+                for e in entries
+            ])
+
+        return {
+            "target": target.name,
+            "ref": ref,
+            "tree": tree,
+            "files": len(entries),
+            "hashed": len(suspicious),
+            "missing": sorted(missing),
+            "damaged": sorted(damaged),
+        }
+
+    def repair(self, target: Path, report: dict) -> dict:
+        """Restore the missing and damaged files found by verify() from the store.
+
+        A file cannot be repaired if its blob is gone or damaged too, which
+        happens when a hardlinked file was modified in place.
+
+        Args:
+            target: Installed directory that was verified
+            report: Result of verify() for the directory
+
+        Returns:
+            Relative paths that were repaired and that could not be repaired
+        """
+        entries = {entry.path: entry for entry in self._load_entries(target, report["tree"])}
+        repaired = []
+        unrepairable = []
+
+        for relative in report["missing"] + report["damaged"]:
+            entry = entries[relative]
+            blob = self.store.blob_path(entry.digest)
+            if not blob.exists() or file_sha256(blob) != entry.digest:
+                unrepairable.append(relative)
+                continue
+
+            path = target / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            if entry.private:
+                shutil.copyfile(blob, partial)
+            else:
+                self.store.link(blob, partial)
+            try:
+                os.replace(partial, path)
+            except PermissionError:
+                # Windows does not replace read-only files, such as links into the store
+                remove_file(path)
+                os.replace(partial, path)
+            repaired.append(relative)
+
+        if repaired:
+            self.record(target, report["tree"], lambda relative: entries[relative].private)
+
+        return {"repaired": repaired, "unrepairable": unrepairable}
+
+    def _load_entries(self, target: Path, tree: str) -> list[IndexEntry]:
+        """Load the index of a tree, building an unconfirmed one if it is missing.
+
+        Args:
+            target: Installed directory of the tree
+            tree: Tree digest
+
+        Returns:
+            Index entries of the tree
+        """
+        try:
+            index = TreeIndex(self.store.index_path(tree))
+        except (OSError, ValueError):
+            index = None
+
+        if index is not None:
+            try:
+                if index.tree == tree:
+                    return list(index)
+            finally:
+                index.close()
+
+        # Without a recorded state every file is hashed on the first run
+        return [
+            IndexEntry(relative, self._blob_size(digest), 0, digest, is_rewritten(relative))
+            for relative, digest in sorted(self.store.load_tree(tree).items())
+        ]
+
+    def _save_entries(self, tree: str, entries: list[IndexEntry]) -> None:
+        try:
+            TreeIndex.write(self.store.index_path(tree), tree, entries)
+        except OSError as e:
+            print(f"Warning: Could not update the index of tree {tree}: {e}")
+
+    def _blob_size(self, digest: str) -> int:
+        blob = self.store.blob_path(digest)
+        return blob.stat().st_size if blob.exists() else 0
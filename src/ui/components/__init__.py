@@ -1,6 +1,10 @@
 """UI components."""
 from ui.components.base_dialog import BaseDialog
-from ui.components.install_dialog import InstallProgressDialog, SectorfileInstructionsDialog
+from ui.components.progress_channel import ProgressChannel
+from ui.components.install_dialog import (
+    FreshInstallDialog,
+    SectorfileInstructionsDialog,
+)
 from ui.components.error_dialogs import (
     NoProfilesDialog,
     SectorfileUpdateDialog,
@@ -11,8 +15,9 @@ from ui.components.update_dialogs import MandatoryUpdateDialog, UpdateAvailableD
 
 __all__ = [
     "BaseDialog",
-    "InstallProgressDialog",
+    "FreshInstallDialog",
     "NoProfilesDialog",
+    "ProgressChannel",
     "SectorfileInstructionsDialog",
     "SectorfileUpdateDialog",
     "SettingsDialog",
@@ -1,17 +1,18 @@
 """Error dialog components."""
 
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 import flet as ft
 from ui.components import BaseDialog, SectorfileInstructionsDialog
 
-from services import Installer
+if TYPE_CHECKING:
+    from services import Installer
 
 
 class SectorfileUpdateDialog(BaseDialog):
     """Dialog shown when sectorfile needs to be updated."""
 
-    def __init__(self, page: ft.Page, installer: Installer, on_complete: Optional[Callable] = None):
+    def __init__(self, page: ft.Page, installer: "Installer", on_complete: Optional[Callable] = None):
         """Initialize sectorfile update dialog.
 
         Args:
@@ -1,99 +1,71 @@
 """Installation dialog components."""
 
+from typing import TYPE_CHECKING, Callable
+
 import flet as ft
 
-from services import Installer
+from models import ProgressEvent
+from services import CancellationToken
+from ui.components import ProgressChannel
 
+if TYPE_CHECKING:
+    from services import Installer
 
-class InstallProgressDialog:
-    """Dialog showing EuroScope installation progress."""
 
-    def __init__(self, page: ft.Page, installer: Installer):
-        """Initialize install progress dialog.
+def format_progress_detail(event: ProgressEvent) -> str:
+    """Format the percentage and remaining time of a progress event.
 
-        Args:
-            page: Flet page instance
-            installer: Installer service
-        """
-        self.page = page
-        self.installer = installer
+    Args:
+        event: Progress event
 
-        self.progress_text = ft.Text("Starting installation...", size=16)
-        self.progress_bar = ft.ProgressBar(width=400)
+    Returns:
+        Text such as '42% - about 1 min 5 s remaining', empty if progress is unknown
+    """
+    if event.percent is None:
+        return ""
 
-        self.dialog = ft.AlertDialog(
-            modal=True,
-            title=ft.Text("Installing EuroScope"),
-            content=ft.Container(
-                content=ft.Column(
-                    controls=[
-                        self.progress_text,
-                        self.progress_bar,
-                    ],
-                    tight=True,
-                    spacing=20,
-                ),
-                width=500,
-                padding=20,
-            ),
-        )
+    if event.eta_seconds is None:
+        return f"{event.percent}%"
 
-    def show(self, on_complete_callback=None):
-        """Show the dialog and start installation.
+    minutes, seconds = divmod(int(event.eta_seconds), 60)
+    remaining = f"{minutes} min {seconds} s" if minutes else f"{seconds} s"
+    return f"{event.percent}% - about {remaining} remaining"
 
-        Args:
-            on_complete_callback: Callback to run when installation completes
-        """
-        self.page.overlay.append(self.dialog)
-        self.dialog.open = True
-        self.page.update()
-
-        def progress_callback(message: str) -> None:
-            """Update progress text."""
-            self.progress_text.value = message
-            self.page.update()
-
-        try:
-            success = self.installer.install_euroscope(
-                progress_callback=progress_callback
-            )
-
-            if success:
-                self.progress_text.value = "EuroScope installation complete!"
-                self.progress_bar.visible = False
-                self.page.update()
-
-                self.close()
-
-                if on_complete_callback:
-                    on_complete_callback()
-            else:
-                self.progress_text.value = "Installation failed!"
-                self.progress_bar.visible = False
-                self.dialog.actions = [
-                    ft.TextButton(text="Close", on_click=lambda _: self.close())
-                ]
-        except Exception as ex:
-            self.progress_text.value = f"Error: {ex}"
-            self.progress_bar.visible = False
-            self.dialog.actions = [
-                ft.TextButton(text="Close", on_click=lambda _: self.close())
-            ]
 
-        self.page.update()
+def show_progress_event(
+        event: ProgressEvent,
+        progress_text: ft.Text,
+        detail_text: ft.Text,
+        progress_bar: ft.ProgressBar
+) -> None:
+    """Apply a progress event to progress controls.
 
-    def close(self):
-        """Close the dialog."""
-        self.dialog.open = False
-        self.page.update()
-        if self.dialog in self.page.overlay:
-            self.page.overlay.remove(self.dialog)
+    Args:
+        event: Progress event
+        progress_text: Text control showing the current step
+        detail_text: Text control showing percentage and remaining time
+        progress_bar: Progress bar, indeterminate while progress is unknown
+    """
+    progress_text.value = event.message
+    detail_text.value = format_progress_detail(event)
+    progress_bar.value = event.fraction
 
 
 class SectorfileInstructionsDialog:
     """Dialog with instructions for manual sectorfile download."""
 
-    def __init__(self, page: ft.Page, installer: Installer):
+    INSTRUCTIONS = (
+        "Due to changes in GNG, you must manually download the sectorfile.\n\n"
+        "When you press OK:\n"
+        "1. Your web browser will open the AeroNav GNG page\n"
+        "2. Log in with your Navigraph and VATSIM accounts\n"
+        "3. Download the ZIP file to the Sectorfile folder that will open\n"
+        "4. The installer will detect and extract it automatically"
+    )
+    PROGRESS_TITLE = "Installing Sectorfile"
+    COMPLETE_MESSAGE = "Sectorfile installation complete!"
+
+    def __init__(self, page: ft.Page, installer: "Installer"):
         """Initialize sectorfile instructions dialog.
 
         Args:
@@ -102,20 +74,13 @@ class SectorfileInstructionsDialog:
         """
         self.page = page
         self.installer = installer
+        self.cancel_token = CancellationToken()
 
         self.dialog = ft.AlertDialog(
             modal=True,
             title=ft.Text("Manual Sectorfile Download Required"),
             content=ft.Container(
-                content=ft.Text(
-                    "Due to changes in GNG, you must manually download the sectorfile.\n\n"
-                    "When you press OK:\n"
-                    "1. Your web browser will open the AeroNav GNG page\n"
-                    "2. Log in with your Navigraph and VATSIM accounts\n"
-                    "3. Download the ZIP file to the Sectorfile folder that will open\n"
-                    "4. The installer will detect and extract it automatically",
-                    size=14,
-                ),
+                content=ft.Text(self.INSTRUCTIONS, size=14),
                 width=500,
                 height=300,
                 padding=0,
@@ -148,18 +113,32 @@ class SectorfileInstructionsDialog:
         self._show_progress_dialog()
 
     def _show_progress_dialog(self):
-        """Show progress dialog and start installation."""
+        """Show progress dialog and start installation in a background thread."""
         progress_text = ft.Text("Opening browser and file explorer...", size=16)
+        detail_text = ft.Text("", size=12, italic=True)
         progress_bar = ft.ProgressBar(width=400)
 
+        def on_cancel_click():
+            """Handle cancel button click."""
+            self.cancel_token.cancel()
+            cancel_button.disabled = True
+            progress_text.value = "Cancelling..."
+            self.page.update()
+
+        cancel_button = ft.TextButton(
+            text="Cancel",
+            on_click=lambda _: on_cancel_click(),
+        )
+
         progress_dialog = ft.AlertDialog(
             modal=True,
-            title=ft.Text("Installing Sectorfile"),
+            title=ft.Text(self.PROGRESS_TITLE),
             content=ft.Container(
                 content=ft.Column(
                     controls=[
                         progress_text,
                         progress_bar,
+                        detail_text,
                     ],
                     tight=True,
                     spacing=20,
@@ -167,23 +146,45 @@ class SectorfileInstructionsDialog:
                 width=500,
                 padding=20,
             ),
+            actions=[cancel_button],
         )
 
         self.page.overlay.append(progress_dialog)
         progress_dialog.open = True
         self.page.update()
 
-        def progress_callback(message: str) -> None:
-            """Update progress text."""
-            progress_text.value = message
-            self.page.update()
+        self.page.run_thread(
+            self._run_install, progress_dialog, progress_text, detail_text, progress_bar
+        )
+
+    def _run_install(
+            self,
+            progress_dialog: ft.AlertDialog,
+            progress_text: ft.Text,
+            detail_text: ft.Text,
+            progress_bar: ft.ProgressBar
+    ):
+        """Run the sectorfile installation. Executed in a background thread.
+
+        Args:
+            progress_dialog: Progress dialog to update
+            progress_text: Progress text control
+            detail_text: Progress percentage and remaining time control
+            progress_bar: Progress bar control
+        """
+        channel = ProgressChannel(
+            self.page,
+            lambda event: show_progress_event(event, progress_text, detail_text, progress_bar),
+        )
 
         try:
-            success = self.installer.install_sectorfile(progress_callback=progress_callback)
+            success = self._install(channel.post, self.cancel_token)
+            channel.close()
 
             if success:
-                progress_text.value = "Sectorfile installation complete!"
+                progress_text.value = self.COMPLETE_MESSAGE
                 progress_bar.visible = False
+                detail_text.visible = False
                 progress_dialog.actions = [
                     ft.FilledButton(
                         text="OK",
@@ -191,8 +192,12 @@ class SectorfileInstructionsDialog:
                     )
                 ]
             else:
-                progress_text.value = "Installation failed or timed out"
+                if self.cancel_token.is_cancelled:
+                    progress_text.value = "Installation cancelled."
+                else:
+                    progress_text.value = "Installation failed or timed out"
                 progress_bar.visible = False
+                detail_text.visible = False
                 progress_dialog.actions = [
                     ft.TextButton(
                         text="Close",
@@ -200,8 +205,10 @@ class SectorfileInstructionsDialog:
                     )
                 ]
         except Exception as ex:
+            channel.close()
             progress_text.value = f"Error: {ex}"
             progress_bar.visible = False
+            detail_text.visible = False
             progress_dialog.actions = [
                 ft.TextButton(
                     text="Close",
@@ -211,9 +218,65 @@ class SectorfileInstructionsDialog:
 
         self.page.update()
 
+    def _install(
+            self,
+            progress_callback: Callable[[ProgressEvent], None],
+            cancel_token: CancellationToken
+    ) -> bool:
+        """Run the installation started by this dialog.
+
+        Args:
+            progress_callback: Callback for progress updates
+            cancel_token: Token used to stop the installation
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.installer.install_sectorfile(
+            progress_callback=progress_callback,
+            cancel_token=cancel_token,
+        )
+
     def _close_progress_dialog(self, dialog: ft.AlertDialog):
         """Close the progress dialog."""
         dialog.open = False
         self.page.update()
         if dialog in self.page.overlay:
             self.page.overlay.remove(dialog)
+
+
+class FreshInstallDialog(SectorfileInstructionsDialog):
+    """Dialog installing EuroScope while the user downloads the sectorfile."""
+
+    INSTRUCTIONS = (
+        "Due to changes in GNG, you must manually download the sectorfile.\n\n"
+        "When you press OK:\n"
+        "1. EuroScope will be downloaded and installed in the background\n"
+        "2. Your web browser will open the AeroNav GNG page\n"
+        "3. Log in with your Navigraph and VATSIM accounts\n"
+        "4. Download the ZIP file to the Sectorfile folder that will open\n"
+        "5. The installer will detect and extract it automatically"
+    )
+    PROGRESS_TITLE = "Installing EuroScope and Sectorfile"
+    COMPLETE_MESSAGE = "Installation complete!"
+
+    def _install(
+            self,
+            progress_callback: Callable[[ProgressEvent], None],
+            cancel_token: CancellationToken
+    ) -> bool:
+        """Run EuroScope and sectorfile installation together.
+
+        Args:
+            progress_callback: Callback for progress updates
+            cancel_token: Token used to stop the installation
+
+        Returns:
+            True if successful, False otherwise
+        """
+        from services import FreshInstall
+
+        return FreshInstall(self.installer).run(
+            progress_callback=progress_callback,
+            cancel_token=cancel_token,
+        )
@@ -0,0 +1,92 @@
+"""Rate-limited progress channel between worker threads and the UI."""
+
+import threading
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+import flet as ft
+
+from config import settings
+
+T = TypeVar("T")
+
+
+class ProgressChannel(Generic[T]):
+    """Delivers progress from a worker thread to the UI at a fixed frame rate.
+
+    Workers may post as often as they like; only the latest value is kept and
+    it is applied to the controls, followed by a single page.update(), at most
+    once per frame.
+    """
+
+    def __init__(
+            self,
+            page: ft.Page,
+            apply: Callable[[T], None],
+            fps: Optional[float] = None
+    ):
+        """Initialize progress channel.
+
+        Args:
+            page: Flet page instance
+            apply: Callback that applies a progress value to the controls
+            fps: Maximum number of UI updates per second (default: from settings)
+        """
+        self.page = page
+        self.apply = apply
+        self.interval = 1 / (fps or settings.PROGRESS_UPDATE_FPS)
+
+        self._lock = threading.Lock()
+        self._pending: Optional[T] = None
+        self._has_pending = False
+        self._last_flush = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    def post(self, value: T) -> None:
+        """Post a progress value. Safe to call from any thread.
+
+        Args:
+            value: Progress value to show
+        """
+        with self._lock:
+            if self._closed:
+                return
+
+            self._pending = value
+            self._has_pending = True
+
+            if self._timer is not None:
+                return
+
+            delay = self._last_flush + self.interval - time.monotonic()
+            if delay > 0:
+                self._timer = threading.Timer(delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+                return
+
+        self.flush()
+
+    def flush(self) -> None:
+        """Apply the latest pending value to the UI immediately."""
+        with self._lock:
+            self._timer = None
+            if not self._has_pending:
+                return
+            value = self._pending
+            self._has_pending = False
+            self._last_flush = time.monotonic()
+
+            self.apply(value)
+
+        self.page.update()
+
+    def close(self) -> None:
+        """Deliver any pending value and stop accepting new ones."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._closed = True
+
+        self.flush()
@@ -1,10 +1,15 @@
 """Application update dialog components."""
 
+from typing import TYPE_CHECKING
+
 import flet as ft
 
-from services import AppUpdateManager
+from services import CancellationToken, OperationCancelled
 from ui.components import BaseDialog
 
+if TYPE_CHECKING:
+    from services import AppUpdateManager
+
 
 class MandatoryUpdateDialog(BaseDialog):
     """Dialog shown on Windows when application update is required.
@@ -17,7 +22,7 @@ class MandatoryUpdateDialog(BaseDialog):
             self,
             page: ft.Page,
             release_info: dict,
-            update_manager: AppUpdateManager
+            update_manager: "AppUpdateManager"
     ):
         """Initialize mandatory update dialog.
 
@@ -29,7 +34,13 @@ class MandatoryUpdateDialog(BaseDialog):
         """
         self.release_info = release_info
         self.update_manager = update_manager
+        self.cancel_token = CancellationToken()
         self.progress_text = ft.Text("", size=12, italic=True)
+        self.cancel_button = ft.TextButton(
+            text="Cancel",
+            on_click=lambda _: self._cancel_update(),
+            disabled=True,
+        )
 
         version = release_info.get("version", "unknown")
 
@@ -53,7 +64,8 @@ class MandatoryUpdateDialog(BaseDialog):
                 ft.FilledButton(
                     text="Update Now",
                     on_click=lambda _: self._start_update(),
-                )
+                ),
+                self.cancel_button,
             ],
             modal=True,
         )
@@ -72,20 +84,31 @@ class MandatoryUpdateDialog(BaseDialog):
 
         Downloads the update, extracts it, and launches the updater script.
         """
+        self.cancel_token = CancellationToken()
+
         try:
             self.dialog.actions[0].disabled = True
+            self.cancel_button.disabled = False
             self.page.update()
 
             self._update_progress("Downloading update...")
             download_url = self.release_info["download_url"]
-            zip_path = self.update_manager.download_update(download_url)
+            zip_path = self.update_manager.download_update(
+                download_url, self.cancel_token, self.release_info.get("sha256")
+            )
 
             self._update_progress("Extracting update...")
-            new_version_path = self.update_manager.extract_update(zip_path)
+            new_version_path = self.update_manager.extract_update(zip_path, self.cancel_token)
 
+            self.cancel_button.disabled = True
             self._update_progress("Preparing to install update...")
             self.update_manager.launch_updater_and_exit(new_version_path, self.page)
 
+        except OperationCancelled:
+            self.dialog.actions[0].disabled = False
+            self.cancel_button.disabled = True
+            self._update_progress("Update cancelled.")
+
         except Exception as e:
             self._update_progress("")
             error_dialog = ft.AlertDialog(
@@ -106,6 +129,12 @@ class MandatoryUpdateDialog(BaseDialog):
             error_dialog.open = True
             self.page.update()
 
+    def _cancel_update(self) -> None:
+        """Stop a running update download or extraction."""
+        self.cancel_token.cancel()
+        self.cancel_button.disabled = True
+        self._update_progress("Cancelling...")
+
     def _retry_update(self, error_dialog: ft.AlertDialog) -> None:
         """Retry the update after a failure.
 
@@ -1,50 +1,63 @@
 """Main application view."""
 
+from typing import TYPE_CHECKING
+
 import flet as ft
 
-from assets.vacc_lithuania_darkgreen_transparent_b64 import IMAGE_B64 as LOGO_DARK_B64
-from assets.vacc_lithuania_white_transparent_b64 import IMAGE_B64 as LOGO_WHITE_B64
-from services import (
-    ConfigManager,
-    Installer,
-    Launcher,
-    PathManager,
-    ProfileManager,
-    SectorVersionManager,
-)
+from services import AppContext
 from ui.components import (
-    InstallProgressDialog,
+    FreshInstallDialog,
     NoProfilesDialog,
-    SectorfileInstructionsDialog,
     SectorfileUpdateDialog,
     SettingsDialog,
     SettingsRequiredDialog,
 )
 
+if TYPE_CHECKING:
+    from services import Installer, Launcher
+
+LOGO_DARK = "vacc_lithuania_darkgreen_transparent.png"
+LOGO_WHITE = "vacc_lithuania_white_transparent.png"
+
 
 class MainView(ft.View):
-    """Main application view with logo and action buttons."""
+    """Main application view with logo and action buttons.
 
-    def __init__(self, page: ft.Page):
+    The install and launch buttons start disabled, and are enabled by
+    enable_actions() once the application update check has resolved.
+    """
+
+    def __init__(self, page: ft.Page, context: AppContext):
         """Initialize main view.
 
         Args:
             page: Flet page instance
+            context: Application context with shared services
         """
         super().__init__()
         self.page = page
 
-        self.path_manager = PathManager()
-        self.config_manager = ConfigManager(self.path_manager)
-        self.installer = Installer(self.path_manager)
-        self.launcher = Launcher()
-        self.profile_manager = ProfileManager()
+        self.context = context
+        self.path_manager = context.path_manager
+        self.config_manager = context.config_manager
+        self.profile_manager = context.profile_manager
+        self.asset_manager = context.asset_manager
 
         self.route = "/"
         self.controls = [self._build_ui()]
         self.padding = 20
         self.spacing = 20
 
+    @property
+    def installer(self) -> "Installer":
+        """Get the shared installer service."""
+        return self.context.installer
+
+    @property
+    def launcher(self) -> "Launcher":
+        """Get the shared launcher service."""
+        return self.context.launcher
+
     def _build_ui(self) -> ft.Container:
         """Build the main UI.
 
@@ -52,12 +65,32 @@ class MainView(ft.View):
             Container with all UI elements
         """
         self.logo = ft.Image(
-            src_base64=self._get_logo_base64(),
+            src=self._get_logo_src(),
             width=400,
             height=190,
             fit=ft.ImageFit.CONTAIN,
         )
 
+        self.fresh_install_button = ft.ElevatedButton(
+            text="Fresh Install",
+            icon="download",
+            on_click=self._on_fresh_install_click,
+            disabled=True,
+            style=ft.ButtonStyle(
+                padding=ft.padding.all(20),
+            ),
+        )
+
+        self.start_button = ft.FilledButton(
+            text="Start",
+            icon="play_arrow",
+            on_click=self._on_start_click,
+            disabled=True,
+            style=ft.ButtonStyle(
+                padding=ft.padding.all(20),
+            ),
+        )
+
         button_row = ft.Row(
             controls=[
                 ft.ElevatedButton(
@@ -68,22 +101,8 @@ class MainView(ft.View):
                         padding=ft.padding.all(20),
                     ),
                 ),
-                ft.ElevatedButton(
-                    text="Fresh Install",
-                    icon="download",
-                    on_click=self._on_fresh_install_click,
-                    style=ft.ButtonStyle(
-                        padding=ft.padding.all(20),
-                    ),
-                ),
-                ft.FilledButton(
-                    text="Start",
-                    icon="play_arrow",
-                    on_click=self._on_start_click,
-                    style=ft.ButtonStyle(
-                        padding=ft.padding.all(20),
-                    ),
-                ),
+                self.fresh_install_button,
+                self.start_button,
             ],
             alignment=ft.MainAxisAlignment.CENTER,
             spacing=15,
@@ -123,6 +142,12 @@ class MainView(ft.View):
             expand=True,
         )
 
+    def enable_actions(self) -> None:
+        """Enable the install and launch buttons."""
+        self.fresh_install_button.disabled = False
+        self.start_button.disabled = False
+        self.page.update()
+
     def _on_settings_click(self, _: ft.ControlEvent) -> None:
         """Handle settings button click."""
         try:
@@ -135,13 +160,8 @@ class MainView(ft.View):
 
     def _on_fresh_install_click(self, _: ft.ControlEvent) -> None:
         """Handle fresh install button click."""
-        install_dialog = InstallProgressDialog(self.page, self.installer)
-        install_dialog.show(on_complete_callback=self._show_sectorfile_install_dialog)
-
-    def _show_sectorfile_install_dialog(self) -> None:
-        """Show dialog with sectorfile installation instructions."""
-        sectorfile_dialog = SectorfileInstructionsDialog(self.page, self.installer)
-        sectorfile_dialog.show()
+        install_dialog = FreshInstallDialog(self.page, self.installer)
+        install_dialog.show()
 
     def _on_start_click(self, _: ft.ControlEvent) -> None:
         """Handle start button click."""
@@ -152,7 +172,7 @@ class MainView(ft.View):
             return
 
         try:
-            if SectorVersionManager.is_update_available():
+            if self.context.sector_version_manager.is_update_available():
                 update_dialog = SectorfileUpdateDialog(self.page, self.installer)
                 update_dialog.show()
                 return
@@ -208,13 +228,13 @@ class MainView(ft.View):
             import traceback
             traceback.print_exc()
 
-    def _get_logo_base64(self) -> str:
-        """Get the appropriate logo base64 string based on theme mode."""
+    def _get_logo_src(self) -> str:
+        """Get the appropriate logo asset reference based on theme mode."""
         config = self.config_manager.config
         if config.theme_mode == "dark":
-            return LOGO_WHITE_B64
+            return self.asset_manager.get_src(LOGO_WHITE)
         else:
-            return LOGO_DARK_B64
+            return self.asset_manager.get_src(LOGO_DARK)
 
     def _get_theme_icon(self) -> str:
         """Get the appropriate icon for current theme."""
@@ -238,5 +258,5 @@ class MainView(ft.View):
         self.config_manager.save(config)
 
         self.theme_button.icon = self._get_theme_icon()
-        self.logo.src_base64 = self._get_logo_base64()
+        self.logo.src = self._get_logo_src()
         self.page.update()
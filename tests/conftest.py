@@ -0,0 +1,61 @@
+"""Shared test fixtures."""
+
+import functools
+import io
+import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+STUBS_DIR = Path(__file__).parent / "stubs"
+
+
+@pytest.fixture
+def fake_pymsi(monkeypatch):
+    """Replace pymsi, in this process and in spawned workers, by a JSON-based stand-in."""
+    monkeypatch.syspath_prepend(str(STUBS_DIR))
+    monkeypatch.delitem(sys.modules, "pymsi", raising=False)
+    import pymsi
+
+    return pymsi
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    """Static file handler with open-ended range requests, recording every request."""
+
+    def __init__(self, *args, requests, **kwargs):
+        self.requests = requests
+        super().__init__(*args, **kwargs)
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_head(self):
+        self.requests.append(self.path)
+        path = Path(self.translate_path(self.path))
+        range_header = self.headers.get("Range")
+        if not range_header or not path.is_file():
+            return super().send_head()
+
+        data = path.read_bytes()[int(range_header[len("bytes="):].rstrip("-")):]
+        self.send_response(206)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        return io.BytesIO(data)
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Serve tmp_path/www over HTTP, yielding the base URL and the requested paths."""
+    root = tmp_path / "www"
+    root.mkdir()
+    requests = []
+    handler = functools.partial(_Handler, directory=str(root), requests=requests)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", requests
+    httpd.shutdown()
+    httpd.server_close()
@@ -0,0 +1,88 @@
+"""Stand-in for pymsi that reads a JSON description of an MSI, for tests.
+
+The description maps relative paths to file contents. Top-level directories
+are identified by their name, like the mapped directories of the EuroScope
+MSI, and every file lives in a single cabinet folder.
+"""
+
+import json
+from pathlib import Path
+
+
+def write_msi(path: Path, files: dict[str, bytes]) -> None:
+    """Write an MSI description that this module reads back."""
+    path.write_text(json.dumps({name: data.decode("latin-1") for name, data in files.items()}))
+
+
+class _Stream:
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def decompress(self) -> bytes:
+        return self.data
+
+
+class _File:
+    def __init__(self, name: str, data: bytes):
+        self.name = name
+        self.size = len(data)
+        self.media = 1
+        self._data = data
+
+    def resolve(self) -> _Stream:
+        return _Stream(self._data)
+
+
+class _Component:
+    def __init__(self):
+        self.files = {}
+
+
+class _Directory:
+    def __init__(self, name: str):
+        self.id = name
+        self.name = name
+        self.components = {"component": _Component()}
+        self.children = {}
+
+    def add(self, parts: list[str], data: bytes) -> None:
+        if len(parts) == 1:
+            self.components["component"].files[parts[0]] = _File(parts[0], data)
+            return
+        child = self.children.setdefault(parts[0], _Directory(parts[0]))
+        child.add(parts[1:], data)
+
+
+class _Folder:
+    def decompress(self) -> None:
+        pass
+
+
+class _Cabinet:
+    def __init__(self):
+        self.disks = {1: [type("CabinetDirectory", (), {"folders": [_Folder()]})()]}
+
+
+class _Media:
+    def __init__(self):
+        self.cabinet = _Cabinet()
+
+
+class Package:
+    def __init__(self, path: Path):
+        try:
+            description = json.loads(Path(path).read_text())
+        except (UnicodeDecodeError, ValueError):
+            raise ValueError("not an OLE2 structured storage file")
+        self.files = {name: data.encode("latin-1") for name, data in description.items()}
+
+    def close(self) -> None:
+        pass
+
+
+class Msi:
+    def __init__(self, package: Package, load_data: bool = False):
+        self.root = _Directory("TARGETDIR")
+        for name, data in package.files.items():
+            self.root.add(name.split("/"), data)
+        self.medias = {1: _Media()}
@@ -0,0 +1,46 @@
+"""Tests for sharing installed files through the blob store."""
+
+import stat
+
+from config import settings
+from services import BlobStore, PathManager, TrashReaper
+from services.installer import Installer
+
+
+def _is_read_only(path):
+    return not path.stat().st_mode & stat.S_IWUSR
+
+
+def test_custom_file_overlay_is_not_linked_into_the_store(tmp_path):
+    path_manager = PathManager(tmp_path)
+    custom_plugin = path_manager.custom_fir_path(settings.FIR_CODE) / "Plugins" / "Custom.dll"
+    custom_plugin.parent.mkdir(parents=True)
+    custom_plugin.write_bytes(b"custom plugin")
+
+    installer = Installer(path_manager)
+    staged = installer.staged_install(path_manager.sectorfile)
+    plugins = staged.begin() / settings.FIR_CODE / "Plugins"
+    plugins.mkdir(parents=True)
+    (plugins / "Custom.dll").write_bytes(b"custom plugin")
+    (plugins / "TopSky.dll").write_bytes(b"shared plugin")
+    installer.commit_sectorfile(staged)
+
+    installed = path_manager.sectorfile / settings.FIR_CODE / "Plugins"
+    assert (installed / "Custom.dll").stat().st_nlink == 1
+    assert not _is_read_only(installed / "Custom.dll")
+    assert (installed / "TopSky.dll").stat().st_nlink == 2
+
+
+def test_deleting_a_linked_tree_keeps_the_blob_read_only(tmp_path):
+    path_manager = PathManager(tmp_path)
+    store = BlobStore(path_manager.store)
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    (tree / "EuroScope.exe").write_bytes(b"binary")
+    digest = store.load_tree(store.ingest(tree))["EuroScope.exe"]
+
+    TrashReaper._delete(tree)
+
+    assert not tree.exists()
+    assert _is_read_only(store.blob_path(digest))
+    assert store.blob_path(digest).stat().st_nlink == 1
@@ -0,0 +1,27 @@
+"""Tests for the headless command-line interface."""
+
+import json
+
+import cli
+from config import settings
+
+
+def test_stdout_holds_only_the_json_result(tmp_path, server, fake_pymsi, monkeypatch, capfd):
+    base_url, _ = server
+    # A top-level directory ID with a GUID suffix makes the extraction worker print a warning
+    fake_pymsi.write_msi(
+        tmp_path / "www" / "EuroScopeSetup.msi",
+        {"EuroScope.exe": b"binary", "Plugins.1A2B3C/plugin.dll": b"plugin"},
+    )
+    monkeypatch.setattr(settings, "EUROSCOPE_MSI_URL", f"{base_url}/EuroScopeSetup.msi")
+
+    code = cli.run(["--root", str(tmp_path / "root"), "install-euroscope"])
+
+    out, err = capfd.readouterr()
+    assert json.loads(out) == {
+        "command": "install-euroscope",
+        "ok": True,
+        "path": str(tmp_path / "root" / settings.EUROSCOPE_DIR),
+    }
+    assert code == cli.EXIT_OK
+    assert "GUID suffix" in err
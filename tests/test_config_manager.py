@@ -0,0 +1,38 @@
+"""Tests for configuration persistence."""
+
+import gc
+import json
+import weakref
+
+from models import UserConfig
+from services import ConfigManager, PathManager
+from services.config_manager import _open_managers
+
+
+def test_failed_write_keeps_the_change_pending(tmp_path):
+    path_manager = PathManager(tmp_path)
+    config_manager = ConfigManager(path_manager)
+    blocker = path_manager.config_file.with_name(path_manager.config_file.name + ".tmp")
+    blocker.mkdir(parents=True)
+
+    config_manager.save(UserConfig(name="Jonas", afv_path="afv.exe"))
+    assert not path_manager.config_file.exists()
+
+    blocker.rmdir()
+    config_manager.flush()
+
+    assert json.loads(path_manager.config_file.read_text(encoding="utf-8"))["name"] == "Jonas"
+
+
+def test_closed_or_dropped_managers_are_not_flushed_on_exit(tmp_path):
+    first = ConfigManager(PathManager(tmp_path / "first"))
+    second = ConfigManager(PathManager(tmp_path / "second"))
+    assert {first, second} <= set(_open_managers)
+
+    first.close()
+    second_ref = weakref.ref(second)
+    del second
+    gc.collect()
+
+    assert first not in _open_managers
+    assert second_ref() is None
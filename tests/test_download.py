@@ -0,0 +1,58 @@
+"""Tests for cancelling the EuroScope MSI download."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from services import CancellationToken, InstallJournal, OperationCancelled, ProgressTracker
+from services.installer import Installer
+
+SIZE = 1024 * 1024
+
+
+class _TrickleHandler(BaseHTTPRequestHandler):
+    """Serves a large file one kilobyte at a time, like a very slow link."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(SIZE))
+        self.end_headers()
+        try:
+            for _ in range(SIZE // 1024):
+                self.wfile.write(b"x" * 1024)
+                self.wfile.flush()
+                time.sleep(0.05)
+        except OSError:
+            pass
+
+
+def test_cancelling_a_slow_download_stops_it_promptly(tmp_path):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _TrickleHandler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    cancel_token = CancellationToken()
+    threading.Timer(0.5, cancel_token.cancel).start()
+    journal = InstallJournal(tmp_path / "journal", tmp_path)
+    journal.open("test")
+
+    started = time.monotonic()
+    try:
+        with pytest.raises(OperationCancelled):
+            Installer._download_msi_from(
+                f"http://127.0.0.1:{httpd.server_address[1]}/EuroScopeSetup.msi",
+                tmp_path / "EuroScopeSetup.msi",
+                ProgressTracker(),
+                cancel_token,
+                journal,
+            )
+    finally:
+        journal.close()
+        httpd.shutdown()
+        httpd.server_close()
+
+    assert time.monotonic() - started < 2
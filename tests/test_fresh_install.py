@@ -0,0 +1,37 @@
+"""Tests for running the fresh installation stages."""
+
+import time
+
+from config import settings
+from services import CancellationToken, FreshInstall
+
+
+class _FailingEuroScopeInstaller:
+    """Installer whose EuroScope install fails while the sectorfile download is awaited."""
+
+    def __init__(self):
+        self.sectorfile_token = None
+
+    def install_euroscope(self, progress_callback, cancel_token):
+        time.sleep(0.2)
+        raise RuntimeError("MSI download failed")
+
+    def wait_for_sectorfile_download(self, tracker, cancel_token):
+        self.sectorfile_token = cancel_token
+        cancel_token.wait(settings.SECTORFILE_DOWNLOAD_TIMEOUT)
+        cancel_token.raise_if_cancelled()
+        return None
+
+
+def test_failed_euroscope_stage_stops_the_sectorfile_wait(tmp_path):
+    installer = _FailingEuroScopeInstaller()
+    cancel_token = CancellationToken()
+    events = []
+
+    started = time.monotonic()
+    assert not FreshInstall(installer).run(events.append, cancel_token)
+
+    assert time.monotonic() - started < 5
+    assert installer.sectorfile_token.is_cancelled
+    assert not cancel_token.is_cancelled
+    assert "EuroScope installation failed" in events[-1].message
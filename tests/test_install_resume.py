@@ -0,0 +1,118 @@
+"""Tests that an interrupted EuroScope installation resumes correctly.
+
+Each installation runs in a child process whose Installer is given a step
+to exit abruptly at (fault_at), in the process itself or in its extraction
+worker. An attempt without faults must then complete the installation, with the same
+files as an uninterrupted reference installation.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from config import settings
+from services.install_journal import FAULT_EXIT_CODE, file_sha256
+
+from conftest import STUBS_DIR
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+# A fault injected in the extraction worker fails the installation
+# instead of killing the installing process
+WORKER_FAULT = f"worker exited unexpectedly (code {FAULT_EXIT_CODE})"
+
+# Upper bound of the steps an installation of MSI_FILES takes
+MAX_STEPS = 50
+
+INSTALL_CODE = (
+    "import sys; from pathlib import Path; "
+    "from config import settings; settings.EUROSCOPE_MSI_URL = sys.argv[2]; "
+    "from services import Installer, PathManager; "
+    "fault_at = int(sys.argv[3]) if len(sys.argv) > 3 else None; "
+    "installer = Installer(PathManager(Path(sys.argv[1])), fault_at=fault_at); "
+    "sys.exit(0 if installer.install_euroscope() else 1)"
+)
+
+MSI_FILES = {
+    "EuroScope.exe": b"binary" * 1000,
+    "sounds/ok.wav": b"sound" * 100,
+    "soundbackends/backend.dll": b"backend",
+    "FontsFolder/EuroScope.ttf": b"font",
+    "AppDataFolder/Euroscope/EuroScope.prf": b"profile",
+    "AppDataFolder/Euroscope/Settings/General.txt": b"settings",
+}
+
+
+def _install(root: Path, msi_url: str, fault_at: int | None = None) -> int:
+    """Install EuroScope in a child process.
+
+    Returns:
+        Exit code of the child process, or FAULT_EXIT_CODE if a fault was
+        injected in its extraction worker
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(STUBS_DIR), str(SRC_DIR), env.get("PYTHONPATH", "")])
+    fault = [] if fault_at is None else [str(fault_at)]
+
+    result = subprocess.run(
+        [sys.executable, "-c", INSTALL_CODE, str(root), msi_url, *fault],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    if result.returncode != 0 and WORKER_FAULT in result.stdout:
+        return FAULT_EXIT_CODE
+    return result.returncode
+
+
+def _tree_hashes(path: Path) -> dict[str, str]:
+    return {
+        item.relative_to(path).as_posix(): file_sha256(item)
+        for item in path.rglob("*")
+        if item.is_file()
+    }
+
+
+def _msi_url(tmp_path, server, fake_pymsi) -> str:
+    base_url, _ = server
+    fake_pymsi.write_msi(tmp_path / "www" / "EuroScopeSetup.msi", MSI_FILES)
+    return f"{base_url}/EuroScopeSetup.msi"
+
+
+def _reference(tmp_path, msi_url) -> dict[str, str]:
+    assert _install(tmp_path / "reference", msi_url) == 0
+    return _tree_hashes(tmp_path / "reference" / settings.EUROSCOPE_DIR)
+
+
+def test_install_resumes_after_a_fault_at_any_step(tmp_path, server, fake_pymsi):
+    msi_url = _msi_url(tmp_path, server, fake_pymsi)
+    reference = _reference(tmp_path, msi_url)
+
+    for fault_at in range(1, MAX_STEPS + 1):
+        root = tmp_path / f"fault{fault_at}"
+        code = _install(root, msi_url, fault_at)
+        if code == 0:
+            # The installation took fewer steps, so every step has been covered
+            break
+
+        assert code == FAULT_EXIT_CODE, f"fault at step {fault_at}"
+        assert _install(root, msi_url) == 0, f"resume after fault at step {fault_at}"
+        assert _tree_hashes(root / settings.EUROSCOPE_DIR) == reference, f"fault at step {fault_at}"
+    else:
+        raise AssertionError(f"installation took more than {MAX_STEPS} steps")
+
+
+def test_install_resumes_after_repeated_faults(tmp_path, server, fake_pymsi):
+    msi_url = _msi_url(tmp_path, server, fake_pymsi)
+    reference = _reference(tmp_path, msi_url)
+    root = tmp_path / "root"
+
+    for fault_at in (4, 2, 5):
+        assert _install(root, msi_url, fault_at) == FAULT_EXIT_CODE
+    assert _install(root, msi_url) == 0
+
+    assert _tree_hashes(root / settings.EUROSCOPE_DIR) == reference
@@ -0,0 +1,113 @@
+"""Tests for mirror fallback against a local stand-in server."""
+
+import hashlib
+
+from config import settings
+from services import CancellationToken, InstallJournal, ProgressTracker
+from services.installer import Installer
+from services.mirrors import mirror_urls
+
+MSI = b"MSI content " * 1000
+
+
+def _publish(tmp_path, base_url, relative, data):
+    """Serve data at a path below the server root, returning its URL."""
+    path = tmp_path / "www" / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return f"{base_url}/{relative}"
+
+
+def _download(tmp_path, url):
+    msi_path = tmp_path / "EuroScopeSetup.msi"
+    journal = InstallJournal(tmp_path / "journal", tmp_path)
+    journal.open("test")
+    try:
+        Installer._download_msi_from(url, msi_path, ProgressTracker(), CancellationToken(), journal)
+    finally:
+        journal.close()
+    return msi_path
+
+
+def test_partial_download_from_another_source_is_discarded(tmp_path, server):
+    base_url, _ = server
+    url = _publish(tmp_path, base_url, "origin/EuroScopeSetup.msi", MSI)
+
+    # A mirror failed halfway through with different content
+    (tmp_path / "EuroScopeSetup.msi.part").write_bytes(b"X" * 5000)
+    (tmp_path / "EuroScopeSetup.msi.part.source").write_text("http://mirror.invalid/EuroScopeSetup.msi")
+
+    assert _download(tmp_path, url).read_bytes() == MSI
+    assert not (tmp_path / "EuroScopeSetup.msi.part.source").exists()
+
+
+def test_partial_download_from_the_same_source_is_continued(tmp_path, server):
+    base_url, _ = server
+    url = _publish(tmp_path, base_url, "origin/EuroScopeSetup.msi", MSI)
+
+    (tmp_path / "EuroScopeSetup.msi.part").write_bytes(MSI[:5000])
+    (tmp_path / "EuroScopeSetup.msi.part.source").write_text(url)
+
+    assert _download(tmp_path, url).read_bytes() == MSI
+
+
+def _mirrored(tmp_path, monkeypatch, server):
+    """Serve the MSI from its origin and from three mirrors: missing, corrupt and intact."""
+    base_url, requests = server
+    origin = _publish(tmp_path, base_url, "origin/EuroScopeSetup.msi", MSI)
+    relative = origin[len("http://"):]
+    _publish(tmp_path, base_url, f"corrupt/{relative}", MSI[::-1])
+    _publish(tmp_path, base_url, f"intact/{relative}", MSI)
+
+    monkeypatch.setattr(settings, "EUROSCOPE_MSI_URL", origin)
+    monkeypatch.setattr(
+        settings, "MIRROR_URLS", (f"{base_url}/missing", f"{base_url}/corrupt", f"{base_url}/intact")
+    )
+    return requests
+
+
+def _download_msi(tmp_path):
+    msi_path = tmp_path / "EuroScopeSetup.msi"
+    journal = InstallJournal(tmp_path / "journal", tmp_path)
+    journal.open("test")
+    try:
+        Installer._download_msi(msi_path, ProgressTracker(), CancellationToken(), journal)
+    finally:
+        journal.close()
+    return msi_path
+
+
+def test_mirrors_are_tried_in_order_and_bad_hashes_rejected(tmp_path, monkeypatch, server):
+    requests = _mirrored(tmp_path, monkeypatch, server)
+    monkeypatch.setattr(settings, "EUROSCOPE_MSI_SHA256", hashlib.sha256(MSI).hexdigest())
+
+    assert _download_msi(tmp_path).read_bytes() == MSI
+    assert [path.split("/")[1] for path in requests] == ["missing", "corrupt", "intact"]
+
+
+def test_every_mirror_failing_falls_back_to_origin(tmp_path, monkeypatch, server):
+    requests = _mirrored(tmp_path, monkeypatch, server)
+    monkeypatch.setattr(settings, "EUROSCOPE_MSI_SHA256", hashlib.sha256(MSI).hexdigest())
+    monkeypatch.setattr(settings, "MIRROR_URLS", settings.MIRROR_URLS[:2])
+
+    assert _download_msi(tmp_path).read_bytes() == MSI
+    assert [path.split("/")[1] for path in requests] == ["missing", "corrupt", "origin"]
+
+
+def test_unpinned_msi_is_only_fetched_from_origin(tmp_path, monkeypatch, server):
+    requests = _mirrored(tmp_path, monkeypatch, server)
+    monkeypatch.setattr(settings, "EUROSCOPE_MSI_SHA256", "")
+
+    assert _download_msi(tmp_path).read_bytes() == MSI
+    assert [path.split("/")[1] for path in requests] == ["origin"]
+
+
+def test_mirrors_are_read_from_the_environment_when_used(monkeypatch):
+    monkeypatch.setattr(settings, "MIRROR_URLS", None)
+    monkeypatch.setenv(settings.MIRRORS_ENV, "http://a.local/files;http://b.local")
+
+    assert mirror_urls("https://euroscope.hu/install/setup.msi") == [
+        "http://a.local/files/euroscope.hu/install/setup.msi",
+        "http://b.local/euroscope.hu/install/setup.msi",
+        "https://euroscope.hu/install/setup.msi",
+    ]
@@ -0,0 +1,94 @@
+"""Tests for MSI extraction in a worker process."""
+
+import errno
+import os
+import time
+
+import pytest
+
+from config import settings
+from models import InstallPhase
+from services import CancellationToken, InstallJournal, ProgressTracker, msi_extraction
+from services.msi_extraction import ExtractionRequest, MsiLayout, extract_msi, run_extraction_worker
+
+
+def _request(tmp_path, msi_path, resumed=False):
+    (tmp_path / "staging").mkdir(exist_ok=True)
+    journal = InstallJournal(tmp_path / "journal", tmp_path / "staging")
+    journal.open("test")
+    journal.mark_done(InstallPhase.DOWNLOAD, sha256="ab" * 32)
+    journal.close()
+    return ExtractionRequest(
+        msi_path, tmp_path / "staging", tmp_path / "journal", "test", resumed, 0, tmp_path / "index"
+    )
+
+
+def test_worker_extracts_files(tmp_path, fake_pymsi):
+    msi_path = tmp_path / "setup.msi"
+    fake_pymsi.write_msi(msi_path, {"EuroScope.exe": b"binary", "sounds/ok.wav": b"sound"})
+    events = []
+
+    run_extraction_worker(_request(tmp_path, msi_path), ProgressTracker(events.append), CancellationToken())
+
+    assert (tmp_path / "staging" / "sounds" / "ok.wav").read_bytes() == b"sound"
+    assert events[-1].phase == InstallPhase.EXTRACT
+    assert events[-1].bytes_done == len(b"binary") + len(b"sound")
+
+
+def test_worker_failure_raises(tmp_path, fake_pymsi):
+    msi_path = tmp_path / "setup.msi"
+    msi_path.write_bytes(b"\xd0\xcf not an msi")
+
+    with pytest.raises(RuntimeError, match="not an OLE2"):
+        run_extraction_worker(_request(tmp_path, msi_path), ProgressTracker(), CancellationToken())
+
+
+def test_failing_tracker_stops_worker_without_hanging(tmp_path, fake_pymsi):
+    msi_path = tmp_path / "setup.msi"
+    fake_pymsi.write_msi(msi_path, {f"files/{i}.txt": b"x" for i in range(20000)})
+
+    def fail(event):
+        if event.phase == InstallPhase.EXTRACT:
+            raise RuntimeError("progress callback failed")
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="progress callback failed"):
+        run_extraction_worker(_request(tmp_path, msi_path), ProgressTracker(fail), CancellationToken())
+    assert time.monotonic() - started < 30
+
+
+def test_cached_index_plans_and_checks_space_without_opening_the_msi(tmp_path, fake_pymsi, monkeypatch):
+    msi_path = tmp_path / "setup.msi"
+    fake_pymsi.write_msi(msi_path, {"EuroScope.exe": b"binary"})
+    request = _request(tmp_path, msi_path)
+    MsiLayout(files=(("EuroScope.exe", 6),), folders=1).save(tmp_path / "index" / f"{'ab' * 32}.json")
+
+    def refuse(directory, required, action):
+        raise OSError(errno.ENOSPC, f"Not enough space to {action}")
+
+    def fail(msi_path):
+        raise AssertionError("the MSI was opened")
+
+    monkeypatch.setattr(msi_extraction, "ensure_free_space", refuse)
+    monkeypatch.setattr(msi_extraction, "_open_msi", fail)
+    journal = InstallJournal(request.journal_path, request.staging_dir)
+    journal.open("test")
+
+    with pytest.raises(OSError, match="Not enough space"):
+        extract_msi(request, journal, ProgressTracker(), CancellationToken())
+
+
+def test_index_cache_keeps_the_most_recently_used_indexes(tmp_path):
+    layout = MsiLayout(files=(("EuroScope.exe", 6),), folders=1)
+    paths = [tmp_path / f"{i}.json" for i in range(settings.MSI_INDEX_COUNT)]
+    for age, path in enumerate(paths):
+        layout.save(path)
+        os.utime(path, (age, age))
+
+    assert MsiLayout.load(paths[0]) == layout
+    layout.save(tmp_path / "new.json")
+
+    kept = sorted(path.name for path in tmp_path.glob("*.json"))
+    assert len(kept) == settings.MSI_INDEX_COUNT
+    assert paths[0].name in kept
+    assert paths[1].name not in kept
@@ -0,0 +1,144 @@
+"""Tests for offline bundle export and import."""
+
+import hashlib
+import io
+import json
+import tarfile
+
+import pytest
+
+from config import settings
+from models import UserConfig, VatsimRating
+from services import PathManager
+from services.installer import Installer
+from services.launcher import Launcher
+from services.offline_bundle import BUNDLE_FORMAT, MANIFEST_NAME, OfflineBundle
+
+PROFILE = b"Settings\tsettings\\EYVL.txt\r\nLastSession\tserver\tAUTOMATIC\r\n"
+SECRET = "hunter2"
+
+
+@pytest.fixture
+def path_manager(tmp_path):
+    return PathManager(tmp_path)
+
+
+def _write_sectorfile(directory):
+    (directory / "EYVL_20250101000000-2501-1.SCT").write_bytes(b"[INFO]\n")
+    (directory / "EYVL" / "Plugins" / "Topsky").mkdir(parents=True)
+    (directory / "EYVL" / "Plugins" / "Topsky" / settings.HOPPIE_CODE_FILE).write_text("")
+    (directory / "EYVL" / "Vilnius.prf").write_bytes(PROFILE)
+
+
+def _fill_in_credentials(path_manager):
+    config = UserConfig(
+        name="Jane Doe",
+        vatsim_id="1234567",
+        vatsim_password=SECRET,
+        rating=list(VatsimRating)[0],
+        hoppie_code="hoppie-secret",
+    )
+    Launcher(path_manager).prepare_profiles(config, path_manager.sectorfile)
+
+
+def _bundle_contents(path_manager, tmp_path):
+    bundle = tmp_path / "bundle.tar"
+    OfflineBundle(Installer(path_manager)).export(bundle)
+    with tarfile.open(bundle) as tar:
+        return {
+            member.name: tar.extractfile(member).read()
+            for member in tar.getmembers()
+            if member.isfile()
+        }
+
+
+def _assert_no_credentials(contents):
+    assert not any(name.endswith(settings.HOPPIE_CODE_FILE) for name in contents)
+    for name, data in contents.items():
+        assert b"LastSession\tpassword" not in data, name
+        assert b"LastSession\tcertificate" not in data, name
+        assert SECRET.encode() not in data, name
+        assert b"hoppie-secret" not in data, name
+
+
+def test_export_uses_pristine_snapshot(path_manager, tmp_path):
+    installer = Installer(path_manager)
+    staged = installer.staged_install(path_manager.sectorfile)
+    _write_sectorfile(staged.begin())
+    installer.commit_sectorfile(staged)
+    _fill_in_credentials(path_manager)
+
+    contents = _bundle_contents(path_manager, tmp_path)
+
+    _assert_no_credentials(contents)
+    assert contents["sectorfile/EYVL/Vilnius.prf"] == PROFILE
+
+
+def test_export_strips_credentials_without_snapshot(path_manager, tmp_path):
+    path_manager.sectorfile.mkdir()
+    _write_sectorfile(path_manager.sectorfile)
+    _fill_in_credentials(path_manager)
+
+    contents = _bundle_contents(path_manager, tmp_path)
+
+    _assert_no_credentials(contents)
+    assert b"LastSession\tserver\tAUTOMATIC" in contents["sectorfile/EYVL/Vilnius.prf"]
+
+
+def _write_bundle(path, files, corrupt=None):
+    """Write a bundle by hand, optionally with one file not matching its hash."""
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "fir": settings.FIR_CODE,
+        "files": {
+            name: {"size": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+            for name, data in files.items()
+        },
+    }
+    with tarfile.open(path, "w") as tar:
+        for name, data in [(MANIFEST_NAME, json.dumps(manifest).encode())] + list(files.items()):
+            if name == corrupt:
+                data = data[::-1]
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+def test_import_keeps_custom_files_out_of_the_store(path_manager, tmp_path):
+    bundle = tmp_path / "bundle.tar"
+    _write_bundle(bundle, {"customfiles/EYVL/Alias/alias.txt": b".hello world"})
+
+    OfflineBundle(Installer(path_manager)).import_bundle(bundle)
+
+    custom_file = path_manager.custom_files / "EYVL" / "Alias" / "alias.txt"
+    assert custom_file.read_bytes() == b".hello world"
+    assert custom_file.stat().st_nlink == 1
+    custom_file.write_bytes(b".edited")
+
+
+def test_failed_import_leaves_application_untouched(path_manager, tmp_path):
+    (tmp_path / "main.exe").write_bytes(b"old build")
+    bundle = tmp_path / "bundle.tar"
+    _write_bundle(
+        bundle,
+        {"app/main.exe": b"new build", "app/lib/module.pyd": b"module"},
+        corrupt="app/lib/module.pyd",
+    )
+
+    with pytest.raises(ValueError):
+        OfflineBundle(Installer(path_manager)).import_bundle(bundle)
+
+    assert (tmp_path / "main.exe").read_bytes() == b"old build"
+    assert not (tmp_path / "lib").exists()
+
+
+def test_import_moves_staged_application_into_root(path_manager, tmp_path):
+    (tmp_path / "main.exe").write_bytes(b"old build")
+    bundle = tmp_path / "bundle.tar"
+    _write_bundle(bundle, {"app/main.exe": b"new build", "app/lib/module.pyd": b"module"})
+
+    OfflineBundle(Installer(path_manager)).import_bundle(bundle)
+
+    assert (tmp_path / "main.exe").read_bytes() == b"new build"
+    assert (tmp_path / "lib" / "module.pyd").read_bytes() == b"module"
+    assert (path_manager.previous / "app" / "main.exe").read_bytes() == b"old build"
@@ -0,0 +1,63 @@
+"""Tests for provisioning seats from a shared blob store."""
+
+import json
+
+import cli
+from services import BlobStore, SeatProvisioner
+from services.seat_provisioner import SEAT_REF_PREFIX
+
+
+def _euroscope(root, version):
+    root.mkdir(parents=True)
+    (root / "EuroScope.exe").write_bytes(f"EuroScope {version}".encode())
+    (root / "AppDataFolder" / "Euroscope").mkdir(parents=True)
+    (root / "AppDataFolder" / "Euroscope" / "EuroScope.prf").write_bytes(b"profile")
+    return root
+
+
+def test_provisioned_seat_survives_a_new_publish_and_store_gc(tmp_path):
+    store = BlobStore(tmp_path / "store")
+    provisioner = SeatProvisioner(store)
+    seat = tmp_path / "seat"
+    seat_ref = f"{SEAT_REF_PREFIX}{seat.resolve().as_posix()}"
+
+    provisioner.provision(seat, provisioner.publish(_euroscope(tmp_path / "v1", 1)))
+    provisioner.publish(_euroscope(tmp_path / "v2", 2))
+    store.collect_garbage()
+
+    refs = store.refs()
+    assert [name for name in refs if name.startswith(SEAT_REF_PREFIX)] == [seat_ref]
+    manifest = store.load_tree(refs[seat_ref])
+    assert store.blob_path(manifest["EuroScope.exe"]).read_bytes() == b"EuroScope 1"
+    assert (seat / "Euroscope" / "EuroScope.exe").read_bytes() == b"EuroScope 1"
+
+
+def test_tree_ingested_with_a_ref_survives_store_gc(tmp_path):
+    store = BlobStore(tmp_path / "store")
+    tree = _euroscope(tmp_path / "tree", 1)
+
+    digest = store.ingest(tree, ref="Euroscope.staged")
+    store.collect_garbage()
+
+    assert store.ref("Euroscope.staged") == digest
+    assert store.load_tree(digest)["EuroScope.exe"]
+
+
+def test_doctor_verifies_and_repairs_seats(tmp_path, capfd):
+    store = BlobStore(tmp_path / "store")
+    provisioner = SeatProvisioner(store)
+    seat = tmp_path / "seat"
+    provisioner.provision(seat, provisioner.publish(_euroscope(tmp_path / "v1", 1)))
+    (seat / "Euroscope" / "EuroScope.exe").unlink()
+
+    code = cli.run([
+        "--root", str(tmp_path / "root"),
+        "doctor", "--store", str(store.root), "--target", "seats", "--repair",
+    ])
+
+    [report] = json.loads(capfd.readouterr().out)["trees"]
+    assert code == cli.EXIT_OK
+    assert report["seat"] == str(seat.resolve())
+    assert report["missing"] == ["EuroScope.exe"]
+    assert report["repaired"] == ["EuroScope.exe"]
+    assert (seat / "Euroscope" / "EuroScope.exe").read_bytes() == b"EuroScope 1"
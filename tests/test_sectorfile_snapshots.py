@@ -0,0 +1,43 @@
+"""Tests for keeping and pruning sectorfile snapshots."""
+
+from config import settings
+from services import PathManager
+from services.installer import Installer
+
+
+def _install(installer, version):
+    staged = installer.staged_install(installer.path_manager.sectorfile)
+    staging_dir = staged.begin()
+    (staging_dir / f"{settings.FIR_CODE}_{version}.SCT").write_text(version)
+    installer.commit_sectorfile(staged)
+
+
+def test_snapshots_are_pruned_oldest_first(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SECTORFILE_SNAPSHOT_COUNT", 3)
+    installer = Installer(PathManager(tmp_path))
+    versions = [
+        "manual",
+        "20250101000000-2501-0001",
+        "20250201000000-2502-0001",
+        "20250301000000-2503-0001",
+        "20250401000000-2504-0001",
+    ]
+
+    for version in versions:
+        _install(installer, version)
+
+    assert installer.sectorfile_snapshots() == versions[:1:-1]
+
+
+def test_just_installed_snapshot_is_always_kept(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SECTORFILE_SNAPSHOT_COUNT", 3)
+    installer = Installer(PathManager(tmp_path))
+    for version in ["20250101000000-2501-0001", "20250201000000-2502-0001", "20250301000000-2503-0001"]:
+        _install(installer, version)
+
+    _install(installer, "manual")
+
+    snapshots = installer.sectorfile_snapshots()
+    assert "manual" in snapshots
+    assert "20250101000000-2501-0001" not in snapshots
+    assert len(snapshots) == 3